@@ -0,0 +1,201 @@
+"""Dynamic micro-batching of concurrent predict calls for one loaded model.
+
+There is no background thread. The first caller to find the queue idle becomes
+the leader. It waits up to ``max_wait_ms`` for followers (or until
+``max_batch_size`` requests are queued, or until every call reported by
+``in_flight`` that is not already running is queued), concatenates their inputs along the
+batch axis, runs one predict, and hands each caller its own rows; leftover
+requests promote the next queued caller to leader.  Requests whose input
+shapes differ are grouped separately.  When a batched call fails, or returns
+the wrong number of rows, every request in the group is retried alone so that
+one bad input never fails its neighbours.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+Predictor = Callable[[list[np.ndarray]], np.ndarray]
+
+HISTOGRAM_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Histogram:
+    """Per-bucket counts: a value lands in the first bucket ``>=`` it, else in ``+Inf``."""
+
+    def __init__(self, buckets: tuple[int, ...] = HISTOGRAM_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum = 0
+
+    def observe(self, value: int) -> None:
+        idx = next((i for i, b in enumerate(self.buckets) if value <= b), len(self.buckets))
+        self.counts[idx] += 1
+        self.total += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+            "count": self.total,
+            "mean": round(self.sum / self.total, 3) if self.total else None,
+        }
+
+
+class BatchingStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.queue_depth = Histogram()
+        self.batch_size = Histogram()
+        self.batches = 0
+        self.requests = 0
+        self.split_fallbacks = 0
+
+    def observe_enqueue(self, depth: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.queue_depth.observe(depth)
+
+    def observe_batch(self, size: int, *, fallback: bool = False) -> None:
+        with self._lock:
+            self.batches += 1
+            self.batch_size.observe(size)
+            self.split_fallbacks += int(fallback)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "batches": self.batches,
+                "split_fallbacks": self.split_fallbacks,
+                "queue_depth": self.queue_depth.snapshot(),
+                "batch_size": self.batch_size.snapshot(),
+            }
+
+
+class _Request:
+    __slots__ = ("inputs", "lead", "done", "output", "error")
+
+    def __init__(self, inputs: list[np.ndarray]) -> None:
+        self.inputs = inputs
+        self.lead = False
+        self.done = False
+        self.output: np.ndarray | None = None
+        self.error: BaseException | None = None
+
+
+def _signature(inputs: list[np.ndarray]) -> tuple[Any, ...]:
+    return tuple((a.shape[1:], a.dtype.str) for a in inputs)
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        predict: Predictor,
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        stats: BatchingStats | None = None,
+        in_flight: Callable[[], int] | None = None,
+    ) -> None:
+        self.predict = predict
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.stats = stats or BatchingStats()
+        # Calls that may be on their way into this batcher (e.g. busy inference workers); None waits out max_wait.
+        self.in_flight = in_flight
+        self._cond = threading.Condition()
+        self._queue: list[_Request] = []
+        self._leader = False
+        self._running = 0
+
+    def __call__(self, model_inputs: list[np.ndarray]) -> np.ndarray:
+        inputs = [np.asarray(a) for a in model_inputs]
+        # Only batch-of-one requests are coalesced; anything else goes straight through.
+        if self.max_batch_size == 1 or any(a.ndim == 0 or a.shape[0] != 1 for a in inputs):
+            self.stats.observe_batch(inputs[0].shape[0] if inputs and inputs[0].ndim else 1)
+            return self.predict(inputs)
+
+        item = _Request(inputs)
+        with self._cond:
+            self._queue.append(item)
+            self.stats.observe_enqueue(len(self._queue))
+            if self._leader:
+                self._cond.notify_all()
+            else:
+                self._leader = item.lead = True
+            while not item.lead and not item.done:
+                self._cond.wait()
+            if item.done:
+                return self._result(item)
+
+            deadline = time.monotonic() + self.max_wait
+            while len(self._queue) < self._wanted_locked():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._queue[: self.max_batch_size]
+            del self._queue[: self.max_batch_size]
+            self._running += len(batch)
+            if self._queue:
+                self._queue[0].lead = True
+            else:
+                self._leader = False
+            self._cond.notify_all()
+
+        try:
+            self._run(batch)
+        finally:
+            with self._cond:
+                self._running -= len(batch)
+                for req in batch:
+                    req.done = True
+                self._cond.notify_all()
+        return self._result(item)
+
+    def _wanted_locked(self) -> int:
+        """Queue length worth waiting for: every call that could still join, at most ``max_batch_size``."""
+        if self.in_flight is None:
+            return self.max_batch_size
+        # Calls already inside a running batch cannot join this one.
+        return min(self.max_batch_size, self.in_flight() - self._running)
+
+    @staticmethod
+    def _result(item: _Request) -> np.ndarray:
+        if item.error is not None:
+            raise item.error
+        assert item.output is not None
+        return item.output
+
+    def _run(self, batch: list[_Request]) -> None:
+        groups: dict[tuple[Any, ...], list[_Request]] = {}
+        for req in batch:
+            groups.setdefault(_signature(req.inputs), []).append(req)
+        for group in groups.values():
+            if len(group) > 1:
+                try:
+                    stacked = [np.concatenate(parts, axis=0) for parts in zip(*(r.inputs for r in group), strict=True)]
+                    out = np.asarray(self.predict(stacked))
+                    if out.ndim and out.shape[0] == len(group):
+                        for i, req in enumerate(group):
+                            req.output = out[i : i + 1]
+                        self.stats.observe_batch(len(group))
+                        continue
+                except Exception:
+                    pass
+                self.stats.observe_batch(len(group), fallback=True)
+            else:
+                self.stats.observe_batch(1)
+            for req in group:
+                try:
+                    req.output = np.asarray(self.predict(req.inputs))
+                except Exception as exc:
+                    req.error = exc
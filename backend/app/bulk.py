@@ -0,0 +1,267 @@
+"""Bulk forecasting: parse columnar payloads and stream NDJSON results chunk by chunk.
+
+Three request encodings carry the same columns (``series_id``,
+``target_history`` and optional ``static_covariates`` /
+``known_future_covariates``, each a list of numbers per series):
+
+* ``application/json``: one object of parallel arrays (``series_ids``,
+  ``target_history``, ...), optionally with ``run_id`` and ``horizon``;
+* ``application/x-ndjson``: one series object per line;
+* ``application/vnd.apache.arrow.stream``: an Arrow IPC stream with those
+  columns (needs the optional ``pyarrow`` dependency).
+
+Each chunk becomes one input tensor and one batched predict on the runtime's
+inference pool.  The response is NDJSON with a ``meta`` line, one
+``forecast`` line per series and a closing ``summary`` line.  A chunk that
+cannot be served emits an ``error`` line and ends the stream.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from backend.app.config import BULK_MAX_SERIES
+from backend.app.inference import _as_numeric_list, infer_bulk_chunk
+from backend.app.inference_pool import INFERENCE_POOLS
+
+ARROW_MEDIA_TYPES = {"application/vnd.apache.arrow.stream", "application/vnd.apache.arrow.file"}
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+
+class BulkPayloadError(ValueError):
+    """The bulk payload is malformed; ``status_code`` is the HTTP status to answer with."""
+
+    def __init__(self, message: str, status_code: int = 400) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class BulkSeries:
+    series_ids: list[str]
+    histories: list[list[float]]
+    static_covariates: list[list[float]] | None = None
+    future_covariates: list[list[float]] | None = None
+    run_id: str | None = None
+    horizon: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.series_ids)
+
+    def chunk(self, start: int, stop: int) -> dict[str, Any]:
+        return {
+            "histories": self.histories[start:stop],
+            "static_covariates": self.static_covariates[start:stop] if self.static_covariates else None,
+            "future_covariates": self.future_covariates[start:stop] if self.future_covariates else None,
+        }
+
+
+def _optional_column(rows: list[Any]) -> list[list[float]] | None:
+    values = [_as_numeric_list(x) if x is not None else [] for x in rows]
+    return values if any(values) else None
+
+
+def _too_many_series(max_series: int, got: int | None = None) -> BulkPayloadError:
+    detail = f", got {got}" if got is not None else ""
+    return BulkPayloadError(f"at most {max_series} series per request{detail}", status_code=413)
+
+
+def _from_columns(
+    columns: dict[str, list[Any]], max_series: int, run_id: Any = None, horizon: Any = None
+) -> BulkSeries:
+    histories = columns.get("target_history")
+    if not isinstance(histories, list) or not histories:
+        raise BulkPayloadError("target_history must be a non-empty list with one history per series")
+    n = len(histories)
+    # Checked before any series is converted.
+    if n > max_series:
+        raise _too_many_series(max_series, n)
+    ids = columns.get("series_ids") or [str(i) for i in range(n)]
+    for name in ("series_ids", "static_covariates", "known_future_covariates"):
+        col = columns.get(name)
+        if col is not None and (not isinstance(col, list) or len(col) != n):
+            raise BulkPayloadError(f"{name} must be a list with {n} entries")
+    if horizon is not None and (not isinstance(horizon, int) or isinstance(horizon, bool) or horizon < 1):
+        raise BulkPayloadError("horizon must be a positive integer")
+    return BulkSeries(
+        series_ids=[str(x) for x in ids],
+        histories=[_as_numeric_list(h) for h in histories],
+        static_covariates=_optional_column(columns.get("static_covariates") or [None] * n),
+        future_covariates=_optional_column(columns.get("known_future_covariates") or [None] * n),
+        run_id=str(run_id) if run_id else None,
+        horizon=horizon,
+    )
+
+
+def _parse_json(body: bytes, max_series: int) -> BulkSeries:
+    try:
+        payload = json.loads(body)
+    except ValueError as exc:
+        raise BulkPayloadError(f"invalid JSON body: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise BulkPayloadError("JSON body must be an object of parallel arrays")
+    return _from_columns(payload, max_series, run_id=payload.get("run_id"), horizon=payload.get("horizon"))
+
+
+def _parse_ndjson(body: bytes, max_series: int) -> BulkSeries:
+    rows: list[dict[str, Any]] = []
+    for lineno, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        if len(rows) >= max_series:
+            # Stop at the first line past the cap instead of decoding the rest.
+            raise _too_many_series(max_series)
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            raise BulkPayloadError(f"invalid NDJSON on line {lineno}: {exc}") from exc
+        if not isinstance(row, dict):
+            raise BulkPayloadError(f"NDJSON line {lineno} must be an object")
+        rows.append(row)
+    return _from_columns(
+        {
+            "series_ids": [row.get("series_id", str(i)) for i, row in enumerate(rows)],
+            "target_history": [row.get("target_history") for row in rows],
+            "static_covariates": [row.get("static_covariates") for row in rows],
+            "known_future_covariates": [row.get("known_future_covariates") for row in rows],
+        },
+        max_series,
+    )
+
+
+def _parse_arrow(body: bytes, max_series: int) -> BulkSeries:
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise BulkPayloadError("Arrow IPC payloads need the optional pyarrow dependency", status_code=415) from exc
+    try:
+        table = pa.ipc.open_stream(pa.BufferReader(body)).read_all()
+    except Exception:
+        try:
+            table = pa.ipc.open_file(pa.BufferReader(body)).read_all()
+        except Exception as exc:
+            raise BulkPayloadError(f"invalid Arrow IPC payload: {exc}") from exc
+    if table.num_rows > max_series:
+        raise _too_many_series(max_series, table.num_rows)
+    names = set(table.column_names)
+    columns = {
+        "series_ids": table.column("series_id").to_pylist() if "series_id" in names else None,
+        "target_history": table.column("target_history").to_pylist() if "target_history" in names else None,
+    }
+    for name in ("static_covariates", "known_future_covariates"):
+        if name in names:
+            columns[name] = table.column(name).to_pylist()
+    return _from_columns({k: v for k, v in columns.items() if v is not None}, max_series)
+
+
+def parse_bulk_payload(body: bytes, content_type: str | None, max_series: int = BULK_MAX_SERIES) -> BulkSeries:
+    """Decode ``body``; more than ``max_series`` series raise a 413 :class:`BulkPayloadError`."""
+    media_type = (content_type or "application/json").split(";")[0].strip().lower()
+    if media_type in ARROW_MEDIA_TYPES:
+        return _parse_arrow(body, max_series)
+    if media_type in NDJSON_MEDIA_TYPES:
+        return _parse_ndjson(body, max_series)
+    if media_type == "application/json":
+        return _parse_json(body, max_series)
+    raise BulkPayloadError(f"unsupported content type '{media_type}'", status_code=415)
+
+
+def _forecast_lines(series: BulkSeries, start: int, result: dict[str, Any]) -> list[str]:
+    predictions = result["predictions"].tolist()
+    quantiles = {label: arr.tolist() for label, arr in (result["quantiles"] or {}).items()}
+    lines = []
+    for i, row in enumerate(predictions):
+        line: dict[str, Any] = {
+            "type": "forecast",
+            "series_id": series.series_ids[start + i],
+            "predictions": row,
+            "runtime": result["runtime"],
+        }
+        if quantiles:
+            line["quantiles"] = {label: values[i] for label, values in quantiles.items()}
+        lines.append(json.dumps(line, ensure_ascii=False) + "\n")
+    return lines
+
+
+def bulk_chunk_job(
+    run_id: str, series: BulkSeries, resolved: dict[str, Any], runtimes: list[str], start: int, stop: int
+) -> Callable[[], dict[str, Any]]:
+    """A zero-argument job forecasting ``series[start:stop]`` for an inference pool."""
+    return functools.partial(
+        infer_bulk_chunk,
+        run_id=run_id,
+        resolved=resolved,
+        runtimes=runtimes,
+        horizon=series.horizon,
+        **series.chunk(start, stop),
+    )
+
+
+async def stream_bulk_forecast(
+    run_id: str,
+    series: BulkSeries,
+    resolved: dict[str, Any],
+    chunk_size: int,
+    timeout_s: float | None,
+    first: dict[str, Any],
+    started_at: float,
+) -> AsyncIterator[str]:
+    """Yield NDJSON lines; ``first`` is the already computed result of the first chunk.
+
+    The route computes that chunk before the response starts, so saturation
+    and deadline errors on it still become HTTP statuses.
+    """
+    chain = list(resolved["fallback_chain"])
+    meta = {
+        "type": "meta",
+        "run_id": run_id,
+        "n_series": len(series),
+        "chunk_size": chunk_size,
+        "runtime_stack": resolved["runtime_stack"],
+        "fallback_chain": chain,
+    }
+    yield json.dumps(meta) + "\n"
+
+    runtimes_used: dict[str, int] = {}
+    served = 0
+    chunks = 0
+    error: str | None = None
+    result = first
+    for start in range(0, len(series), chunk_size):
+        if start:
+            # Later chunks start from the runtime that served the previous one.
+            used = result["runtime"]
+            order = [used, *[r for r in chain if r != used]] if used in chain else chain
+            fn = bulk_chunk_job(run_id, series, resolved, order, start, start + chunk_size)
+            try:
+                result = await INFERENCE_POOLS.run(resolved["runtime_stack"], fn, timeout_s)
+            except Exception as exc:
+                error = str(exc)
+                stop = min(start + chunk_size, len(series))
+                yield (
+                    json.dumps({"type": "error", "chunk": chunks, "start": start, "stop": stop, "error": error}) + "\n"
+                )
+                break
+        chunks += 1
+        n = result["predictions"].shape[0]
+        served += n
+        runtimes_used[result["runtime"]] = runtimes_used.get(result["runtime"], 0) + n
+        for line in _forecast_lines(series, start, result):
+            yield line
+
+    summary = {
+        "type": "summary",
+        "ok": error is None,
+        "n_series": len(series),
+        "n_forecasts": served,
+        "chunks": chunks,
+        "runtimes": runtimes_used,
+        "rollout": first.get("rollout"),
+        "seconds": round(time.perf_counter() - started_at, 4),
+    }
+    yield json.dumps(summary) + "\n"
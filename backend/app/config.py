@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextvars
 import logging
 import os
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,42 @@ ARTIFACTS_DIR = Path(os.getenv("SPLINE_BACKEND_ARTIFACTS_DIR", str(ROOT_DIR / "a
 STORE_PATH = Path(
     os.getenv("SPLINE_BACKEND_STORE_PATH", str(ROOT_DIR / "backend" / "data" / "jobs_store.json"))
 ).resolve()
+# Per-job logs: newest lines kept in memory, all lines mirrored to rotating JSONL files.
+JOB_LOG_DIR = Path(os.getenv("SPLINE_BACKEND_JOB_LOG_DIR", str(STORE_PATH.parent / "job_logs"))).resolve()
+JOB_LOG_BUFFER = max(1, int(os.getenv("SPLINE_BACKEND_JOB_LOG_BUFFER", "5000")))
+JOB_LOG_MAX_BYTES = max(1024, int(os.getenv("SPLINE_BACKEND_JOB_LOG_MAX_BYTES", str(10 * 1024 * 1024))))
+JOB_LOG_BACKUPS = max(0, int(os.getenv("SPLINE_BACKEND_JOB_LOG_BACKUPS", "5")))
+# Write-behind delay for executor job-state updates (coalesced per job, flushed in one transaction).
+STORE_FLUSH_MS = max(0.0, float(os.getenv("SPLINE_BACKEND_STORE_FLUSH_MS", "200")))
+
+# Real-mode runner subprocesses allowed at once; each slot is pinned to its own share of the CPUs.
+JOB_MAX_CONCURRENT = max(
+    1, int(os.getenv("SPLINE_BACKEND_MAX_CONCURRENT_JOBS", str(max(1, (os.cpu_count() or 2) // 2))))
+)
+JOB_PIN_CPUS = os.getenv("SPLINE_BACKEND_PIN_CPUS", "1").strip().lower() not in {"0", "false", "no", "off"}
+# Opt-in warm workers: one long-lived process per slot with the runner (and TensorFlow) preloaded.
+WARM_WORKERS = os.getenv("SPLINE_BACKEND_WARM_WORKERS", "0").strip().lower() in {"1", "true", "yes", "on"}
+WARM_WORKER_CMD = os.getenv("SPLINE_BACKEND_WARM_WORKER_CMD", f"{sys.executable} -m src.training.warm_worker")
+WARM_PRELOAD = os.getenv("SPLINE_BACKEND_WARM_PRELOAD", "src.training.runner")
+WARM_MAX_JOBS = max(1, int(os.getenv("SPLINE_BACKEND_WARM_MAX_JOBS", "20")))
+WARM_MAX_RSS_GROWTH_MB = max(1.0, float(os.getenv("SPLINE_BACKEND_WARM_MAX_RSS_GROWTH_MB", "1024")))
+
+# Loaded inference sessions kept in memory (LRU, bounded by count and by model file size).
+MODEL_CACHE_MAX_ENTRIES = max(1, int(os.getenv("SPLINE_BACKEND_MODEL_CACHE_ENTRIES", "8")))
+MODEL_CACHE_MAX_MB = max(1.0, float(os.getenv("SPLINE_BACKEND_MODEL_CACHE_MB", "512")))
+# Per-runtime inference pools: workers (which also caps the micro-batch size), queue slots, default deadline.
+INFER_POOL_WORKERS = max(1, int(os.getenv("SPLINE_BACKEND_INFER_WORKERS", "8")))
+INFER_POOL_QUEUE = max(0, int(os.getenv("SPLINE_BACKEND_INFER_QUEUE", "32")))
+INFER_TIMEOUT_MS = max(1.0, float(os.getenv("SPLINE_BACKEND_INFER_TIMEOUT_MS", "30000")))
+# Concurrent /forecast/infer calls for one model are coalesced into batches (1 disables).
+# Only pool workers can call into a batch, so more than INFER_POOL_WORKERS could never be queued.
+INFER_BATCH_MAX_SIZE = max(1, min(int(os.getenv("SPLINE_BACKEND_INFER_BATCH_MAX_SIZE", "32")), INFER_POOL_WORKERS))
+INFER_BATCH_MAX_WAIT_MS = max(0.0, float(os.getenv("SPLINE_BACKEND_INFER_BATCH_MAX_WAIT_MS", "2")))
+# Bulk forecasting: series per batched predict call, and the most series one request may carry.
+BULK_CHUNK_SIZE = max(1, int(os.getenv("SPLINE_BACKEND_BULK_CHUNK_SIZE", "1024")))
+BULK_MAX_SERIES = max(1, int(os.getenv("SPLINE_BACKEND_BULK_MAX_SERIES", "100000")))
+# Bodies larger than this are refused with 413 before they are read.
+BULK_MAX_BYTES = max(1, int(os.getenv("SPLINE_BACKEND_BULK_MAX_MB", "512"))) * 1024 * 1024
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
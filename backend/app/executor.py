@@ -9,37 +9,107 @@ import sys
 import threading
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
-from backend.app.config import ARTIFACTS_DIR, ROOT_DIR
+from backend.app.config import ARTIFACTS_DIR, JOB_MAX_CONCURRENT, JOB_PIN_CPUS, ROOT_DIR, WARM_WORKERS
+from backend.app.joblog import JobLog, job_log_path, read_persisted
+from backend.app.progress import PROGRESS_EVENTS, append_progress_point, apply_progress, open_progress_pipe
 from backend.app.store import JobRecord, JobStore
-from backend.app.utils import sanitize_line, utc_now_iso
+from backend.app.warm_pool import WarmJob, WarmPool
+from src.training.progress import PROGRESS_FD_ENV
+
+# Synthetic mock jobs report "running" after 1s and complete this long after submission.
+MOCK_JOB_SECONDS = 3.0
+CANCELED_MESSAGE = (
+    "\uc0ac\uc6a9\uc790 \uc694\uccad\uc73c\ub85c \uc791\uc5c5\uc774 \ucde8\uc18c\ub418\uc5c8\uc2b5\ub2c8\ub2e4."
+)
+
+
+TERMINAL_STATUSES = frozenset({"succeeded", "failed", "canceled"})
+# Lower runs first; unknown classes queue behind batch.
+PRIORITY_RANK = {"interactive": 0, "batch": 1}
+
+
+def cpu_slots(n_slots: int, pin: bool = True) -> list[list[int] | None]:
+    """Split the CPUs this process may use into ``n_slots`` disjoint sets (shared round-robin if too few)."""
+    cpus = sorted(os.sched_getaffinity(0)) if pin and hasattr(os, "sched_getaffinity") else []
+    if not cpus:
+        return [None] * n_slots
+    if len(cpus) < n_slots:
+        return [[cpus[i % len(cpus)]] for i in range(n_slots)]
+    size, extra = divmod(len(cpus), n_slots)
+    slots: list[list[int] | None] = []
+    start = 0
+    for i in range(n_slots):
+        stop = start + size + (1 if i < extra else 0)
+        slots.append(cpus[start:stop])
+        start = stop
+    return slots
+
+
+@dataclass
+class QueuedJob:
+    job_id: str
+    run_id: str
+    priority: str
+    seq: int
+    resume: bool = False
+
+    def sort_key(self, running_by_run: dict[str, int]) -> tuple[int, int, int]:
+        # Priority class first, then fair share (fewest running jobs of the same run), then FIFO.
+        return (PRIORITY_RANK.get(self.priority, len(PRIORITY_RANK)), running_by_run.get(self.run_id, 0), self.seq)
 
 
 @dataclass
 class JobRuntime:
-    process: subprocess.Popen[str] | None = None
-    logs: list[dict[str, Any]] = field(default_factory=list)
-    lock: threading.Lock = field(default_factory=threading.Lock)
+    log: JobLog
+    process: subprocess.Popen[str] | WarmJob | None = None
     started_at: float = field(default_factory=time.time)
     finished_at: float | None = None
+    pumps: list[threading.Thread] = field(default_factory=list)
 
     def append_log(self, level: str, message: str, source: str = "runtime") -> None:
-        with self.lock:
-            self.logs.append({"ts": utc_now_iso(), "level": level, "source": source, "message": sanitize_line(message)})
-            if len(self.logs) > 5000:
-                self.logs = self.logs[-5000:]
+        self.log.append(level, message, source)
 
     def read_logs(self, offset: int, limit: int) -> list[dict[str, Any]]:
-        with self.lock:
-            return list(self.logs[offset : offset + limit])
+        return self.log.read(offset, limit)
 
 
 class JobExecutor:
-    def __init__(self, store: JobStore):
+    """Runs jobs in mock mode (timer) or as ``runner`` subprocesses in real mode.
+
+    Real jobs wait in a queue until one of ``max_concurrent`` slots frees up.
+    The next job is picked by priority class (interactive before batch).
+    Within a class, the run with the fewest running jobs goes first.  Ties go
+    to the earliest submission.  Each slot owns a disjoint set of CPUs.  The
+    runner is pinned to it and its thread pools are sized to match.  With
+    ``warm_workers`` each slot keeps a preloaded runner process (see
+    :mod:`backend.app.warm_pool`) instead of spawning one per job.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_concurrent: int = JOB_MAX_CONCURRENT,
+        pin_cpus: bool = JOB_PIN_CPUS,
+        warm_workers: bool = WARM_WORKERS,
+        artifacts_dir: Path = ARTIFACTS_DIR,
+    ):
         self.store = store
+        self.artifacts_dir = Path(artifacts_dir)
         self._runtimes: dict[str, JobRuntime] = {}
         self._lock = threading.Lock()
+        # Serializes read-modify-write of a running job's record between progress events and finalization.
+        self._record_lock = threading.Lock()
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._cpu_slots = cpu_slots(self.max_concurrent, pin=pin_cpus)
+        self._slots: list[QueuedJob | None] = [None] * self.max_concurrent
+        self._waiting: list[QueuedJob] = []
+        self._seq = 0
+        self.warm_pool = WarmPool(self._cpu_slots) if warm_workers else None
+        # Pending mock completions, cancelled by shutdown() so none fires after the app is gone.
+        self._mock_timers: dict[str, threading.Timer] = {}
 
     def _mode(self) -> str:
         return os.getenv("SPLINE_BACKEND_EXECUTOR_MODE", "auto").strip().lower()
@@ -62,26 +132,141 @@ class JobExecutor:
             return True
         return bool(shlex.split(os.getenv("SPLINE_BACKEND_RUNNER_CMD", "")))
 
-    def submit(self, rec: JobRecord) -> None:
+    def submit(self, rec: JobRecord, resume: bool = False) -> None:
+        """Start ``rec``; ``resume`` re-runs it from the runner's last epoch checkpoint."""
         if self.should_use_real():
             rec.execution_mode = "real"
-            self.store.upsert(rec)
-            self._start_real_job(rec)
+            rec.status = "queued"
+            rec.step = "queued"
+            rec.progress = 0
+            rec.message = "waiting for a worker slot"
+            self.store.upsert_later(rec)
+            with self._lock:
+                self._seq += 1
+                self._waiting.append(QueuedJob(rec.job_id, rec.run_id, rec.priority, self._seq, resume))
+            self._dispatch()
             return
 
         rec.execution_mode = "mock"
-        self.store.upsert(rec)
+        self.store.upsert_later(rec)
+        self._schedule_mock_completion(rec)
+
+    def _schedule_mock_completion(self, rec: JobRecord) -> None:
+        delay = max(0.0, rec.created_at + MOCK_JOB_SECONDS - time.time())
+        timer = threading.Timer(delay, self._complete_mock_job, args=(rec.job_id,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._mock_timers.pop(rec.job_id, None)
+            self._mock_timers[rec.job_id] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _complete_mock_job(self, job_id: str) -> None:
+        from backend.app.routes.jobs import ensure_mock_run_artifacts
+
+        with self._lock:
+            self._mock_timers.pop(job_id, None)
+        rec = self.store.get(job_id)
+        if rec is None or rec.canceled or rec.execution_mode != "mock" or rec.status in TERMINAL_STATUSES:
+            return
+        rec.status = "succeeded"
+        rec.step = "finished"
+        rec.progress = 100
+        rec.message = "completed"
+        ensure_mock_run_artifacts(rec, self.artifacts_dir)
+        self.store.upsert_later(rec)
+
+    def recover(self) -> int:
+        """Re-arm completion of mock jobs left unfinished by a previous process; returns how many."""
+        pending = [
+            rec
+            for rec in self.store.list_by_status(("queued", "running"))
+            if rec.execution_mode == "mock" and not rec.canceled
+        ]
+        for rec in pending:
+            self._schedule_mock_completion(rec)
+        return len(pending)
 
-    def _start_real_job(self, rec: JobRecord) -> None:
-        runtime = JobRuntime()
+    def shutdown(self) -> None:
+        """Cancel pending mock completions and retire warm workers; running subprocesses are left alone."""
         with self._lock:
+            timers = list(self._mock_timers.values())
+            self._mock_timers.clear()
+        for timer in timers:
+            timer.cancel()
+        if self.warm_pool is not None:
+            self.warm_pool.shutdown()
+
+    def _running_by_run_locked(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for job in self._slots:
+            if job is not None:
+                counts[job.run_id] = counts.get(job.run_id, 0) + 1
+        return counts
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while slots are free."""
+        while True:
+            with self._lock:
+                slot = next((i for i, job in enumerate(self._slots) if job is None), None)
+                if slot is None or not self._waiting:
+                    return
+                running = self._running_by_run_locked()
+                job = min(self._waiting, key=lambda q: q.sort_key(running))
+                self._waiting.remove(job)
+                self._slots[slot] = job
+            rec = self.store.get(job.job_id)
+            if rec is None or rec.canceled:
+                self._release(job, dispatch=False)
+                continue
+            if not self._start_real_job(rec, resume=job.resume, slot=slot):
+                self._release(job, dispatch=False)
+
+    def _release(self, queued: QueuedJob | None, dispatch: bool = True) -> None:
+        with self._lock:
+            # By identity: a resumed attempt of the same job may already hold another slot.
+            self._slots = [None if job is queued else job for job in self._slots]
+        if dispatch:
+            self._dispatch()
+
+    def queue_position(self, job_id: str) -> int | None:
+        """1-based position among waiting jobs in dispatch order, or None when not waiting."""
+        with self._lock:
+            running = self._running_by_run_locked()
+            waiting = list(self._waiting)
+        position = 0
+        while waiting:
+            position += 1
+            job = min(waiting, key=lambda q: q.sort_key(running))
+            if job.job_id == job_id:
+                return position
+            waiting.remove(job)
+            running[job.run_id] = running.get(job.run_id, 0) + 1
+        return None
+
+    def diagnostics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "running": [job.job_id for job in self._slots if job is not None],
+                "queued": len(self._waiting),
+                "cpu_slots": self._cpu_slots,
+                "warm_pool": self.warm_pool.stats() if self.warm_pool is not None else None,
+            }
+
+    def _start_real_job(self, rec: JobRecord, resume: bool = False, slot: int | None = None) -> bool:
+        with self._lock:
+            previous = self._runtimes.get(rec.job_id)
+            # A resumed job keeps appending to its log, so sequence numbers stay monotonic.
+            runtime = JobRuntime(log=previous.log if previous is not None else JobLog(rec.job_id))
             self._runtimes[rec.job_id] = runtime
 
-        args = self._command_template() + [
+        job_args = [
             "--run-id",
             rec.run_id,
             "--artifacts-dir",
-            str(ARTIFACTS_DIR),
+            str(self.artifacts_dir),
             "--model-type",
             rec.model_type,
             "--feature-mode",
@@ -91,29 +276,39 @@ class JobExecutor:
             "--verbose",
             "0",
         ]
+        if resume:
+            # Fail instead of silently retraining from scratch when no checkpoint survived.
+            job_args += ["--resume", "require"]
+        cpus = self._cpu_slots[slot] if slot is not None else None
 
         try:
-            process = subprocess.Popen(
-                args,
-                cwd=str(ROOT_DIR),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                start_new_session=True,
-            )
+            process: subprocess.Popen[str] | WarmJob
+            if self.warm_pool is not None and slot is not None:
+                process = self.warm_pool.submit(
+                    slot,
+                    rec.job_id,
+                    job_args,
+                    lambda level, line, source: runtime.append_log(level, line, source),
+                    on_progress=lambda event: self._on_progress(rec.job_id, event),
+                )
+                runtime.append_log(
+                    "INFO",
+                    f"dispatched to warm worker pid={process.pid} slot={slot} cpus={cpus or 'all'} "
+                    f"args={' '.join(job_args)}",
+                )
+            else:
+                process = self._spawn_runner(rec.job_id, self._command_template() + job_args, cpus, runtime)
             runtime.process = process
-            runtime.append_log("INFO", f"spawned pid={process.pid} cmd={' '.join(args)}")
             rec.status = "running"
             rec.step = "training"
             rec.progress = 5
-            rec.message = "runner started"
-            self.store.upsert(rec)
+            rec.message = "runner resumed" if resume else "runner started"
+            self.store.upsert_later(rec)
 
-            threading.Thread(target=self._pump_stream, args=(rec.job_id, process.stdout, "stdout"), daemon=True).start()
-            threading.Thread(target=self._pump_stream, args=(rec.job_id, process.stderr, "stderr"), daemon=True).start()
+            with self._lock:
+                queued = self._slots[slot] if slot is not None else None
             threading.Thread(
-                target=self._wait_and_finalize, args=(rec.job_id, process, self._timeout_sec()), daemon=True
+                target=self._wait_and_finalize, args=(rec.job_id, process, self._timeout_sec(), queued), daemon=True
             ).start()
         except Exception as exc:
             runtime.append_log("ERROR", f"executor spawn failed: {exc}")
@@ -122,7 +317,63 @@ class JobExecutor:
             rec.progress = 100
             rec.error_message = f"executor spawn failed: {exc}"
             rec.message = "runner failed to start"
-            self.store.upsert(rec)
+            self.store.upsert_later(rec)
+            runtime.finished_at = time.time()
+            return False
+        return True
+
+    def _spawn_runner(
+        self, job_id: str, args: list[str], cpus: list[int] | None, runtime: JobRuntime
+    ) -> subprocess.Popen[str]:
+        env = dict(os.environ)
+        if cpus:
+            # Size the runner's thread pools to its CPU share; explicit settings win.
+            for name in ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS"):
+                env.setdefault(name, str(len(cpus)))
+            env.setdefault("TF_NUM_INTEROP_THREADS", "1")
+
+        progress_fd, progress_reader = open_progress_pipe(lambda event: self._on_progress(job_id, event))
+        env[PROGRESS_FD_ENV] = str(progress_fd)
+        try:
+            process = subprocess.Popen(
+                args,
+                cwd=str(ROOT_DIR),
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                start_new_session=True,
+                pass_fds=(progress_fd,),
+            )
+        finally:
+            # Only the child keeps the write end open, so the reader sees EOF when the runner exits.
+            os.close(progress_fd)
+        if cpus:
+            try:
+                os.sched_setaffinity(process.pid, cpus)
+            except OSError as exc:
+                runtime.append_log("WARN", f"cpu pinning failed: {exc}")
+        runtime.append_log("INFO", f"spawned pid={process.pid} cpus={cpus or 'all'} cmd={' '.join(args)}")
+        pumps = [
+            threading.Thread(target=self._pump_stream, args=(job_id, process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=self._pump_stream, args=(job_id, process.stderr, "stderr"), daemon=True),
+        ]
+        for pump in pumps:
+            pump.start()
+        runtime.pumps = [*pumps, progress_reader]
+        return process
+
+    def _on_progress(self, job_id: str, event: dict[str, Any]) -> None:
+        if event.get("event") not in PROGRESS_EVENTS:
+            return
+        append_progress_point(job_id, event)
+        with self._record_lock:
+            rec = self.store.get(job_id)
+            # Events racing the start or the end of the process must not overwrite its status.
+            if rec is None or rec.status != "running" or not apply_progress(rec, event):
+                return
+            self.store.upsert_later(rec)
 
     def _pump_stream(self, job_id: str, stream: Any, source: str) -> None:
         if stream is None:
@@ -133,9 +384,19 @@ class JobExecutor:
                 return
             runtime.append_log("INFO" if source == "stdout" else "WARN", line, source=source)
 
-    def _wait_and_finalize(self, job_id: str, process: subprocess.Popen[str], timeout_sec: int) -> None:
-        from backend.app.routes.jobs import ensure_mock_run_artifacts
+    def _wait_and_finalize(
+        self,
+        job_id: str,
+        process: subprocess.Popen[str] | WarmJob,
+        timeout_sec: int,
+        queued: QueuedJob | None = None,
+    ) -> None:
+        try:
+            self._finalize(job_id, process, timeout_sec)
+        finally:
+            self._release(queued)
 
+    def _finalize(self, job_id: str, process: subprocess.Popen[str] | WarmJob, timeout_sec: int) -> None:
         runtime = self._runtimes.get(job_id)
         rec = self.store.get(job_id)
         if rec is None:
@@ -148,6 +409,22 @@ class JobExecutor:
             exit_code = -signal.SIGKILL
             if runtime:
                 runtime.append_log("ERROR", f"timeout exceeded ({timeout_sec}s)")
+            with self._record_lock:
+                rec = self.store.get(job_id)
+                if rec is not None:
+                    rec.error_message = f"timeout exceeded ({timeout_sec}s); resumable from the last epoch checkpoint"
+                    self.store.upsert_later(rec)
+
+        if runtime:
+            # Drain the output and progress pipes so the job's last lines precede "process finished".
+            for pump in runtime.pumps:
+                pump.join(timeout=2.0)
+
+        with self._record_lock:
+            self._finish_record(job_id, exit_code, runtime)
+
+    def _finish_record(self, job_id: str, exit_code: int, runtime: JobRuntime | None) -> None:
+        from backend.app.routes.jobs import ensure_mock_run_artifacts
 
         rec = self.store.get(job_id)
         if rec is None:
@@ -160,27 +437,28 @@ class JobExecutor:
             rec.status = "canceled"
             rec.step = "canceled"
             rec.message = "cancel accepted"
-            rec.error_message = (
-                rec.error_message
-                or "\uc0ac\uc6a9\uc790 \uc694\uccad\uc73c\ub85c \uc791\uc5c5\uc774 \ucde8\uc18c\ub418\uc5c8\uc2b5\ub2c8\ub2e4."
-            )
+            rec.error_message = rec.error_message or CANCELED_MESSAGE
         elif exit_code == 0:
             rec.status = "succeeded"
             rec.step = "finished"
             rec.message = "completed"
-            ensure_mock_run_artifacts(rec)
+            ensure_mock_run_artifacts(rec, self.artifacts_dir)
         else:
             rec.status = "failed"
             rec.step = "failed"
             rec.message = "failed"
             rec.error_message = rec.error_message or f"runner exited with code {exit_code}"
-        self.store.upsert(rec)
 
+        # The log is complete before the terminal status becomes visible, so log streams can end on it.
         if runtime:
-            runtime.finished_at = time.time()
             runtime.append_log("INFO", f"process finished exit_code={exit_code}")
+            runtime.log.close()
+        self.store.upsert_later(rec)
+        if runtime:
+            # Set last: once log_complete() holds, the terminal record is written and the job may be resumed.
+            runtime.finished_at = time.time()
 
-    def _terminate_process(self, process: subprocess.Popen[str]) -> None:
+    def _terminate_process(self, process: subprocess.Popen[str] | WarmJob) -> None:
         try:
             os.killpg(process.pid, signal.SIGTERM)
         except Exception:
@@ -195,7 +473,37 @@ class JobExecutor:
                 with contextlib.suppress(Exception):
                     process.kill()
 
-    def cancel(self, job_id: str) -> bool:
+    def cancel(self, job_id: str) -> JobRecord | None:
+        """Mark ``job_id`` canceled and stop it; None if there is no such job.
+
+        The record is rewritten under the record lock, so a progress event that read the job
+        before the cancel cannot queue its stale, not-canceled copy afterwards.
+        """
+        with self._record_lock:
+            rec = self.store.get(job_id)
+            if rec is None:
+                return None
+            rec.canceled = True
+            rec.status = "canceled"
+            rec.step = "canceled"
+            rec.progress = 100
+            rec.error_message = CANCELED_MESSAGE
+            rec.message = "cancel accepted"
+            self.store.upsert(rec)
+        self._stop(job_id)
+        return rec
+
+    def _stop(self, job_id: str) -> bool:
+        with self._lock:
+            timer = self._mock_timers.pop(job_id, None)
+            queued = [job for job in self._waiting if job.job_id == job_id]
+            for job in queued:
+                self._waiting.remove(job)
+        if timer is not None:
+            timer.cancel()
+            return True
+        if queued:
+            return True
         runtime = self._runtimes.get(job_id)
         if runtime and runtime.process and runtime.process.poll() is None:
             runtime.append_log("WARN", "cancel requested")
@@ -204,7 +512,20 @@ class JobExecutor:
         return False
 
     def logs(self, job_id: str, offset: int, limit: int) -> list[dict[str, Any]]:
+        """Lines with ``seq >= offset``; after a restart they are read back from the job's log files."""
         runtime = self._runtimes.get(job_id)
         if runtime is None:
-            return []
+            return read_persisted(job_log_path(job_id), offset, limit)
         return runtime.read_logs(offset, limit)
+
+    def job_log(self, job_id: str) -> JobLog | None:
+        """The live log of a job started by this process, or None."""
+        runtime = self._runtimes.get(job_id)
+        return runtime.log if runtime is not None else None
+
+    def log_complete(self, job_id: str) -> bool:
+        """True once no further lines will be appended to the job's log by this process."""
+        with self._lock:
+            queued = any(job.job_id == job_id for job in self._waiting)
+        runtime = self._runtimes.get(job_id)
+        return not queued and (runtime is None or runtime.finished_at is not None)
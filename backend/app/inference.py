@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 from backend.app.config import ARTIFACTS_DIR
+from backend.app.registry import MODEL_REGISTRY, ModelRegistry
 from backend.app.runtime import resolve_runtime_for_run
 
 
@@ -97,6 +100,47 @@ def _build_model_inputs(base_inputs: dict[str, Any], input_specs: list[dict[str,
     return inputs
 
 
+def _fill_right_aligned(rows: list[list[float]], width: int) -> np.ndarray:
+    """Stack ragged rows into ``[n, width]``, keeping each row's last ``width`` values right-aligned."""
+    out = np.zeros((len(rows), width), dtype=np.float32)
+    for i, row in enumerate(rows):
+        tail = row[-width:]
+        if tail:
+            out[i, width - len(tail) :] = tail
+    return out
+
+
+def build_bulk_model_inputs(
+    histories: list[list[float]],
+    input_specs: list[dict[str, Any]],
+    *,
+    static_covariates: list[list[float]] | None = None,
+    future_covariates: list[list[float]] | None = None,
+) -> list[np.ndarray]:
+    """Batched counterpart of :func:`_build_model_inputs`: one ``[n_series, ...]`` array per model input."""
+    n = len(histories)
+    statics = [s if s else h for s, h in zip(static_covariates or [[]] * n, histories, strict=True)]
+    futures = [f if f else h for f, h in zip(future_covariates or [[]] * n, histories, strict=True)]
+    if not input_specs:
+        lookback = max(1, max((len(h) for h in histories), default=1))
+        return [_fill_right_aligned(histories, lookback)[:, :, None]]
+
+    inputs: list[np.ndarray] = []
+    for idx, spec in enumerate(input_specs):
+        name = str(spec.get("name", f"input_{idx}")).lower()
+        shape = _normalize_input_shape(spec.get("shape"))
+        if len(shape) == 3:
+            _, timesteps, features = shape
+            arr = np.zeros((n, timesteps, features), dtype=np.float32)
+            arr[:, :, 0] = _fill_right_aligned(futures if "future" in name else histories, timesteps)
+        elif len(shape) == 2:
+            arr = _fill_right_aligned(statics if "static" in name else histories, shape[1])
+        else:
+            arr = _fill_right_aligned(histories, shape[0])
+        inputs.append(arr)
+    return inputs
+
+
 def _find_keras_checkpoint(run_id: str) -> Path | None:
     checkpoint_dir = ARTIFACTS_DIR / "checkpoints" / run_id
     for name in ("best.keras", "best.h5", "last.keras", "last.h5"):
@@ -106,24 +150,63 @@ def _find_keras_checkpoint(run_id: str) -> Path | None:
     return None
 
 
-def _predict_tflite(model_path: Path, model_inputs: list[np.ndarray]) -> np.ndarray:
-    from src.training.edge import run_tflite_inference
-
-    return np.asarray(run_tflite_inference(model_path, model_inputs), dtype=np.float32)
-
-
-def _predict_onnx(model_path: Path, model_inputs: list[np.ndarray]) -> np.ndarray:
-    from src.training.edge import run_onnx_inference
-
-    return np.asarray(run_onnx_inference(model_path, model_inputs), dtype=np.float32)
-
-
-def _predict_keras(model_path: Path, model_inputs: list[np.ndarray]) -> np.ndarray:
-    import tensorflow as tf
-
-    model = tf.keras.models.load_model(str(model_path), compile=False)
-    payload: Any = model_inputs if len(model_inputs) > 1 else model_inputs[0]
-    return np.asarray(model.predict(payload, verbose=0), dtype=np.float32)
+def _runtime_predictor(
+    registry: ModelRegistry, run_id: str, runtime: str, model_path: Path | None
+) -> Callable[[list[np.ndarray]], np.ndarray]:
+    """Return the registry's predict function for ``runtime``, loading the model on first use."""
+    if runtime not in {"tflite", "onnx", "numpy", "keras"}:
+        raise ValueError(f"unsupported runtime '{runtime}'")
+    if model_path is None:
+        raise FileNotFoundError("keras checkpoint not found" if runtime == "keras" else f"{runtime} model path missing")
+    return registry.get(run_id, runtime, model_path)
+
+
+def _runtime_model_path(run_id: str, runtime: str, runtime_compatibility: Any) -> Path | None:
+    runtime_row = runtime_compatibility.get(runtime, {}) if isinstance(runtime_compatibility, dict) else {}
+    model_path_raw = runtime_row.get("path") if isinstance(runtime_row, dict) else None
+    model_path = Path(str(model_path_raw)) if isinstance(model_path_raw, str) and model_path_raw else None
+    if runtime == "keras" and model_path is None:
+        model_path = _find_keras_checkpoint(run_id)
+    return model_path
+
+
+def _rollout_to_horizon(
+    predict: Callable[[list[np.ndarray]], np.ndarray],
+    model_inputs: list[np.ndarray],
+    input_specs: list[dict[str, Any]],
+    first_block: np.ndarray,
+    horizon: int,
+) -> tuple[np.ndarray, dict[str, Any]]:
+    """Extend a single-window forecast to ``horizon`` steps with hybrid rollout.
+
+    Only univariate past-window models (optionally with static inputs) can be
+    rolled out; future-covariate inputs would need values beyond the request.
+    """
+    from src.training.rollout import RolloutEngine
+
+    names = [str(spec.get("name", "")).lower() for spec in input_specs]
+    past = model_inputs[0]
+    if any("future" in name for name in names) or past.ndim != 3 or past.shape[2] != 1:
+        return first_block, {"applied": False, "reason": "rollout needs a univariate past-only model"}
+    static = model_inputs[1] if len(model_inputs) > 1 else None
+    # ``first_block`` is one series' ``[model_horizon]`` or a bulk ``[n_series, model_horizon]``.
+    model_horizon = int(first_block.shape[-1])
+    engine = RolloutEngine(predict, sequence_length=past.shape[1], model_horizon=model_horizon)
+    extended = engine.forecast(past, horizon=horizon, strategy="hybrid", static=static)
+    extended = extended.reshape(*first_block.shape[:-1], horizon)
+    return extended, {"applied": True, **engine.last_stats, "model_horizon": model_horizon}
+
+
+def _split_quantiles(prediction: np.ndarray, quantiles: list[float]) -> tuple[np.ndarray, dict[str, list[float]]]:
+    """Split a flat ``[horizon * n_quantiles]`` quantile-head output into the median and named quantiles."""
+    from src.training.baselines import quantile_label
+
+    if prediction.size % len(quantiles):
+        raise ValueError(f"output size {prediction.size} is not a multiple of {len(quantiles)} quantiles")
+    table = prediction.reshape(-1, len(quantiles))
+    named = {quantile_label(q): [float(x) for x in table[:, i]] for i, q in enumerate(quantiles)}
+    median = int(np.argmin(np.abs(np.asarray(quantiles) - 0.5)))
+    return table[:, median], named
 
 
 def infer_with_runtime_fallback(
@@ -131,12 +214,20 @@ def infer_with_runtime_fallback(
     run_id: str,
     base_inputs: dict[str, Any],
     preferred_order: list[str] | None = None,
+    registry: ModelRegistry | None = None,
+    resolved: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    resolved = resolve_runtime_for_run(run_id=run_id, preferred_order=preferred_order)
+    registry = registry or MODEL_REGISTRY
+    resolved = resolved or resolve_runtime_for_run(run_id=run_id, preferred_order=preferred_order)
+    registry.check_manifest(run_id, resolved.get("manifest_path"))
     runtime_compatibility = resolved.get("runtime_compatibility", {})
-    manifest = resolved.get("manifest") if isinstance(resolved.get("manifest"), dict) else {}
-    input_specs = manifest.get("input_specs") if isinstance(manifest.get("input_specs"), list) else []
+    raw_manifest = resolved.get("manifest")
+    manifest: dict[str, Any] = raw_manifest if isinstance(raw_manifest, dict) else {}
+    raw_specs = manifest.get("input_specs")
+    input_specs: list[dict[str, Any]] = raw_specs if isinstance(raw_specs, list) else []
     model_inputs = _build_model_inputs(base_inputs, input_specs)
+    requested_horizon = base_inputs.get("horizon")
+    quantile_levels = manifest.get("quantiles") if isinstance(manifest.get("quantiles"), list) else None
 
     fallback_chain = resolved.get("fallback_chain")
     if not isinstance(fallback_chain, list) or not fallback_chain:
@@ -144,29 +235,24 @@ def infer_with_runtime_fallback(
 
     attempts: list[dict[str, Any]] = []
     for runtime in [x for x in fallback_chain if isinstance(x, str) and x]:
-        runtime_row = runtime_compatibility.get(runtime, {}) if isinstance(runtime_compatibility, dict) else {}
-        model_path_raw = runtime_row.get("path")
-        model_path = Path(str(model_path_raw)) if isinstance(model_path_raw, str) and model_path_raw else None
-        if runtime == "keras" and model_path is None:
-            model_path = _find_keras_checkpoint(run_id)
-
+        model_path = _runtime_model_path(run_id, runtime, runtime_compatibility)
         try:
-            if runtime == "tflite":
-                if model_path is None:
-                    raise FileNotFoundError("tflite model path missing")
-                prediction = _predict_tflite(model_path, model_inputs)
-            elif runtime == "onnx":
-                if model_path is None:
-                    raise FileNotFoundError("onnx model path missing")
-                prediction = _predict_onnx(model_path, model_inputs)
-            elif runtime == "keras":
-                if model_path is None:
-                    raise FileNotFoundError("keras checkpoint not found")
-                prediction = _predict_keras(model_path, model_inputs)
-            else:
-                raise ValueError(f"unsupported runtime '{runtime}'")
-
-            flat = np.asarray(prediction, dtype=np.float32).reshape(-1).tolist()
+            predict = _runtime_predictor(registry, run_id, runtime, model_path)
+            prediction = np.asarray(predict(model_inputs), dtype=np.float32).reshape(-1)
+            quantiles: dict[str, list[float]] | None = None
+            if quantile_levels:
+                # All quantiles come from the same forward pass; the median is the point forecast.
+                prediction, quantiles = _split_quantiles(prediction, [float(q) for q in quantile_levels])
+            rollout: dict[str, Any] = {"applied": False}
+            if isinstance(requested_horizon, int) and requested_horizon > prediction.size:
+                if quantiles is not None:
+                    rollout = {"applied": False, "reason": "quantile-head models are not rolled out"}
+                else:
+                    prediction, rollout = _rollout_to_horizon(
+                        predict, model_inputs, input_specs, prediction, requested_horizon
+                    )
+
+            flat = prediction.tolist()
             attempts.append({"runtime": runtime, "ok": True, "model_path": str(model_path) if model_path else None})
             return {
                 "runtime_stack_requested": resolved.get("runtime_stack"),
@@ -174,6 +260,8 @@ def infer_with_runtime_fallback(
                 "runtime_used": runtime,
                 "fallback_used": runtime != resolved.get("runtime_stack"),
                 "predictions": [float(x) for x in flat],
+                "quantiles": quantiles,
+                "rollout": rollout,
                 "attempts": attempts,
                 "manifest_path": resolved.get("manifest_path"),
             }
@@ -195,6 +283,139 @@ def infer_with_runtime_fallback(
         "runtime_used": "naive",
         "fallback_used": True,
         "predictions": [float(x) for x in naive],
+        "quantiles": None,
+        "rollout": {"applied": False},
         "attempts": attempts,
         "manifest_path": resolved.get("manifest_path"),
     }
+
+
+def warm_runtime_models(
+    *,
+    run_id: str,
+    preferred_order: list[str] | None = None,
+    include_fallbacks: bool = False,
+    registry: ModelRegistry | None = None,
+) -> dict[str, Any]:
+    """Load the run's primary runtime (or its whole fallback chain) and run one dummy forward pass.
+
+    The dummy pass pays for graph tracing and buffer allocation up front so the
+    first real request is served at steady-state latency.
+    """
+    registry = registry or MODEL_REGISTRY
+    resolved = resolve_runtime_for_run(run_id=run_id, preferred_order=preferred_order)
+    registry.check_manifest(run_id, resolved.get("manifest_path"))
+    manifest = resolved.get("manifest")
+    specs = manifest.get("input_specs") if isinstance(manifest, dict) else None
+    model_inputs = _build_model_inputs({}, specs if isinstance(specs, list) else [])
+    chain = [x for x in resolved.get("fallback_chain", []) if isinstance(x, str) and x]
+    runtimes = chain if include_fallbacks else chain[:1]
+
+    warmed: list[dict[str, Any]] = []
+    for runtime in runtimes:
+        model_path = _runtime_model_path(run_id, runtime, resolved.get("runtime_compatibility"))
+        was_cached = registry.contains(run_id, runtime)
+        start = time.perf_counter()
+        try:
+            _runtime_predictor(registry, run_id, runtime, model_path)(model_inputs)
+            row: dict[str, Any] = {"runtime": runtime, "ok": True}
+        except Exception as exc:
+            row = {"runtime": runtime, "ok": False, "error": str(exc)}
+        row.update(
+            model_path=str(model_path) if model_path else None,
+            cached=was_cached,
+            seconds=round(time.perf_counter() - start, 4),
+        )
+        warmed.append(row)
+    return {
+        "runtime_stack": resolved.get("runtime_stack"),
+        "fallback_chain": chain,
+        "warmed": warmed,
+        "registry": registry.stats(),
+    }
+
+
+def infer_bulk_chunk(
+    *,
+    run_id: str,
+    resolved: dict[str, Any],
+    runtimes: list[str],
+    histories: list[list[float]],
+    static_covariates: list[list[float]] | None = None,
+    future_covariates: list[list[float]] | None = None,
+    horizon: int | None = None,
+    registry: ModelRegistry | None = None,
+) -> dict[str, Any]:
+    """Forecast one chunk of series with a single batched call per runtime attempt.
+
+    ``runtimes`` is tried in order, like the single-series fallback chain; the
+    naive forecast is used only when all of them fail.  Returns
+    ``predictions`` as ``[n_series, horizon]`` and, for quantile-head models,
+    ``quantiles`` mapping each label to an ``[n_series, horizon]`` array.
+    """
+    registry = registry or MODEL_REGISTRY
+    registry.check_manifest(run_id, resolved.get("manifest_path"))
+    manifest = resolved.get("manifest")
+    manifest = manifest if isinstance(manifest, dict) else {}
+    specs = manifest.get("input_specs")
+    input_specs = specs if isinstance(specs, list) else []
+    levels = manifest.get("quantiles")
+    quantile_levels = [float(q) for q in levels] if isinstance(levels, list) and levels else None
+    model_inputs = build_bulk_model_inputs(
+        histories, input_specs, static_covariates=static_covariates, future_covariates=future_covariates
+    )
+    n = len(histories)
+
+    attempts: list[dict[str, Any]] = []
+    for runtime in runtimes:
+        model_path = _runtime_model_path(run_id, runtime, resolved.get("runtime_compatibility"))
+        try:
+            predict = _runtime_predictor(registry, run_id, runtime, model_path)
+            prediction = np.asarray(predict(model_inputs), dtype=np.float32).reshape(n, -1)
+            quantiles: dict[str, np.ndarray] | None = None
+            if quantile_levels:
+                from src.training.baselines import quantile_label
+
+                if prediction.shape[1] % len(quantile_levels):
+                    raise ValueError(
+                        f"output size {prediction.shape[1]} is not a multiple of {len(quantile_levels)} quantiles"
+                    )
+                table = prediction.reshape(n, -1, len(quantile_levels))
+                quantiles = {quantile_label(q): table[:, :, i] for i, q in enumerate(quantile_levels)}
+                prediction = table[:, :, int(np.argmin(np.abs(np.asarray(quantile_levels) - 0.5)))]
+            rollout: dict[str, Any] = {"applied": False}
+            if horizon is not None and horizon > prediction.shape[1]:
+                if quantiles is not None:
+                    rollout = {"applied": False, "reason": "quantile-head models are not rolled out"}
+                else:
+                    prediction, rollout = _rollout_to_horizon(predict, model_inputs, input_specs, prediction, horizon)
+            attempts.append({"runtime": runtime, "ok": True})
+            return {
+                "runtime": runtime,
+                "predictions": prediction,
+                "quantiles": quantiles,
+                "rollout": rollout,
+                "attempts": attempts,
+            }
+        except Exception as exc:
+            attempts.append({"runtime": runtime, "ok": False, "error": str(exc)})
+
+    naive_horizon = horizon if horizon is not None and horizon > 0 else 1
+    naive = [
+        _naive_forecast(
+            {
+                "horizon": naive_horizon,
+                "target_history": history,
+                "known_future_covariates": (future_covariates[i] if future_covariates else []),
+            }
+        )
+        for i, history in enumerate(histories)
+    ]
+    attempts.append({"runtime": "naive", "ok": True})
+    return {
+        "runtime": "naive",
+        "predictions": np.asarray(naive, dtype=np.float32).reshape(n, naive_horizon),
+        "quantiles": None,
+        "rollout": {"applied": False},
+        "attempts": attempts,
+    }
@@ -0,0 +1,133 @@
+"""Bounded per-runtime thread pools for the async inference routes.
+
+Inference runs on a dedicated pool per primary runtime instead of Starlette's
+shared threadpool, so slow TFLite/Keras calls cannot starve ``/health`` or
+``/jobs``.  Admission is checked before submitting.  A request is rejected
+with :class:`InferenceSaturatedError` (HTTP 429) when ``workers + queue``
+requests are already in flight.  It is rejected with
+:class:`RuntimeUnavailableError` (HTTP 503) when every worker is stuck on a
+call that outlived its deadline.  A deadline that expires raises
+:class:`TimeoutError` (HTTP 504).  The worker thread cannot be interrupted:
+it keeps its slot until the call returns, so a wedged runtime only ever
+exhausts its own pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from backend.app.config import INFER_POOL_QUEUE, INFER_POOL_WORKERS
+
+
+class InferenceSaturatedError(RuntimeError):
+    """The runtime's pool has no free worker or queue slot."""
+
+
+class RuntimeUnavailableError(RuntimeError):
+    """Every worker of the runtime's pool is stuck past its deadline."""
+
+
+class RuntimePool:
+    def __init__(self, runtime: str, max_workers: int = INFER_POOL_WORKERS, max_queue: int = INFER_POOL_QUEUE) -> None:
+        self.runtime = runtime
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"infer-{runtime}")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stuck: set[Future[Any]] = set()
+        self._counters = {"submitted": 0, "completed": 0, "rejected": 0, "unavailable": 0, "timed_out": 0}
+
+    def _admit(self) -> None:
+        with self._lock:
+            if len(self._stuck) >= self.max_workers:
+                self._counters["unavailable"] += 1
+                raise RuntimeUnavailableError(
+                    f"{self.runtime} runtime unavailable: all {self.max_workers} workers exceeded their deadline"
+                )
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._counters["rejected"] += 1
+                raise InferenceSaturatedError(f"{self.runtime} inference pool saturated ({self._in_flight} in flight)")
+            self._in_flight += 1
+            self._counters["submitted"] += 1
+
+    def _release(self, fut: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._stuck.discard(fut)
+            if not fut.cancelled():
+                self._counters["completed"] += 1
+
+    async def run(self, fn: Callable[[], Any], timeout_s: float | None) -> Any:
+        self._admit()
+        fut = self._executor.submit(fn)
+        fut.add_done_callback(self._release)
+        try:
+            # On timeout wait_for cancels the wrapper, which cancels ``fut`` if it is still queued.
+            return await asyncio.wait_for(asyncio.wrap_future(fut), timeout_s)
+        except asyncio.TimeoutError:  # not the builtin TimeoutError before Python 3.11
+            with self._lock:
+                self._counters["timed_out"] += 1
+                # A running call cannot be cancelled and keeps its worker until it returns.
+                if not fut.done():
+                    self._stuck.add(fut)
+            raise TimeoutError(f"{self.runtime} inference exceeded its {timeout_s:.3f}s deadline") from None
+
+    def busy_workers(self) -> int:
+        """Calls currently running on a worker; queued ones wait for a worker to free up."""
+        with self._lock:
+            return min(self._in_flight, self.max_workers)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "stuck": len(self._stuck),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class InferencePools:
+    """Lazily created :class:`RuntimePool` per runtime name."""
+
+    def __init__(self, max_workers: int = INFER_POOL_WORKERS, max_queue: int = INFER_POOL_QUEUE) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._pools: dict[str, RuntimePool] = {}
+
+    def pool(self, runtime: str) -> RuntimePool:
+        with self._lock:
+            if runtime not in self._pools:
+                self._pools[runtime] = RuntimePool(runtime, self.max_workers, self.max_queue)
+            return self._pools[runtime]
+
+    async def run(self, runtime: str, fn: Callable[[], Any], timeout_s: float | None) -> Any:
+        return await self.pool(runtime).run(fn, timeout_s)
+
+    def busy_workers(self) -> int:
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.busy_workers() for pool in pools)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {name: pool.stats() for name, pool in self._pools.items()}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for pool in self._pools.values():
+                pool.shutdown()
+            self._pools.clear()
+
+
+INFERENCE_POOLS = InferencePools()
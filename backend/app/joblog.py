@@ -0,0 +1,175 @@
+"""Per-job log: an in-memory ring buffer with sequence numbers, mirrored to rotating JSONL files.
+
+Every line gets a per-job ``seq`` that keeps counting across resumes and
+backend restarts.  Clients page with ``offset`` = the next ``seq`` they want,
+and SSE clients resume with ``Last-Event-ID``.  The newest ``buffer_size``
+lines are served from memory.  Older lines are read back from
+``<job_id>.jsonl`` and its rotated siblings ``<job_id>.jsonl.1`` ..
+``.jsonl.<backups>`` (``.1`` is the most recent).  Rotation happens when the
+current file reaches ``max_bytes``.  Async waiters (the SSE route) are woken
+from the appending thread through their event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import IO, Any
+
+from backend.app.config import JOB_LOG_BACKUPS, JOB_LOG_BUFFER, JOB_LOG_DIR, JOB_LOG_MAX_BYTES
+from backend.app.utils import sanitize_line, utc_now_iso
+
+
+def job_log_path(job_id: str, log_dir: Path | None = None) -> Path:
+    return (log_dir or JOB_LOG_DIR) / f"{job_id}.jsonl"
+
+
+def _log_files(path: Path, backups: int) -> list[Path]:
+    """Existing files of one job log, oldest first."""
+    rotated = [path.with_name(f"{path.name}.{i}") for i in range(backups, 0, -1)]
+    return [p for p in (*rotated, path) if p.exists()]
+
+
+def _iter_file(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as f:
+        for raw in f:
+            try:
+                yield json.loads(raw)
+            except ValueError:
+                continue  # a line torn by a crash mid-write
+
+
+def read_persisted(path: Path, offset: int, limit: int, backups: int = JOB_LOG_BACKUPS) -> list[dict[str, Any]]:
+    """Lines with ``seq >= offset`` from the files on disk, oldest first."""
+    out: list[dict[str, Any]] = []
+    for file in _log_files(path, backups):
+        for line in _iter_file(file):
+            if int(line.get("seq", -1)) >= offset:
+                out.append(line)
+                if len(out) >= limit:
+                    return out
+    return out
+
+
+def _last_seq(path: Path, backups: int) -> int:
+    for file in reversed(_log_files(path, backups)):
+        last = -1
+        for line in _iter_file(file):
+            last = max(last, int(line.get("seq", -1)))
+        if last >= 0:
+            return last
+    return -1
+
+
+class JobLog:
+    def __init__(
+        self,
+        job_id: str,
+        log_dir: Path | None = None,
+        buffer_size: int = JOB_LOG_BUFFER,
+        max_bytes: int = JOB_LOG_MAX_BYTES,
+        backups: int = JOB_LOG_BACKUPS,
+    ) -> None:
+        self.job_id = job_id
+        self.path = job_log_path(job_id, log_dir)
+        self.max_bytes = max(1, int(max_bytes))
+        self.backups = max(0, int(backups))
+        self._lock = threading.Lock()
+        self._lines: deque[dict[str, Any]] = deque(maxlen=max(1, int(buffer_size)))
+        # Continue numbering after whatever an earlier process already wrote for this job.
+        self.next_seq = _last_seq(self.path, self.backups) + 1
+        self._file: IO[str] | None = None
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    def append(self, level: str, message: str, source: str = "runtime") -> dict[str, Any]:
+        with self._lock:
+            line = {
+                "seq": self.next_seq,
+                "ts": utc_now_iso(),
+                "level": level,
+                "source": source,
+                "message": sanitize_line(message),
+            }
+            self.next_seq += 1
+            self._lines.append(line)
+            self._write_locked(line)
+            waiters, self._waiters = self._waiters, []
+        for loop, fut in waiters:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(_resolve, fut)
+        return line
+
+    def _write_locked(self, line: dict[str, Any]) -> None:
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(json.dumps(line, ensure_ascii=False) + "\n")
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate_locked()
+        except OSError:
+            # The in-memory buffer still has the line; losing the on-disk copy must not fail the job.
+            self._close_locked()
+
+    def _rotate_locked(self) -> None:
+        assert self._file is not None
+        self._file.close()
+        self._file = None
+        if self.backups == 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for i in range(self.backups, 0, -1):
+            src = self.path if i == 1 else self.path.with_name(f"{self.path.name}.{i - 1}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i}"))
+
+    def read(self, offset: int, limit: int) -> list[dict[str, Any]]:
+        """Up to ``limit`` lines with ``seq >= offset``; lines older than the buffer come from disk."""
+        with self._lock:
+            oldest = self._lines[0]["seq"] if self._lines else self.next_seq
+            if offset >= oldest:
+                start = offset - oldest
+                return list(itertools.islice(self._lines, start, start + limit))
+        older = read_persisted(self.path, offset, limit, self.backups)
+        older = [line for line in older if line["seq"] < oldest]
+        return older + self.read(oldest, limit - len(older)) if len(older) < limit else older
+
+    async def wait(self, after_seq: int, timeout: float) -> bool:
+        """Wait until a line with ``seq > after_seq`` exists; False on timeout."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[None] = loop.create_future()
+        with self._lock:
+            if self.next_seq > after_seq + 1:
+                return True
+            self._waiters.append((loop, fut))
+        try:
+            await asyncio.wait_for(fut, timeout)
+            return True
+        except asyncio.TimeoutError:  # not the builtin TimeoutError before Python 3.11
+            return False
+        finally:
+            with self._lock:
+                self._waiters = [w for w in self._waiters if w[1] is not fut]
+
+    def close(self) -> None:
+        """Release the file handle; a later append reopens it."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._file is not None:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+
+
+def _resolve(fut: asyncio.Future[None]) -> None:
+    if not fut.done():
+        fut.set_result(None)
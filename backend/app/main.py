@@ -8,9 +8,13 @@ so that route handlers can import them via lazy imports.
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from backend.app.config import _REQUEST_ID, API_PREFIX, SECURITY, STORE_PATH, logger
 from backend.app.executor import JobExecutor
+from backend.app.inference_pool import INFERENCE_POOLS
+from backend.app.registry import MODEL_REGISTRY
 from backend.app.routes import agent, forecast, health, jobs, runs, tollama
 from backend.app.store import JobRecord, JobStore  # noqa: F401 - re-exported for backward compat
 from fastapi import FastAPI, HTTPException, Request
@@ -24,13 +28,23 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 # ---------------------------------------------------------------------------
 store = JobStore(STORE_PATH)
 executor = JobExecutor(store)
+executor.recover()
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    executor.shutdown()
+
 
 # ---------------------------------------------------------------------------
 # App creation
 # ---------------------------------------------------------------------------
-app = FastAPI(title="spline-lstm backend skeleton", version="0.2.0")
+app = FastAPI(title="spline-lstm backend skeleton", version="0.2.0", lifespan=_lifespan)
 app.state.store = store
 app.state.executor = executor
+app.state.model_registry = MODEL_REGISTRY
+app.state.inference_pools = INFERENCE_POOLS
 
 if SECURITY["trusted_hosts"]:
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=SECURITY["trusted_hosts"])
@@ -79,10 +93,11 @@ async def _security_middleware(request: Request, call_next):
 
 @app.exception_handler(HTTPException)
 async def _http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    if exc.status_code >= 500:
+    # 503/504 carry backpressure and deadline messages meant for the client; other 5xx stay sanitized.
+    if exc.status_code >= 500 and exc.status_code not in {503, 504}:
         logger.exception("HTTPException path=%s detail=%s", request.url.path, exc.detail)
         return JSONResponse(status_code=exc.status_code, content={"ok": False, "error": "internal server error"})
-    return JSONResponse(status_code=exc.status_code, content={"ok": False, "error": exc.detail})
+    return JSONResponse(status_code=exc.status_code, content={"ok": False, "error": exc.detail}, headers=exc.headers)
 
 
 @app.exception_handler(RequestValidationError)
@@ -11,6 +11,7 @@ class RunRequest(BaseModel):
     model_type: str | None = None
     model: str | None = None
     feature_mode: str | None = "univariate"
+    priority: str = Field(default="interactive", pattern="^(interactive|batch)$")
     model_config_payload: dict[str, Any] | None = Field(default=None, alias="model_config")
 
 
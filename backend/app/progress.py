@@ -0,0 +1,123 @@
+"""Structured training progress from runner processes.
+
+The runner writes JSON-lines events (see :mod:`src.training.progress`) to a
+pipe inherited as ``$SPLINE_PROGRESS_FD``.  :func:`open_progress_pipe` creates
+that pipe and a reader thread.  :func:`apply_progress` folds an event into the
+job's record (epoch, loss, val_loss, samples/sec, ETA and the progress
+percentage).  Every event is also appended to ``<job_id>.progress.jsonl`` next
+to the job's log, which is the metrics time series served by
+``GET /jobs/{job_id}/progress``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from backend.app.config import JOB_LOG_DIR, logger
+from backend.app.store import JobRecord
+
+PROGRESS_EVENTS = {"train_begin", "step", "epoch", "train_end"}
+# Record field -> type of the matching event field.
+TRAINING_FIELDS: dict[str, type] = {
+    "epoch": int,
+    "epochs": int,
+    "loss": float,
+    "val_loss": float,
+    "samples_per_sec": float,
+    "eta_s": float,
+}
+
+ProgressHandler = Callable[[dict[str, Any]], None]
+
+
+def open_progress_pipe(on_event: ProgressHandler) -> tuple[int, threading.Thread]:
+    """Return the write end for the child and the started reader thread.
+
+    The child gets the write end through ``pass_fds`` and ``$SPLINE_PROGRESS_FD``
+    (``src.training.progress.PROGRESS_FD_ENV``).  The caller closes its copy once the child has
+    been spawned, so the reader ends when the child exits.
+    """
+    read_fd, write_fd = os.pipe()
+    thread = threading.Thread(target=_read_events, args=(read_fd, on_event), daemon=True)
+    thread.start()
+    return write_fd, thread
+
+
+def _read_events(fd: int, on_event: ProgressHandler) -> None:
+    with os.fdopen(fd, "r", encoding="utf-8", errors="replace") as stream:
+        for line in stream:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            try:
+                on_event(event)
+            except Exception as exc:
+                logger.warning("progress_event_failed event=%s error=%s", event.get("event"), exc)
+
+
+def apply_progress(rec: JobRecord, event: dict[str, Any]) -> bool:
+    """Fold a progress event into ``rec``; False for events that are not training progress."""
+    kind = event.get("event")
+    if kind not in PROGRESS_EVENTS:
+        return False
+    for name, cast in TRAINING_FIELDS.items():
+        value = event.get(name)
+        if value is None:
+            continue
+        with contextlib.suppress(TypeError, ValueError):
+            setattr(rec, name, cast(value))
+    fraction = 1.0 if kind == "train_end" else event.get("fraction")
+    if kind == "train_end":
+        rec.eta_s = 0.0
+    if isinstance(fraction, (int, float)):
+        # 5% means "runner started" and 100% is set when the process exits; training fills the rest.
+        rec.progress = max(rec.progress or 0, min(95, 5 + int(90 * float(fraction))))
+    rec.step = "training"
+    if rec.epoch and rec.epochs:
+        rec.message = f"epoch {rec.epoch}/{rec.epochs}"
+    return True
+
+
+def training_snapshot(rec: JobRecord) -> dict[str, Any] | None:
+    values = {name: getattr(rec, name) for name in TRAINING_FIELDS}
+    return values if any(v is not None for v in values.values()) else None
+
+
+def progress_path(job_id: str) -> Path:
+    return JOB_LOG_DIR / f"{job_id}.progress.jsonl"
+
+
+def append_progress_point(job_id: str, event: dict[str, Any]) -> None:
+    path = progress_path(job_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    except OSError as exc:
+        logger.warning("progress_persist_failed job_id=%s error=%s", job_id, exc)
+
+
+def read_progress_points(job_id: str, limit: int, kinds: set[str] | None = None) -> list[dict[str, Any]]:
+    """The last ``limit`` recorded events of the job (optionally only ``kinds``), oldest first."""
+    path = progress_path(job_id)
+    if not path.exists():
+        return []
+    points: list[dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as f:
+        for raw in f:
+            try:
+                event = json.loads(raw)
+            except ValueError:
+                continue
+            if kinds is None or event.get("event") in kinds:
+                points.append(event)
+    return points[-limit:]
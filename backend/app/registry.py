@@ -0,0 +1,213 @@
+"""In-process registry of loaded inference sessions.
+
+Sessions are keyed by ``(run_id, runtime, sha256 of the model file)`` so a
+re-exported model is never served stale, and the whole run is dropped when its
+export manifest changes.  The registry is an LRU bounded by entry count and by
+the summed model file sizes (a proxy for resident weights).  Cached sessions
+are wrapped in a :class:`~backend.app.batching.MicroBatcher`, so concurrent
+requests for the same model share one forward pass.  The batch leader only
+waits for calls that are running on an inference pool worker.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from backend.app.batching import BatchingStats, MicroBatcher
+from backend.app.config import (
+    INFER_BATCH_MAX_SIZE,
+    INFER_BATCH_MAX_WAIT_MS,
+    MODEL_CACHE_MAX_ENTRIES,
+    MODEL_CACHE_MAX_MB,
+)
+from backend.app.inference_pool import INFERENCE_POOLS
+
+Predictor = Callable[[list[np.ndarray]], np.ndarray]
+RegistryKey = tuple[str, str, str]
+
+
+def _default_loader(runtime: str, model_path: Path) -> Predictor:
+    from src.training.edge import load_runtime_session
+
+    return load_runtime_session(runtime, model_path)
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass
+class _Entry:
+    predict: Predictor
+    model_path: str
+    size_bytes: int
+    load_seconds: float
+    hits: int = 0
+
+
+class ModelRegistry:
+    def __init__(
+        self,
+        max_entries: int = MODEL_CACHE_MAX_ENTRIES,
+        max_bytes: int = int(MODEL_CACHE_MAX_MB * 1024 * 1024),
+        loader: Callable[[str, Path], Predictor] | None = None,
+        max_batch_size: int = INFER_BATCH_MAX_SIZE,
+        max_wait_ms: float = INFER_BATCH_MAX_WAIT_MS,
+        in_flight: Callable[[], int] | None = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_ms = max(0.0, float(max_wait_ms))
+        self.in_flight = in_flight
+        self.batching = BatchingStats()
+        self._loader = loader or _default_loader
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[RegistryKey, _Entry] = OrderedDict()
+        self._loading: dict[RegistryKey, threading.Lock] = {}
+        self._digests: dict[str, tuple[tuple[int, int], str]] = {}
+        self._manifests: dict[str, tuple[int, int] | None] = {}
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "uncached": 0}
+
+    def file_digest(self, path: Path) -> str:
+        """sha256 of ``path``, recomputed only when its mtime or size changes."""
+        resolved = path.resolve()
+        signature = _stat_signature(resolved)
+        if signature is None:
+            raise FileNotFoundError(f"model file not found: {path}")
+        with self._lock:
+            known = self._digests.get(str(resolved))
+        if known is not None and known[0] == signature:
+            return known[1]
+        h = hashlib.sha256()
+        with resolved.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._digests[str(resolved)] = (signature, digest)
+        return digest
+
+    def check_manifest(self, run_id: str, manifest_path: Path | str | None) -> bool:
+        """Drop ``run_id``'s sessions when its manifest changed since last seen; True if dropped."""
+        if manifest_path is None:
+            return False
+        signature = _stat_signature(Path(manifest_path))
+        with self._lock:
+            if run_id not in self._manifests:
+                self._manifests[run_id] = signature
+                return False
+            if self._manifests[run_id] == signature:
+                return False
+            self._manifests[run_id] = signature
+        return self.invalidate(run_id) > 0
+
+    def get(self, run_id: str, runtime: str, model_path: Path) -> Predictor:
+        """Return the cached predictor for the model file, loading it on a miss."""
+        key = (run_id, runtime, self.file_digest(model_path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self._counters["hits"] += 1
+                return entry.predict
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        # One loader per key: concurrent requests for a cold model wait instead of loading it twice.
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.hits += 1
+                    self._counters["hits"] += 1
+                    return entry.predict
+                self._counters["misses"] += 1
+            try:
+                start = time.perf_counter()
+                predict = self._loader(runtime, model_path)
+                load_seconds = time.perf_counter() - start
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+            size_bytes = int(model_path.stat().st_size)
+            with self._lock:
+                if size_bytes > self.max_bytes:
+                    self._counters["uncached"] += 1
+                    return predict
+                if self.max_batch_size > 1:
+                    predict = MicroBatcher(
+                        predict,
+                        max_batch_size=self.max_batch_size,
+                        max_wait_ms=self.max_wait_ms,
+                        stats=self.batching,
+                        in_flight=self.in_flight,
+                    )
+                self._entries[key] = _Entry(predict, str(model_path), size_bytes, load_seconds)
+                self._evict_locked()
+            return predict
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > self.max_entries or self._bytes_locked() > self.max_bytes:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _bytes_locked(self) -> int:
+        return sum(e.size_bytes for e in self._entries.values())
+
+    def invalidate(self, run_id: str | None = None) -> int:
+        """Drop every session of ``run_id`` (all runs when None); returns the number dropped."""
+        with self._lock:
+            keys = [k for k in self._entries if run_id is None or k[0] == run_id]
+            for key in keys:
+                del self._entries[key]
+            if run_id is None:
+                self._manifests.clear()
+            self._counters["invalidations"] += len(keys)
+        return len(keys)
+
+    def contains(self, run_id: str, runtime: str) -> bool:
+        with self._lock:
+            return any(k[0] == run_id and k[1] == runtime for k in self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._bytes_locked(),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "batching": {
+                    "max_batch_size": self.max_batch_size,
+                    "max_wait_ms": self.max_wait_ms,
+                    **self.batching.snapshot(),
+                },
+                "models": [
+                    {
+                        "run_id": run_id,
+                        "runtime": runtime,
+                        "sha256": digest,
+                        "model_path": entry.model_path,
+                        "size_bytes": entry.size_bytes,
+                        "load_ms": round(entry.load_seconds * 1000.0, 3),
+                        "hits": entry.hits,
+                    }
+                    for (run_id, runtime, digest), entry in self._entries.items()
+                ],
+            }
+
+
+MODEL_REGISTRY = ModelRegistry(in_flight=INFERENCE_POOLS.busy_workers)
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import functools
 import hashlib
 import json
 import time
 import uuid
 from typing import Any
 
-from backend.app.config import API_PREFIX, ARTIFACTS_DIR, PHASE6_FLAGS, ROOT_DIR
-from backend.app.inference import infer_with_runtime_fallback
+from backend.app.bulk import BulkPayloadError, bulk_chunk_job, parse_bulk_payload, stream_bulk_forecast
+from backend.app.config import (
+    API_PREFIX,
+    ARTIFACTS_DIR,
+    BULK_CHUNK_SIZE,
+    BULK_MAX_BYTES,
+    INFER_TIMEOUT_MS,
+    PHASE6_FLAGS,
+    ROOT_DIR,
+)
+from backend.app.inference import infer_with_runtime_fallback, warm_runtime_models
+from backend.app.inference_pool import INFERENCE_POOLS, InferenceSaturatedError, RuntimeUnavailableError
 from backend.app.models import (
     CovariateContractValidateRequest,
     CovariateFieldSpec,
@@ -16,10 +28,13 @@ from backend.app.models import (
     ForecastInputRequest,
     InputPatchOperation,
 )
+from backend.app.registry import MODEL_REGISTRY
 from backend.app.runtime import resolve_runtime_for_run
 from backend.app.store import JobRecord
 from backend.app.utils import atomic_write_text, corr, ensure_parent, utc_now_iso
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 router = APIRouter()
 
@@ -319,11 +334,49 @@ def forecast_runtime_selection(
     }
 
 
+@router.get(f"{API_PREFIX}/forecast/models")
+def forecast_model_registry(request: Request) -> dict[str, Any]:
+    return {
+        "ok": True,
+        "data": {**MODEL_REGISTRY.stats(), "pools": INFERENCE_POOLS.stats(), "correlation": corr(request)},
+    }
+
+
+async def _run_inference_job(runtime: str, fn: Any, timeout_ms: float | None) -> Any:
+    """Run ``fn`` on the runtime's dedicated pool, mapping backpressure and deadlines to HTTP errors."""
+    try:
+        return await INFERENCE_POOLS.run(runtime, fn, (timeout_ms or INFER_TIMEOUT_MS) / 1000.0)
+    except InferenceSaturatedError as exc:
+        raise HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "1"}) from exc
+    except RuntimeUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"}) from exc
+    except (TimeoutError, asyncio.TimeoutError) as exc:  # distinct classes before Python 3.11
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+
+
+@router.post(f"{API_PREFIX}/forecast/models/{{run_id}}:warm")
+async def warm_forecast_models(
+    run_id: str,
+    request: Request,
+    preferred: str | None = Query(default=None, description="Optional runtime preference order, e.g. tflite,onnx"),
+    include_fallbacks: bool = Query(default=False, description="Also load every fallback runtime"),
+    timeout_ms: float | None = Query(default=None, gt=0, description="Deadline for loading the models"),
+) -> dict[str, Any]:
+    preferred_order = [x.strip() for x in preferred.split(",") if x.strip()] if preferred else None
+    resolved = resolve_runtime_for_run(run_id=run_id, preferred_order=preferred_order)
+    warm = functools.partial(
+        warm_runtime_models, run_id=run_id, preferred_order=preferred_order, include_fallbacks=include_fallbacks
+    )
+    result = await _run_inference_job(resolved["runtime_stack"], warm, timeout_ms)
+    return {"ok": True, "data": {"run_id": run_id, **result, "correlation": corr(request, run_id=run_id)}}
+
+
 @router.post(f"{API_PREFIX}/forecast/infer")
-def infer_forecast(
+async def infer_forecast(
     payload: ForecastInputRequest,
     request: Request,
     preferred: str | None = Query(default=None, description="Optional runtime preference order, e.g. tflite,onnx"),
+    timeout_ms: float | None = Query(default=None, gt=0, description="Per-request deadline in milliseconds"),
 ) -> dict[str, Any]:
     candidate = json.loads(json.dumps(payload.base_inputs, ensure_ascii=False))
     before_hash = _payload_hash(candidate)
@@ -333,7 +386,15 @@ def infer_forecast(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     preferred_order = [x.strip() for x in preferred.split(",") if x.strip()] if preferred else None
-    result = infer_with_runtime_fallback(run_id=payload.run_id, base_inputs=candidate, preferred_order=preferred_order)
+    resolved = resolve_runtime_for_run(run_id=payload.run_id, preferred_order=preferred_order)
+    infer = functools.partial(
+        infer_with_runtime_fallback,
+        run_id=payload.run_id,
+        base_inputs=candidate,
+        preferred_order=preferred_order,
+        resolved=resolved,
+    )
+    result = await _run_inference_job(resolved["runtime_stack"], infer, timeout_ms)
     after_hash = _payload_hash(candidate)
 
     return {
@@ -341,6 +402,8 @@ def infer_forecast(
         "data": {
             "run_id": payload.run_id,
             "predictions": result["predictions"],
+            "quantiles": result.get("quantiles"),
+            "rollout": result.get("rollout"),
             "runtime_stack_requested": result["runtime_stack_requested"],
             "runtime_used": result["runtime_used"],
             "fallback_chain": result["fallback_chain"],
@@ -352,3 +415,54 @@ def infer_forecast(
             "correlation": corr(request, run_id=payload.run_id),
         },
     }
+
+
+def _payload_too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail=f"bulk bodies are limited to {BULK_MAX_BYTES} bytes")
+
+
+async def _read_bulk_body(request: Request) -> bytes:
+    """Read the body, refusing it on its declared length or as soon as it outgrows ``BULK_MAX_BYTES``."""
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > BULK_MAX_BYTES:
+        raise _payload_too_large()
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        # Chunked uploads carry no length to check up front.
+        if len(body) > BULK_MAX_BYTES:
+            raise _payload_too_large()
+    return bytes(body)
+
+
+@router.post(f"{API_PREFIX}/forecast/infer:bulk")
+async def infer_forecast_bulk(
+    request: Request,
+    run_id: str | None = Query(default=None, description="Run to forecast with (JSON bodies may carry it instead)"),
+    horizon: int | None = Query(default=None, ge=1, description="Forecast steps per series"),
+    chunk_size: int = Query(default=BULK_CHUNK_SIZE, ge=1, le=65536, description="Series per batched predict"),
+    preferred: str | None = Query(default=None, description="Optional runtime preference order, e.g. tflite,onnx"),
+    timeout_ms: float | None = Query(default=None, gt=0, description="Deadline per chunk in milliseconds"),
+) -> StreamingResponse:
+    started_at = time.perf_counter()
+    body = await _read_bulk_body(request)
+    try:
+        # Decoding up to BULK_MAX_SERIES series is CPU-bound; keep it off the event loop.
+        # The parser answers 413 as soon as a payload carries more series than that.
+        series = await run_in_threadpool(parse_bulk_payload, body, request.headers.get("content-type"))
+    except BulkPayloadError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc)) from exc
+    run_id = run_id or series.run_id
+    if not run_id:
+        raise HTTPException(status_code=400, detail="run_id is required")
+    series.horizon = horizon or series.horizon
+
+    preferred_order = [x.strip() for x in preferred.split(",") if x.strip()] if preferred else None
+    resolved = resolve_runtime_for_run(run_id=run_id, preferred_order=preferred_order)
+    first_job = bulk_chunk_job(run_id, series, resolved, list(resolved["fallback_chain"]), 0, chunk_size)
+    first = await _run_inference_job(resolved["runtime_stack"], first_job, timeout_ms)
+    timeout_s = (timeout_ms or INFER_TIMEOUT_MS) / 1000.0
+    return StreamingResponse(
+        stream_bulk_forecast(run_id, series, resolved, chunk_size, timeout_s, first, started_at),
+        media_type="application/x-ndjson",
+    )
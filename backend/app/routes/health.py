@@ -34,6 +34,7 @@ def health(request: Request) -> dict[str, Any]:
             "security": {"dev_mode": SECURITY["dev_mode"], "auth_required": SECURITY["auth_required"]},
             "details": {
                 "store": store.diagnostics(),
+                "executor": executor.diagnostics(),
                 "artifacts_dir": str(ARTIFACTS_DIR),
                 "store_dir_writable": writable,
             },
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 from backend.app.config import API_PREFIX, ARTIFACTS_DIR, ROOT_DIR
+from backend.app.executor import TERMINAL_STATUSES
 from backend.app.models import RunRequest
+from backend.app.progress import PROGRESS_EVENTS, read_progress_points, training_snapshot
 from backend.app.store import JobRecord
 from backend.app.utils import atomic_write_text, corr, utc_now_iso
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 router = APIRouter()
 
@@ -30,30 +36,27 @@ def compute_status(rec: JobRecord) -> JobRecord:
         rec.message = "cancel accepted"
         return rec
 
-    elapsed = time.time() - rec.created_at
-    if elapsed < 1.0:
+    if rec.status in {"succeeded", "failed"}:
+        return rec
+
+    # Pure read: queued/running are derived from the clock, completion is persisted by the executor.
+    if time.time() - rec.created_at < 1.0:
         rec.status = "queued"
         rec.step = "queued"
         rec.progress = 0
         rec.message = "job accepted"
-    elif elapsed < 3.0:
+    else:
         rec.status = "running"
         rec.step = "training"
         rec.progress = 55
         rec.message = "training"
-    else:
-        rec.status = "succeeded"
-        rec.step = "finished"
-        rec.progress = 100
-        rec.message = "completed"
-        ensure_mock_run_artifacts(rec)
     return rec
 
 
-def ensure_mock_run_artifacts(rec: JobRecord) -> None:
-    metrics_dir = ARTIFACTS_DIR / "metrics"
-    reports_dir = ARTIFACTS_DIR / "reports"
-    runmeta_dir = ARTIFACTS_DIR / "runs"
+def ensure_mock_run_artifacts(rec: JobRecord, artifacts_dir: Path = ARTIFACTS_DIR) -> None:
+    metrics_dir = artifacts_dir / "metrics"
+    reports_dir = artifacts_dir / "reports"
+    runmeta_dir = artifacts_dir / "runs"
     for d in (metrics_dir, reports_dir, runmeta_dir):
         d.mkdir(parents=True, exist_ok=True)
 
@@ -92,10 +95,9 @@ def ensure_mock_run_artifacts(rec: JobRecord) -> None:
 
 
 def to_job_payload(rec: JobRecord, request: Request | None = None) -> dict[str, Any]:
-    from backend.app.main import store
+    from backend.app.main import executor
 
     cur = compute_status(rec)
-    store.upsert(cur)
     return {
         "job_id": cur.job_id,
         "run_id": cur.run_id,
@@ -107,6 +109,10 @@ def to_job_payload(rec: JobRecord, request: Request | None = None) -> dict[str,
         "updated_at": cur.updated_at,
         "execution_mode": cur.execution_mode,
         "exit_code": cur.exit_code,
+        "attempt": cur.attempt,
+        "priority": cur.priority,
+        "queue_position": executor.queue_position(cur.job_id) if cur.status == "queued" else None,
+        "training": training_snapshot(cur),
         "correlation": corr(request, job_id=cur.job_id, run_id=cur.run_id),
     }
 
@@ -132,6 +138,7 @@ def run_pipeline(payload: RunRequest, request: Request) -> dict[str, Any]:
         model_type=model_type,
         feature_mode=feature_mode,
         created_at=time.time(),
+        priority=payload.priority,
     )
     store.upsert(rec)
     executor.submit(rec)
@@ -143,6 +150,8 @@ def run_pipeline(payload: RunRequest, request: Request) -> dict[str, Any]:
             "status": "queued",
             "message": "job accepted",
             "execution_mode": rec.execution_mode,
+            "priority": rec.priority,
+            "queue_position": executor.queue_position(rec.job_id),
             "correlation": corr(request, job_id=rec.job_id, run_id=rec.run_id),
         },
     }
@@ -160,21 +169,36 @@ def get_job(job_id: str, request: Request) -> dict[str, Any]:
 
 @router.post(f"{API_PREFIX}/jobs/{{job_id}}:cancel")
 def cancel_job(job_id: str, request: Request) -> dict[str, Any]:
+    from backend.app.main import executor
+
+    rec = executor.cancel(job_id)
+    if rec is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return {"ok": True, "data": to_job_payload(rec, request=request)}
+
+
+@router.post(f"{API_PREFIX}/jobs/{{job_id}}:resume")
+def resume_job(job_id: str, request: Request) -> dict[str, Any]:
     from backend.app.main import executor, store
 
     rec = store.get(job_id)
     if not rec:
         raise HTTPException(status_code=404, detail="job not found")
-    rec.canceled = True
-    rec.status = "canceled"
-    rec.step = "canceled"
-    rec.progress = 100
-    rec.error_message = (
-        "\uc0ac\uc6a9\uc790 \uc694\uccad\uc73c\ub85c \uc791\uc5c5\uc774 \ucde8\uc18c\ub418\uc5c8\uc2b5\ub2c8\ub2e4."
-    )
-    rec.message = "cancel accepted"
+    if rec.execution_mode != "real" or rec.status not in {"failed", "canceled"}:
+        raise HTTPException(status_code=409, detail="only failed or canceled real jobs can be resumed")
+    if not executor.log_complete(job_id):
+        # A canceled runner may still be finalizing; a second attempt now would race its final write.
+        raise HTTPException(status_code=409, detail="previous attempt is still finishing; retry shortly")
+    rec.attempt += 1
+    rec.canceled = False
+    rec.status = "queued"
+    rec.step = "queued"
+    rec.progress = 0
+    rec.exit_code = None
+    rec.error_message = None
+    rec.message = "resume accepted"
     store.upsert(rec)
-    executor.cancel(job_id)
+    executor.submit(rec, resume=True)
     return {"ok": True, "data": to_job_payload(rec, request=request)}
 
 
@@ -194,18 +218,113 @@ def get_logs(
         enriched = [{**line, **corr_data} for line in runtime_lines]
         return {"ok": True, "data": {"job_id": job_id, "lines": enriched, "correlation": corr_data}}
 
+    lines = [{**line, **corr_data} for line in _mock_log_lines(rec)]
+    sliced = lines[offset : offset + limit]
+    return {"ok": True, "data": {"job_id": job_id, "lines": sliced, "correlation": corr_data}}
+
+
+def _mock_log_lines(rec: JobRecord) -> list[dict[str, Any]]:
     cur = compute_status(rec)
     base = datetime.fromtimestamp(rec.created_at, tz=timezone.utc)
-    lines: list[dict[str, Any]] = [
-        {"ts": base.isoformat(), "level": "INFO", "source": "mock", "message": "job accepted", **corr_data},
+    return [
+        {"seq": 0, "ts": base.isoformat(), "level": "INFO", "source": "mock", "message": "job accepted"},
         {
+            "seq": 1,
             "ts": (base.replace(microsecond=0)).isoformat(),
             "level": "INFO",
             "source": "mock",
             "message": "preprocessing",
-            **corr_data,
         },
-        {"ts": utc_now_iso(), "level": "INFO", "source": "mock", "message": f"status={cur.status}", **corr_data},
+        {"seq": 2, "ts": utc_now_iso(), "level": "INFO", "source": "mock", "message": f"status={cur.status}"},
     ]
-    sliced = lines[offset : offset + limit]
-    return {"ok": True, "data": {"job_id": job_id, "lines": sliced, "correlation": corr_data}}
+
+
+def _sse(event: str, data: dict[str, Any], event_id: int | None = None) -> str:
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_job_logs(
+    job_id: str, after: int, corr_data: dict[str, Any], heartbeat_s: float
+) -> AsyncIterator[str]:
+    from backend.app.main import executor, store
+
+    last = after
+    while True:
+        lines = executor.logs(job_id, last + 1, 500)
+        if not lines and executor.job_log(job_id) is None and last < 0:
+            rec = store.get(job_id)
+            lines = _mock_log_lines(rec) if rec is not None and rec.execution_mode == "mock" else []
+        for line in lines:
+            last = int(line["seq"])
+            yield _sse("log", {**line, **corr_data}, event_id=last)
+        if lines:
+            continue
+
+        rec = store.get(job_id)
+        status = compute_status(rec).status if rec is not None else "unknown"
+        if (
+            rec is None
+            or rec.execution_mode == "mock"
+            or (status in TERMINAL_STATUSES and executor.log_complete(job_id))
+        ):
+            yield _sse("end", {"job_id": job_id, "status": status, "last_seq": last, **corr_data})
+            return
+        log = executor.job_log(job_id)
+        if log is None:
+            # Queued, or started by an earlier process: nothing to wait on, so poll.
+            await asyncio.sleep(min(heartbeat_s, 0.5))
+        elif not await log.wait(last, heartbeat_s):
+            yield ": keep-alive\n\n"
+
+
+@router.get(f"{API_PREFIX}/jobs/{{job_id}}/logs/stream")
+def stream_logs(
+    job_id: str,
+    request: Request,
+    after: int | None = Query(default=None, ge=-1, description="Resume after this seq (same as Last-Event-ID)"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    heartbeat_s: float = Query(default=15.0, gt=0, le=300),
+) -> StreamingResponse:
+    """Server-Sent Events: one ``log`` event per line (``id`` = seq), then ``end`` once the job is terminal."""
+    from backend.app.main import store
+
+    rec = store.get(job_id)
+    if not rec:
+        raise HTTPException(status_code=404, detail="job not found")
+    if after is None:
+        try:
+            after = int(last_event_id) if last_event_id is not None else -1
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be an integer seq") from exc
+    corr_data = corr(request, job_id=job_id, run_id=rec.run_id)
+    return StreamingResponse(
+        _stream_job_logs(job_id, after, corr_data, heartbeat_s),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(f"{API_PREFIX}/jobs/{{job_id}}/progress")
+def get_progress(
+    job_id: str,
+    request: Request,
+    limit: int = Query(500, ge=1, le=5000),
+    kind: str | None = Query(None, pattern="^(train_begin|step|epoch|train_end)$"),
+) -> dict[str, Any]:
+    """The job's training progress time series (runner progress events, oldest first)."""
+    from backend.app.main import store
+
+    rec = store.get(job_id)
+    if not rec:
+        raise HTTPException(status_code=404, detail="job not found")
+    points = read_progress_points(job_id, limit, {kind} if kind else PROGRESS_EVENTS)
+    return {
+        "ok": True,
+        "data": {
+            "job_id": job_id,
+            "training": training_snapshot(rec),
+            "points": points,
+            "correlation": corr(request, job_id=job_id, run_id=rec.run_id),
+        },
+    }
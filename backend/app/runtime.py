@@ -26,7 +26,7 @@ def select_runtime_stack(
     runtime_compatibility: dict[str, Any],
     preferred_order: list[str] | None = None,
 ) -> tuple[str, list[str]]:
-    order = preferred_order or ["tflite", "onnx", "keras"]
+    order = preferred_order or ["tflite", "onnx", "numpy", "keras"]
     supported = [name for name in order if _runtime_supported(runtime_compatibility, name)]
     if not supported:
         return "keras", ["keras"]
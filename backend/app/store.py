@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-import fcntl
+import atexit
+import contextlib
 import json
 import os
+import sqlite3
 import threading
-from dataclasses import asdict, dataclass
+import weakref
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from backend.app.config import logger
-from backend.app.utils import atomic_write_text, ensure_parent, utc_now_iso
+from backend.app.config import STORE_FLUSH_MS, logger
+from backend.app.utils import ensure_parent, utc_now_iso
 
 
 @dataclass
@@ -29,82 +32,295 @@ class JobRecord:
     canceled: bool = False
     execution_mode: str = "mock"
     exit_code: int | None = None
+    attempt: int = 1
+    priority: str = "interactive"
+    # Latest structured training progress reported by the runner (see backend.app.progress).
+    epoch: int | None = None
+    epochs: int | None = None
+    loss: float | None = None
+    val_loss: float | None = None
+    samples_per_sec: float | None = None
+    eta_s: float | None = None
+
+
+_RECORD_FIELDS = {f.name for f in fields(JobRecord)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS idx_jobs_run_id ON jobs (run_id);
+"""
+
+_UPSERT = """
+INSERT INTO jobs (job_id, run_id, status, created_at, updated_at, record) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(job_id) DO UPDATE SET
+    run_id = excluded.run_id,
+    status = excluded.status,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    record = excluded.record
+"""
+
+_INSERT_MISSING = """
+INSERT INTO jobs (job_id, run_id, status, created_at, updated_at, record) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(job_id) DO NOTHING
+"""
+
+
+def _row_values(rec: JobRecord) -> tuple[Any, ...]:
+    return (
+        rec.job_id,
+        rec.run_id,
+        rec.status,
+        float(rec.created_at),
+        rec.updated_at,
+        json.dumps(asdict(rec), ensure_ascii=False),
+    )
+
+
+def _record_from_json(raw: str) -> JobRecord:
+    # Unknown keys (from a newer writer) are dropped rather than failing the read.
+    data = json.loads(raw)
+    return JobRecord(**{k: v for k, v in data.items() if k in _RECORD_FIELDS})
+
+
+def _flush_at_exit(ref: weakref.ref[JobStore]) -> None:
+    store = ref()
+    if store is not None:
+        store.flush()
 
 
 class JobStore:
-    def __init__(self, path: Path):
+    """Job records in an SQLite database (WAL mode) with one row per job.
+
+    ``path`` is the configured store path.  A ``.json`` path keeps its meaning
+    as the legacy JSON store: the database lives next to it as ``.sqlite3``
+    and the JSON file, if present, is imported once and renamed to
+    ``*.migrated``.  A corrupt JSON file or database is quarantined with a
+    ``.corrupt.<timestamp>`` suffix and the store starts empty.
+
+    :meth:`upsert` writes through.  :meth:`upsert_later` is the write-behind
+    path for executor state changes.  Updates are coalesced per ``job_id``
+    and a background thread flushes them in one transaction at most
+    ``flush_interval_ms`` after the first pending change, or sooner once
+    ``max_batch`` jobs are pending.  Reads see pending updates.
+    """
+
+    def __init__(self, path: Path, flush_interval_ms: float = STORE_FLUSH_MS, max_batch: int = 256):
         self.path = path
+        self.db_path = path.with_suffix(".sqlite3") if path.suffix == ".json" else path
         self.lock = threading.Lock()
-        self._records: dict[str, JobRecord] = {}
         self.corrupted_file: str | None = None
         self.last_save_error: str | None = None
-        self._load()
+        self.migrated_from: str | None = None
+        self.flush_interval = max(0.0, float(flush_interval_ms)) / 1000.0
+        self.max_batch = max(1, int(max_batch))
+        self._pending: dict[str, JobRecord] = {}
+        self._wake = threading.Event()
+        self._full = threading.Event()
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        self._write_stats = {"enqueued": 0, "coalesced": 0, "flushes": 0, "flushed_rows": 0}
+        self._conn = self._connect()
+        if path.suffix == ".json":
+            self._migrate_json(path)
 
     @property
     def lock_path(self) -> Path:
-        return self.path.with_suffix(self.path.suffix + ".lock")
+        # SQLite coordinates writers through the write-ahead log next to the database.
+        return self.db_path.with_name(self.db_path.name + "-wal")
+
+    def _quarantine(self, path: Path) -> None:
+        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        bad_path = path.with_suffix(path.suffix + f".corrupt.{ts}")
+        try:
+            os.replace(path, bad_path)
+            self.corrupted_file = str(bad_path)
+        except Exception:
+            self.corrupted_file = str(path)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        ensure_parent(self.db_path)
+        try:
+            return self._open()
+        except sqlite3.DatabaseError as exc:
+            logger.error("job_store_corrupt_db path=%s error=%s", self.db_path, exc)
+            self._quarantine(self.db_path)
+            for suffix in ("-wal", "-shm"):
+                self.db_path.with_name(self.db_path.name + suffix).unlink(missing_ok=True)
+            return self._open()
 
-    def _load(self) -> None:
-        if not self.path.exists():
+    def _migrate_json(self, json_path: Path) -> None:
+        if not json_path.exists():
             return
         try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            raw = json.loads(json_path.read_text(encoding="utf-8"))
         except Exception as exc:
-            ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-            bad_path = self.path.with_suffix(self.path.suffix + f".corrupt.{ts}")
-            try:
-                os.replace(self.path, bad_path)
-                self.corrupted_file = str(bad_path)
-            except Exception:
-                self.corrupted_file = str(self.path)
-            logger.error("job_store_corrupt_json path=%s error=%s", self.path, exc)
+            self._quarantine(json_path)
+            logger.error("job_store_corrupt_json path=%s error=%s", json_path, exc)
             return
-        if not isinstance(raw, dict):
-            return
-        for item in raw.get("jobs", []):
+        records: list[JobRecord] = []
+        for item in raw.get("jobs", []) if isinstance(raw, dict) else []:
             try:
-                rec = JobRecord(**item)
+                records.append(JobRecord(**item))
             except Exception:
                 continue
-            self._records[rec.job_id] = rec
-
-    def _save(self) -> None:
-        ensure_parent(self.path)
-        payload = {"jobs": [asdict(v) for v in self._records.values()]}
-        serialized = json.dumps(payload, ensure_ascii=False, indent=2)
-        try:
-            with open(self.lock_path, "a+", encoding="utf-8") as lockf:
-                fcntl.flock(lockf.fileno(), fcntl.LOCK_EX)
-                atomic_write_text(self.path, serialized)
-                fcntl.flock(lockf.fileno(), fcntl.LOCK_UN)
-            self.last_save_error = None
-        except Exception as exc:
-            self.last_save_error = str(exc)
-            logger.error("job_store_save_failed path=%s error=%s", self.path, exc)
-            raise
+        with self.lock:
+            # Rows already in the database win over the legacy file.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(_INSERT_MISSING, [_row_values(rec) for rec in records])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        migrated = json_path.with_suffix(json_path.suffix + ".migrated")
+        os.replace(json_path, migrated)
+        self.migrated_from = str(migrated)
+        logger.info("job_store_migrated_json path=%s records=%d db=%s", json_path, len(records), self.db_path)
 
     def upsert(self, rec: JobRecord) -> None:
         with self.lock:
             rec.updated_at = utc_now_iso()
-            self._records[rec.job_id] = rec
-            self._save()
+            # A write-through supersedes any older pending update of the same job.
+            self._pending.pop(rec.job_id, None)
+            try:
+                self._conn.execute(_UPSERT, _row_values(rec))
+                self.last_save_error = None
+            except Exception as exc:
+                self.last_save_error = str(exc)
+                logger.error("job_store_save_failed path=%s error=%s", self.db_path, exc)
+                raise
+
+    def upsert_later(self, rec: JobRecord) -> None:
+        """Queue ``rec`` for the background writer; a newer update of the same job replaces it."""
+        with self.lock:
+            rec.updated_at = utc_now_iso()
+            if rec.job_id in self._pending:
+                self._write_stats["coalesced"] += 1
+            self._pending[rec.job_id] = JobRecord(**asdict(rec))
+            self._write_stats["enqueued"] += 1
+            if self._writer is None and not self._closed:
+                self._writer = threading.Thread(target=self._writer_loop, name="job-store-writer", daemon=True)
+                self._writer.start()
+                atexit.register(_flush_at_exit, weakref.ref(self))
+            if len(self._pending) >= self.max_batch:
+                self._full.set()
+        self._wake.set()
+
+    def _writer_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait()
+            # Coalescing window, cut short when a full batch is pending.
+            self._full.wait(self.flush_interval)
+            self._wake.clear()
+            self._full.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Already logged; the rows stay pending and are retried after the next window.
+                self._wake.set()
+
+    def flush(self) -> int:
+        """Write every pending update in one transaction; returns the number of rows written."""
+        with self.lock:
+            if not self._pending or self._closed:
+                return 0
+            batch = list(self._pending.values())
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany(_UPSERT, [_row_values(rec) for rec in batch])
+                self._conn.execute("COMMIT")
+            except Exception as exc:
+                with contextlib.suppress(Exception):
+                    self._conn.execute("ROLLBACK")
+                self.last_save_error = str(exc)
+                logger.error("job_store_flush_failed path=%s rows=%d error=%s", self.db_path, len(batch), exc)
+                raise
+            self._pending.clear()
+            self.last_save_error = None
+            self._write_stats["flushes"] += 1
+            self._write_stats["flushed_rows"] += len(batch)
+            return len(batch)
 
     def get(self, job_id: str) -> JobRecord | None:
         with self.lock:
-            rec = self._records.get(job_id)
-            return JobRecord(**asdict(rec)) if rec else None
+            pending = self._pending.get(job_id)
+            if pending is not None:
+                return JobRecord(**asdict(pending))
+            row = self._conn.execute("SELECT record FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _record_from_json(row[0]) if row else None
+
+    def _overlay_locked(self, rows: list[tuple[str]], pending: list[JobRecord]) -> list[JobRecord]:
+        merged = {rec.job_id: rec for rec in (_record_from_json(row[0]) for row in rows)}
+        merged.update({rec.job_id: JobRecord(**asdict(rec)) for rec in pending})
+        return sorted(merged.values(), key=lambda r: r.created_at, reverse=True)
 
     def list_recent(self, limit: int = 20) -> list[JobRecord]:
         with self.lock:
-            values = list(self._records.values())
-        values.sort(key=lambda x: x.created_at, reverse=True)
-        return [JobRecord(**asdict(v)) for v in values[:limit]]
+            rows = self._conn.execute(
+                "SELECT record FROM jobs ORDER BY created_at DESC LIMIT ?", (int(limit),)
+            ).fetchall()
+            return self._overlay_locked(rows, list(self._pending.values()))[:limit]
+
+    def list_by_status(self, statuses: tuple[str, ...]) -> list[JobRecord]:
+        """Jobs whose status is one of ``statuses``, oldest first."""
+        marks = ",".join("?" * len(statuses))
+        with self.lock:
+            rows = self._conn.execute(
+                f"SELECT record FROM jobs WHERE status IN ({marks}) ORDER BY created_at", statuses
+            ).fetchall()
+            merged = self._overlay_locked(rows, list(self._pending.values()))
+        return [rec for rec in reversed(merged) if rec.status in statuses]
+
+    def count(self) -> int:
+        with self.lock:
+            total = int(self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0])
+            if self._pending:
+                ids = list(self._pending)
+                marks = ",".join("?" * len(ids))
+                stored = self._conn.execute(f"SELECT COUNT(*) FROM jobs WHERE job_id IN ({marks})", ids).fetchone()
+                total += len(ids) - int(stored[0])
+            return total
+
+    def close(self) -> None:
+        self.flush()
+        self._closed = True
+        self._wake.set()
+        self._full.set()
+        if self._writer is not None:
+            self._writer.join(timeout=1.0)
+        with self.lock:
+            self._conn.close()
 
     def diagnostics(self) -> dict[str, Any]:
         return {
             "path": str(self.path),
             "lock_path": str(self.lock_path),
-            "records": len(self._records),
+            "records": self.count(),
             "corrupted_file": self.corrupted_file,
             "last_save_error": self.last_save_error,
+            "backend": "sqlite",
+            "db_path": str(self.db_path),
+            "migrated_from": self.migrated_from,
+            "write_behind": {
+                **self._write_stats,
+                "pending": len(self._pending),
+                "flush_interval_ms": round(self.flush_interval * 1000.0, 3),
+            },
         }
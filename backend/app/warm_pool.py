@@ -0,0 +1,347 @@
+"""Pre-started runner workers that keep TensorFlow loaded between real-mode jobs.
+
+One :class:`WarmWorker` per executor slot runs ``python -m
+src.training.warm_worker``.  It is pinned to the slot's CPUs before it
+imports anything, so TensorFlow sizes its thread pools for that share.  A job
+is one JSON line on the worker's stdin.  Output lines are routed to the job's
+log sink until the worker's end-of-job markers arrive (see
+:mod:`src.training.warm_worker`).  :class:`WarmJob` mimics the parts of
+``subprocess.Popen`` the executor uses (``pid``, ``poll``, ``wait``), so
+timeouts and cancellation kill the worker's process group and the slot gets a
+fresh worker.  Each worker also gets a training-progress pipe
+(:mod:`backend.app.progress`); the worker names the job before its events, and
+they go to that job's ``on_progress`` handler.  A worker is retired after ``max_jobs`` jobs or once its RSS
+grew by more than ``max_rss_growth_mb`` since it became ready; its
+replacement starts right away so the next job finds it warm.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shlex
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from typing import IO, Any
+
+from backend.app.config import (
+    ROOT_DIR,
+    WARM_MAX_JOBS,
+    WARM_MAX_RSS_GROWTH_MB,
+    WARM_PRELOAD,
+    WARM_WORKER_CMD,
+    logger,
+)
+from backend.app.progress import ProgressHandler, open_progress_pipe
+from src.training.progress import PROGRESS_FD_ENV
+from src.training.warm_worker import MARKER
+
+LogSink = Callable[[str, str, str], None]
+
+
+class WarmJob:
+    """Handle for one job running on a warm worker; a ``Popen`` stand-in for the executor."""
+
+    def __init__(
+        self, job_id: str, worker: WarmWorker, sink: LogSink, on_progress: ProgressHandler | None = None
+    ) -> None:
+        self.job_id = job_id
+        self.worker = worker
+        self.pid = worker.pid
+        self.sink = sink
+        self.on_progress = on_progress
+        self.returncode: int | None = None
+        self.exit_code: int | None = None
+        self._streams_open = {"stdout", "stderr", "progress"}
+        self._done = threading.Event()
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        if not self._done.wait(timeout):
+            raise subprocess.TimeoutExpired(f"warm-worker:{self.job_id}", timeout or 0.0)
+        assert self.returncode is not None
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.worker.kill(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.worker.kill(signal.SIGKILL)
+
+    def _finish(self, returncode: int) -> None:
+        if self.returncode is None:
+            self.returncode = returncode
+        self._done.set()
+
+
+class WarmWorker:
+    def __init__(
+        self,
+        slot: int,
+        cpus: list[int] | None,
+        on_job_done: Callable[[WarmWorker], None],
+        on_exit: Callable[[WarmWorker], None],
+    ) -> None:
+        self.slot = slot
+        self.cpus = cpus
+        self.jobs_run = 0
+        self.ready_rss_mb: float | None = None
+        self.rss_mb: float | None = None
+        self.startup_s: float | None = None
+        self.retired = False
+        self._on_job_done = on_job_done
+        self._on_exit = on_exit
+        self._lock = threading.Lock()
+        self._job: WarmJob | None = None
+        # The job the worker announced on the progress pipe; its events are routed there.
+        self._progress_job: WarmJob | None = None
+        self.ready = threading.Event()
+
+        env = dict(os.environ)
+        if cpus:
+            for name in ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS"):
+                env.setdefault(name, str(len(cpus)))
+            env.setdefault("TF_NUM_INTEROP_THREADS", "1")
+        progress_fd, self._progress_reader = open_progress_pipe(self._progress)
+        env[PROGRESS_FD_ENV] = str(progress_fd)
+        try:
+            self.process = subprocess.Popen(
+                [*shlex.split(WARM_WORKER_CMD), "--preload", WARM_PRELOAD],
+                cwd=str(ROOT_DIR),
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                start_new_session=True,
+                pass_fds=(progress_fd,),
+            )
+        finally:
+            os.close(progress_fd)
+        self.pid = self.process.pid
+        self.started_at = time.time()
+        if cpus:
+            # Pinned before the preload import starts any threads, so they all inherit it.
+            with contextlib.suppress(OSError):
+                os.sched_setaffinity(self.pid, cpus)
+        self._readers = [
+            threading.Thread(target=self._read, args=(self.process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=self._read, args=(self.process.stderr, "stderr"), daemon=True),
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    @property
+    def busy(self) -> bool:
+        with self._lock:
+            return self._job is not None
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def submit(
+        self, job_id: str, argv: list[str], sink: LogSink, on_progress: ProgressHandler | None = None
+    ) -> WarmJob:
+        job = WarmJob(job_id, self, sink, on_progress)
+        with self._lock:
+            if self._job is not None:
+                raise RuntimeError(f"warm worker for slot {self.slot} is busy with {self._job.job_id}")
+            self._job = job
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(json.dumps({"job_id": job_id, "argv": argv}) + "\n")
+            self.process.stdin.flush()
+        except OSError as exc:
+            with self._lock:
+                self._job = None
+            raise RuntimeError(f"warm worker pid={self.pid} is gone: {exc}") from exc
+        return job
+
+    def retire(self) -> None:
+        """Let the worker exit after its current job by closing its stdin."""
+        self.retired = True
+        with contextlib.suppress(OSError):
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+
+    def kill(self, sig: int) -> None:
+        self.retired = True
+        try:
+            os.killpg(self.pid, sig)
+        except OSError:
+            with contextlib.suppress(OSError):
+                self.process.send_signal(sig)
+
+    def _read(self, stream: IO[str] | None, source: str) -> None:
+        if stream is None:
+            return
+        for line in stream:
+            if line.startswith(MARKER):
+                self._control(source, json.loads(line[len(MARKER) :]))
+                continue
+            with self._lock:
+                job = self._job
+            if job is not None:
+                job.sink("INFO" if source == "stdout" else "WARN", line, source)
+            elif line.strip():
+                logger.info("warm_worker slot=%s pid=%s %s: %s", self.slot, self.pid, source, line.rstrip())
+        if source == "stdout":
+            self._exited()
+
+    def _progress(self, event: dict[str, Any]) -> None:
+        kind = event.get("event")
+        with self._lock:
+            if kind == "job":
+                current = self._job
+                self._progress_job = current if current is not None and current.job_id == event.get("job_id") else None
+                return
+            job = self._progress_job
+            if kind == "end":
+                self._progress_job = None
+        if kind == "end":
+            self._control("progress", event)
+        elif job is not None and job.on_progress is not None:
+            job.on_progress(event)
+
+    def _control(self, source: str, event: dict[str, Any]) -> None:
+        kind = event.get("event")
+        if kind == "ready":
+            self.ready_rss_mb = self.rss_mb = float(event.get("rss_mb") or 0.0)
+            self.startup_s = float(event.get("startup_s") or 0.0)
+            self.ready.set()
+            return
+        with self._lock:
+            job = self._job
+            if job is None:
+                return
+            job._streams_open.discard(source)
+            if kind == "done":
+                self.rss_mb = float(event.get("rss_mb") or 0.0)
+                self.jobs_run += 1
+                job.exit_code = int(event.get("exit_code", 1))
+                if not event.get("progress", False):
+                    job._streams_open.discard("progress")
+            # Finish once every stream delivered its marker, so no log line or progress event arrives late.
+            if job._streams_open:
+                return
+            self._job = None
+        # Recycling happens before the job is reported done, so the slot's next job finds a worker.
+        self._on_job_done(self)
+        job._finish(job.exit_code if job.exit_code is not None else 1)
+
+    def _exited(self) -> None:
+        code = self.process.wait()
+        with self._lock:
+            job, self._job = self._job, None
+        self._on_exit(self)
+        if job is not None:
+            # A clean exit with a job in flight still means the job never completed.
+            job._finish(code if code != 0 else 1)
+
+    def needs_recycle(self, max_jobs: int, max_rss_growth_mb: float) -> bool:
+        if self.jobs_run >= max_jobs:
+            return True
+        if self.ready_rss_mb is not None and self.rss_mb is not None:
+            return self.rss_mb - self.ready_rss_mb > max_rss_growth_mb
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "slot": self.slot,
+            "pid": self.pid,
+            "ready": self.ready.is_set(),
+            "busy": self.busy,
+            "jobs_run": self.jobs_run,
+            "startup_s": self.startup_s,
+            "ready_rss_mb": self.ready_rss_mb,
+            "rss_mb": self.rss_mb,
+            "cpus": self.cpus,
+        }
+
+
+class WarmPool:
+    """One warm worker per executor slot, replaced when it is recycled or dies."""
+
+    def __init__(
+        self,
+        cpu_slots: list[list[int] | None],
+        max_jobs: int = WARM_MAX_JOBS,
+        max_rss_growth_mb: float = WARM_MAX_RSS_GROWTH_MB,
+    ) -> None:
+        self.cpu_slots = cpu_slots
+        self.max_jobs = max(1, int(max_jobs))
+        self.max_rss_growth_mb = float(max_rss_growth_mb)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counters = {"spawned": 0, "recycled": 0, "died": 0, "jobs": 0}
+        self._workers: list[WarmWorker | None] = [None] * len(cpu_slots)
+        for slot in range(len(cpu_slots)):
+            self._spawn(slot)
+
+    def _spawn(self, slot: int) -> WarmWorker:
+        worker = WarmWorker(slot, self.cpu_slots[slot], on_job_done=self._job_done, on_exit=self._worker_exited)
+        with self._lock:
+            self._workers[slot] = worker
+            self._counters["spawned"] += 1
+        return worker
+
+    def _worker_exited(self, worker: WarmWorker) -> None:
+        with self._lock:
+            current = self._workers[worker.slot] is worker
+            if current:
+                self._workers[worker.slot] = None
+            if not worker.retired:
+                self._counters["died"] += 1
+            closed = self._closed
+        # Keep the slot warm, unless the worker never got ready (e.g. the preload import fails).
+        if current and not closed and worker.ready.is_set():
+            self._spawn(worker.slot)
+
+    def _job_done(self, worker: WarmWorker) -> None:
+        if not worker.needs_recycle(self.max_jobs, self.max_rss_growth_mb):
+            return
+        with self._lock:
+            self._counters["recycled"] += 1
+            if self._workers[worker.slot] is worker:
+                self._workers[worker.slot] = None
+            closed = self._closed
+        worker.retire()
+        if not closed:
+            self._spawn(worker.slot)
+
+    def submit(
+        self, slot: int, job_id: str, argv: list[str], sink: LogSink, on_progress: ProgressHandler | None = None
+    ) -> WarmJob:
+        with self._lock:
+            worker = self._workers[slot]
+        if worker is None or not worker.alive() or worker.retired:
+            worker = self._spawn(slot)
+        job = worker.submit(job_id, argv, sink, on_progress)
+        with self._lock:
+            self._counters["jobs"] += 1
+        return job
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            workers = list(self._workers)
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "max_jobs": self.max_jobs,
+            "max_rss_growth_mb": self.max_rss_growth_mb,
+            "workers": [w.stats() for w in workers if w is not None],
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = [w for w in self._workers if w is not None]
+        for worker in workers:
+            worker.retire()
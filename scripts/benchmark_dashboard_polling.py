@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Measure dashboard polling throughput of the backend against a seeded job store.
+
+Seeds ``--jobs`` mock jobs into a temporary store, then polls
+``/api/v1/dashboard/summary`` and ``/api/v1/jobs?limit=100`` in-process for
+``--seconds`` each and prints requests/s and latency percentiles as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _poll(client, url: str, seconds: float) -> dict[str, float]:
+    samples: list[float] = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        res = client.get(url)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        if res.status_code != 200:
+            raise RuntimeError(f"{url} returned {res.status_code}")
+    arr = np.asarray(samples)
+    return {
+        "requests": len(samples),
+        "rps": round(len(samples) / seconds, 1),
+        "p50_ms": round(float(np.percentile(arr, 50)), 3),
+        "p95_ms": round(float(np.percentile(arr, 95)), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200, help="Mock jobs to seed into the store")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Polling time per endpoint")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SPLINE_BACKEND_STORE_PATH"] = str(Path(tmp) / "jobs_store.json")
+        os.environ["SPLINE_BACKEND_ARTIFACTS_DIR"] = str(Path(tmp) / "artifacts")
+        os.environ["SPLINE_BACKEND_EXECUTOR_MODE"] = "mock"
+        from backend.app import main as backend_main
+        from backend.app.store import JobRecord
+        from fastapi.testclient import TestClient
+
+        now = time.time()
+        for i in range(args.jobs):
+            backend_main.store.upsert(
+                JobRecord(
+                    job_id=f"job-{i:06d}",
+                    run_id=f"bench-run-{i:06d}",
+                    model_type="lstm",
+                    feature_mode="univariate",
+                    created_at=now - 60.0 + i * 1e-3,
+                    status="succeeded",
+                    step="finished",
+                    progress=100,
+                    message="completed",
+                )
+            )
+        client = TestClient(backend_main.app)
+        result = {
+            "jobs": args.jobs,
+            "dashboard_summary": _poll(client, "/api/v1/dashboard/summary", args.seconds),
+            "list_jobs_100": _poll(client, "/api/v1/jobs?limit=100", args.seconds),
+        }
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""CLI wrapper for recurrent kernel benchmark."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.training.kernel_benchmark import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
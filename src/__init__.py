@@ -1,10 +1,27 @@
 """Spline + LSTM Time Series Forecasting Library."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from .models.lstm import AttentionLSTMModel, BidirectionalLSTMModel, GRUModel, LSTMModel
-from .preprocessing.spline import SplinePreprocessor
-from .training.trainer import Trainer
+if TYPE_CHECKING:
+    from .models.lstm import AttentionLSTMModel, BidirectionalLSTMModel, GRUModel, LSTMModel
+    from .preprocessing.spline import SplinePreprocessor
+    from .training.trainer import Trainer
+
+# Resolved on first access so that TensorFlow-free submodules (e.g.
+# ``src.training.numpy_runtime``) can be imported without loading TensorFlow.
+_LAZY_EXPORTS = {
+    "LSTMModel": ".models.lstm",
+    "GRUModel": ".models.lstm",
+    "BidirectionalLSTMModel": ".models.lstm",
+    "AttentionLSTMModel": ".models.lstm",
+    "SplinePreprocessor": ".preprocessing.spline",
+    "Trainer": ".training.trainer",
+}
 
 __all__ = [
     "LSTMModel",
@@ -14,3 +31,10 @@ __all__ = [
     "SplinePreprocessor",
     "Trainer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
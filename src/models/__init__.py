@@ -2,6 +2,18 @@
 
 from .dlinear import DLinearLikeModel
 from .lstm import AttentionLSTMModel, BidirectionalLSTMModel, GRUModel, LSTMModel
+from .streaming import StreamingForecaster, StreamingStateCache, build_streaming_model, export_streaming_model
 from .tcn import TCNModel
 
-__all__ = ["LSTMModel", "GRUModel", "BidirectionalLSTMModel", "AttentionLSTMModel", "TCNModel", "DLinearLikeModel"]
+__all__ = [
+    "LSTMModel",
+    "GRUModel",
+    "BidirectionalLSTMModel",
+    "AttentionLSTMModel",
+    "TCNModel",
+    "DLinearLikeModel",
+    "StreamingForecaster",
+    "StreamingStateCache",
+    "build_streaming_model",
+    "export_streaming_model",
+]
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
 
-from .lstm import DEFAULT_DROPOUT, _build_optimizer, _resolve_loss
+from .lstm import DEFAULT_DROPOUT, _build_optimizer, _compile_args, _output_head, _point_forecast, _validate_quantiles
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,8 @@ class DLinearLikeModel:
         recurrent_dropout: float = 0.0,
         use_residual: bool = False,
         use_layer_norm: bool = False,
+        fast_kernel: bool = False,
+        quantiles: Sequence[float] | None = None,
     ) -> None:
         self.sequence_length = sequence_length
         self.output_units = output_units
@@ -56,6 +59,7 @@ class DLinearLikeModel:
         self.l2_reg = l2_reg
         self.static_features = static_features
         self.future_features = future_features
+        self.quantiles = _validate_quantiles(quantiles)
         self.model: Model | None = None
         self.history: dict[str, Any] | None = None
 
@@ -74,8 +78,7 @@ class DLinearLikeModel:
     def _compile_model(self, total_steps: int | None = None) -> None:
         assert self.model is not None
         optimizer = _build_optimizer(self.learning_rate, self.lr_schedule, total_steps=total_steps)
-        loss = _resolve_loss(self.loss)
-        self.model.compile(optimizer=optimizer, loss=loss, metrics=["mae"])
+        self.model.compile(optimizer=optimizer, **_compile_args(self.loss, self.quantiles))
 
     def build(self) -> None:
         reg = keras.regularizers.l2(self.l2_reg) if self.l2_reg > 0 else None
@@ -108,7 +111,7 @@ class DLinearLikeModel:
             if self.dropout > 0:
                 x = layers.Dropout(self.dropout, name=f"dlinear_dropout_{i + 1}")(x)
 
-        output = layers.Dense(self.output_units, name="output")(x)
+        output = _output_head(x, self.output_units, self.quantiles)
         self.model = Model(inputs=model_inputs, outputs=output, name=self._model_name)
         self._compile_model()
         logger.info(
@@ -129,6 +132,7 @@ class DLinearLikeModel:
         shuffle: bool = False,
         verbose: int = 1,
         extra_callbacks: list[Any] | None = None,
+        initial_epoch: int = 0,
     ) -> dict[str, Any]:
         self._validate_xy(X, y)
         if validation_data is not None:
@@ -157,11 +161,16 @@ class DLinearLikeModel:
             )
         if extra_callbacks:
             callbacks.extend(extra_callbacks)
+        for callback in extra_callbacks or []:
+            # Resumable checkpoints save and restore the early-stopping / LR-plateau counters.
+            if hasattr(callback, "peer_callbacks"):
+                callback.peer_callbacks = callbacks
 
         fit_history = self.model.fit(
             X,
             y,
             epochs=epochs,
+            initial_epoch=initial_epoch,
             batch_size=batch_size,
             validation_data=validation_data,
             callbacks=callbacks,
@@ -175,7 +184,18 @@ class DLinearLikeModel:
         if self.model is None:
             raise RuntimeError("Model is not built/trained.")
         self._validate_xy(X)
-        return np.asarray(self.model.predict(X, verbose=0), dtype=np.float32)
+        pred = np.asarray(self.model.predict(X, verbose=0), dtype=np.float32)
+        return _point_forecast(pred, self.output_units, self.quantiles)
+
+    def predict_quantiles(self, X: np.ndarray) -> np.ndarray:
+        if self.model is None:
+            raise RuntimeError("Model is not built/trained.")
+        if self.quantiles is None:
+            raise ValueError("model was built without quantiles; pass quantiles=(...) to predict quantiles")
+        self._validate_xy(X)
+        pred = np.asarray(self.model.predict(X, verbose=0), dtype=np.float32)
+        _point_forecast(pred, self.output_units, self.quantiles)
+        return pred
 
     def evaluate(self, X: np.ndarray, y: np.ndarray) -> dict[str, float]:
         if self.model is None:
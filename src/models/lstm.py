@@ -18,6 +18,7 @@ Key improvements over the previous version:
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
@@ -80,6 +81,55 @@ class QuantileLoss(keras.losses.Loss):
         return {**super().get_config(), "quantile": self.quantile}
 
 
+@keras.utils.register_keras_serializable(package="spline_lstm")
+class MultiQuantileLoss(keras.losses.Loss):
+    """Pinball loss averaged over every quantile of a ``[batch, horizon, n_quantiles]`` output.
+
+    ``y_true`` stays ``[batch, horizon]`` and is broadcast against each
+    quantile, so one model learns the whole quantile set in a single pass.
+    """
+
+    def __init__(self, quantiles: Sequence[float] = (0.1, 0.5, 0.9), **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.quantiles = [float(q) for q in quantiles]
+
+    def call(self, y_true: tf.Tensor, y_pred: tf.Tensor) -> tf.Tensor:
+        q = tf.constant(self.quantiles, dtype=y_pred.dtype)
+        error = tf.expand_dims(tf.cast(y_true, y_pred.dtype), -1) - y_pred
+        return tf.reduce_mean(tf.maximum(q * error, (q - 1.0) * error), axis=-1)
+
+    def get_config(self) -> dict:
+        return {**super().get_config(), "quantiles": self.quantiles}
+
+
+@keras.utils.register_keras_serializable(package="spline_lstm")
+class MonotonicQuantiles(layers.Layer):
+    """Reshape ``[batch, horizon * n_quantiles]`` into non-crossing quantiles.
+
+    The lowest quantile is used as-is and each higher one adds a softplus
+    increment, so ``q_i <= q_{i+1}`` holds by construction.  The cumulative sum
+    is a ``tensordot`` with an upper-triangular ones matrix and softplus is
+    spelled out with ``relu``/``exp``/``log`` so TFLite and ONNX export only
+    need builtin ops.
+    """
+
+    def __init__(self, output_units: int, n_quantiles: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.output_units = output_units
+        self.n_quantiles = n_quantiles
+
+    def call(self, inputs: tf.Tensor) -> tf.Tensor:  # type: ignore[override]
+        x = tf.reshape(inputs, (-1, self.output_units, self.n_quantiles))
+        raw = x[..., 1:]
+        steps = tf.nn.relu(raw) + tf.math.log(1.0 + tf.exp(-tf.abs(raw)))
+        increments = tf.concat([x[..., :1], steps], axis=-1)
+        cumsum = tf.constant(np.triu(np.ones((self.n_quantiles, self.n_quantiles))), dtype=inputs.dtype)
+        return tf.tensordot(increments, cumsum, axes=1)
+
+    def get_config(self) -> dict[str, Any]:
+        return {**super().get_config(), "output_units": self.output_units, "n_quantiles": self.n_quantiles}
+
+
 def _resolve_loss(loss_name: str) -> str | keras.losses.Loss:
     """Map a loss name string to a Keras loss object or built-in string."""
     if loss_name in ("mse", "mae"):
@@ -92,6 +142,56 @@ def _resolve_loss(loss_name: str) -> str | keras.losses.Loss:
     raise ValueError(f"Unsupported loss: {loss_name!r}. Choose from {SUPPORTED_LOSSES}")
 
 
+def _validate_quantiles(quantiles: Sequence[float] | None) -> tuple[float, ...] | None:
+    """Normalise a multi-quantile spec; ``None`` keeps the single point-forecast head."""
+    if quantiles is None:
+        return None
+    levels = tuple(float(q) for q in quantiles)
+    if len(levels) < 2:
+        raise ValueError("quantiles needs at least two levels; use loss='quantile_XX' for a single quantile")
+    if any(not 0.0 < q < 1.0 for q in levels):
+        raise ValueError(f"quantiles must lie in (0, 1), got {levels}")
+    if any(b <= a for a, b in zip(levels, levels[1:], strict=False)):
+        raise ValueError(f"quantiles must be strictly increasing, got {levels}")
+    return levels
+
+
+def median_quantile_index(quantiles: Sequence[float]) -> int:
+    """Index of the quantile closest to the median (used as the point forecast)."""
+    return int(np.argmin(np.abs(np.asarray(quantiles, dtype=float) - 0.5)))
+
+
+def _output_head(x: tf.Tensor, output_units: int, quantiles: tuple[float, ...] | None) -> tf.Tensor:
+    """Final projection: ``[batch, output_units]`` or ``[batch, output_units, n_quantiles]``."""
+    if quantiles is None:
+        return layers.Dense(output_units, name="output")(x)
+    x = layers.Dense(output_units * len(quantiles), name="output")(x)
+    return MonotonicQuantiles(output_units, len(quantiles), name="quantile_head")(x)
+
+
+def _compile_args(loss_name: str, quantiles: tuple[float, ...] | None) -> dict[str, Any]:
+    """Loss/metrics for ``Model.compile``; quantile heads report MAE of the median quantile."""
+    if quantiles is None:
+        return {"loss": _resolve_loss(loss_name), "metrics": ["mae"]}
+    mid = median_quantile_index(quantiles)
+
+    def mae(y_true: tf.Tensor, y_pred: tf.Tensor) -> tf.Tensor:
+        return tf.reduce_mean(tf.abs(tf.cast(y_true, y_pred.dtype) - y_pred[..., mid]), axis=-1)
+
+    return {"loss": MultiQuantileLoss(quantiles), "metrics": [mae]}
+
+
+def _point_forecast(pred: np.ndarray, output_units: int, quantiles: tuple[float, ...] | None) -> np.ndarray:
+    """Collapse a quantile-head prediction to its median so ``predict()`` stays ``[batch, output_units]``."""
+    if quantiles is None:
+        return pred
+    if pred.ndim != 3 or pred.shape[1:] != (output_units, len(quantiles)):
+        raise RuntimeError(
+            f"Prediction contract violated: expected [batch, {output_units}, {len(quantiles)}], got {pred.shape}"
+        )
+    return pred[..., median_quantile_index(quantiles)]
+
+
 def _build_optimizer(
     learning_rate: float,
     lr_schedule: str,
@@ -134,6 +234,68 @@ def _ensure_2d(arr: np.ndarray, name: str) -> None:
         raise ValueError(f"{name} must be a 2‑D array, got shape {arr.shape}")
 
 
+# ---------------------------------------------------------------------------
+# Recurrent kernel introspection
+# ---------------------------------------------------------------------------
+def _gpu_available() -> bool:
+    return bool(tf.config.list_logical_devices("GPU"))
+
+
+def recurrent_kernel_report(model: Model) -> list[dict[str, Any]]:
+    """Describe which kernel each LSTM/GRU layer of a Keras model will run on.
+
+    ``kernel`` is ``"cudnn"`` when the layer qualifies for the cuDNN kernel and a
+    GPU is visible, ``"fused"`` when it runs the single-matmul cell
+    (implementation 2, the oneDNN-friendly CPU path), and ``"generic"`` when a
+    setting such as ``recurrent_dropout`` forces the split per-gate loop.
+    ``fallback_reasons`` lists every setting that rules out cuDNN/fused execution.
+    """
+    gpu = _gpu_available()
+    report: list[dict[str, Any]] = []
+    for layer in model.layers:
+        inner = layer.forward_layer if isinstance(layer, layers.Bidirectional) else layer
+        if not isinstance(inner, (layers.LSTM, layers.GRU)):
+            continue
+        cell = inner.cell
+        reasons: list[str] = []
+        if cell.activation is not keras.activations.tanh:
+            reasons.append(f"activation={getattr(cell.activation, '__name__', cell.activation)} (needs tanh)")
+        if cell.recurrent_activation is not keras.activations.sigmoid:
+            name = getattr(cell.recurrent_activation, "__name__", cell.recurrent_activation)
+            reasons.append(f"recurrent_activation={name} (needs sigmoid)")
+        if inner.unroll:
+            reasons.append("unroll=True")
+        if not cell.use_bias:
+            reasons.append("use_bias=False")
+        if isinstance(inner, layers.GRU) and not cell.reset_after:
+            reasons.append("reset_after=False")
+        if cell.recurrent_dropout:
+            reasons.append(f"recurrent_dropout={cell.recurrent_dropout:g}")
+        if getattr(inner, "use_cudnn", "auto") is False:
+            reasons.append("use_cudnn=False")
+        fused = getattr(cell, "implementation", 2) != 1
+        if not reasons and gpu:
+            kernel = "cudnn"
+        elif fused and not cell.recurrent_dropout:
+            kernel = "fused"
+        else:
+            kernel = "generic"
+        report.append(
+            {
+                "layer": layer.name,
+                "cell": type(inner).__name__,
+                "bidirectional": inner is not layer,
+                "kernel": kernel,
+                "cudnn_eligible": not reasons,
+                "gpu_available": gpu,
+                "input_dropout": float(cell.dropout),
+                "recurrent_dropout": float(cell.recurrent_dropout),
+                "fallback_reasons": reasons,
+            }
+        )
+    return report
+
+
 # ---------------------------------------------------------------------------
 class LSTMModel:
     """Base LSTM model supporting optional static and future covariates.
@@ -156,6 +318,18 @@ class LSTMModel:
         Number of static covariates (0 if none).
     future_features: int
         Number of future‑known covariates (0 if none).
+    fast_kernel: bool
+        Keep recurrent layers on the fused kernel path (cuDNN on GPU, single
+        fused matmul per step on CPU).  ``recurrent_dropout`` disables that path
+        in Keras, so in this mode it is applied as input dropout on the
+        recurrent layers instead.  See :func:`recurrent_kernel_report`.
+    quantiles: Sequence[float] | None
+        Strictly increasing quantile levels, e.g. ``(0.1, 0.5, 0.9)``.  When set
+        the output head predicts all of them at once (``[batch, output_units,
+        n_quantiles]``, non-crossing via :class:`MonotonicQuantiles`) and is
+        trained with :class:`MultiQuantileLoss`, which replaces ``loss``.
+        ``predict()`` returns the median quantile; use ``predict_quantiles()``
+        for the full set.
     """
 
     # Subclasses can override this to give the Keras model a distinct name.
@@ -177,6 +351,8 @@ class LSTMModel:
         recurrent_dropout: float = 0.0,
         use_residual: bool = False,
         use_layer_norm: bool = False,
+        fast_kernel: bool = False,
+        quantiles: Sequence[float] | None = None,
     ) -> None:
         self.sequence_length = sequence_length
         self.hidden_units = hidden_units or [128, 64]
@@ -192,6 +368,8 @@ class LSTMModel:
         self.recurrent_dropout = recurrent_dropout
         self.use_residual = use_residual
         self.use_layer_norm = use_layer_norm
+        self.fast_kernel = fast_kernel
+        self.quantiles = _validate_quantiles(quantiles)
         self.model: Model | None = None
         self.history: dict[str, Any] | None = None
 
@@ -258,6 +436,35 @@ class LSTMModel:
             return keras.regularizers.l2(self.l2_reg)
         return None
 
+    def _recurrent_layer_kwargs(self) -> dict[str, Any]:
+        """Regularization kwargs shared by every recurrent layer in the stack.
+
+        In ``fast_kernel`` mode ``recurrent_dropout`` is moved to the layer's
+        input dropout, which both the cuDNN and fused CPU kernels support.
+        """
+        if self.fast_kernel:
+            return {"kernel_regularizer": self._get_regularizer(), "dropout": self.recurrent_dropout}
+        return {"kernel_regularizer": self._get_regularizer(), "recurrent_dropout": self.recurrent_dropout}
+
+    def kernel_report(self) -> list[dict[str, Any]]:
+        """Report which kernel each recurrent layer of the built model runs on."""
+        if self.model is None:
+            raise RuntimeError("Model is not built/trained. Call build() or fit_model() first.")
+        return recurrent_kernel_report(self.model)
+
+    def _warn_on_kernel_fallback(self) -> None:
+        assert self.model is not None
+        for entry in recurrent_kernel_report(self.model):
+            if entry["kernel"] == "generic" or (entry["gpu_available"] and entry["kernel"] != "cudnn"):
+                logger.warning(
+                    "%s: layer %s runs the slow %s recurrent kernel (%s); pass fast_kernel=True to keep "
+                    "the fused kernel",
+                    self._model_name,
+                    entry["layer"],
+                    entry["kernel"],
+                    "; ".join(entry["fallback_reasons"]),
+                )
+
     def _build_lstm_stack(self, inputs: list[tf.keras.layers.Layer]) -> tf.keras.layers.Layer:
         """Construct the shared LSTM backbone.
 
@@ -269,18 +476,12 @@ class LSTMModel:
         When ``use_layer_norm=True``, LayerNormalization is applied after each
         LSTM output (before the residual add).
         """
-        reg = self._get_regularizer()
+        rnn_kwargs = self._recurrent_layer_kwargs()
         x = inputs[0]
         for i, units in enumerate(self.hidden_units):
             return_seq = i < len(self.hidden_units) - 1
             skip = x  # stash for residual
-            x = layers.LSTM(
-                units,
-                return_sequences=return_seq,
-                kernel_regularizer=reg,
-                recurrent_dropout=self.recurrent_dropout,
-                name=f"lstm_{i + 1}",
-            )(x)
+            x = layers.LSTM(units, return_sequences=return_seq, name=f"lstm_{i + 1}", **rnn_kwargs)(x)
             if self.use_layer_norm:
                 x = layers.LayerNormalization(name=f"layer_norm_{i + 1}")(x)
             if self.dropout > 0:
@@ -319,9 +520,10 @@ class LSTMModel:
                 layers.Dense(min(16, self.static_features * 2), activation="relu", name="static_dense")(static_input)
             )
         x = layers.Concatenate(name="feature_concat")(concat_tensors) if len(concat_tensors) > 1 else concat_tensors[0]
-        output = layers.Dense(self.output_units, name="output")(x)
+        output = _output_head(x, self.output_units, self.quantiles)
         self.model = Model(inputs=model_inputs, outputs=output, name=self._model_name)
         self._compile_model()
+        self._warn_on_kernel_fallback()
         logger.info(
             "Built %s – past=%d, static=%d, future=%d, loss=%s, lr_schedule=%s",
             self._model_name,
@@ -336,8 +538,7 @@ class LSTMModel:
         """Compile the model with the configured loss and optimizer."""
         assert self.model is not None
         optimizer = _build_optimizer(self.learning_rate, self.lr_schedule, total_steps=total_steps)
-        loss = _resolve_loss(self.loss)
-        self.model.compile(optimizer=optimizer, loss=loss, metrics=["mae"])
+        self.model.compile(optimizer=optimizer, **_compile_args(self.loss, self.quantiles))
 
     def fit_model(
         self,
@@ -350,6 +551,7 @@ class LSTMModel:
         shuffle: bool = False,
         verbose: int = 1,
         extra_callbacks: list[Any] | None = None,
+        initial_epoch: int = 0,
     ) -> dict[str, Any]:
         """Train the model.
 
@@ -381,10 +583,15 @@ class LSTMModel:
             )
         if extra_callbacks:
             callbacks.extend(extra_callbacks)
+        for callback in extra_callbacks or []:
+            # Resumable checkpoints save and restore the early-stopping / LR-plateau counters.
+            if hasattr(callback, "peer_callbacks"):
+                callback.peer_callbacks = callbacks
         fit_history = self.model.fit(
             X,
             y,
             epochs=epochs,
+            initial_epoch=initial_epoch,
             batch_size=batch_size,
             validation_data=validation_data,
             callbacks=callbacks,
@@ -402,11 +609,24 @@ class LSTMModel:
         if self.model is None:
             raise RuntimeError("Model is not built/trained. Call build() or fit_model() first.")
         self._validate_xy(X)
-        pred = np.asarray(self.model.predict(X, verbose=0), dtype=float)
+        pred = _point_forecast(
+            np.asarray(self.model.predict(X, verbose=0), dtype=float), self.output_units, self.quantiles
+        )
         if pred.ndim != 2 or pred.shape[1] != self.output_units:
             raise RuntimeError(f"Prediction contract violated: expected [batch, {self.output_units}], got {pred.shape}")
         return pred
 
+    def predict_quantiles(self, X: np.ndarray) -> np.ndarray:
+        """Return the full quantile set ``[batch, output_units, n_quantiles]`` from one forward pass."""
+        if self.model is None:
+            raise RuntimeError("Model is not built/trained. Call build() or fit_model() first.")
+        if self.quantiles is None:
+            raise ValueError("model was built without quantiles; pass quantiles=(...) to predict quantiles")
+        self._validate_xy(X)
+        pred = np.asarray(self.model.predict(X, verbose=0), dtype=float)
+        _point_forecast(pred, self.output_units, self.quantiles)  # shape check
+        return pred
+
     def evaluate(self, X: np.ndarray, y: np.ndarray) -> dict:
         """Evaluate the model and return loss/MAE."""
         if self.model is None:
@@ -471,18 +691,13 @@ class BidirectionalLSTMModel(LSTMModel):
     _model_name = "bilstm_forecaster"
 
     def _build_lstm_stack(self, inputs: list[tf.keras.layers.Layer]) -> tf.keras.layers.Layer:
-        reg = self._get_regularizer()
+        rnn_kwargs = self._recurrent_layer_kwargs()
         x = inputs[0]
         for i, units in enumerate(self.hidden_units):
             return_seq = i < len(self.hidden_units) - 1
             skip = x
             x = layers.Bidirectional(
-                layers.LSTM(
-                    units,
-                    return_sequences=return_seq,
-                    kernel_regularizer=reg,
-                    recurrent_dropout=self.recurrent_dropout,
-                ),
+                layers.LSTM(units, return_sequences=return_seq, **rnn_kwargs),
                 name=f"bilstm_{i + 1}",
             )(x)
             if self.use_layer_norm:
@@ -508,18 +723,12 @@ class GRUModel(LSTMModel):
     _model_name = "gru_forecaster"
 
     def _build_lstm_stack(self, inputs: list[tf.keras.layers.Layer]) -> tf.keras.layers.Layer:
-        reg = self._get_regularizer()
+        rnn_kwargs = self._recurrent_layer_kwargs()
         x = inputs[0]
         for i, units in enumerate(self.hidden_units):
             return_seq = i < len(self.hidden_units) - 1
             skip = x
-            x = layers.GRU(
-                units,
-                return_sequences=return_seq,
-                kernel_regularizer=reg,
-                recurrent_dropout=self.recurrent_dropout,
-                name=f"gru_{i + 1}",
-            )(x)
+            x = layers.GRU(units, return_sequences=return_seq, name=f"gru_{i + 1}", **rnn_kwargs)(x)
             if self.use_layer_norm:
                 x = layers.LayerNormalization(name=f"layer_norm_{i + 1}")(x)
             if self.dropout > 0:
@@ -565,17 +774,11 @@ class AttentionLSTMModel(LSTMModel):
 
     def _build_lstm_stack(self, inputs: list[tf.keras.layers.Layer]) -> tf.keras.layers.Layer:
         """LSTM stack that keeps sequences for the attention layer."""
-        reg = self._get_regularizer()
+        rnn_kwargs = self._recurrent_layer_kwargs()
         x = inputs[0]
         for i, units in enumerate(self.hidden_units[:-1]):
             skip = x
-            x = layers.LSTM(
-                units,
-                return_sequences=True,
-                kernel_regularizer=reg,
-                recurrent_dropout=self.recurrent_dropout,
-                name=f"lstm_{i + 1}",
-            )(x)
+            x = layers.LSTM(units, return_sequences=True, name=f"lstm_{i + 1}", **rnn_kwargs)(x)
             if self.use_layer_norm:
                 x = layers.LayerNormalization(name=f"layer_norm_{i + 1}")(x)
             if self.dropout > 0:
@@ -587,13 +790,7 @@ class AttentionLSTMModel(LSTMModel):
                 x = layers.Add(name=f"residual_add_{i + 1}")([x, skip])
         # Final LSTM must return sequences so the attention layer can score each step.
         skip = x
-        x = layers.LSTM(
-            self.hidden_units[-1],
-            return_sequences=True,
-            kernel_regularizer=reg,
-            recurrent_dropout=self.recurrent_dropout,
-            name="lstm_last",
-        )(x)
+        x = layers.LSTM(self.hidden_units[-1], return_sequences=True, name="lstm_last", **rnn_kwargs)(x)
         if self.use_layer_norm:
             x = layers.LayerNormalization(name="layer_norm_last")(x)
         if self.use_residual:
@@ -636,9 +833,10 @@ class AttentionLSTMModel(LSTMModel):
                 layers.Dense(min(16, self.static_features * 2), activation="relu", name="static_dense")(static_input)
             )
         x = layers.Concatenate(name="feature_concat")(concat_tensors) if len(concat_tensors) > 1 else concat_tensors[0]
-        output = layers.Dense(self.output_units, name="output")(x)
+        output = _output_head(x, self.output_units, self.quantiles)
         self.model = Model(inputs=model_inputs, outputs=output, name="attention_lstm_forecaster")
         self._compile_model()
+        self._warn_on_kernel_fallback()
         logger.info(
             "Built Attention LSTM model – past=%d, static=%d, future=%d, loss=%s",
             self.input_features,
@@ -0,0 +1,400 @@
+"""Stateful streaming inference for recurrent forecasters.
+
+A trained ``LSTMModel``/``GRUModel`` consumes a full ``sequence_length``
+window on every call.  When forecasts are requested tick by tick for the same
+series, consecutive windows share all but one observation, so most of that
+work is repeated.  This module exports a *step model* that takes the recurrent
+hidden (and cell) state as explicit inputs and returns the updated state
+alongside the forecast.  A new tick then costs a single recurrent step.
+
+- :func:`build_streaming_model` – derive the step model from a trained
+  forecaster.  It shares the trained weights and works for any number of
+  timesteps per call, so the same graph primes a series from a full history
+  and advances it by one observation.
+- :class:`StreamingStateCache` – thread-safe LRU of per-series state keyed by
+  series id.
+- :class:`StreamingForecaster` – ``prime()`` / ``update()`` / ``update_batch()``
+  on top of the step model and the cache.
+
+Parity: the window model always starts from a zero state, so streaming from a
+reset over the same observations gives the same forecast as a full-window
+recomputation.  Past ``sequence_length`` ticks the carried state also covers
+older history, which the window model never saw.  ``refresh_every`` bounds
+that drift by re-running the last ``sequence_length`` observations from a zero
+state every N ticks.
+
+Bidirectional and attention backbones need the whole window for every output
+step, so :func:`build_streaming_model` rejects them.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras import Model, layers
+
+logger = logging.getLogger(__name__)
+
+STREAMABLE_LAYER_TYPES = ("LSTM", "GRU")
+
+_RNN_NAME = re.compile(r"^(lstm|gru)_(\d+)$")
+# Layers produced by LSTMModel/GRUModel.build(); anything else needs the full window.
+_STREAMABLE_NAME = re.compile(
+    r"^(past_input|future_input|static_input|future_flatten|static_dense|feature_concat|output"
+    r"|(lstm|gru|layer_norm|dropout|residual_proj|residual_add)_\d+)$"
+)
+
+
+def _keras_model(model: Any) -> Model:
+    keras_model = getattr(model, "model", model)
+    if keras_model is None:
+        raise RuntimeError("Model is not built/trained. Call build() or fit_model() first.")
+    return keras_model
+
+
+def _optional_layer(model: Model, name: str) -> layers.Layer | None:
+    try:
+        return model.get_layer(name)
+    except ValueError:
+        return None
+
+
+def build_streaming_model(model: Any) -> Model:
+    """Build the stateful step model for a trained LSTM/GRU forecaster.
+
+    ``model`` may be an ``LSTMModel``/``GRUModel`` wrapper or the underlying
+    Keras model (e.g. a loaded checkpoint).  The returned model has inputs
+    ``[step_input (batch, steps, features), *states, future_input?, static_input?]``
+    and outputs ``[forecast, *new_states]``; recurrent layers are fresh copies
+    with ``return_state=True`` and the trained weights, every other layer is
+    shared with ``model``.
+
+    Raises ``ValueError`` for backbones that cannot carry state between calls
+    (bidirectional, attention).
+    """
+    keras_model = _keras_model(model)
+    unsupported = [
+        f"{layer.name} ({type(layer).__name__})"
+        for layer in keras_model.layers
+        if not _STREAMABLE_NAME.match(layer.name)
+        or (_RNN_NAME.match(layer.name) and type(layer).__name__ not in STREAMABLE_LAYER_TYPES)
+    ]
+    if unsupported:
+        raise ValueError(
+            f"{keras_model.name} cannot be streamed: {', '.join(unsupported)} need(s) the full window; "
+            "only unidirectional LSTM/GRU stacks can carry state between calls"
+        )
+    rnn_layers = sorted(
+        (layer for layer in keras_model.layers if _RNN_NAME.match(layer.name)),
+        key=lambda layer: int(_RNN_NAME.match(layer.name).group(2)),  # type: ignore[union-attr]
+    )
+    if not rnn_layers:
+        raise ValueError(f"{keras_model.name} has no recurrent layers to stream")
+
+    past_shape = keras_model.inputs[0].shape
+    step_input = layers.Input(shape=(None, past_shape[-1]), name="step_input")
+    state_inputs: list[Any] = []
+    state_outputs: list[Any] = []
+    x = step_input
+    for rnn in rnn_layers:
+        index = _RNN_NAME.match(rnn.name).group(2)  # type: ignore[union-attr]
+        n_states = 2 if type(rnn).__name__ == "LSTM" else 1
+        layer_states = [
+            layers.Input(shape=(rnn.units,), name=f"{rnn.name}_{suffix}") for suffix in ("h", "c")[:n_states]
+        ]
+        config = rnn.get_config()
+        config.update(return_state=True, stateful=False, dropout=0.0, recurrent_dropout=0.0)
+        stepper = type(rnn).from_config(config)
+        skip = x
+        outputs = stepper(x, initial_state=layer_states)
+        stepper.set_weights(rnn.get_weights())
+        x = outputs[0]
+        state_inputs.extend(layer_states)
+        state_outputs.extend(outputs[1:])
+
+        layer_norm = _optional_layer(keras_model, f"layer_norm_{index}")
+        if layer_norm is not None:
+            x = layer_norm(x)
+        residual_add = _optional_layer(keras_model, f"residual_add_{index}")
+        if residual_add is not None:
+            projection = _optional_layer(keras_model, f"residual_proj_{index}")
+            x = residual_add([x, projection(skip) if projection is not None else skip])
+
+    model_inputs: list[Any] = [step_input, *state_inputs]
+    concat_tensors = [x]
+    future_flatten = _optional_layer(keras_model, "future_flatten")
+    if future_flatten is not None:
+        future_input = layers.Input(shape=keras_model.get_layer("future_input").output.shape[1:], name="future_input")
+        model_inputs.append(future_input)
+        concat_tensors.append(future_flatten(future_input))
+    static_dense = _optional_layer(keras_model, "static_dense")
+    if static_dense is not None:
+        static_input = layers.Input(shape=keras_model.get_layer("static_input").output.shape[1:], name="static_input")
+        model_inputs.append(static_input)
+        concat_tensors.append(static_dense(static_input))
+    if len(concat_tensors) > 1:
+        x = keras_model.get_layer("feature_concat")(concat_tensors)
+    forecast = keras_model.get_layer("output")(x)
+    return Model(inputs=model_inputs, outputs=[forecast, *state_outputs], name=f"{keras_model.name}_streaming")
+
+
+def export_streaming_model(model: Any, path: str) -> str:
+    """Build the step model for ``model`` and save it to ``path`` (HDF5).
+
+    Returns the written path.  ``.keras`` paths are rewritten to ``.h5`` like
+    :meth:`LSTMModel.save`.  Load it with ``keras.models.load_model(path,
+    compile=False)`` and wrap it in :class:`StreamingForecaster`.
+    """
+    if path.lower().endswith(".keras"):
+        path = path[:-6] + ".h5"
+    build_streaming_model(model).save(path)
+    logger.info("Streaming model saved to %s", path)
+    return path
+
+
+@dataclass
+class SeriesState:
+    """Recurrent state and recent observations of one streamed series."""
+
+    states: list[np.ndarray]
+    window: deque[np.ndarray]
+    ticks: int = 0
+    ticks_since_refresh: int = 0
+
+
+@dataclass
+class StreamingStateCache:
+    """Thread-safe LRU of :class:`SeriesState` keyed by series id."""
+
+    max_series: int = 1024
+    _entries: OrderedDict[str, SeriesState] = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    evictions: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.max_series < 1:
+            raise ValueError("max_series must be >= 1")
+
+    def get(self, series_id: str) -> SeriesState | None:
+        with self._lock:
+            entry = self._entries.get(series_id)
+            if entry is not None:
+                self._entries.move_to_end(series_id)
+            return entry
+
+    def put(self, series_id: str, entry: SeriesState) -> None:
+        with self._lock:
+            self._entries[series_id] = entry
+            self._entries.move_to_end(series_id)
+            while len(self._entries) > self.max_series:
+                evicted, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                logger.debug("Evicted streaming state for series %s", evicted)
+
+    def pop(self, series_id: str) -> SeriesState | None:
+        with self._lock:
+            return self._entries.pop(series_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, series_id: object) -> bool:
+        with self._lock:
+            return series_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class StreamingForecaster:
+    """Tick-by-tick forecasts that carry recurrent state between calls.
+
+    Parameters
+    ----------
+    step_model: keras.Model
+        Output of :func:`build_streaming_model` (or a loaded export).
+    sequence_length: int
+        Look-back window of the original forecaster.  Used for the refresh
+        window and to decide when a series has seen a full window.
+    refresh_every: int | None
+        Re-run the last ``sequence_length`` observations from a zero state
+        every N ticks so forecasts stay anchored to the window the model was
+        trained on.  ``None`` carries state indefinitely.
+    max_series: int
+        Number of series kept in the state cache (LRU eviction).
+    """
+
+    def __init__(
+        self,
+        step_model: Model,
+        sequence_length: int,
+        refresh_every: int | None = None,
+        max_series: int = 1024,
+    ) -> None:
+        if sequence_length < 1:
+            raise ValueError("sequence_length must be >= 1")
+        if refresh_every is not None and refresh_every < 1:
+            raise ValueError("refresh_every must be >= 1 or None")
+        self.step_model = step_model
+        self.sequence_length = sequence_length
+        self.refresh_every = refresh_every
+        self.cache = StreamingStateCache(max_series=max_series)
+
+        self.input_features = int(step_model.inputs[0].shape[-1])
+        self.output_units = int(step_model.outputs[0].shape[-1])
+        self.state_sizes = [int(t.shape[-1]) for t in step_model.outputs[1:]]
+        self.has_future = _optional_layer(step_model, "future_input") is not None
+        self.has_static = _optional_layer(step_model, "static_input") is not None
+        self._forward = tf.function(self._call_step_model, reduce_retracing=True)
+
+    @classmethod
+    def from_model(cls, model: Any, **kwargs: Any) -> StreamingForecaster:
+        """Build a forecaster from a trained ``LSTMModel``/``GRUModel`` or Keras model."""
+        keras_model = _keras_model(model)
+        sequence_length = kwargs.pop("sequence_length", None) or int(keras_model.inputs[0].shape[1])
+        return cls(build_streaming_model(keras_model), sequence_length=sequence_length, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _call_step_model(self, inputs: list[tf.Tensor]) -> Any:
+        return self.step_model(inputs, training=False)
+
+    def _zero_states(self, batch: int) -> list[np.ndarray]:
+        return [np.zeros((batch, size), dtype=np.float32) for size in self.state_sizes]
+
+    def _as_steps(self, values: Any, name: str) -> np.ndarray:
+        arr = np.asarray(values, dtype=np.float32)
+        if arr.ndim == 1 and self.input_features == 1:
+            arr = arr[:, None]
+        if arr.ndim != 2 or arr.shape[1] != self.input_features:
+            raise ValueError(f"{name} must have shape (steps, {self.input_features}), got {arr.shape}")
+        return arr
+
+    def _covariates(self, future: Any, static: Any, batch: int) -> list[np.ndarray]:
+        extra: list[np.ndarray] = []
+        for enabled, values, name, rank in (
+            (self.has_future, future, "future", 2),
+            (self.has_static, static, "static", 1),
+        ):
+            if not enabled:
+                if values is not None:
+                    raise ValueError(f"{name} covariates given but the model has no {name}_input")
+                continue
+            if values is None:
+                raise ValueError(f"model expects {name} covariates on every call")
+            arr = np.asarray(values, dtype=np.float32)
+            extra.append(arr.reshape((batch, *arr.shape[-rank:])))
+        return extra
+
+    def _run(
+        self, steps: np.ndarray, states: list[np.ndarray], extra: list[np.ndarray]
+    ) -> tuple[np.ndarray, list[np.ndarray]]:
+        outputs = self._forward([tf.convert_to_tensor(a) for a in (steps, *states, *extra)])
+        return np.asarray(outputs[0]), [np.asarray(s) for s in outputs[1:]]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def prime(self, series_id: str, history: Any, future: Any = None, static: Any = None) -> np.ndarray:
+        """Reset ``series_id`` and run ``history`` from a zero state.
+
+        Returns the forecast after the last observation – identical to the
+        window model's prediction when ``history`` is exactly one window.
+        """
+        steps = self._as_steps(history, "history")
+        if len(steps) == 0:
+            raise ValueError("history must contain at least one observation")
+        forecast, states = self._run(steps[None], self._zero_states(1), self._covariates(future, static, 1))
+        self.cache.put(
+            series_id,
+            SeriesState(
+                states=[s[0] for s in states],
+                window=deque(steps[-self.sequence_length :], maxlen=self.sequence_length),
+                ticks=len(steps),
+            ),
+        )
+        return np.asarray(forecast[0])
+
+    def update(self, series_id: str, observation: Any, future: Any = None, static: Any = None) -> np.ndarray:
+        """Advance ``series_id`` by one observation and return its forecast."""
+        forecasts = self.update_batch(
+            [series_id],
+            np.asarray(observation, dtype=np.float32).reshape(1, self.input_features),
+            future=None if future is None else np.asarray(future, dtype=np.float32)[None],
+            static=None if static is None else np.asarray(static, dtype=np.float32)[None],
+        )
+        return np.asarray(forecasts[0])
+
+    def update_batch(
+        self, series_ids: list[str], observations: Any, future: Any = None, static: Any = None
+    ) -> np.ndarray:
+        """Advance several series by one observation each in a single step call.
+
+        Unknown series start from a zero state.  Series due for a refresh are
+        recomputed from their retained window instead of stepped.  The batch
+        is applied to copies and cached only after every step call succeeded,
+        so a failing call leaves all series as they were.
+        """
+        obs = np.asarray(observations, dtype=np.float32).reshape(len(series_ids), self.input_features)
+        if len(set(series_ids)) != len(series_ids):
+            raise ValueError("series_ids must be unique within one update_batch call")
+        extra = self._covariates(future, static, len(series_ids))
+
+        entries: list[SeriesState] = []
+        refresh_rows: list[int] = []
+        step_rows: list[int] = []
+        for row, series_id in enumerate(series_ids):
+            cached = self.cache.get(series_id)
+            if cached is None:
+                entry = SeriesState(
+                    states=[s[0] for s in self._zero_states(1)], window=deque(maxlen=self.sequence_length)
+                )
+            else:
+                entry = SeriesState(
+                    states=list(cached.states),
+                    window=deque(cached.window, maxlen=self.sequence_length),
+                    ticks=cached.ticks,
+                    ticks_since_refresh=cached.ticks_since_refresh,
+                )
+            entry.window.append(obs[row])
+            entry.ticks += 1
+            entry.ticks_since_refresh += 1
+            entries.append(entry)
+            due = self.refresh_every is not None and entry.ticks_since_refresh >= self.refresh_every
+            (refresh_rows if due and len(entry.window) == self.sequence_length else step_rows).append(row)
+
+        forecasts = np.zeros((len(series_ids), self.output_units), dtype=np.float32)
+        if step_rows:
+            states = [np.stack([entries[r].states[i] for r in step_rows]) for i in range(len(self.state_sizes))]
+            out, new_states = self._run(obs[step_rows][:, None, :], states, [e[step_rows] for e in extra])
+            forecasts[step_rows] = out
+            for k, row in enumerate(step_rows):
+                entries[row].states = [s[k] for s in new_states]
+        if refresh_rows:
+            windows = np.stack([np.stack(entries[r].window) for r in refresh_rows])
+            out, new_states = self._run(windows, self._zero_states(len(refresh_rows)), [e[refresh_rows] for e in extra])
+            forecasts[refresh_rows] = out
+            for k, row in enumerate(refresh_rows):
+                entries[row].states = [s[k] for s in new_states]
+                entries[row].ticks_since_refresh = 0
+
+        for series_id, entry in zip(series_ids, entries, strict=True):
+            self.cache.put(series_id, entry)
+        return forecasts
+
+    def reset(self, series_id: str | None = None) -> None:
+        """Drop the state of ``series_id`` (or of every series)."""
+        if series_id is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(series_id)
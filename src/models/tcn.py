@@ -7,11 +7,12 @@ Provides a dilated causal convolution model with the same public API as
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
 
-from .lstm import DEFAULT_DROPOUT, _build_optimizer, _resolve_loss
+from .lstm import DEFAULT_DROPOUT, _build_optimizer, _compile_args, _output_head, _point_forecast, _validate_quantiles
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,8 @@ class TCNModel:
         Number of static covariates (0 if none).
     future_features : int
         Number of future-known covariates (0 if none).
+    quantiles : Sequence[float] | None
+        Multi-quantile head levels (same semantics as LSTMModel).
     """
 
     _model_name: str = "tcn_forecaster"
@@ -82,6 +85,8 @@ class TCNModel:
         recurrent_dropout: float = 0.0,
         use_residual: bool = False,
         use_layer_norm: bool = False,
+        fast_kernel: bool = False,
+        quantiles: Sequence[float] | None = None,
     ) -> None:
         self.sequence_length = sequence_length
         self.output_units = output_units
@@ -96,6 +101,7 @@ class TCNModel:
         self.l2_reg = l2_reg
         self.static_features = static_features
         self.future_features = future_features
+        self.quantiles = _validate_quantiles(quantiles)
         self.model: Model | None = None
         self.history: dict[str, Any] | None = None
 
@@ -132,8 +138,7 @@ class TCNModel:
     def _compile_model(self, total_steps: int | None = None) -> None:
         assert self.model is not None
         optimizer = _build_optimizer(self.learning_rate, self.lr_schedule, total_steps=total_steps)
-        loss = _resolve_loss(self.loss)
-        self.model.compile(optimizer=optimizer, loss=loss, metrics=["mae"])
+        self.model.compile(optimizer=optimizer, **_compile_args(self.loss, self.quantiles))
 
     def build(self) -> None:
         """Build the TCN Keras model."""
@@ -166,7 +171,7 @@ class TCNModel:
 
         x = layers.Concatenate(name="feature_concat")(concat_tensors) if len(concat_tensors) > 1 else concat_tensors[0]
 
-        output = layers.Dense(self.output_units, name="output")(x)
+        output = _output_head(x, self.output_units, self.quantiles)
         self.model = Model(inputs=model_inputs, outputs=output, name=self._model_name)
         self._compile_model()
         logger.info(
@@ -196,6 +201,7 @@ class TCNModel:
         shuffle: bool = False,
         verbose: int = 1,
         extra_callbacks: list[Any] | None = None,
+        initial_epoch: int = 0,
     ) -> dict[str, Any]:
         """Train the model (same interface as LSTMModel)."""
         self._validate_xy(X, y)
@@ -222,11 +228,16 @@ class TCNModel:
             )
         if extra_callbacks:
             callbacks.extend(extra_callbacks)
+        for callback in extra_callbacks or []:
+            # Resumable checkpoints save and restore the early-stopping / LR-plateau counters.
+            if hasattr(callback, "peer_callbacks"):
+                callback.peer_callbacks = callbacks
 
         fit_history = self.model.fit(
             X,
             y,
             epochs=epochs,
+            initial_epoch=initial_epoch,
             batch_size=batch_size,
             validation_data=validation_data,
             callbacks=callbacks,
@@ -241,6 +252,17 @@ class TCNModel:
             raise RuntimeError("Model not built/trained.")
         self._validate_xy(X)
         pred = np.asarray(self.model.predict(X, verbose=0), dtype=float)
+        return _point_forecast(pred, self.output_units, self.quantiles)
+
+    def predict_quantiles(self, X: np.ndarray) -> np.ndarray:
+        """Full quantile set ``[batch, output_units, n_quantiles]`` (see ``LSTMModel.predict_quantiles``)."""
+        if self.model is None:
+            raise RuntimeError("Model not built/trained.")
+        if self.quantiles is None:
+            raise ValueError("model was built without quantiles; pass quantiles=(...) to predict quantiles")
+        self._validate_xy(X)
+        pred = np.asarray(self.model.predict(X, verbose=0), dtype=float)
+        _point_forecast(pred, self.output_units, self.quantiles)
         return pred
 
     def evaluate(self, X: np.ndarray, y: np.ndarray) -> dict:
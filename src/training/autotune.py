@@ -0,0 +1,207 @@
+"""Pick a training batch size and CPU thread configuration by measurement.
+
+TensorFlow's thread pools can only be sized before its runtime starts, so every
+thread setting is measured in a fresh spawned process (the same mechanism as
+parallel cross-validation).  Inside that process each candidate batch size
+fits the real model for one warm-up epoch (graph tracing) and one timed epoch
+of ``trial_steps`` steps on the run's own windows.
+
+The decision keeps the configurations whose peak RSS fits the memory budget
+and, among those, the smallest batch size within ``tolerance`` of the best
+throughput: larger batches change the optimization, so they have to pay for
+themselves.  The learning rate can be scaled with the chosen batch size
+(``linear`` or ``sqrt`` relative to the requested batch size).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from src.utils.threads import available_cpu_count, configure_cpu_threads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZES = (32, 64, 128, 256)
+LR_SCALING = ("none", "linear", "sqrt")
+
+
+def default_thread_candidates(cpus: int | None = None) -> list[tuple[int, int]]:
+    """``(intra_op, inter_op)`` pairs to try: all cores, half and a quarter of them."""
+    n = cpus or available_cpu_count()
+    intra = sorted({n, max(1, n // 2), max(1, n // 4)}, reverse=True)
+    return [(t, min(2, t)) for t in intra]
+
+
+def physical_memory_mb() -> float | None:
+    try:
+        return float(os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")) / (1024.0 * 1024.0)
+    except (ValueError, OSError, AttributeError):  # pragma: no cover - platform specific
+        return None
+
+
+def scale_learning_rate(learning_rate: float, base_batch: int, batch_size: int, rule: str) -> float:
+    if rule not in LR_SCALING:
+        raise ValueError(f"lr scaling must be one of {LR_SCALING}, got '{rule}'")
+    ratio = batch_size / max(base_batch, 1)
+    if rule == "linear":
+        return float(learning_rate * ratio)
+    if rule == "sqrt":
+        return float(learning_rate * np.sqrt(ratio))
+    return float(learning_rate)
+
+
+def choose_configuration(trials: list[dict[str, Any]], memory_budget_mb: float, tolerance: float) -> dict[str, Any]:
+    """Smallest batch within ``tolerance`` of the best throughput among trials that fit the budget."""
+    for trial in trials:
+        trial["within_budget"] = trial["peak_rss_mb"] <= memory_budget_mb
+    eligible = [t for t in trials if t["within_budget"] and t["samples_per_sec"]]
+    if not eligible:
+        raise RuntimeError(f"no autotune configuration fits the {memory_budget_mb:.0f} MB memory budget")
+    best = max(t["samples_per_sec"] for t in eligible)
+    return min(
+        (t for t in eligible if t["samples_per_sec"] >= best * (1.0 - tolerance)),
+        key=lambda t: (t["batch_size"], -t["samples_per_sec"]),
+    )
+
+
+def _take_rows(X: Any, n: int) -> Any:
+    # Repeat rows when the run has fewer windows than a trial epoch needs.
+    def take(a: np.ndarray | None) -> np.ndarray | None:
+        return None if a is None else np.resize(a, (n, *a.shape[1:]))
+
+    return [take(x) for x in X] if isinstance(X, list) else take(X)
+
+
+def _measure_thread_setting(
+    model_factory: Callable[[], Any],
+    X: Any,
+    y: np.ndarray,
+    batch_sizes: Sequence[int],
+    trial_steps: int,
+    intra_op: int,
+    inter_op: int,
+) -> list[dict[str, Any]]:
+    """Run in a spawned process whose TF thread pools were sized by the initializer."""
+    from src.training.edge_benchmark import _max_rss_mb
+
+    trials = []
+    # Ascending batch sizes: the process-wide peak RSS then tracks the current trial.
+    for batch_size in sorted(batch_sizes):
+        n = batch_size * trial_steps
+        X_trial, y_trial = _take_rows(X, n), np.resize(y, (n, *y.shape[1:]))
+        model = model_factory()
+        model.build()
+        model.fit_model(X_trial, y_trial, epochs=1, batch_size=batch_size, early_stopping=False, verbose=0)
+        start = time.perf_counter()
+        model.fit_model(X_trial, y_trial, epochs=1, batch_size=batch_size, early_stopping=False, verbose=0)
+        seconds = time.perf_counter() - start
+        trials.append(
+            {
+                "batch_size": int(batch_size),
+                "intra_op": intra_op,
+                "inter_op": inter_op,
+                "samples_per_sec": round(n / seconds, 2) if seconds > 0 else None,
+                "step_ms": round(seconds * 1000.0 / trial_steps, 3),
+                "peak_rss_mb": round(_max_rss_mb(), 1),
+            }
+        )
+    return trials
+
+
+def autotune_training(
+    model_factory: Callable[[], Any],
+    X: Any,
+    y: np.ndarray,
+    *,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    thread_candidates: Sequence[tuple[int, int]] | None = None,
+    memory_budget_mb: float | None = None,
+    trial_steps: int = 20,
+    tolerance: float = 0.05,
+    base_batch_size: int = 32,
+    learning_rate: float | None = None,
+    lr_scaling: str = "none",
+) -> dict[str, Any]:
+    """Benchmark ``batch_sizes`` x ``thread_candidates`` and return the decision.
+
+    Parameters
+    ----------
+    model_factory : Callable[[], Any]
+        Picklable zero-argument factory for an unbuilt model wrapper (e.g.
+        ``functools.partial`` over the runner's model builder).
+    X, y : Any, np.ndarray
+        Training windows (only shapes matter; rows are repeated if too few).
+    thread_candidates : Sequence[tuple[int, int]] | None
+        ``(intra_op, inter_op)`` settings; defaults to
+        :func:`default_thread_candidates`.
+    memory_budget_mb : float | None
+        Peak-RSS limit for a training process; defaults to 80% of physical memory.
+    tolerance : float
+        A larger batch is only chosen when it beats every smaller one by more
+        than this fraction of the best throughput.
+    base_batch_size, learning_rate, lr_scaling
+        The requested batch size and learning rate; with ``lr_scaling`` other
+        than ``"none"`` the returned ``learning_rate`` is rescaled for the
+        chosen batch size.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    if not batch_sizes or any(int(b) < 1 for b in batch_sizes):
+        raise ValueError(f"batch sizes must be positive integers, got {list(batch_sizes)}")
+    if trial_steps < 1:
+        raise ValueError(f"trial_steps must be >= 1, got {trial_steps}")
+    if lr_scaling not in LR_SCALING:
+        raise ValueError(f"lr scaling must be one of {LR_SCALING}, got '{lr_scaling}'")
+    candidates = list(thread_candidates or default_thread_candidates())
+    budget = memory_budget_mb if memory_budget_mb is not None else (physical_memory_mb() or float("inf")) * 0.8
+
+    start = time.perf_counter()
+    trials: list[dict[str, Any]] = []
+    for intra_op, inter_op in candidates:
+        # spawn: one fresh process per thread setting, since TF pools are fixed once started.
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=get_context("spawn"),
+            initializer=configure_cpu_threads,
+            initargs=(intra_op, inter_op),
+        ) as pool:
+            trials += pool.submit(
+                _measure_thread_setting, model_factory, X, y, list(batch_sizes), trial_steps, intra_op, inter_op
+            ).result()
+
+    chosen = choose_configuration(trials, budget, tolerance)
+    best = max(t["samples_per_sec"] for t in trials if t["within_budget"] and t["samples_per_sec"])
+    decision = {
+        "batch_size": chosen["batch_size"],
+        "intra_op": chosen["intra_op"],
+        "inter_op": chosen["inter_op"],
+        "samples_per_sec": chosen["samples_per_sec"],
+        "best_samples_per_sec": best,
+        "base_batch_size": int(base_batch_size),
+        "lr_scaling": lr_scaling,
+        "learning_rate": (
+            scale_learning_rate(learning_rate, base_batch_size, chosen["batch_size"], lr_scaling)
+            if learning_rate is not None
+            else None
+        ),
+        "memory_budget_mb": round(budget, 1) if np.isfinite(budget) else None,
+        "tolerance": tolerance,
+        "trial_steps": trial_steps,
+        "seconds": round(time.perf_counter() - start, 2),
+        "trials": trials,
+    }
+    logger.info(
+        "Autotune chose batch_size=%d intra_op=%d inter_op=%d (%.0f samples/s)",
+        decision["batch_size"],
+        decision["intra_op"],
+        decision["inter_op"],
+        chosen["samples_per_sec"],
+    )
+    return decision
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -42,6 +43,56 @@ def _compute_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, float]
     }
 
 
+def quantile_label(q: float) -> str:
+    """Label a quantile level as ``p10``/``p50``/``p90`` (``p2.5`` for non-integer percents)."""
+    return f"p{round(q * 100, 4):g}"
+
+
+def pinball_loss(y_true: np.ndarray, y_quantiles: np.ndarray, quantiles: Sequence[float]) -> dict[str, float]:
+    """Mean pinball loss per quantile for ``y_quantiles`` shaped ``[batch, horizon, n_quantiles]``."""
+    y = np.asarray(y_true, dtype=np.float64).reshape(-1, 1)
+    yq = np.asarray(y_quantiles, dtype=np.float64).reshape(-1, len(quantiles))
+    if yq.shape[0] != y.shape[0]:
+        raise ValueError(f"y_true has {y.shape[0]} values but y_quantiles has {yq.shape[0]} per quantile")
+    q = np.asarray(quantiles, dtype=np.float64)[None, :]
+    error = y - yq
+    per_q = np.mean(np.maximum(q * error, (q - 1.0) * error), axis=0)
+    return {quantile_label(level): float(v) for level, v in zip(quantiles, per_q, strict=True)}
+
+
+def interval_coverage(y_true: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> dict[str, float]:
+    """Share of ``y_true`` inside ``[lower, upper]`` plus the mean interval width."""
+    y = np.asarray(y_true, dtype=np.float64).reshape(-1)
+    lo = np.asarray(lower, dtype=np.float64).reshape(-1)
+    hi = np.asarray(upper, dtype=np.float64).reshape(-1)
+    inside = (y >= lo) & (y <= hi)
+    return {"coverage": float(np.mean(inside)), "mean_width": float(np.mean(hi - lo))}
+
+
+def quantile_metrics(y_true: np.ndarray, y_quantiles: np.ndarray, quantiles: Sequence[float]) -> dict[str, Any]:
+    """Pinball loss and interval coverage for a multi-quantile forecast.
+
+    Coverage is reported for every symmetric pair ``(q, 1 - q)`` in
+    ``quantiles`` (e.g. ``p10-p90`` with nominal 0.8).
+    """
+    levels = [float(q) for q in quantiles]
+    yq = np.asarray(y_quantiles, dtype=np.float64).reshape(-1, len(levels))
+    per_q = pinball_loss(y_true, yq, levels)
+    intervals: dict[str, dict[str, float]] = {}
+    for i, lo in enumerate(levels):
+        hi_idx = next((j for j, hi in enumerate(levels) if j > i and abs(hi - (1.0 - lo)) < 1e-9), None)
+        if hi_idx is None:
+            continue
+        key = f"{quantile_label(lo)}-{quantile_label(levels[hi_idx])}"
+        intervals[key] = {"nominal": round(1.0 - 2.0 * lo, 6), **interval_coverage(y_true, yq[:, i], yq[:, hi_idx])}
+    return {
+        "quantiles": levels,
+        "pinball_loss": float(np.mean(list(per_q.values()))),
+        "pinball_by_quantile": per_q,
+        "intervals": intervals,
+    }
+
+
 def _validate_phase3_baseline_report(report: dict[str, Any]) -> None:
     """Validate Phase 3 baseline comparison contract in one place.
 
@@ -119,6 +170,25 @@ def exponential_smoothing_predict(X_test: np.ndarray, alpha: float = 0.3, horizo
     return np.repeat(levels.reshape(-1, 1), repeats=horizon, axis=1).astype(np.float32)
 
 
+def naive_quantile_predict(X_test: np.ndarray, quantiles: Sequence[float], horizon: int = 1) -> np.ndarray:
+    """Naive last value plus empirical quantiles of each window's own ``h``-step changes.
+
+    Returns ``[batch, horizon, n_quantiles]``.  Windows too short for an
+    ``h``-step change fall back to the largest available lag.
+    """
+    past = np.asarray(X_test[:, :, 0], dtype=np.float64)
+    last = past[:, -1]
+    out = np.empty((past.shape[0], horizon, len(quantiles)), dtype=np.float32)
+    for h in range(1, horizon + 1):
+        lag = min(h, past.shape[1] - 1)
+        if lag < 1:
+            out[:, h - 1, :] = last[:, None]
+            continue
+        changes = past[:, lag:] - past[:, :-lag]
+        out[:, h - 1, :] = last[:, None] + np.quantile(changes, quantiles, axis=1).T
+    return out
+
+
 def build_baseline_report(
     y_true: np.ndarray,
     y_lstm: np.ndarray,
@@ -127,11 +197,16 @@ def build_baseline_report(
     ma_window: int | None = None,
     seasonal_period: int | None = None,
     ses_alpha: float = 0.3,
+    y_quantiles: np.ndarray | None = None,
+    quantiles: Sequence[float] | None = None,
 ) -> dict:
     """Compute baseline predictions + metrics and relative improvement vs LSTM.
 
     Includes naive last-value, moving average, and optionally seasonal naive
-    and exponential smoothing baselines.
+    and exponential smoothing baselines.  When the model also produced
+    ``y_quantiles`` (``[batch, horizon, n_quantiles]`` for ``quantiles``), a
+    ``quantile`` block compares its pinball loss and interval coverage with
+    :func:`naive_quantile_predict`.
     """
     y_true_2d = np.asarray(y_true, dtype=np.float32).reshape(-1, horizon)
     y_lstm_2d = np.asarray(y_lstm, dtype=np.float32).reshape(-1, horizon)
@@ -199,5 +274,16 @@ def build_baseline_report(
             "rmse_improvement_pct": _improve(seasonal_metrics["rmse"])
         }
 
+    if y_quantiles is not None and quantiles is not None:
+        model_q = quantile_metrics(y_true_2d, y_quantiles, quantiles)
+        naive_q = quantile_metrics(y_true_2d, naive_quantile_predict(X_test, quantiles, horizon=horizon), quantiles)
+        report["quantile"] = {
+            "model": model_q,
+            "naive": naive_q,
+            "pinball_improvement_pct": float(
+                (naive_q["pinball_loss"] - model_q["pinball_loss"]) / (naive_q["pinball_loss"] + 1e-8) * 100.0
+            ),
+        }
+
     _validate_phase3_baseline_report(report)
     return report
@@ -0,0 +1,407 @@
+"""Asynchronous, deduplicated checkpoint writes.
+
+:class:`CheckpointManager` owns one checkpoint directory and writes into it
+from a single background thread, so training only pays for copying the
+weights to host memory:
+
+- **weights-only** saves (``<name>.weights.npz``) of a ``get_weights()``
+  snapshot, written atomically (temp file + rename);
+- **deduplication**: every save is content-hashed; a save whose weights match
+  a file already on disk (e.g. ``best`` in the epoch that also wrote ``last``)
+  becomes a hard link (or a copy where links are unsupported) instead of a
+  second write;
+- **one optimizer-state file** (``optimizer.npz``) overwritten in place, with
+  the epoch it belongs to, for resuming a run;
+- **full-model** saves for deployment artifacts, written once and linked to
+  every alias (``last.h5``, ``best.keras``, ...);
+- save-time metrics (:meth:`CheckpointManager.metrics`).
+
+:func:`make_checkpoint_callback` wires the manager into ``Model.fit`` (or
+:func:`src.training.distributed.fit_distributed`) as an ``extra_callbacks``
+entry.  Its optimizer file also carries the resume state (epoch, early-stopping
+and LR-plateau counters, Python/NumPy RNG state and the hash of the ``last``
+weights it belongs to), so a killed run can continue from its last completed
+epoch: :meth:`CheckpointManager.load_resume_state` returns that state when it
+is consistent with the weights on disk, and ``make_checkpoint_callback(...,
+resume_state=...)`` restores it when training starts again with
+``initial_epoch=resume_state["epoch"]``.  The RNG state covers Python, NumPy
+and the Keras seed generators behind dropout, so a resumed fit continues the
+same random streams as an uninterrupted one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+WEIGHTS_SUFFIX = ".weights.npz"
+OPTIMIZER_FILE = "optimizer.npz"
+
+# Counters of the built-in fit callbacks that decide when training stops or the LR drops.
+_PEER_STATE = {
+    "EarlyStopping": ("wait", "best", "best_epoch", "stopped_epoch"),
+    "ReduceLROnPlateau": ("wait", "best", "cooldown_counter"),
+}
+
+
+def _digest(arrays: list[np.ndarray]) -> str:
+    h = hashlib.sha256()
+    for arr in arrays:
+        h.update(str((arr.dtype.str, arr.shape)).encode("utf-8"))
+        h.update(np.ascontiguousarray(arr).tobytes())
+    return h.hexdigest()
+
+
+def _seed_generator_states(keras_model: Any) -> list[Any]:
+    # Dropout & co. draw from per-layer SeedGenerator variables that get_weights() leaves out.
+    # Their paths carry process-wide name counters, so they are matched by position.
+    return [v for v in keras_model.variables if v.path.endswith("seed_generator_state")]
+
+
+def _rng_state(keras_model: Any) -> dict[str, Any]:
+    version, internal, gauss = random.getstate()
+    name, keys, pos, has_gauss, cached = np.random.get_state(legacy=True)
+    return {
+        "python": [version, list(internal), gauss],
+        "numpy": [name, np.asarray(keys).tolist(), int(pos), int(has_gauss), float(cached)],
+        "seed_generators": [np.asarray(v).tolist() for v in _seed_generator_states(keras_model)],
+    }
+
+
+def _set_rng_state(state: dict[str, Any], keras_model: Any) -> None:
+    version, internal, gauss = state["python"]
+    random.setstate((version, tuple(internal), gauss))
+    name, keys, pos, has_gauss, cached = state["numpy"]
+    np.random.set_state((name, np.asarray(keys, dtype=np.uint32), pos, has_gauss, cached))
+    variables = _seed_generator_states(keras_model)
+    values = state.get("seed_generators") or []
+    if len(values) == len(variables):
+        for var, value in zip(variables, values, strict=True):
+            var.assign(np.asarray(value, dtype=var.dtype))
+
+
+def _jsonable(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _replace_with_link(src: Path, dst: Path) -> None:
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _write_npz(path: Path, arrays: dict[str, np.ndarray]) -> int:
+    # np.savez appends ".npz" to names without it, so write through a file object.
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("wb") as fh:
+        np.savez(fh, **arrays)
+    os.replace(tmp, path)
+    return path.stat().st_size
+
+
+class CheckpointManager:
+    """Write checkpoints for one run directory off the training thread.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Checkpoint directory (created if missing).
+    max_pending : int
+        Snapshots allowed to queue behind the writer before a save blocks;
+        bounds the host memory held by in-flight copies.
+    """
+
+    def __init__(self, directory: str | Path, max_pending: int = 2) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_pending = int(max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._pending: deque[Future[None]] = deque()
+        self._lock = threading.Lock()
+        self._digests: dict[Path, str] = {}
+        self._error: BaseException | None = None
+        self._stats: dict[str, Any] = {
+            "saves": 0,
+            "deduplicated": 0,
+            "bytes_written": 0,
+            "snapshot_seconds": 0.0,
+            "blocked_seconds": 0.0,
+            "write_seconds": 0.0,
+            "max_write_seconds": 0.0,
+        }
+
+    def weights_path(self, name: str) -> Path:
+        return self.directory / f"{name}{WEIGHTS_SUFFIX}"
+
+    @property
+    def optimizer_path(self) -> Path:
+        return self.directory / OPTIMIZER_FILE
+
+    # ------------------------------------------------------------------ saves
+
+    def save_weights(self, model: Any, name: str, weights: list[np.ndarray] | None = None) -> Path:
+        """Queue a weights-only save of ``model`` (or a ready ``weights`` snapshot) as ``name``."""
+        start = time.perf_counter()
+        if weights is None:
+            weights = [np.array(w, copy=True) for w in model.get_weights()]
+        self._stats["snapshot_seconds"] += time.perf_counter() - start
+        path = self.weights_path(name)
+        self._submit(self._write_weights, path, weights)
+        return path
+
+    def save_optimizer(self, optimizer: Any, meta: dict[str, Any] | None = None, weights_name: str = "last") -> Path:
+        """Queue a save of the optimizer slots and step counter, replacing the previous one.
+
+        ``meta`` is stored alongside, together with the hash of the
+        ``weights_name`` weights queued before it, which ties the two files
+        together for :meth:`load_resume_state`.
+        """
+        start = time.perf_counter()
+        arrays = {f"var_{i}": np.array(v.numpy(), copy=True) for i, v in enumerate(optimizer.variables)}
+        self._stats["snapshot_seconds"] += time.perf_counter() - start
+        self._submit(
+            self._write_optimizer, self.optimizer_path, arrays, dict(meta or {}), self.weights_path(weights_name)
+        )
+        return self.optimizer_path
+
+    def save_model(self, model: Any, name: str, aliases: tuple[str, ...] = ()) -> Path:
+        """Save the full model once as ``name`` and link each alias to it.
+
+        Runs on the calling thread after pending weight writes finish: the
+        model is serialized from live variables, so it cannot overlap training.
+        """
+        self.flush()
+        path = self.directory / name
+        start = time.perf_counter()
+        model.save(str(path))
+        size = path.stat().st_size
+        for alias in aliases:
+            _replace_with_link(path, self.directory / alias)
+        self._record_write(time.perf_counter() - start, size, deduplicated=len(aliases))
+        return path
+
+    # --------------------------------------------------------------- loading
+
+    def load_weights(self, model: Any, name: str) -> None:
+        """Load ``<name>.weights.npz`` into ``model`` (anything with ``set_weights``)."""
+        self.flush()
+        with np.load(self.weights_path(name)) as data:
+            model.set_weights([data[f"w_{i}"] for i in range(len(data.files))])
+
+    def load_resume_state(self) -> dict[str, Any] | None:
+        """Meta of ``optimizer.npz`` if it matches the ``last`` weights on disk, else None.
+
+        A run killed between the weights and the optimizer write of an epoch
+        leaves the two files out of step; that checkpoint is not resumable.
+        """
+        self.flush()
+        if not self.optimizer_path.exists():
+            return None
+        with np.load(self.optimizer_path) as data:
+            meta = dict(json.loads(str(data["meta"])))
+        weights_path = self.weights_path("last")
+        if "epoch" not in meta or not weights_path.exists():
+            return None
+        with np.load(weights_path) as data:
+            digest = _digest([data[f"w_{i}"] for i in range(len(data.files))])
+        return meta if meta.get("weights_sha256") == digest else None
+
+    def restore_optimizer(self, keras_model: Any) -> dict[str, Any] | None:
+        """Restore ``optimizer.npz`` into ``keras_model.optimizer``; returns its meta, or None if absent."""
+        self.flush()
+        if not self.optimizer_path.exists():
+            return None
+        optimizer = keras_model.optimizer
+        if not optimizer.built:
+            optimizer.build(keras_model.trainable_variables)
+        with np.load(self.optimizer_path) as data:
+            values = [data[f"var_{i}"] for i in range(len(data.files) - 1)]
+            meta = json.loads(str(data["meta"]))
+        variables = optimizer.variables
+        if len(values) != len(variables):
+            raise ValueError(
+                f"optimizer state in {self.optimizer_path} has {len(values)} variables, model expects {len(variables)}"
+            )
+        for var, value in zip(variables, values, strict=True):
+            if tuple(var.shape) != value.shape:
+                raise ValueError(f"optimizer variable {var.name}: expected shape {tuple(var.shape)}, got {value.shape}")
+            var.assign(value)
+        return dict(meta)
+
+    # ------------------------------------------------------------ lifecycle
+
+    def flush(self) -> None:
+        """Wait for queued writes; re-raises the first background write error."""
+        while self._pending:
+            self._pending.popleft().result()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"checkpoint write failed in {self.directory}") from error
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def metrics(self) -> dict[str, Any]:
+        """Save counts, bytes and timings so far; ``snapshot_seconds`` + ``blocked_seconds`` is training-thread time."""
+        with self._lock:
+            stats = dict(self._stats)
+        writes = stats["saves"] - stats["deduplicated"]
+        return {
+            **{k: round(v, 4) if isinstance(v, float) else v for k, v in stats.items()},
+            "mean_write_seconds": round(stats["write_seconds"] / writes, 4) if writes > 0 else None,
+            "pending": sum(1 for f in self._pending if not f.done()),
+            "files": sorted(p.name for p in self.directory.iterdir() if p.is_file() and not p.name.startswith(".")),
+        }
+
+    # ------------------------------------------------------------- internals
+
+    def _submit(self, fn: Any, *args: Any) -> None:
+        while len(self._pending) >= self.max_pending:
+            start = time.perf_counter()
+            self._pending.popleft().result()
+            self._stats["blocked_seconds"] += time.perf_counter() - start
+        self._pending.append(self._executor.submit(self._guarded, fn, *args))
+
+    def _guarded(self, fn: Any, *args: Any) -> None:
+        try:
+            fn(*args)
+        except BaseException as exc:  # surfaced on the training thread by flush()
+            self._error = self._error or exc
+
+    def _write_weights(self, path: Path, weights: list[np.ndarray]) -> None:
+        start = time.perf_counter()
+        digest = _digest(weights)
+        twin = next((p for p, d in self._digests.items() if d == digest and p != path and p.exists()), None)
+        if self._digests.get(path) == digest and path.exists():
+            self._record_write(0.0, 0, deduplicated=1)
+            return
+        if twin is not None:
+            _replace_with_link(twin, path)
+            self._digests[path] = digest
+            self._record_write(time.perf_counter() - start, 0, deduplicated=1)
+            return
+        size = _write_npz(path, {f"w_{i}": w for i, w in enumerate(weights)})
+        self._digests[path] = digest
+        self._record_write(time.perf_counter() - start, size)
+
+    def _write_optimizer(
+        self, path: Path, arrays: dict[str, np.ndarray], meta: dict[str, Any], weights_path: Path
+    ) -> None:
+        start = time.perf_counter()
+        # Writes run in submission order, so the weights queued before this save are hashed already.
+        meta["weights_sha256"] = self._digests.get(weights_path)
+        size = _write_npz(path, {**arrays, "meta": np.asarray(json.dumps(meta, sort_keys=True))})
+        self._record_write(time.perf_counter() - start, size)
+
+    def _record_write(self, seconds: float, size: int, deduplicated: int = 0) -> None:
+        with self._lock:
+            if size:
+                self._stats["saves"] += 1
+                self._stats["bytes_written"] += size
+                self._stats["write_seconds"] += seconds
+                self._stats["max_write_seconds"] = max(self._stats["max_write_seconds"], seconds)
+            self._stats["saves"] += deduplicated
+            self._stats["deduplicated"] += deduplicated
+
+
+def make_checkpoint_callback(
+    manager: CheckpointManager,
+    monitor: str = "val_loss",
+    save_optimizer: bool = True,
+    resume_state: dict[str, Any] | None = None,
+) -> Any:
+    """Build a Keras callback that checkpoints through ``manager`` after every epoch.
+
+    Each epoch saves ``last`` weights, ``best`` weights when ``monitor``
+    improved (falling back to ``loss`` without validation data), and, with
+    ``save_optimizer``, the optimizer state plus the resume state.  Pending
+    writes are flushed when training ends.
+
+    With ``resume_state`` (from :meth:`CheckpointManager.load_resume_state`)
+    the callback reloads the ``last`` weights, the optimizer, the RNG state and
+    the early-stopping / LR-plateau counters when training begins.  The fit
+    loop fills ``peer_callbacks`` with its built-in callbacks.
+    """
+    from tensorflow import keras
+
+    class AsyncCheckpoint(keras.callbacks.Callback):
+        def __init__(self) -> None:
+            super().__init__()
+            self.manager = manager
+            self.monitor = monitor
+            self.resume_state = resume_state
+            self.peer_callbacks: list[Any] = []
+            self.best: float | None = None
+            self.best_epoch: int | None = None
+
+        def on_train_begin(self, logs: dict[str, Any] | None = None) -> None:
+            # Runs after the built-in callbacks reset their own state for this fit.
+            state = self.resume_state
+            if state is None:
+                return
+            self.manager.load_weights(self.model, "last")
+            self.manager.restore_optimizer(self.model)
+            self.best, self.best_epoch = state.get("best"), state.get("best_epoch")
+            if state.get("rng"):
+                _set_rng_state(state["rng"], self.model)
+            peers = state.get("callbacks", {})
+            for callback in self.peer_callbacks:
+                saved = peers.get(type(callback).__name__)
+                if not saved:
+                    continue
+                for attr, value in saved.items():
+                    setattr(callback, attr, value)
+                if getattr(callback, "restore_best_weights", False) and self.manager.weights_path("best").exists():
+                    with np.load(self.manager.weights_path("best")) as data:
+                        callback.best_weights = [data[f"w_{i}"] for i in range(len(data.files))]
+
+        def on_epoch_end(self, epoch: int, logs: dict[str, Any] | None = None) -> None:
+            logs = logs or {}
+            value = logs.get(self.monitor, logs.get("loss"))
+            weights = [np.array(w, copy=True) for w in self.model.get_weights()]
+            self.manager.save_weights(self.model, "last", weights=weights)
+            if value is not None and (self.best is None or float(value) < self.best):
+                self.best, self.best_epoch = float(value), epoch + 1
+                self.manager.save_weights(self.model, "best", weights=weights)
+            if save_optimizer and getattr(self.model, "optimizer", None) is not None:
+                self.manager.save_optimizer(
+                    self.model.optimizer,
+                    meta={
+                        "epoch": epoch + 1,
+                        "monitor": self.monitor,
+                        "best": self.best,
+                        "best_epoch": self.best_epoch,
+                        "stop_training": bool(getattr(self.model, "stop_training", False)),
+                        "callbacks": {
+                            type(cb).__name__: {a: _jsonable(getattr(cb, a, None)) for a in attrs}
+                            for cb in self.peer_callbacks
+                            if (attrs := _PEER_STATE.get(type(cb).__name__))
+                        },
+                        "rng": _rng_state(self.model),
+                    },
+                )
+
+        def on_train_end(self, logs: dict[str, Any] | None = None) -> None:
+            self.manager.flush()
+
+    return AsyncCheckpoint()
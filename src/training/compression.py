@@ -0,0 +1,250 @@
+"""Post-training model compression ahead of edge export.
+
+Two transforms run on the trained Keras model in place, followed by a short
+fine-tune:
+
+- **Magnitude pruning**: zero the smallest weights of every Dense/Conv
+  ``kernel`` and recurrent ``kernel``/``recurrent_kernel`` tensor, either
+  individually (``granularity="weight"``) or as whole output channels ranked by
+  L2 norm (``granularity="channel"``).
+- **Weight clustering**: replace the non-zero weights of each tensor with
+  ``clusters`` shared values (1-D k-means, linear centroid init).
+
+During fine-tuning a callback re-applies the pruning masks and re-snaps each
+tensor to its cluster centroids after every batch.  Assignments are fixed, and
+each centroid becomes the mean of its members after the optimizer step.  So the
+stored weights stay sparse and clustered while the loss can still recover.
+Biases, normalization and embedding weights are left untouched.
+
+Sparse and clustered float tensors only shrink once compressed, so the report
+records the gzip size of the saved model before and after.  It also records
+output parity against the uncompressed model (:func:`compute_parity`).
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.training.edge import compute_parity
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_WEIGHT_NAMES = ("kernel", "recurrent_kernel")
+PRUNING_GRANULARITIES = ("weight", "channel")
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    """Compression stage settings (all transforms disabled by default)."""
+
+    sparsity: float = 0.0
+    granularity: str = "weight"
+    clusters: int = 0
+    fine_tune_epochs: int = 2
+    # Tensors smaller than this (e.g. a 32x1 output kernel) are left dense.
+    min_params: int = 64
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.sparsity < 1.0:
+            raise ValueError(f"sparsity must be in [0, 1), got {self.sparsity}")
+        if self.granularity not in PRUNING_GRANULARITIES:
+            raise ValueError(f"granularity must be one of {PRUNING_GRANULARITIES}, got {self.granularity!r}")
+        if self.clusters < 0 or self.clusters == 1:
+            raise ValueError(f"clusters must be 0 (disabled) or >= 2, got {self.clusters}")
+        if self.fine_tune_epochs < 0:
+            raise ValueError(f"fine_tune_epochs must be >= 0, got {self.fine_tune_epochs}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.sparsity > 0 or self.clusters > 0
+
+
+@dataclass
+class _TensorPlan:
+    variable: Any
+    mask: np.ndarray | None = None
+    assignments: np.ndarray | None = None
+    n_clusters: int = 0
+
+
+def compressible_variables(keras_model: Any, min_params: int = 64) -> list[Any]:
+    """Kernel tensors eligible for pruning/clustering, in model order."""
+    return [
+        v
+        for v in keras_model.weights
+        if v.name in COMPRESSIBLE_WEIGHT_NAMES and v.trainable and int(np.prod(v.shape)) >= min_params
+    ]
+
+
+def _magnitude_mask(weights: np.ndarray, sparsity: float, granularity: str) -> np.ndarray:
+    if granularity == "channel":
+        flat = weights.reshape(-1, weights.shape[-1])
+        norms = np.linalg.norm(flat, axis=0)
+        n_drop = int(round(sparsity * norms.size))
+        keep = np.ones(norms.size, dtype=bool)
+        keep[np.argsort(norms, kind="stable")[:n_drop]] = False
+        return np.broadcast_to(keep, weights.shape).astype(weights.dtype)
+    n_drop = int(round(sparsity * weights.size))
+    mask = np.ones(weights.size, dtype=weights.dtype)
+    mask[np.argsort(np.abs(weights).reshape(-1), kind="stable")[:n_drop]] = 0
+    return mask.reshape(weights.shape)
+
+
+def _kmeans_1d(values: np.ndarray, n_clusters: int, iterations: int = 20) -> tuple[np.ndarray, np.ndarray]:
+    centroids = np.linspace(values.min(), values.max(), n_clusters)
+    assignments = np.zeros(values.size, dtype=np.int64)
+    for _ in range(iterations):
+        assignments = np.abs(values[:, None] - centroids[None, :]).argmin(axis=1)
+        sums = np.bincount(assignments, weights=values, minlength=n_clusters)
+        counts = np.bincount(assignments, minlength=n_clusters)
+        updated = np.where(counts > 0, sums / np.maximum(counts, 1), centroids)
+        if np.allclose(updated, centroids):
+            break
+        centroids = updated
+    return centroids, assignments
+
+
+def _apply_plan(plan: _TensorPlan) -> None:
+    weights = np.asarray(plan.variable.numpy())
+    if plan.mask is not None:
+        weights = weights * plan.mask
+    if plan.assignments is not None:
+        active = weights.reshape(-1) if plan.mask is None else weights.reshape(-1)[plan.mask.reshape(-1) > 0]
+        sums = np.bincount(plan.assignments, weights=active, minlength=plan.n_clusters)
+        counts = np.maximum(np.bincount(plan.assignments, minlength=plan.n_clusters), 1)
+        snapped = (sums / counts)[plan.assignments].astype(weights.dtype)
+        flat = weights.reshape(-1)
+        if plan.mask is None:
+            flat[:] = snapped
+        else:
+            flat[plan.mask.reshape(-1) > 0] = snapped
+        weights = flat.reshape(weights.shape)
+    plan.variable.assign(weights)
+
+
+def _constraint_callback(plans: list[_TensorPlan]) -> Any:
+    from tensorflow import keras
+
+    class _CompressionConstraint(keras.callbacks.Callback):
+        def on_train_batch_end(self, batch: int, logs: dict[str, Any] | None = None) -> None:
+            for plan in plans:
+                _apply_plan(plan)
+
+    return _CompressionConstraint()
+
+
+def _gzipped_model_bytes(keras_model: Any) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "model.h5"
+        keras_model.save(str(path))
+        return len(gzip.compress(path.read_bytes(), compresslevel=9))
+
+
+def _predict(keras_model: Any, X: Any) -> np.ndarray:
+    payload = [x for x in X if x is not None] if isinstance(X, list) else X
+    if isinstance(payload, list) and len(payload) == 1:
+        payload = payload[0]
+    return np.asarray(keras_model.predict(payload, verbose=0), dtype=np.float32)
+
+
+def compress_model(
+    model_wrapper: Any,
+    config: CompressionConfig,
+    *,
+    X_train: Any,
+    y_train: np.ndarray,
+    validation_data: tuple[Any, np.ndarray] | None = None,
+    reference_inputs: Any | None = None,
+    batch_size: int = 32,
+    verbose: int = 0,
+) -> dict[str, Any]:
+    """Prune/cluster ``model_wrapper.model`` in place, fine-tune, and report the effect.
+
+    ``reference_inputs`` (e.g. the test windows) are predicted before and after
+    compression to record output parity.
+    """
+    keras_model = getattr(model_wrapper, "model", None)
+    if keras_model is None:
+        raise RuntimeError("compression requested but model is not built")
+    if not config.enabled:
+        return {"enabled": False}
+
+    reference = _predict(keras_model, reference_inputs) if reference_inputs is not None else None
+    size_before = _gzipped_model_bytes(keras_model)
+
+    plans: list[_TensorPlan] = []
+    for variable in compressible_variables(keras_model, config.min_params):
+        weights = np.asarray(variable.numpy())
+        plan = _TensorPlan(variable=variable)
+        if config.sparsity > 0:
+            plan.mask = _magnitude_mask(weights, config.sparsity, config.granularity)
+            weights = weights * plan.mask
+        if config.clusters > 0:
+            active = weights.reshape(-1) if plan.mask is None else weights.reshape(-1)[plan.mask.reshape(-1) > 0]
+            if active.size > config.clusters:
+                _, plan.assignments = _kmeans_1d(active, config.clusters)
+                plan.n_clusters = config.clusters
+        _apply_plan(plan)
+        plans.append(plan)
+    logger.info(
+        "Compression: %d tensor(s), sparsity=%.2f (%s), clusters=%d",
+        len(plans),
+        config.sparsity,
+        config.granularity,
+        config.clusters,
+    )
+
+    fine_tune_history: dict[str, Any] = {}
+    if config.fine_tune_epochs > 0 and plans:
+        fine_tune_history = model_wrapper.fit_model(
+            X_train,
+            y_train,
+            epochs=config.fine_tune_epochs,
+            batch_size=batch_size,
+            validation_data=validation_data,
+            early_stopping=False,
+            verbose=verbose,
+            extra_callbacks=[_constraint_callback(plans)],
+        )
+        # The last optimizer step may land after the final batch callback on some backends.
+        for plan in plans:
+            _apply_plan(plan)
+
+    tensors = []
+    for plan in plans:
+        weights = np.asarray(plan.variable.numpy())
+        nonzero = weights[weights != 0]
+        tensors.append(
+            {
+                "weight": plan.variable.path,
+                "params": int(weights.size),
+                "sparsity": float(1.0 - nonzero.size / weights.size),
+                "unique_values": int(np.unique(nonzero).size),
+            }
+        )
+    params_total = sum(t["params"] for t in tensors)
+    params_zero = sum(round(t["params"] * t["sparsity"]) for t in tensors)
+    size_after = _gzipped_model_bytes(keras_model)
+
+    report: dict[str, Any] = {
+        "enabled": True,
+        "config": asdict(config),
+        "tensors": tensors,
+        "compressed_params": int(params_total),
+        "achieved_sparsity": float(params_zero / params_total) if params_total else 0.0,
+        "gzip_size_bytes_before": size_before,
+        "gzip_size_bytes_after": size_after,
+        "gzip_size_delta_mb": round((size_after - size_before) / (1024 * 1024), 4),
+        "fine_tune_epochs": config.fine_tune_epochs,
+        "fine_tune_final_loss": float(fine_tune_history["loss"][-1]) if fine_tune_history.get("loss") else None,
+    }
+    if reference is not None:
+        report["parity"] = compute_parity(reference=reference, candidate=_predict(keras_model, reference_inputs))
+    return report
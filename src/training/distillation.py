@@ -0,0 +1,144 @@
+"""Knowledge distillation from trained teachers to edge-sized students.
+
+A teacher is one Keras checkpoint (e.g. an ``attention_lstm`` run) or several
+checkpoints averaged as an ensemble.  :meth:`DistillationTeacher.soft_targets`
+predicts on the student's training windows and caches the result on disk, keyed
+by the teacher checkpoint bytes and the window arrays, so repeated student runs
+on the same dataset pay for teacher inference once.  :func:`blend_soft_targets`
+mixes those predictions with the ground truth; ``Trainer.train(teacher=...)``
+fits the student on the blend while validation and test stay on hard labels.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def blend_soft_targets(y_true: np.ndarray, y_teacher: np.ndarray, alpha: float) -> np.ndarray:
+    """Return ``alpha * y_teacher + (1 - alpha) * y_true``."""
+    if not 0.0 <= alpha <= 1.0:
+        raise ValueError(f"distill alpha must be in [0, 1], got {alpha}")
+    y_true = np.asarray(y_true, dtype=float)
+    y_teacher = np.asarray(y_teacher, dtype=float)
+    if y_true.shape != y_teacher.shape:
+        raise ValueError(f"teacher prediction shape {y_teacher.shape} does not match targets {y_true.shape}")
+    return alpha * y_teacher + (1.0 - alpha) * y_true
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _inputs_digest(X: Any) -> str:
+    digest = hashlib.sha256()
+    for arr in X if isinstance(X, list) else [X]:
+        if arr is None:
+            digest.update(b"none")
+            continue
+        contiguous = np.ascontiguousarray(arr, dtype=np.float32)
+        digest.update(str(contiguous.shape).encode("utf-8"))
+        digest.update(contiguous.tobytes())
+    return digest.hexdigest()
+
+
+def _shapes_match(expected: list[tuple[Any, ...]], given: list[tuple[int, ...]]) -> bool:
+    """Per-sample input shapes agree; ``None`` dimensions of the model accept any size."""
+    return len(expected) == len(given) and all(
+        len(exp) == len(got) and all(e is None or e == g for e, g in zip(exp, got, strict=True))
+        for exp, got in zip(expected, given, strict=True)
+    )
+
+
+class DistillationTeacher:
+    """Averaged predictions of one or more teacher checkpoints, cached per dataset.
+
+    Parameters
+    ----------
+    checkpoints : list[str]
+        Keras checkpoint paths (``.h5``/``.keras``).  More than one path forms
+        an equal-weight ensemble.
+    cache_dir : str | None
+        Directory for cached teacher predictions (``None`` disables caching).
+    """
+
+    def __init__(self, checkpoints: list[str], cache_dir: str | None = None) -> None:
+        if not checkpoints:
+            raise ValueError("at least one teacher checkpoint is required")
+        self.checkpoints = [Path(p) for p in checkpoints]
+        missing = [str(p) for p in self.checkpoints if not p.exists()]
+        if missing:
+            raise FileNotFoundError(f"teacher checkpoint(s) not found: {missing}")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.fingerprint = hashlib.sha256(
+            "|".join(_file_digest(p) for p in self.checkpoints).encode("utf-8")
+        ).hexdigest()[:16]
+        self._models: list[Any] | None = None
+
+    def _load(self) -> list[Any]:
+        if self._models is None:
+            from tensorflow import keras
+
+            import src.models  # noqa: F401  (registers custom layers/losses for deserialization)
+
+            self._models = [keras.models.load_model(str(p), compile=False) for p in self.checkpoints]
+            logger.info("Loaded %d distillation teacher(s): %s", len(self._models), [p.name for p in self.checkpoints])
+        return self._models
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Mean prediction of all teacher members for ``X``."""
+        payload = [x for x in X if x is not None] if isinstance(X, list) else X
+        if isinstance(payload, list) and len(payload) == 1:
+            payload = payload[0]
+        arrays = payload if isinstance(payload, list) else [payload]
+        preds = []
+        for model in self._load():
+            expected = [tuple(t.shape[1:]) for t in model.inputs]
+            given = [tuple(np.shape(a)[1:]) for a in arrays]
+            if not _shapes_match(expected, given):
+                raise ValueError(f"teacher {model.name} expects inputs {expected}, got windows {given}")
+            pred = np.asarray(model.predict(payload, verbose=0), dtype=float)
+            if pred.ndim != 2:
+                raise ValueError(f"teacher {model.name} must output [batch, units], got {pred.shape}")
+            preds.append(pred)
+        if len({p.shape for p in preds}) != 1:
+            raise ValueError(f"teacher ensemble members disagree on output shape: {[p.shape for p in preds]}")
+        return np.asarray(np.mean(preds, axis=0))
+
+    def soft_targets(self, X: Any) -> tuple[np.ndarray, bool]:
+        """Return teacher predictions for ``X`` and whether they came from the cache."""
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self.cache_dir / f"{self.fingerprint}_{_inputs_digest(X)[:24]}.npy"
+            if cache_path.exists():
+                logger.info("Distillation: reusing cached teacher predictions %s", cache_path)
+                return np.load(cache_path), True
+
+        preds = self.predict(X)
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".npy.tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, preds)
+            os.replace(tmp, cache_path)
+        return preds, False
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "teacher_checkpoints": [str(p) for p in self.checkpoints],
+            "teacher_fingerprint": self.fingerprint,
+            "ensemble_size": len(self.checkpoints),
+            "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+        }
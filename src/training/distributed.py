@@ -0,0 +1,350 @@
+"""Data-parallel training across CPU workers with ``tf.distribute``.
+
+``Trainer.train(strategy=...)`` hands the fit to :func:`fit_distributed`, which
+replicates the model under the strategy and feeds each replica its shard of a
+``tf.data`` pipeline (``AutoShardPolicy.DATA``).  ``batch_size`` stays the
+per-replica batch, so the global batch is ``batch_size * replicas``.
+
+The loop is a plain ``strategy.run`` step rather than ``Model.fit``: Keras 3
+cannot symbolically build a model from multi-worker distributed batches.  The
+usual Keras callbacks (early stopping, ``ReduceLROnPlateau``, extras) still run
+once per epoch on every worker.  Losses are all-reduced, so every worker reaches
+the same stopping decision and the collectives stay in step.  After the fit the
+weights are copied into a fresh local model, so prediction, checkpoints and
+export never need the other workers.
+
+Multi-worker clusters are described by ``TF_CONFIG``.  Only the chief (task
+``chief``, or ``worker`` 0 when the cluster has no chief) writes artifacts;
+:func:`worker_info` reports the role.  :func:`launch_local_workers` (and
+``scripts/train_distributed_local.py``) runs a whole cluster on localhost, one
+runner process per worker, for testing without real hosts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import socket
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_STRATEGIES = ("none", "mirrored", "multi_worker")
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class WorkerInfo:
+    """This process's place in the cluster (a single local worker without ``TF_CONFIG``)."""
+
+    task_type: str = "worker"
+    task_index: int = 0
+    num_workers: int = 1
+    has_chief: bool = False
+
+    @property
+    def is_chief(self) -> bool:
+        if self.task_type == "chief":
+            return True
+        return self.task_type == "worker" and self.task_index == 0 and not self.has_chief
+
+
+def worker_info(tf_config: str | None = None) -> WorkerInfo:
+    """Parse ``TF_CONFIG`` (or the given JSON string) into a :class:`WorkerInfo`."""
+    raw = tf_config if tf_config is not None else os.environ.get("TF_CONFIG", "")
+    if not raw:
+        return WorkerInfo()
+    config = json.loads(raw)
+    cluster = config.get("cluster", {})
+    task = config.get("task", {})
+    return WorkerInfo(
+        task_type=str(task.get("type", "worker")),
+        task_index=int(task.get("index", 0)),
+        num_workers=len(cluster.get("worker", [])) + len(cluster.get("chief", [])),
+        has_chief=bool(cluster.get("chief")),
+    )
+
+
+def build_strategy(kind: str) -> Any | None:
+    """Create the ``tf.distribute`` strategy for ``kind`` (``None`` for ``"none"``).
+
+    ``multi_worker`` reads ``TF_CONFIG`` and must be created before any other
+    TensorFlow op runs in the process.
+    """
+    if kind not in SUPPORTED_STRATEGIES:
+        raise ValueError(f"distributed strategy must be one of {SUPPORTED_STRATEGIES}, got {kind!r}")
+    if kind == "none":
+        return None
+    import tensorflow as tf
+
+    if kind == "mirrored":
+        return tf.distribute.MirroredStrategy()
+    if not os.environ.get("TF_CONFIG"):
+        raise ValueError("multi_worker training needs TF_CONFIG describing the cluster")
+    return tf.distribute.MultiWorkerMirroredStrategy()
+
+
+def describe_strategy(strategy: Any, batch_size: int) -> dict[str, Any]:
+    """Summary of the strategy and this worker's role for run payloads."""
+    import tensorflow as tf
+
+    multi_worker = isinstance(strategy, tf.distribute.MultiWorkerMirroredStrategy)
+    info = worker_info() if multi_worker else WorkerInfo()
+    return {
+        "strategy": "multi_worker" if multi_worker else "mirrored",
+        "replicas": int(strategy.num_replicas_in_sync),
+        "global_batch_size": int(batch_size * strategy.num_replicas_in_sync),
+        **asdict(info),
+        "is_chief": info.is_chief,
+    }
+
+
+def _input_arrays(X: Any) -> Any:
+    if isinstance(X, list):
+        return tuple(np.asarray(x, dtype=np.float32) for x in X if x is not None)
+    return np.asarray(X, dtype=np.float32)
+
+
+def shard_dataset(X: Any, y: np.ndarray, global_batch_size: int) -> Any:
+    """Endless, batch-sharded ``tf.data`` pipeline over ``(X, y)`` windows.
+
+    Batches are full (``drop_remainder``) and the data repeats, so every worker
+    runs the same number of steps whatever its shard size.
+    """
+    import tensorflow as tf
+
+    options = tf.data.Options()
+    options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.DATA
+    ds = tf.data.Dataset.from_tensor_slices((_input_arrays(X), np.asarray(y, dtype=np.float32)))
+    ds = ds.repeat().batch(global_batch_size, drop_remainder=True)
+    return ds.with_options(options).prefetch(tf.data.AUTOTUNE)
+
+
+def _num_rows(X: Any) -> int:
+    return int(X[0].shape[0]) if isinstance(X, list) else int(X.shape[0])
+
+
+def fit_distributed(
+    model_wrapper: Any,
+    strategy: Any,
+    X: Any,
+    y: np.ndarray,
+    epochs: int = 100,
+    batch_size: int = 32,
+    validation_data: tuple[Any, np.ndarray] | None = None,
+    early_stopping: bool = True,
+    verbose: int = 1,
+    extra_callbacks: list[Any] | None = None,
+    initial_epoch: int = 0,
+) -> dict[str, list[float]]:
+    """Fit ``model_wrapper`` data-parallel under ``strategy``; returns the history.
+
+    Weights already in the model (e.g. from ``initial_checkpoint``) are the
+    starting point; ``initial_epoch`` skips epochs already run (resume).  On return ``model_wrapper.model`` is a local, non-distributed
+    model holding the trained weights.
+    """
+    import tensorflow as tf
+    from tensorflow import keras
+
+    from src.models.lstm import median_quantile_index
+
+    model_wrapper._validate_xy(X, y)
+    if validation_data is not None:
+        model_wrapper._validate_xy(*validation_data)
+
+    replicas = int(strategy.num_replicas_in_sync)
+    global_batch = max(batch_size, 1) * replicas
+    steps = max(1, math.ceil(_num_rows(X) / global_batch))
+    initial_weights = model_wrapper.model.get_weights() if model_wrapper.model is not None else None
+
+    with strategy.scope():
+        model_wrapper.build()
+        if initial_weights is not None:
+            model_wrapper.model.set_weights(initial_weights)
+        if model_wrapper.lr_schedule in ("cosine", "exponential"):
+            model_wrapper._compile_model(total_steps=steps * epochs)
+        net = model_wrapper.model
+        net.optimizer.build(net.trainable_variables)
+        train_iter = iter(strategy.experimental_distribute_dataset(shard_dataset(X, y, global_batch)))
+        val_iter = None
+        val_steps = 0
+        if validation_data is not None:
+            X_val, y_val = validation_data
+            val_steps = max(1, math.ceil(_num_rows(X_val) / global_batch))
+            val_iter = iter(strategy.experimental_distribute_dataset(shard_dataset(X_val, y_val, global_batch)))
+
+    loss_fn = keras.losses.get(net.loss)
+    quantiles = getattr(model_wrapper, "quantiles", None)
+    mid = median_quantile_index(quantiles) if quantiles is not None else None
+
+    def _forward(xb: Any, yb: Any, training: bool) -> tuple[Any, Any, Any]:
+        pred = net(list(xb) if isinstance(xb, tuple) else xb, training=training)
+        loss = tf.reduce_mean(loss_fn(yb, pred))
+        if training and net.losses:
+            loss += tf.add_n(net.losses)
+        point = pred[..., mid] if mid is not None else pred
+        mae = tf.reduce_mean(tf.abs(tf.cast(yb, point.dtype) - point))
+        # Scaled so the cross-replica SUM is the mean over the global batch.
+        return loss, loss / replicas, mae / replicas
+
+    def _train_replica(xb: Any, yb: Any) -> tuple[Any, Any]:
+        with tf.GradientTape() as tape:
+            _, scaled, mae = _forward(xb, yb, training=True)
+        grads = tape.gradient(scaled, net.trainable_variables)
+        net.optimizer.apply_gradients(zip(grads, net.trainable_variables, strict=True))
+        return scaled, mae
+
+    def _eval_replica(xb: Any, yb: Any) -> tuple[Any, Any]:
+        _, scaled, mae = _forward(xb, yb, training=False)
+        return scaled, mae
+
+    @tf.function
+    def train_step(iterator: Any) -> tuple[Any, Any]:
+        loss, mae = strategy.run(_train_replica, args=next(iterator))
+        return strategy.reduce("SUM", loss, axis=None), strategy.reduce("SUM", mae, axis=None)
+
+    @tf.function
+    def eval_step(iterator: Any) -> tuple[Any, Any]:
+        loss, mae = strategy.run(_eval_replica, args=next(iterator))
+        return strategy.reduce("SUM", loss, axis=None), strategy.reduce("SUM", mae, axis=None)
+
+    callbacks = []
+    if early_stopping:
+        callbacks.append(keras.callbacks.EarlyStopping(monitor="val_loss", patience=10, restore_best_weights=True))
+    if model_wrapper.lr_schedule == "reduce_on_plateau":
+        callbacks.append(
+            keras.callbacks.ReduceLROnPlateau(
+                monitor="val_loss", factor=0.5, patience=5, min_lr=model_wrapper.learning_rate * 0.01
+            )
+        )
+    if extra_callbacks:
+        callbacks.extend(extra_callbacks)
+    for callback in extra_callbacks or []:
+        if hasattr(callback, "peer_callbacks"):
+            callback.peer_callbacks = callbacks
+    callback_list = keras.callbacks.CallbackList(callbacks, model=net, epochs=epochs, steps=steps, verbose=0)
+
+    history: dict[str, list[float]] = {}
+    net.stop_training = False
+    callback_list.on_train_begin()
+    for epoch in range(initial_epoch, epochs):
+        callback_list.on_epoch_begin(epoch)
+        loss_sum = mae_sum = 0.0
+        for step in range(steps):
+            callback_list.on_train_batch_begin(step)
+            loss, mae = train_step(train_iter)
+            loss_sum += float(loss)
+            mae_sum += float(mae)
+            callback_list.on_train_batch_end(step, {"loss": float(loss)})
+        logs = {"loss": loss_sum / steps, "mae": mae_sum / steps}
+        if val_iter is not None:
+            val_loss = val_mae = 0.0
+            for _ in range(val_steps):
+                loss, mae = eval_step(val_iter)
+                val_loss += float(loss)
+                val_mae += float(mae)
+            logs.update(val_loss=val_loss / val_steps, val_mae=val_mae / val_steps)
+        callback_list.on_epoch_end(epoch, logs)
+        for key, value in logs.items():
+            history.setdefault(key, []).append(float(value))
+        if verbose:
+            logger.info(
+                "epoch %d/%d (%d replicas) %s",
+                epoch + 1,
+                epochs,
+                replicas,
+                " ".join(f"{k}={v:.4f}" for k, v in logs.items()),
+            )
+        if net.stop_training:
+            break
+    callback_list.on_train_end()
+
+    trained_weights = net.get_weights()
+    model_wrapper.build()
+    model_wrapper.model.set_weights(trained_weights)
+    model_wrapper.history = history
+    return history
+
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return int(sock.getsockname()[1])
+
+
+def local_cluster(n_workers: int, host: str = "localhost") -> list[dict[str, Any]]:
+    """``TF_CONFIG`` dicts for ``n_workers`` workers on free local ports (worker 0 is chief)."""
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be >= 1, got {n_workers}")
+    workers = [f"{host}:{_free_port(host)}" for _ in range(n_workers)]
+    return [{"cluster": {"worker": workers}, "task": {"type": "worker", "index": i}} for i in range(n_workers)]
+
+
+def launch_local_workers(
+    runner_args: list[str],
+    n_workers: int = 2,
+    timeout: float | None = None,
+) -> list[dict[str, Any]]:
+    """Run ``n_workers`` runner processes as one multi-worker cluster on localhost.
+
+    Every worker gets the same ``runner_args`` plus ``--distributed multi_worker``
+    and its own ``TF_CONFIG``.  Returns one entry per worker with its exit code
+    and captured output; the chief's stdout is the run payload.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    cmd = [sys.executable, "-m", "src.training.runner", *runner_args, "--distributed", "multi_worker"]
+    procs = [
+        subprocess.Popen(
+            cmd,
+            cwd=str(ROOT),
+            env={**env, "TF_CONFIG": json.dumps(tf_config)},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for tf_config in local_cluster(n_workers)
+    ]
+    results = []
+    try:
+        for index, proc in enumerate(procs):
+            stdout, stderr = proc.communicate(timeout=timeout)
+            results.append({"task_index": index, "returncode": proc.returncode, "stdout": stdout, "stderr": stderr})
+            if proc.returncode != 0:
+                logger.error("worker %d exited with %d", index, proc.returncode)
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+    return results
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+    parser = argparse.ArgumentParser(
+        description="Run the training runner as a local multi-worker cluster (extra args go to the runner)"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=None, help="seconds to wait for each worker")
+    args, runner_args = parser.parse_known_args()
+
+    results = launch_local_workers(runner_args, n_workers=args.workers, timeout=args.timeout)
+    for res in results:
+        if res["returncode"] != 0:
+            print(res["stderr"], file=sys.stderr)
+    print(results[0]["stdout"], end="")
+    raise SystemExit(max(res["returncode"] for res in results))
+
+
+if __name__ == "__main__":
+    main()
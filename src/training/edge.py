@@ -9,6 +9,9 @@ import logging
 import subprocess
 import sys
 import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -16,26 +19,32 @@ from typing import Any
 import numpy as np
 
 logger = logging.getLogger(__name__)
-_KERAS_MODEL_CACHE: dict[str, Any] = {}
+# Loaded runtime sessions keyed by (runtime, resolved path, mtime_ns, size): a
+# re-exported file gets a fresh session and the oldest sessions are evicted.
+_SESSION_CACHE: OrderedDict[tuple[str, str, int, int], Callable[[Any], np.ndarray]] = OrderedDict()
+_SESSION_CACHE_SIZE = 8
+_SESSION_CACHE_LOCK = threading.Lock()
+# Allocated TFLite interpreters kept per session, one per distinct input shape (batch size).
+_TFLITE_SHAPES_PER_SESSION = 8
 
 
 EDGE_DEVICE_PROFILES: dict[str, dict[str, Any]] = {
     "android_high_end": {
-        "runtime_order": ["tflite", "onnx", "keras"],
+        "runtime_order": ["tflite", "onnx", "numpy", "keras"],
         "latency_p95_target_ms": 50.0,
         "size_target_mb": 8.0,
         "size_hard_limit_mb": 15.0,
         "memory_budget_mb": 256.0,
     },
     "ios_high_end": {
-        "runtime_order": ["tflite", "onnx", "keras"],
+        "runtime_order": ["tflite", "onnx", "numpy", "keras"],
         "latency_p95_target_ms": 50.0,
         "size_target_mb": 8.0,
         "size_hard_limit_mb": 15.0,
         "memory_budget_mb": 256.0,
     },
     "desktop_reference": {
-        "runtime_order": ["tflite", "onnx", "keras"],
+        "runtime_order": ["tflite", "onnx", "numpy", "keras"],
         "latency_p95_target_ms": 50.0,
         "size_target_mb": 8.0,
         "size_hard_limit_mb": 15.0,
@@ -204,7 +213,9 @@ def _export_tflite_model_subprocess(*, keras_model: Any, out_path: Path, quantiz
             "model_path = Path(sys.argv[1])\n"
             "out_path = Path(sys.argv[2])\n"
             "quantization = sys.argv[3]\n"
-            "model = tf.keras.models.load_model(model_path)\n"
+            "sys.path.insert(0, sys.argv[4])\n"
+            "import src.models  # registers custom layers/losses for deserialization\n"
+            "model = tf.keras.models.load_model(model_path, compile=False)\n"
             "converter = tf.lite.TFLiteConverter.from_keras_model(model)\n"
             "if quantization == 'fp16':\n"
             "    converter.optimizations = [tf.lite.Optimize.DEFAULT]\n"
@@ -217,7 +228,15 @@ def _export_tflite_model_subprocess(*, keras_model: Any, out_path: Path, quantiz
             "print(json.dumps({'size_bytes': int(out_path.stat().st_size)}))\n"
         )
         proc = subprocess.run(
-            [sys.executable, "-c", script, str(tmp_model_path), str(out_path), quantization],
+            [
+                sys.executable,
+                "-c",
+                script,
+                str(tmp_model_path),
+                str(out_path),
+                quantization,
+                str(Path(__file__).resolve().parents[2]),
+            ],
             text=True,
             capture_output=True,
         )
@@ -265,61 +284,156 @@ def export_onnx_model(keras_model: Any, out_path: Path) -> dict[str, Any]:
         return {"status": "failed", "error": str(exc)}
 
 
-def run_tflite_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
-    import tensorflow as tf
-
-    interpreter = tf.lite.Interpreter(model_path=str(model_path))
-    interpreter.allocate_tensors()
-    input_details = interpreter.get_input_details()
-    output_details = interpreter.get_output_details()
-
-    inputs = _as_input_list(sample_inputs)
-    if len(inputs) != len(input_details):
-        raise ValueError(f"tflite input count mismatch: got {len(inputs)} expected {len(input_details)}")
-
-    for i, detail in enumerate(input_details):
-        arr = np.asarray(inputs[i], dtype=np.dtype(detail["dtype"]))
-        interpreter.set_tensor(detail["index"], arr)
-    interpreter.invoke()
-    out = interpreter.get_tensor(output_details[0]["index"])
-    return np.asarray(out, dtype=np.float32)
+def load_tflite_session(model_path: Path) -> Callable[[Any], np.ndarray]:
+    """Return a thread-safe predict function with one allocated interpreter per input shape.
 
+    Micro-batched callers alternate between batch sizes.  Resizing a single
+    interpreter would re-plan its buffers on every switch, so each shape keeps its
+    own interpreter (the least recently used beyond ``_TFLITE_SHAPES_PER_SESSION`` is dropped).
+    """
+    import tensorflow as tf
 
-def run_onnx_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
+    # The interpreters reference this buffer; the closure keeps it alive.
+    model_content = Path(model_path).read_bytes()
+
+    def build(shapes: tuple[tuple[int, ...], ...] | None) -> tuple[Any, threading.Lock]:
+        interpreter = tf.lite.Interpreter(model_content=model_content)
+        if shapes is not None:
+            for d, shape in zip(interpreter.get_input_details(), shapes, strict=True):
+                interpreter.resize_tensor_input(d["index"], list(shape))
+        interpreter.allocate_tensors()
+        return interpreter, threading.Lock()
+
+    default = build(None)
+    input_details = default[0].get_input_details()
+    output_index = default[0].get_output_details()[0]["index"]
+    native_shapes = tuple(tuple(int(x) for x in d["shape"]) for d in input_details)
+    interpreters: OrderedDict[tuple[tuple[int, ...], ...], tuple[Any, threading.Lock]] = OrderedDict(
+        {native_shapes: default}
+    )
+    interpreters_lock = threading.Lock()
+
+    def predict(sample_inputs: Any) -> np.ndarray:
+        inputs = _as_input_list(sample_inputs)
+        if len(inputs) != len(input_details):
+            raise ValueError(f"tflite input count mismatch: got {len(inputs)} expected {len(input_details)}")
+        arrays = [np.asarray(inputs[i], dtype=np.dtype(d["dtype"])) for i, d in enumerate(input_details)]
+        shapes = tuple(arr.shape for arr in arrays)
+        with interpreters_lock:
+            entry = interpreters.get(shapes)
+            if entry is not None:
+                interpreters.move_to_end(shapes)
+        if entry is None:
+            built = build(shapes)
+            with interpreters_lock:
+                entry = interpreters.setdefault(shapes, built)
+                while len(interpreters) > _TFLITE_SHAPES_PER_SESSION:
+                    interpreters.popitem(last=False)
+        interpreter, lock = entry
+        # An interpreter owns its tensor buffers, so invocations must not interleave.
+        with lock:
+            for d, arr in zip(input_details, arrays, strict=True):
+                interpreter.set_tensor(d["index"], arr)
+            interpreter.invoke()
+            out = interpreter.get_tensor(output_index)
+        return np.asarray(out, dtype=np.float32)
+
+    return predict
+
+
+def load_onnx_session(model_path: Path) -> Callable[[Any], np.ndarray]:
     import onnxruntime as ort
 
     sess = ort.InferenceSession(str(model_path), providers=["CPUExecutionProvider"])
-    feed: dict[str, Any] = {}
-    inputs = _as_input_list(sample_inputs)
     sess_inputs = sess.get_inputs()
-    if len(inputs) != len(sess_inputs):
-        raise ValueError(f"onnx input count mismatch: got {len(inputs)} expected {len(sess_inputs)}")
-    for i, meta in enumerate(sess_inputs):
-        feed[meta.name] = np.asarray(inputs[i], dtype=np.float32)
-    outputs = sess.run(None, feed)
-    return np.asarray(outputs[0], dtype=np.float32)
 
+    def predict(sample_inputs: Any) -> np.ndarray:
+        inputs = _as_input_list(sample_inputs)
+        if len(inputs) != len(sess_inputs):
+            raise ValueError(f"onnx input count mismatch: got {len(inputs)} expected {len(sess_inputs)}")
+        feed = {meta.name: np.asarray(inputs[i], dtype=np.float32) for i, meta in enumerate(sess_inputs)}
+        outputs = sess.run(None, feed)
+        return np.asarray(outputs[0], dtype=np.float32)
 
-def run_keras_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
+    return predict
+
+
+def load_keras_session(model_path: Path) -> Callable[[Any], np.ndarray]:
     import tensorflow as tf
 
-    cache_key = str(model_path.resolve())
-    model = _KERAS_MODEL_CACHE.get(cache_key)
-    if model is None:
-        model = tf.keras.models.load_model(str(model_path), compile=False)
-        _KERAS_MODEL_CACHE[cache_key] = model
+    import src.models  # noqa: F401  (registers custom layers/losses for deserialization)
 
-    inputs = _as_input_list(sample_inputs)
+    model = tf.keras.models.load_model(str(model_path), compile=False)
     input_names = list(getattr(model, "input_names", []) or [])
-    if len(inputs) == 1:
-        model_inputs: Any = {input_names[0]: inputs[0]} if input_names else inputs[0]
-    elif input_names and len(input_names) == len(inputs):
-        model_inputs = {name: arr for name, arr in zip(input_names, inputs, strict=False)}
-    else:
-        model_inputs = inputs
 
-    outputs = model(model_inputs, training=False)
-    return np.asarray(outputs, dtype=np.float32)
+    def predict(sample_inputs: Any) -> np.ndarray:
+        inputs = _as_input_list(sample_inputs)
+        if len(inputs) == 1:
+            model_inputs: Any = {input_names[0]: inputs[0]} if input_names else inputs[0]
+        elif input_names and len(input_names) == len(inputs):
+            model_inputs = {name: arr for name, arr in zip(input_names, inputs, strict=False)}
+        else:
+            model_inputs = inputs
+        outputs = model(model_inputs, training=False)
+        return np.asarray(outputs, dtype=np.float32)
+
+    return predict
+
+
+def load_numpy_session(model_path: Path) -> Callable[[Any], np.ndarray]:
+    from src.training.numpy_runtime import NumpyForecaster
+
+    model = NumpyForecaster.load(model_path)
+    return lambda sample_inputs: np.asarray(model.predict(_as_input_list(sample_inputs)), dtype=np.float32)
+
+
+RUNTIME_SESSION_LOADERS: dict[str, Callable[[Path], Callable[[Any], np.ndarray]]] = {
+    "tflite": load_tflite_session,
+    "onnx": load_onnx_session,
+    "numpy": load_numpy_session,
+    "keras": load_keras_session,
+}
+
+
+def load_runtime_session(runtime: str, model_path: Path) -> Callable[[Any], np.ndarray]:
+    """Load ``model_path`` for ``runtime`` and return its predict function (uncached)."""
+    loader = RUNTIME_SESSION_LOADERS.get(runtime)
+    if loader is None:
+        raise ValueError(f"unsupported runtime '{runtime}'")
+    return loader(Path(model_path))
+
+
+def _cached_session(runtime: str, model_path: Path) -> Callable[[Any], np.ndarray]:
+    resolved = Path(model_path).resolve()
+    st = resolved.stat()
+    key = (runtime, str(resolved), st.st_mtime_ns, st.st_size)
+    with _SESSION_CACHE_LOCK:
+        session = _SESSION_CACHE.get(key)
+        if session is not None:
+            _SESSION_CACHE.move_to_end(key)
+            return session
+    session = load_runtime_session(runtime, resolved)
+    with _SESSION_CACHE_LOCK:
+        _SESSION_CACHE[key] = session
+        while len(_SESSION_CACHE) > _SESSION_CACHE_SIZE:
+            _SESSION_CACHE.popitem(last=False)
+    return session
+
+
+def run_tflite_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
+    return _cached_session("tflite", model_path)(sample_inputs)
+
+
+def run_onnx_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
+    return _cached_session("onnx", model_path)(sample_inputs)
+
+
+def run_keras_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
+    return _cached_session("keras", model_path)(sample_inputs)
+
+
+def run_numpy_inference(model_path: Path, sample_inputs: Any) -> np.ndarray:
+    return _cached_session("numpy", model_path)(sample_inputs)
 
 
 def compute_parity(reference: np.ndarray, candidate: np.ndarray) -> dict[str, float]:
@@ -366,6 +480,11 @@ def build_runtime_compatibility(
             "path": export_results.get("onnx", {}).get("path"),
             "reason": export_results.get("onnx", {}).get("error"),
         },
+        "numpy": {
+            "supported": export_results.get("numpy", {}).get("status") == "succeeded",
+            "path": export_results.get("numpy", {}).get("path"),
+            "reason": export_results.get("numpy", {}).get("error"),
+        },
         "keras": {
             "supported": True,
             "path": keras_path,
@@ -379,7 +498,7 @@ def select_runtime_stack(
     runtime_compatibility: dict[str, dict[str, Any]],
     preferred_order: list[str] | None = None,
 ) -> tuple[str, list[str]]:
-    order = preferred_order or ["tflite", "onnx", "keras"]
+    order = preferred_order or ["tflite", "onnx", "numpy", "keras"]
     supported = [name for name in order if runtime_compatibility.get(name, {}).get("supported")]
     if not supported:
         return "keras", ["keras"]
@@ -0,0 +1,157 @@
+"""Benchmark recurrent kernels: recurrent dropout (generic loop) vs fast-kernel mode."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.models.lstm import BidirectionalLSTMModel, GRUModel, LSTMModel
+
+logger = logging.getLogger(__name__)
+
+_MODEL_MAP = {"lstm": LSTMModel, "gru": GRUModel, "bilstm": BidirectionalLSTMModel}
+
+
+def _time_variant(
+    model_cls: type[LSTMModel],
+    *,
+    fast_kernel: bool,
+    X: np.ndarray,
+    y: np.ndarray,
+    hidden_units: list[int],
+    recurrent_dropout: float,
+    batch_size: int,
+    epochs: int,
+    infer_repeats: int,
+) -> dict[str, Any]:
+    model = model_cls(
+        sequence_length=X.shape[1],
+        hidden_units=hidden_units,
+        dropout=0.0,
+        output_units=y.shape[1],
+        input_features=X.shape[2],
+        recurrent_dropout=recurrent_dropout,
+        fast_kernel=fast_kernel,
+    )
+    model.build()
+    assert model.model is not None
+    # One warm-up epoch so graph tracing is excluded from the timings.
+    model.fit_model(X, y, epochs=1, batch_size=batch_size, early_stopping=False, verbose=0)
+
+    t0 = time.perf_counter()
+    model.fit_model(X, y, epochs=epochs, batch_size=batch_size, early_stopping=False, verbose=0)
+    train_sec = time.perf_counter() - t0
+
+    model.predict(X)
+    infer_ms: list[float] = []
+    for _ in range(infer_repeats):
+        t0 = time.perf_counter()
+        model.predict(X)
+        infer_ms.append((time.perf_counter() - t0) * 1000.0)
+
+    return {
+        "fast_kernel": fast_kernel,
+        "kernels": sorted({entry["kernel"] for entry in model.kernel_report()}),
+        "train_sec": round(train_sec, 4),
+        "train_samples_per_sec": round(len(X) * epochs / train_sec, 2) if train_sec > 0 else None,
+        "infer_ms_p50": round(float(np.percentile(infer_ms, 50)), 3),
+        "final_loss": float((model.history or {}).get("loss", [float("nan")])[-1]),
+    }
+
+
+def run_kernel_benchmark(
+    model_type: str = "lstm",
+    hidden_units: list[int] | None = None,
+    sequence_length: int = 48,
+    n_samples: int = 1024,
+    input_features: int = 1,
+    horizon: int = 1,
+    recurrent_dropout: float = 0.2,
+    batch_size: int = 64,
+    epochs: int = 3,
+    infer_repeats: int = 5,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Train the same architecture with ``recurrent_dropout`` and in fast-kernel mode and compare speed."""
+    if model_type not in _MODEL_MAP:
+        raise ValueError(f"model_type must be one of {sorted(_MODEL_MAP)}, got {model_type!r}")
+    if recurrent_dropout <= 0:
+        raise ValueError("recurrent_dropout must be > 0 to compare against the fallback path")
+
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_samples, sequence_length, input_features)).astype(np.float32)
+    y = rng.normal(size=(n_samples, horizon)).astype(np.float32)
+    common: dict[str, Any] = {
+        "X": X,
+        "y": y,
+        "hidden_units": hidden_units or [64, 32],
+        "recurrent_dropout": recurrent_dropout,
+        "batch_size": batch_size,
+        "epochs": epochs,
+        "infer_repeats": infer_repeats,
+    }
+    model_cls = _MODEL_MAP[model_type]
+    baseline = _time_variant(model_cls, fast_kernel=False, **common)
+    fast = _time_variant(model_cls, fast_kernel=True, **common)
+    return {
+        "model_type": model_type,
+        "config": {
+            "hidden_units": common["hidden_units"],
+            "sequence_length": sequence_length,
+            "n_samples": n_samples,
+            "recurrent_dropout": recurrent_dropout,
+            "batch_size": batch_size,
+            "epochs": epochs,
+        },
+        "recurrent_dropout": baseline,
+        "fast_kernel": fast,
+        "train_speedup": round(baseline["train_sec"] / fast["train_sec"], 3) if fast["train_sec"] > 0 else None,
+        "infer_speedup": round(baseline["infer_ms_p50"] / fast["infer_ms_p50"], 3) if fast["infer_ms_p50"] else None,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Benchmark fused vs fallback recurrent kernels")
+    p.add_argument("--model-type", choices=sorted(_MODEL_MAP), default="lstm")
+    p.add_argument("--hidden-units", type=int, nargs="+", default=[64, 32])
+    p.add_argument("--sequence-length", type=int, default=48)
+    p.add_argument("--samples", type=int, default=1024)
+    p.add_argument("--recurrent-dropout", type=float, default=0.2)
+    p.add_argument("--batch-size", type=int, default=64)
+    p.add_argument("--epochs", type=int, default=3)
+    p.add_argument("--infer-repeats", type=int, default=5)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--output", type=str, default=None, help="Optional JSON output path")
+    return p
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+    args = build_parser().parse_args()
+    result = run_kernel_benchmark(
+        model_type=args.model_type,
+        hidden_units=args.hidden_units,
+        sequence_length=args.sequence_length,
+        n_samples=args.samples,
+        recurrent_dropout=args.recurrent_dropout,
+        batch_size=args.batch_size,
+        epochs=args.epochs,
+        infer_repeats=args.infer_repeats,
+        seed=args.seed,
+    )
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        out = Path(args.output)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""TensorFlow-free inference for small forecasting models.
+
+:func:`export_numpy_model` walks a trained Keras functional model and writes its
+layer graph and weights to one ``.npz`` file.  :class:`NumpyForecaster` loads
+that file and runs the forward pass in NumPy only, so serving it avoids
+importing TensorFlow or a TFLite interpreter.  Everything is vectorized over the
+batch dimension.  Dense projections are one matmul per layer.  Recurrent
+layers project every timestep's inputs in a single matmul and then loop only
+over time.
+
+The supported layer set covers ``DLinearLikeModel`` and the ``LSTMModel`` /
+``GRUModel`` stacks: ``Dense``, ``LSTM``, ``GRU``, ``LayerNormalization``,
+``AveragePooling1D``, ``Flatten``, ``Concatenate``, ``Add``, ``Subtract``,
+``Dropout`` (identity at inference) and the ``MonotonicQuantiles`` head.  Export
+fails with a reason for anything else (attention, convolutions, bidirectional
+wrappers), and the runtime stack then falls back to the other exports.
+
+This module must not import TensorFlow or ``src.models``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.training.edge import _sha256
+
+NUMPY_RUNTIME_FORMAT_VERSION = 1
+
+SUPPORTED_LAYERS = (
+    "InputLayer",
+    "Dense",
+    "LSTM",
+    "GRU",
+    "LayerNormalization",
+    "AveragePooling1D",
+    "Flatten",
+    "Concatenate",
+    "Add",
+    "Subtract",
+    "Dropout",
+    "MonotonicQuantiles",
+)
+
+# Layer config keys the forward pass needs; everything else is dropped.
+_CONFIG_KEYS = (
+    "units",
+    "activation",
+    "recurrent_activation",
+    "use_bias",
+    "return_sequences",
+    "go_backwards",
+    "reset_after",
+    "axis",
+    "epsilon",
+    "center",
+    "scale",
+    "pool_size",
+    "strides",
+    "padding",
+    "data_format",
+    "output_units",
+    "n_quantiles",
+)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    out: np.ndarray = 0.5 * (np.tanh(0.5 * x) + 1.0)
+    return out
+
+
+_ACTIVATIONS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0.0),
+    "tanh": np.tanh,
+    "sigmoid": _sigmoid,
+}
+
+
+def _activation(name: str | None) -> Callable[[np.ndarray], np.ndarray]:
+    key = name or "linear"
+    if key not in _ACTIVATIONS:
+        raise ValueError(f"unsupported activation for numpy runtime: {key!r}")
+    return _ACTIVATIONS[key]
+
+
+def _inbound_names(args: Any) -> list[str]:
+    """Collect producer layer names from a serialized Keras 3 ``inbound_nodes`` entry."""
+    if isinstance(args, dict):
+        history = args.get("config", {}).get("keras_history") if args.get("class_name") == "__keras_tensor__" else None
+        if history:
+            return [str(history[0])]
+        return [name for value in args.values() for name in _inbound_names(value)]
+    if isinstance(args, (list, tuple)):
+        return [name for value in args for name in _inbound_names(value)]
+    return []
+
+
+def _graph_from_keras(keras_model: Any) -> dict[str, Any]:
+    config = keras_model.get_config()
+    layers = []
+    for layer_cfg in config["layers"]:
+        class_name = layer_cfg["class_name"]
+        if class_name not in SUPPORTED_LAYERS:
+            raise ValueError(f"layer {layer_cfg['name']!r} ({class_name}) is not supported by the numpy runtime")
+        nodes = layer_cfg.get("inbound_nodes") or []
+        if len(nodes) > 1:
+            raise ValueError(f"layer {layer_cfg['name']!r} is shared; the numpy runtime needs one call per layer")
+        layer_config = {k: v for k, v in layer_cfg.get("config", {}).items() if k in _CONFIG_KEYS}
+        _check_layer_config(layer_cfg["name"], class_name, layer_config)
+        layers.append(
+            {
+                "name": layer_cfg["name"],
+                "class_name": class_name,
+                "config": layer_config,
+                "inbound": _inbound_names(nodes[0]["args"]) if nodes else [],
+            }
+        )
+    return {
+        "format_version": NUMPY_RUNTIME_FORMAT_VERSION,
+        "model_name": config.get("name"),
+        "inputs": [entry[0] for entry in config["input_layers"]],
+        "outputs": [entry[0] for entry in _as_entry_list(config["output_layers"])],
+        "layers": layers,
+    }
+
+
+def _as_entry_list(entries: Any) -> list[Any]:
+    # A single-output model serializes ``output_layers`` as one ``[name, node, tensor]`` entry.
+    return [entries] if entries and isinstance(entries[0], str) else list(entries)
+
+
+def _check_layer_config(name: str, class_name: str, config: dict[str, Any]) -> None:
+    for key in ("activation", "recurrent_activation"):
+        if key in config:
+            _activation(config[key])
+    if class_name == "LayerNormalization":
+        axis = config.get("axis", -1)
+        if (axis if isinstance(axis, list) else [axis]) != [-1]:
+            raise ValueError(f"layer {name!r}: numpy runtime only normalizes over the last axis, got axis={axis}")
+    if class_name == "AveragePooling1D" and config.get("data_format", "channels_last") != "channels_last":
+        raise ValueError(f"layer {name!r}: numpy runtime only supports channels_last pooling")
+
+
+def export_numpy_model(keras_model: Any, out_path: Path) -> dict[str, Any]:
+    """Write ``keras_model`` as a numpy-runtime ``.npz`` (graph JSON + weights)."""
+    try:
+        graph = _graph_from_keras(keras_model)
+        arrays: dict[str, np.ndarray] = {"graph": np.array(json.dumps(graph))}
+        for layer in keras_model.layers:
+            for i, weight in enumerate(layer.get_weights()):
+                arrays[f"{layer.name}/{i}"] = np.asarray(weight, dtype=np.float32)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "wb") as fh:
+            np.savez(fh, **arrays)
+    except Exception as exc:
+        return {"status": "failed", "error": str(exc)}
+    return {
+        "status": "succeeded",
+        "path": str(out_path),
+        "size_bytes": int(out_path.stat().st_size),
+        "sha256": _sha256(out_path),
+    }
+
+
+def _dense(x: np.ndarray, weights: list[np.ndarray], config: dict[str, Any]) -> np.ndarray:
+    out = x @ weights[0]
+    if len(weights) > 1:
+        out = out + weights[1]
+    return _activation(config.get("activation"))(out)
+
+
+def _lstm(x: np.ndarray, weights: list[np.ndarray], config: dict[str, Any]) -> np.ndarray:
+    kernel, recurrent = weights[0], weights[1]
+    units = recurrent.shape[0]
+    act = _activation(config.get("activation", "tanh"))
+    rec_act = _activation(config.get("recurrent_activation", "sigmoid"))
+    if config.get("go_backwards"):
+        x = x[:, ::-1]
+    # One matmul projects the inputs of every timestep; only h @ U stays in the loop.
+    xw = x @ kernel
+    if len(weights) > 2:
+        xw = xw + weights[2]
+    h = np.zeros((x.shape[0], units), dtype=x.dtype)
+    c = np.zeros_like(h)
+    seq = []
+    for t in range(x.shape[1]):
+        z = xw[:, t] + h @ recurrent
+        i, f, g, o = np.split(z, 4, axis=-1)
+        c = rec_act(f) * c + rec_act(i) * act(g)
+        h = rec_act(o) * act(c)
+        seq.append(h)
+    return np.stack(seq, axis=1) if config.get("return_sequences") else h
+
+
+def _gru(x: np.ndarray, weights: list[np.ndarray], config: dict[str, Any]) -> np.ndarray:
+    kernel, recurrent = weights[0], weights[1]
+    units = recurrent.shape[0]
+    act = _activation(config.get("activation", "tanh"))
+    rec_act = _activation(config.get("recurrent_activation", "sigmoid"))
+    reset_after = config.get("reset_after", True)
+    bias = weights[2] if len(weights) > 2 else np.zeros((2, 3 * units) if reset_after else (3 * units,), x.dtype)
+    input_bias, recurrent_bias = (bias[0], bias[1]) if bias.ndim == 2 else (bias, np.zeros_like(bias))
+    if config.get("go_backwards"):
+        x = x[:, ::-1]
+    xw = x @ kernel + input_bias
+    h = np.zeros((x.shape[0], units), dtype=x.dtype)
+    seq = []
+    for t in range(x.shape[1]):
+        x_z, x_r, x_h = np.split(xw[:, t], 3, axis=-1)
+        if reset_after:
+            h_z, h_r, h_h = np.split(h @ recurrent + recurrent_bias, 3, axis=-1)
+            z = rec_act(x_z + h_z)
+            r = rec_act(x_r + h_r)
+            candidate = act(x_h + r * h_h)
+        else:
+            z = rec_act(x_z + h @ recurrent[:, :units])
+            r = rec_act(x_r + h @ recurrent[:, units : 2 * units])
+            candidate = act(x_h + (r * h) @ recurrent[:, 2 * units :])
+        h = z * h + (1.0 - z) * candidate
+        seq.append(h)
+    return np.stack(seq, axis=1) if config.get("return_sequences") else h
+
+
+def _layer_norm(x: np.ndarray, weights: list[np.ndarray], config: dict[str, Any]) -> np.ndarray:
+    mean = x.mean(axis=-1, keepdims=True)
+    var = x.var(axis=-1, keepdims=True)
+    out = (x - mean) / np.sqrt(var + config.get("epsilon", 1e-3))
+    idx = 0
+    if config.get("scale", True):
+        out = out * weights[idx]
+        idx += 1
+    if config.get("center", True):
+        out = out + weights[idx]
+    return np.asarray(out)
+
+
+def _first(value: Any) -> int:
+    return int(value[0] if isinstance(value, (list, tuple)) else value)
+
+
+def _avg_pool_1d(x: np.ndarray, config: dict[str, Any]) -> np.ndarray:
+    """Average pooling over time; ``same`` padding averages only the in-range values, like TF."""
+    pool = _first(config.get("pool_size", 2))
+    stride = _first(config.get("strides") or pool)
+    steps = x.shape[1]
+    if config.get("padding", "valid") == "same":
+        out_len = -(-steps // stride)
+        pad_left = max((out_len - 1) * stride + pool - steps, 0) // 2
+    else:
+        out_len = (steps - pool) // stride + 1
+        pad_left = 0
+    starts = np.arange(out_len) * stride - pad_left
+    lo = np.clip(starts, 0, steps)
+    hi = np.clip(starts + pool, 0, steps)
+    cumsum = np.concatenate([np.zeros_like(x[:, :1]), np.cumsum(x, axis=1)], axis=1)
+    counts = (hi - lo).astype(x.dtype)[None, :, None]
+    return np.asarray((cumsum[:, hi] - cumsum[:, lo]) / counts)
+
+
+def _monotonic_quantiles(x: np.ndarray, config: dict[str, Any]) -> np.ndarray:
+    q = x.reshape(-1, int(config["output_units"]), int(config["n_quantiles"]))
+    raw = q[..., 1:]
+    steps = np.maximum(raw, 0.0) + np.log1p(np.exp(-np.abs(raw)))
+    return np.cumsum(np.concatenate([q[..., :1], steps], axis=-1), axis=-1)
+
+
+class NumpyForecaster:
+    """Forward pass of an exported model in NumPy (see :func:`export_numpy_model`)."""
+
+    def __init__(self, graph: dict[str, Any], weights: dict[str, list[np.ndarray]]) -> None:
+        if graph.get("format_version") != NUMPY_RUNTIME_FORMAT_VERSION:
+            raise ValueError(f"unsupported numpy runtime format: {graph.get('format_version')!r}")
+        for layer in graph["layers"]:
+            if layer["class_name"] not in SUPPORTED_LAYERS:
+                raise ValueError(f"layer {layer['name']!r} ({layer['class_name']}) is not supported")
+            _check_layer_config(layer["name"], layer["class_name"], layer["config"])
+        self.graph = graph
+        self.weights = weights
+        self.input_names: list[str] = list(graph["inputs"])
+
+    @classmethod
+    def load(cls, path: str | Path) -> NumpyForecaster:
+        with np.load(str(path), allow_pickle=False) as data:
+            graph = json.loads(str(data["graph"]))
+            indexed: dict[str, dict[int, np.ndarray]] = {}
+            for key in data.files:
+                if key == "graph":
+                    continue
+                layer_name, index = key.rsplit("/", 1)
+                indexed.setdefault(layer_name, {})[int(index)] = data[key]
+        weights = {name: [items[i] for i in sorted(items)] for name, items in indexed.items()}
+        return cls(graph, weights)
+
+    def predict(self, inputs: Any) -> np.ndarray:
+        """Run the model on one array (single input) or a list ordered like ``input_names``."""
+        arrays = list(inputs) if isinstance(inputs, (list, tuple)) else [inputs]
+        if len(arrays) != len(self.input_names):
+            raise ValueError(f"numpy runtime input count mismatch: got {len(arrays)} expected {len(self.input_names)}")
+        values: dict[str, np.ndarray] = {
+            name: np.asarray(arr, dtype=np.float32) for name, arr in zip(self.input_names, arrays, strict=True)
+        }
+        for layer in self.graph["layers"]:
+            name, kind, config = layer["name"], layer["class_name"], layer["config"]
+            if kind == "InputLayer":
+                continue
+            args = [values[src] for src in layer["inbound"]]
+            weights = self.weights.get(name, [])
+            if kind == "Dense":
+                out = _dense(args[0], weights, config)
+            elif kind == "LSTM":
+                out = _lstm(args[0], weights, config)
+            elif kind == "GRU":
+                out = _gru(args[0], weights, config)
+            elif kind == "LayerNormalization":
+                out = _layer_norm(args[0], weights, config)
+            elif kind == "AveragePooling1D":
+                out = _avg_pool_1d(args[0], config)
+            elif kind == "Flatten":
+                out = args[0].reshape(args[0].shape[0], -1)
+            elif kind == "Concatenate":
+                out = np.concatenate(args, axis=int(config.get("axis", -1)))
+            elif kind == "Add":
+                out = np.sum(args, axis=0)
+            elif kind == "Subtract":
+                out = args[0] - args[1]
+            elif kind == "MonotonicQuantiles":
+                out = _monotonic_quantiles(args[0], config)
+            else:  # Dropout
+                out = args[0]
+            values[name] = out.astype(np.float32, copy=False)
+        return values[self.graph["outputs"][0]]
@@ -0,0 +1,181 @@
+"""Training-speed instrumentation as a Keras callback.
+
+:func:`make_profiler_callback` returns a callback for ``extra_callbacks`` that
+times every training step and epoch and produces a summary
+(:meth:`summary`) fit for the run's metrics JSON:
+
+- **throughput**: samples/sec per epoch, overall, and the median over epochs
+  after the first (``steady_samples_per_sec``); train steps only, so validation
+  time is excluded;
+- **step time**: mean and p50/p90/p99/max in milliseconds.  The first step
+  carries graph tracing, so it is reported separately as ``first_step_ms`` and
+  left out of the percentiles;
+- **input wait**: host time between the end of one step and the start of the
+  next (and before the first step of each epoch).  This is where an input
+  pipeline or callback stall shows up; data fetched inside the compiled step is
+  counted as step time;
+- **peak RSS** of the training process;
+- optionally a TensorBoard profiler trace over a range of global steps.
+
+``Trainer.train`` sets ``samples_per_epoch`` from the fitted windows when the
+caller left it unset.  Without it, throughput assumes every batch is full.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.training.edge_benchmark import _max_rss_mb
+
+
+def _step_time_summary(step_ms: list[float]) -> dict[str, Any]:
+    if not step_ms:
+        return {"count": 0}
+    first, rest = step_ms[0], step_ms[1:] or step_ms[:1]
+    arr = np.asarray(rest, dtype=float)
+    return {
+        "count": len(step_ms),
+        "first_step_ms": round(first, 3),
+        "mean": round(float(arr.mean()), 3),
+        "p50": round(float(np.percentile(arr, 50)), 3),
+        "p90": round(float(np.percentile(arr, 90)), 3),
+        "p99": round(float(np.percentile(arr, 99)), 3),
+        "max": round(float(arr.max()), 3),
+    }
+
+
+def _steady_throughput(epochs: list[dict[str, Any]]) -> float | None:
+    rates = [e["samples_per_sec"] for e in epochs if e["samples_per_sec"] is not None]
+    return round(float(np.median(rates)), 2) if rates else None
+
+
+def make_profiler_callback(
+    batch_size: int,
+    trace_steps: tuple[int, int] | None = None,
+    trace_dir: str | Path | None = None,
+    samples_per_epoch: int | None = None,
+) -> Any:
+    """Build the profiling callback.
+
+    Parameters
+    ----------
+    batch_size : int
+        Batch size passed to the fit; used to convert steps to samples.
+    trace_steps : tuple[int, int] | None
+        Inclusive range of 1-based global training steps to capture with the
+        TensorBoard profiler (e.g. ``(10, 20)``).  Requires ``trace_dir``.
+    trace_dir : str | Path | None
+        Log directory for the profiler trace (open with TensorBoard's profile
+        plugin).
+    samples_per_epoch : int | None
+        Training windows per epoch; filled in by ``Trainer.train`` when omitted.
+    """
+    import tensorflow as tf
+    from tensorflow import keras
+
+    if trace_steps is not None:
+        start, stop = trace_steps
+        if trace_dir is None:
+            raise ValueError("trace_steps requires trace_dir")
+        if not 1 <= start <= stop:
+            raise ValueError(f"trace_steps must be 1 <= start <= stop, got {trace_steps}")
+
+    class TrainingProfiler(keras.callbacks.Callback):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batch_size = int(batch_size)
+            self.samples_per_epoch = samples_per_epoch
+            self.trace_steps = trace_steps
+            self.trace_dir = str(trace_dir) if trace_dir is not None else None
+            self.epochs: list[dict[str, Any]] = []
+            self.step_ms: list[float] = []
+            self._global_step = 0
+            self._tracing = False
+            self._trace_done = False
+            self._fit_start = 0.0
+            self._fit_seconds = 0.0
+
+        def on_train_begin(self, logs: dict[str, Any] | None = None) -> None:
+            self._fit_start = time.perf_counter()
+
+        def on_epoch_begin(self, epoch: int, logs: dict[str, Any] | None = None) -> None:
+            now = time.perf_counter()
+            self._epoch_start = now
+            self._last_step_end = now
+            self._epoch_steps = 0
+            self._epoch_step_seconds = 0.0
+            self._epoch_wait = 0.0
+
+        def on_train_batch_begin(self, batch: int, logs: dict[str, Any] | None = None) -> None:
+            self._global_step += 1
+            if self.trace_steps is not None and not self._trace_done and self._global_step == self.trace_steps[0]:
+                tf.profiler.experimental.start(self.trace_dir)
+                self._tracing = True
+            now = time.perf_counter()
+            self._epoch_wait += now - self._last_step_end
+            self._step_start = now
+
+        def on_train_batch_end(self, batch: int, logs: dict[str, Any] | None = None) -> None:
+            now = time.perf_counter()
+            seconds = now - self._step_start
+            self.step_ms.append(seconds * 1000.0)
+            self._epoch_steps += 1
+            self._epoch_step_seconds += seconds
+            self._last_step_end = now
+            if self._tracing and self.trace_steps is not None and self._global_step >= self.trace_steps[1]:
+                self._stop_trace()
+
+        def on_epoch_end(self, epoch: int, logs: dict[str, Any] | None = None) -> None:
+            now = time.perf_counter()
+            samples = self._epoch_steps * self.batch_size
+            if self.samples_per_epoch is not None:
+                samples = min(samples, int(self.samples_per_epoch))
+            train_seconds = self._epoch_step_seconds + self._epoch_wait
+            self.epochs.append(
+                {
+                    "epoch": epoch + 1,
+                    "seconds": round(now - self._epoch_start, 4),
+                    "steps": self._epoch_steps,
+                    "samples": samples,
+                    "samples_per_sec": round(samples / train_seconds, 2) if train_seconds > 0 else None,
+                    "input_wait_seconds": round(self._epoch_wait, 4),
+                    # Validation and epoch-end work run after the last train step.
+                    "val_seconds": round(now - self._last_step_end, 4),
+                }
+            )
+
+        def on_train_end(self, logs: dict[str, Any] | None = None) -> None:
+            self._fit_seconds = time.perf_counter() - self._fit_start
+            if self._tracing:
+                self._stop_trace()
+
+        def _stop_trace(self) -> None:
+            tf.profiler.experimental.stop()
+            self._tracing = False
+            self._trace_done = True
+
+        def summary(self) -> dict[str, Any]:
+            """Profile of the fit so far as a JSON-serializable dict."""
+            samples = sum(e["samples"] for e in self.epochs)
+            wait = sum(e["input_wait_seconds"] for e in self.epochs)
+            train_seconds = sum(self.step_ms) / 1000.0 + wait
+            return {
+                "fit_seconds": round(self._fit_seconds, 4),
+                "samples": samples,
+                "samples_per_sec": round(samples / train_seconds, 2) if train_seconds > 0 else None,
+                # Epoch 1 pays for graph tracing; later epochs are the number to track across releases.
+                "steady_samples_per_sec": _steady_throughput(self.epochs[1:]),
+                "step_time_ms": _step_time_summary(self.step_ms),
+                "input_wait_seconds": round(wait, 4),
+                "input_wait_fraction": round(wait / train_seconds, 4) if train_seconds > 0 else None,
+                "peak_rss_mb": round(_max_rss_mb(), 1),
+                "trace_dir": self.trace_dir if self._trace_done else None,
+                "trace_steps": list(self.trace_steps) if self._trace_done and self.trace_steps else None,
+                "epochs": self.epochs,
+            }
+
+    return TrainingProfiler()
@@ -0,0 +1,166 @@
+"""Machine-readable training progress as a Keras callback.
+
+The backend starts the runner with a pipe whose write end is inherited as file
+descriptor ``$SPLINE_PROGRESS_FD``.  :func:`make_progress_callback_from_env`
+returns a callback that writes one JSON object per line to it.  Stdout stays
+free for humans, and nothing has to be scraped from log text.  Events:
+
+- ``train_begin``: ``epochs`` and ``steps`` (per epoch);
+- ``step``: at most every ``min_interval_s``, with ``epoch``, ``step``,
+  ``loss``, ``samples_per_sec``, ``fraction`` and ``eta_s``;
+- ``epoch``: after every epoch, adding ``val_loss`` and the epoch's
+  ``seconds``;
+- ``train_end``.
+
+``epoch`` is 1-based.  ``fraction`` is the share of this fit's steps already
+done, and ``eta_s`` extrapolates the remaining steps from the fit's average
+step time so far.  A closed or broken descriptor disables the callback.
+Training itself never fails because of it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import IO, Any
+
+PROGRESS_FD_ENV = "SPLINE_PROGRESS_FD"
+
+
+def progress_stream_from_env() -> IO[str] | None:
+    """Line-buffered writer for ``$SPLINE_PROGRESS_FD``, or None when unset or invalid."""
+    raw = os.getenv(PROGRESS_FD_ENV)
+    if not raw:
+        return None
+    try:
+        # closefd=False: a warm worker reuses the same descriptor for every job it runs.
+        return os.fdopen(int(raw), "w", buffering=1, encoding="utf-8", closefd=False)
+    except (OSError, ValueError):
+        return None
+
+
+def _finite(value: Any) -> float | None:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return round(number, 6) if number == number and abs(number) != float("inf") else None
+
+
+def make_progress_callback(
+    stream: IO[str], batch_size: int, samples_per_epoch: int | None = None, min_interval_s: float = 0.5
+) -> Any:
+    """Build the progress callback writing JSON lines to ``stream``.
+
+    Parameters
+    ----------
+    stream : IO[str]
+        Text stream for the events (normally from :func:`progress_stream_from_env`).
+    batch_size : int
+        Batch size passed to the fit; used to convert steps to samples.
+    samples_per_epoch : int | None
+        Training windows per epoch; filled in by ``Trainer.train`` when omitted.
+    min_interval_s : float
+        Minimum time between two ``step`` events.
+    """
+    from tensorflow import keras
+
+    class ProgressReporter(keras.callbacks.Callback):
+        def __init__(self) -> None:
+            super().__init__()
+            self.stream: IO[str] | None = stream
+            self.batch_size = int(batch_size)
+            self.samples_per_epoch = samples_per_epoch
+            self.min_interval_s = float(min_interval_s)
+            self._steps_done = 0
+            self._last_emit = 0.0
+
+        def _emit(self, event: str, **fields: Any) -> None:
+            if self.stream is None:
+                return
+            try:
+                self.stream.write(json.dumps({"event": event, "ts": time.time(), **fields}) + "\n")
+            except (OSError, ValueError):
+                self.stream = None
+
+        def _steps_per_epoch(self) -> int | None:
+            steps = (self.params or {}).get("steps")
+            return int(steps) if steps else None
+
+        def _rate_and_eta(self) -> tuple[float | None, float | None, float | None]:
+            elapsed = time.perf_counter() - self._fit_start
+            steps = self._steps_per_epoch()
+            if not self._steps_done or elapsed <= 0:
+                return None, None, None
+            samples = self._steps_done * self.batch_size
+            if self.samples_per_epoch is not None and steps:
+                # The last batch of an epoch is usually partial.
+                full, partial = divmod(self._steps_done, steps)
+                per_epoch = int(self.samples_per_epoch)
+                samples = full * per_epoch + min(partial * self.batch_size, per_epoch)
+            if not steps:
+                return round(samples / elapsed, 2), None, None
+            total = steps * max(1, self._epochs - self._initial_epoch)
+            fraction = min(1.0, self._steps_done / total)
+            eta = elapsed / self._steps_done * max(0, total - self._steps_done)
+            return round(samples / elapsed, 2), round(fraction, 4), round(eta, 2)
+
+        def on_train_begin(self, logs: dict[str, Any] | None = None) -> None:
+            self._fit_start = time.perf_counter()
+            self._epochs = int((self.params or {}).get("epochs") or 0)
+            self._initial_epoch = 0
+            self._epoch = 0
+            self._emit("train_begin", epochs=self._epochs, steps=self._steps_per_epoch())
+
+        def on_epoch_begin(self, epoch: int, logs: dict[str, Any] | None = None) -> None:
+            if not self._steps_done:
+                # Resumed fits start at ``initial_epoch``; progress covers only the epochs left.
+                self._initial_epoch = epoch
+            self._epoch = epoch
+            self._epoch_start = time.perf_counter()
+
+        def on_train_batch_end(self, batch: int, logs: dict[str, Any] | None = None) -> None:
+            self._steps_done += 1
+            now = time.perf_counter()
+            if now - self._last_emit < self.min_interval_s:
+                return
+            self._last_emit = now
+            rate, fraction, eta = self._rate_and_eta()
+            self._emit(
+                "step",
+                epoch=self._epoch + 1,
+                epochs=self._epochs,
+                step=batch + 1,
+                steps=self._steps_per_epoch(),
+                loss=_finite((logs or {}).get("loss")),
+                samples_per_sec=rate,
+                fraction=fraction,
+                eta_s=eta,
+            )
+
+        def on_epoch_end(self, epoch: int, logs: dict[str, Any] | None = None) -> None:
+            logs = logs or {}
+            rate, fraction, eta = self._rate_and_eta()
+            self._emit(
+                "epoch",
+                epoch=epoch + 1,
+                epochs=self._epochs,
+                loss=_finite(logs.get("loss")),
+                val_loss=_finite(logs.get("val_loss")),
+                samples_per_sec=rate,
+                fraction=fraction,
+                eta_s=eta,
+                seconds=round(time.perf_counter() - self._epoch_start, 4),
+            )
+
+        def on_train_end(self, logs: dict[str, Any] | None = None) -> None:
+            self._emit("train_end", epoch=self._epoch + 1, epochs=self._epochs)
+
+    return ProgressReporter()
+
+
+def make_progress_callback_from_env(batch_size: int) -> Any | None:
+    """The progress callback when the backend passed a progress descriptor, else None."""
+    stream = progress_stream_from_env()
+    return make_progress_callback(stream, batch_size) if stream is not None else None
@@ -0,0 +1,199 @@
+"""Batched multi-horizon rollout beyond a model's trained output block.
+
+Models predict a fixed block of ``model_horizon`` steps.  To forecast further,
+:class:`RolloutEngine` feeds predictions back as inputs for many series at
+once:
+
+- ``direct``: one call, ``horizon <= model_horizon``.
+- ``recursive``: keep only the first predicted step and shift the window by one
+  (``horizon`` calls).
+- ``hybrid``: keep the whole predicted block and shift by ``model_horizon``
+  (``ceil(horizon / model_horizon)`` calls).
+
+Every call is batched across all series.  Windows live in a preallocated
+double-mapped ring buffer: each value is written at slot ``t % L`` and
+``t % L + L``, so the current window is always the contiguous view
+``buf[:, head:head + L]``.  Memory stays at ``2 * L`` steps per series for any
+horizon, and the rollout never reallocates.  Future-covariate windows are
+sliced as views of the caller's array.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ROLLOUT_STRATEGIES = ("direct", "recursive", "hybrid")
+
+PredictFn = Callable[[list[np.ndarray]], np.ndarray]
+
+
+class _WindowRing:
+    """Fixed-size sliding windows for ``n_series`` series without reallocation."""
+
+    def __init__(self, n_series: int, length: int, features: int, dtype: Any = np.float32) -> None:
+        self.length = length
+        self._buf = np.zeros((n_series, 2 * length, features), dtype=dtype)
+        self._t = 0
+
+    def reset(self, history: np.ndarray) -> None:
+        self._t = 0
+        self.extend(history[:, -self.length :])
+
+    def extend(self, values: np.ndarray) -> None:
+        slots = (self._t + np.arange(values.shape[1])) % self.length
+        self._buf[:, slots] = values
+        self._buf[:, slots + self.length] = values
+        self._t += values.shape[1]
+
+    def window(self) -> np.ndarray:
+        head = self._t % self.length
+        return self._buf[:, head : head + self.length]
+
+
+def keras_predict_fn(keras_model: Any) -> PredictFn:
+    """Wrap a Keras model as a traced ``predict_fn`` (avoids ``Model.predict`` overhead per step)."""
+    import tensorflow as tf
+
+    traced = tf.function(lambda inputs: keras_model(inputs, training=False), reduce_retracing=True)
+
+    def _predict(inputs: list[np.ndarray]) -> np.ndarray:
+        tensors = [tf.convert_to_tensor(np.asarray(x, dtype=np.float32)) for x in inputs]
+        return np.asarray(traced(tensors if len(tensors) > 1 else tensors[0]), dtype=np.float32)
+
+    return _predict
+
+
+class RolloutEngine:
+    """Roll a block forecaster out to arbitrary horizons for many series at once.
+
+    Parameters
+    ----------
+    predict_fn : Callable[[list[np.ndarray]], np.ndarray]
+        Maps ``[past, future?, static?]`` batches to ``[batch, model_horizon * n_targets]``.
+    sequence_length : int
+        Look-back window of the model.
+    model_horizon : int
+        Steps predicted per call.
+    n_targets : int
+        Target features per step.  The past input must consist of exactly these
+        features so predictions can be fed back.
+    """
+
+    def __init__(
+        self,
+        predict_fn: PredictFn,
+        sequence_length: int,
+        model_horizon: int,
+        n_targets: int = 1,
+    ) -> None:
+        if sequence_length < 1 or model_horizon < 1 or n_targets < 1:
+            raise ValueError("sequence_length, model_horizon and n_targets must be positive")
+        self.predict_fn = predict_fn
+        self.sequence_length = sequence_length
+        self.model_horizon = model_horizon
+        self.n_targets = n_targets
+        self.last_stats: dict[str, Any] = {}
+
+    @classmethod
+    def from_model(cls, model: Any, n_targets: int = 1) -> RolloutEngine:
+        """Build an engine from an ``LSTMModel``-style wrapper or a Keras model.
+
+        Wrappers with a multi-quantile head are rolled out on their median
+        quantile, which is also what gets fed back as the next input.
+        """
+        keras_model = getattr(model, "model", model)
+        if keras_model is None:
+            raise RuntimeError("Model is not built/trained. Call build() or fit_model() first.")
+        predict_fn = keras_predict_fn(keras_model)
+        output_shape = keras_model.outputs[0].shape
+        if len(output_shape) == 3:
+            quantiles = getattr(model, "quantiles", None)
+            if quantiles is None:
+                raise ValueError("quantile-head Keras models need the wrapper (with .quantiles) to pick the median")
+            from src.models.lstm import median_quantile_index
+
+            mid = median_quantile_index(quantiles)
+            quantile_fn = predict_fn
+
+            def predict_fn(inputs: list[np.ndarray]) -> np.ndarray:
+                return quantile_fn(inputs)[..., mid]
+
+        output_units = int(output_shape[1])
+        if output_units % n_targets:
+            raise ValueError(f"output width {output_units} is not a multiple of n_targets={n_targets}")
+        return cls(
+            predict_fn,
+            sequence_length=int(keras_model.inputs[0].shape[1]),
+            model_horizon=output_units // n_targets,
+            n_targets=n_targets,
+        )
+
+    def _stride(self, strategy: str, horizon: int) -> int:
+        if strategy not in ROLLOUT_STRATEGIES:
+            raise ValueError(f"strategy must be one of {ROLLOUT_STRATEGIES}, got {strategy!r}")
+        if strategy == "direct":
+            if horizon > self.model_horizon:
+                raise ValueError(f"direct strategy supports horizon <= {self.model_horizon}, got {horizon}")
+            return self.model_horizon
+        return 1 if strategy == "recursive" else self.model_horizon
+
+    def forecast(
+        self,
+        history: np.ndarray,
+        horizon: int,
+        strategy: str = "hybrid",
+        future: np.ndarray | None = None,
+        static: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Forecast ``horizon`` steps for every series in ``history``.
+
+        ``history`` is ``[n_series, time, n_targets]`` (or ``[n_series, time]``
+        for a single target) with ``time >= sequence_length``.  ``future``
+        (``[n_series, time, future_features]``) must cover every window the
+        rollout visits.  Returns ``[n_series, horizon, n_targets]``.
+        """
+        if horizon < 1:
+            raise ValueError("horizon must be >= 1")
+        stride = self._stride(strategy, horizon)
+        hist = np.asarray(history, dtype=np.float32)
+        if hist.ndim == 2:
+            hist = hist[:, :, None]
+        if hist.ndim != 3 or hist.shape[2] != self.n_targets:
+            raise ValueError(
+                f"history must be [n_series, time, {self.n_targets}] (past inputs must be the targets), "
+                f"got {hist.shape}"
+            )
+        if hist.shape[1] < self.sequence_length:
+            raise ValueError(f"history needs >= {self.sequence_length} steps, got {hist.shape[1]}")
+        starts = range(0, horizon, stride)
+        if future is not None and future.shape[1] < starts[-1] + self.model_horizon:
+            raise ValueError(
+                f"future covariates cover {future.shape[1]} steps; rollout needs {starts[-1] + self.model_horizon}"
+            )
+
+        n_series = hist.shape[0]
+        ring = _WindowRing(n_series, self.sequence_length, self.n_targets)
+        ring.reset(hist)
+        out = np.empty((n_series, horizon, self.n_targets), dtype=np.float32)
+        for start in starts:
+            inputs = [ring.window()]
+            if future is not None:
+                inputs.append(future[:, start : start + self.model_horizon])
+            if static is not None:
+                inputs.append(static)
+            block = np.asarray(self.predict_fn(inputs), dtype=np.float32).reshape(
+                n_series, self.model_horizon, self.n_targets
+            )
+            take = min(stride, horizon - start)
+            out[:, start : start + take] = block[:, :take]
+            if start + take < horizon:
+                ring.extend(block[:, :take])
+
+        self.last_stats = {"strategy": strategy, "model_calls": len(starts), "steps_per_call": stride}
+        return out
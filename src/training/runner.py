@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import argparse
 import csv
+import filecmp
+import functools
 import json
 import logging
 import pickle
 import shutil
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -19,7 +22,12 @@ from src.covariates.spec import enforce_covariate_spec, load_covariate_spec
 from src.models.dlinear import DLinearLikeModel
 from src.models.lstm import BACKEND, AttentionLSTMModel, GRUModel, LSTMModel
 from src.models.tcn import TCNModel
-from src.training.baselines import Phase3BaselineComparisonError, build_baseline_report
+from src.training.autotune import DEFAULT_BATCH_SIZES, LR_SCALING, autotune_training
+from src.training.baselines import Phase3BaselineComparisonError, build_baseline_report, quantile_metrics
+from src.training.checkpointing import CheckpointManager, make_checkpoint_callback
+from src.training.compression import CompressionConfig, compress_model
+from src.training.distillation import DistillationTeacher
+from src.training.distributed import SUPPORTED_STRATEGIES, build_strategy, worker_info
 from src.training.edge import (
     build_ota_manifest,
     build_runtime_compatibility,
@@ -30,13 +38,18 @@ from src.training.edge import (
     load_device_profiles,
     parity_within_thresholds,
     parse_edge_sla,
+    run_numpy_inference,
     run_onnx_inference,
     run_tflite_inference,
     select_runtime_stack,
 )
+from src.training.numpy_runtime import export_numpy_model
+from src.training.profiling import make_profiler_callback
+from src.training.progress import make_progress_callback_from_env
 from src.training.trainer import Trainer
 from src.utils.repro import build_phase3_run_metadata, build_run_metadata, get_git_commit_info, set_global_seed
 from src.utils.run_id import validate_run_id
+from src.utils.threads import configure_cpu_threads
 
 logger = logging.getLogger(__name__)
 
@@ -73,16 +86,107 @@ def _parse_csv_like(raw: str | None) -> list[str]:
     return [x.strip() for x in raw.split(",") if x.strip()]
 
 
+def _parse_quantiles(raw: str | None) -> list[float] | None:
+    levels = _parse_csv_like(raw)
+    if not levels:
+        return None
+    try:
+        return [float(x) for x in levels]
+    except ValueError as exc:
+        raise ValueError(f"--quantiles must be comma-separated floats, got {raw!r}") from exc
+
+
+def _parse_trace_steps(raw: str | None) -> tuple[int, int] | None:
+    steps = _parse_csv_like(raw)
+    if not steps:
+        return None
+    try:
+        start, stop = (int(x) for x in steps)
+    except ValueError as exc:
+        raise ValueError(f"--profile-trace-steps must be 'start,stop' step numbers, got {raw!r}") from exc
+    return start, stop
+
+
+def _parse_thread_candidates(raw: str | None) -> list[tuple[int, int]] | None:
+    """``"16:2,8"`` -> ``[(16, 2), (8, 2)]``; inter-op defaults to ``min(2, intra)``."""
+    candidates = []
+    for item in _parse_csv_like(raw):
+        intra, _, inter = item.partition(":")
+        try:
+            pair = (int(intra), int(inter) if inter else min(2, int(intra)))
+        except ValueError as exc:
+            raise ValueError(f"--autotune-threads entries must be 'intra[:inter]', got {item!r}") from exc
+        if min(pair) < 1:
+            raise ValueError(f"--autotune-threads entries must be >= 1, got {item!r}")
+        candidates.append(pair)
+    return candidates or None
+
+
+def _series_windows(series: np.ndarray, sequence_length: int, output_units: int) -> tuple[np.ndarray, np.ndarray]:
+    # Autotune only needs the training window shapes; targets are placeholders.
+    values = series.reshape(len(series), -1)
+    X = np.lib.stride_tricks.sliding_window_view(values, sequence_length, axis=0).transpose(0, 2, 1)
+    return np.ascontiguousarray(X, dtype=np.float32), np.zeros((len(X), output_units), dtype=np.float32)
+
+
+def _autotune(
+    args: argparse.Namespace, model_factory: Any, X: Any, y: np.ndarray, callbacks: list[Any] | None = None
+) -> dict[str, Any] | None:
+    """Measure batch size / thread settings, then apply the winner to ``args`` and this process.
+
+    Must run before this process builds a model: TensorFlow's thread pools are
+    fixed once its runtime starts.  ``callbacks`` that convert steps to samples
+    (profiler, progress reporter) get the tuned batch size.
+    """
+    if not args.autotune:
+        return None
+    decision = autotune_training(
+        model_factory,
+        X,
+        y,
+        batch_sizes=args.autotune_batch_sizes,
+        thread_candidates=_parse_thread_candidates(args.autotune_threads),
+        memory_budget_mb=args.autotune_memory_mb,
+        trial_steps=args.autotune_trial_steps,
+        base_batch_size=args.batch_size,
+        learning_rate=args.learning_rate,
+        lr_scaling=args.autotune_lr_scaling,
+    )
+    args.batch_size = decision["batch_size"]
+    args.learning_rate = decision["learning_rate"]
+    for callback in callbacks or []:
+        if callback is not None:
+            callback.batch_size = args.batch_size
+    decision["threads"] = configure_cpu_threads(decision["intra_op"], decision["inter_op"])
+    return decision
+
+
+def _render_profile_section(profile: dict[str, Any]) -> str:
+    step = profile["step_time_ms"]
+    lines = [
+        "",
+        "## Training Profile",
+        f"- samples/sec: {profile['samples_per_sec']} (steady: {profile['steady_samples_per_sec']})",
+        f"- step time ms (p50/p90/p99): {step.get('p50')}/{step.get('p90')}/{step.get('p99')}"
+        f" (first step {step.get('first_step_ms')})",
+        f"- input wait: {profile['input_wait_seconds']}s ({profile['input_wait_fraction']} of train time)",
+        f"- peak RSS MB: {profile['peak_rss_mb']}",
+    ]
+    if profile["trace_dir"]:
+        lines.append(f"- profiler trace: `{profile['trace_dir']}` (steps {profile['trace_steps']})")
+    return "\n".join(lines) + "\n"
+
+
 def _parse_export_formats(raw: str | None) -> list[str]:
     """Parse and validate export format contract.
 
-    Allowed values: none | onnx | tflite | onnx,tflite
+    Allowed values: none, or any combination of onnx | tflite | numpy (e.g. onnx,tflite)
     """
     formats = _parse_csv_like(raw)
     if not formats:
         return ["none"]
 
-    allowed = {"none", "onnx", "tflite"}
+    allowed = {"none", "onnx", "tflite", "numpy"}
     invalid = [x for x in formats if x not in allowed]
     if invalid:
         raise ValueError(f"unsupported export format(s): {invalid}; allowed={sorted(allowed)}")
@@ -462,10 +566,198 @@ def _validate_phase3_metadata_contract(run_id: str, runmeta: dict[str, Any]) ->
     _require_dict(runmeta.get("artifacts"), "artifacts")
 
 
-def _build_callbacks(checkpoint_dir: Path):
-    # Keep callback wiring lightweight for compatibility with older TF/Keras builds.
-    # Runtime checkpointing in `run()` handles artifact persistence explicitly.
-    return []
+def _build_callbacks(checkpoints: CheckpointManager | None, resume_state: dict[str, Any] | None = None) -> list[Any]:
+    # Per-epoch checkpoints are weights-only and written off the training thread;
+    # the loadable model artifacts are saved once after training in `run()`.
+    if checkpoints is None:
+        return []
+    return [make_checkpoint_callback(checkpoints, resume_state=resume_state)]
+
+
+def _resolve_resume(
+    args: argparse.Namespace, run_id: str, checkpoints: CheckpointManager, metrics_path: Path
+) -> dict[str, Any] | None:
+    """Resume state of an interrupted earlier attempt of ``run_id``, per ``--resume``.
+
+    A run is incomplete when its epoch checkpoints are consistent but it never
+    wrote its metrics JSON (killed by a timeout, preemption or a crash).
+    """
+    if args.resume == "never":
+        return None
+    if args.distributed == "multi_worker":
+        # Non-chief workers keep no checkpoints, so they could not rejoin at the same epoch.
+        if args.resume == "require":
+            raise ValueError("--resume require is not supported with --distributed multi_worker")
+        return None
+    state = None if metrics_path.exists() else checkpoints.load_resume_state()
+    if state is None and args.resume == "require":
+        reason = (
+            "it already completed" if metrics_path.exists() else f"no consistent checkpoint in {checkpoints.directory}"
+        )
+        raise FileNotFoundError(f"cannot resume run '{run_id}': {reason}")
+    if state is not None:
+        logger.info("Resuming run %s after epoch %d", run_id, state["epoch"])
+    return state
+
+
+# Config keys that fix what a run's input windows and targets mean; a distillation teacher must match them all.
+_TEACHER_CONTRACT_KEYS = (
+    "sequence_length",
+    "horizon",
+    "feature_mode",
+    "target_cols",
+    "dynamic_covariates",
+    "static_covariates",
+    "normalize",
+    "normalize_method",
+)
+
+
+def _build_distillation_teacher(
+    args: argparse.Namespace, artifacts_base: Path, student_config: dict[str, Any]
+) -> DistillationTeacher | None:
+    if not getattr(args, "distill_teacher", None):
+        return None
+    if not 0.0 <= args.distill_alpha <= 1.0:
+        raise ValueError(f"--distill-alpha must be in [0, 1], got {args.distill_alpha}")
+    checkpoints = [_resolve_teacher_checkpoint(ref, artifacts_base, student_config) for ref in args.distill_teacher]
+    cache_dir = args.distill_cache_dir or str(artifacts_base / "distill_cache")
+    return DistillationTeacher(checkpoints, cache_dir=cache_dir)
+
+
+def _resolve_teacher_checkpoint(ref: str, artifacts_base: Path, student_config: dict[str, Any]) -> str:
+    """Map a teacher run_id (or a checkpoint under ``checkpoints/<run_id>/``) to its checkpoint.
+
+    The teacher run's recorded config must agree with the student on
+    ``_TEACHER_CONTRACT_KEYS`` and on the preprocessor file; otherwise its
+    predictions live in a different window layout or scale than the student's targets.
+    """
+    ref_path = Path(ref)
+    checkpoint: Path | None = ref_path if ref_path.is_file() else None
+    run_id = ref_path.parent.name if checkpoint is not None else validate_run_id(ref, mode="legacy")
+    metrics_path = artifacts_base / "metrics" / f"{run_id}.json"
+    if not metrics_path.is_file():
+        raise ValueError(f"distillation teacher '{ref}' is not a run under {artifacts_base}; pass the teacher's run_id")
+    with open(metrics_path, encoding="utf-8") as f:
+        prior = json.load(f)
+
+    teacher_config = prior.get("config") or {}
+    mismatched = {
+        key: (teacher_config.get(key), student_config.get(key))
+        for key in _TEACHER_CONTRACT_KEYS
+        if teacher_config.get(key) != student_config.get(key)
+    }
+    teacher_pre, student_pre = teacher_config.get("preprocessor_pkl"), student_config.get("preprocessor_pkl")
+    if teacher_pre != student_pre and not (
+        teacher_pre
+        and student_pre
+        and Path(teacher_pre).is_file()
+        and Path(student_pre).is_file()
+        and filecmp.cmp(teacher_pre, student_pre, shallow=False)
+    ):
+        mismatched["preprocessor_pkl"] = (teacher_pre, student_pre)
+    if mismatched:
+        details = ", ".join(f"{key}: teacher={t!r} student={s!r}" for key, (t, s) in mismatched.items())
+        raise ValueError(f"distillation teacher '{run_id}' is incompatible with this run ({details})")
+
+    if checkpoint is None:
+        best = Path(prior.get("checkpoints", {}).get("best") or "")
+        candidates = [best.with_suffix(".h5"), best] if best.suffix == ".keras" else [best]
+        checkpoint = next((c for c in candidates if c.is_file()), None)
+        if checkpoint is None:
+            raise FileNotFoundError(f"distillation teacher '{run_id}' checkpoint not found: {best}")
+    return str(checkpoint)
+
+
+def _input_spec_signature(specs: list[dict[str, Any]]) -> list[tuple[str, list[int]]]:
+    # Batch dimension is ignored; it is -1 or the export sample size depending on the writer.
+    return [(str(spec.get("name")), [int(d) for d in spec.get("shape", [])[1:]]) for spec in specs]
+
+
+def _resolve_warm_start(args: argparse.Namespace, artifacts_base: Path, model: Any) -> dict[str, Any] | None:
+    """Locate the ``--warm-start-from`` champion and check it is compatible with ``model``.
+
+    The stored ``input_specs`` of the previous run's export manifest must match
+    the inputs of the model this run builds.  Returns the checkpoint to load,
+    the number of training windows the champion already saw, and the cold-start
+    training stats to compare against (carried over through chains of warm
+    starts).
+    """
+    prior_id = getattr(args, "warm_start_from", None)
+    if not prior_id:
+        return None
+    prior_id = validate_run_id(prior_id, mode="legacy")
+    if args.cv_reuse_best:
+        raise ValueError("--warm-start-from and --cv-reuse-best both choose the initial checkpoint; use one")
+    if not 0.0 <= args.warm_start_replay <= 1.0:
+        raise ValueError(f"--warm-start-replay must be in [0, 1], got {args.warm_start_replay}")
+
+    prior_metrics_path = artifacts_base / "metrics" / f"{prior_id}.json"
+    if not prior_metrics_path.exists():
+        raise FileNotFoundError(f"warm start run '{prior_id}' has no metrics at {prior_metrics_path}")
+    with open(prior_metrics_path, encoding="utf-8") as f:
+        prior = json.load(f)
+
+    manifest_path = Path(prior.get("exports", {}).get("manifest_path") or "")
+    if not manifest_path.is_file():
+        raise FileNotFoundError(f"warm start run '{prior_id}' has no export manifest with input_specs")
+    with open(manifest_path, encoding="utf-8") as f:
+        stored_specs = json.load(f).get("input_specs") or []
+
+    if model.model is None:
+        model.build()
+    expected = _input_spec_signature(extract_input_specs(model.model))
+    stored = _input_spec_signature(stored_specs)
+    if stored != expected:
+        raise ValueError(f"warm start run '{prior_id}' is incompatible: stored input_specs {stored} != {expected}")
+
+    best = Path(prior.get("checkpoints", {}).get("best") or "")
+    candidates = [best.with_suffix(".h5"), best] if best.suffix == ".keras" else [best]
+    checkpoint = next((c for c in candidates if c.is_file()), None)
+    if checkpoint is None:
+        raise FileNotFoundError(f"warm start run '{prior_id}' checkpoint not found: {best}")
+
+    import tensorflow as tf
+
+    import src.models  # noqa: F401  (registers custom layers/losses for deserialization)
+
+    prior_outputs = tf.keras.models.load_model(str(checkpoint), compile=False).outputs[0].shape[1:]
+    if tuple(prior_outputs) != tuple(model.model.outputs[0].shape[1:]):
+        raise ValueError(
+            f"warm start run '{prior_id}' is incompatible: output shape {tuple(prior_outputs)} "
+            f"!= {tuple(model.model.outputs[0].shape[1:])}"
+        )
+
+    prior_training = prior.get("training") or {}
+    prior_warm = prior.get("warm_start")
+    cold_start = prior_warm.get("cold_start") if isinstance(prior_warm, dict) else None
+    if cold_start is None and prior_training:
+        cold_start = {"run_id": prior_id, **prior_training}
+    return {
+        "from_run_id": prior_id,
+        "checkpoint": str(checkpoint),
+        "input_specs": stored_specs,
+        "new_windows_from": prior_training.get("train_windows"),
+        "replay_fraction": args.warm_start_replay,
+        "cold_start": cold_start,
+    }
+
+
+def _warm_start_report(warm_start: dict[str, Any], results: dict[str, Any]) -> dict[str, Any]:
+    stats = results["training_stats"]
+    report = {**warm_start, "incremental": results.get("incremental"), "training": stats}
+    cold = warm_start.get("cold_start")
+    if cold:
+        report["vs_cold_start"] = {
+            "epochs_to_converge": {"cold": cold.get("epochs_to_converge"), "warm": stats["epochs_to_converge"]},
+            "fit_seconds": {"cold": cold.get("fit_seconds"), "warm": stats["fit_seconds"]},
+            "wall_time_speedup": (
+                float(cold["fit_seconds"]) / stats["fit_seconds"]
+                if cold.get("fit_seconds") and stats["fit_seconds"] > 0
+                else None
+            ),
+        }
+    return report
 
 
 def _materialize_model_inputs(X: Any) -> list[np.ndarray]:
@@ -514,6 +806,7 @@ def _export_edge_artifacts(
     parity_rmse_max: float,
     parity_enforce: bool,
     keras_model_path: str | None,
+    compression: dict[str, Any] | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any], Path, Path]:
     exports_root = artifacts_base / "exports" / run_id
     model_root = exports_root / model_type
@@ -550,9 +843,14 @@ def _export_edge_artifacts(
     else:
         export_results["onnx"] = {"status": "skipped", "reason": "not requested"}
 
+    if "numpy" in requested_formats:
+        export_results["numpy"] = export_numpy_model(keras_model, model_root / "numpy" / "model.npz")
+    else:
+        export_results["numpy"] = {"status": "skipped", "reason": "not requested"}
+
     parity: dict[str, Any] = {}
     reference = np.asarray(reference_prediction, dtype=np.float32).reshape(-1)
-    for runtime_name in ("tflite", "onnx"):
+    for runtime_name in ("tflite", "onnx", "numpy"):
         result = export_results.get(runtime_name, {})
         if result.get("status") != "succeeded":
             continue
@@ -560,6 +858,8 @@ def _export_edge_artifacts(
         try:
             if runtime_name == "tflite":
                 pred = run_tflite_inference(model_path, sample_input_list)
+            elif runtime_name == "numpy":
+                pred = run_numpy_inference(model_path, sample_input_list)
             else:
                 pred = run_onnx_inference(model_path, sample_input_list)
             parity_metrics = compute_parity(reference=reference, candidate=np.asarray(pred, dtype=np.float32))
@@ -578,7 +878,7 @@ def _export_edge_artifacts(
         export_results,
         keras_path=keras_model_path,
     )
-    for runtime_name in ("tflite", "onnx"):
+    for runtime_name in ("tflite", "onnx", "numpy"):
         parity_result = parity.get(runtime_name)
         if parity_result is None:
             continue
@@ -625,6 +925,7 @@ def _export_edge_artifacts(
         "requested_formats": requested_formats,
         "int8_calibration_samples": int8_calibration_samples,
         "input_specs": extract_input_specs(keras_model),
+        "quantiles": list(model_wrapper.quantiles) if getattr(model_wrapper, "quantiles", None) else None,
         "exports": export_results,
         "runtime_compatibility": runtime_compatibility,
         "runtime_stack": runtime_stack,
@@ -635,6 +936,7 @@ def _export_edge_artifacts(
             "rmse": parity_rmse_max,
         },
         "parity": parity,
+        "compression": compression or {"enabled": False},
         "ota_manifest": ota_manifest,
     }
 
@@ -672,6 +974,8 @@ def _build_model(
         recurrent_dropout=getattr(args, "recurrent_dropout", 0.0),
         use_residual=getattr(args, "use_residual", False),
         use_layer_norm=getattr(args, "use_layer_norm", False),
+        fast_kernel=getattr(args, "fast_kernel", False),
+        quantiles=_parse_quantiles(getattr(args, "quantiles", None)),
     )
 
 
@@ -712,6 +1016,13 @@ def _compute_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, float]
 def run(args: argparse.Namespace) -> dict[str, Any]:
     if BACKEND != "tensorflow":
         raise RuntimeError("TensorFlow backend is required for Phase 3 runner. Install tensorflow and retry.")
+    if args.distributed != "none" and args.cv_splits > 0:
+        raise ValueError("--distributed does not support --cv-splits; run cross-validation separately")
+    if args.distributed != "none" and args.autotune:
+        raise ValueError("--autotune sizes this process's thread pools; it cannot be combined with --distributed")
+    # Multi-worker strategies must exist before other TF ops run in this process.
+    strategy = build_strategy(args.distributed)
+    is_chief = args.distributed != "multi_worker" or worker_info().is_chief
 
     run_id = args.run_id or _make_run_id()
     run_id = validate_run_id(run_id, mode=args.run_id_validation)
@@ -746,17 +1057,59 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
     config_snapshot_path = base / "configs" / f"{run_id}.json"
     metadata_path = base / "metadata" / f"{run_id}.json"
     runmeta_path = base / "runs" / f"{run_id}.meta.json"
+    if not is_chief:
+        # Non-chief workers only contribute gradients; keep their checkpoints out of the run dir.
+        checkpoint_dir = Path(tempfile.mkdtemp(prefix=f"{run_id}-worker-"))
     checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
-    callbacks = _build_callbacks(checkpoint_dir)
+    checkpoints = CheckpointManager(checkpoint_dir)
+    resume_state = _resolve_resume(args, run_id, checkpoints, metrics_path) if is_chief else None
+    # Resuming always keeps checkpointing: the callback restores the saved state.
+    callbacks = _build_callbacks(
+        checkpoints if (args.epoch_checkpoints or resume_state) and is_chief else None, resume_state=resume_state
+    )
+    initial_epoch = 0
+    if resume_state is not None:
+        initial_epoch = args.epochs if resume_state.get("stop_training") else min(resume_state["epoch"], args.epochs)
+    profiler = None
+    trace_steps = _parse_trace_steps(args.profile_trace_steps)
+    if args.profile or trace_steps is not None:
+        profiler = make_profiler_callback(
+            batch_size=args.batch_size,
+            trace_steps=trace_steps,
+            trace_dir=base / "profiles" / run_id if trace_steps is not None else None,
+        )
+        callbacks.append(profiler)
+    progress = make_progress_callback_from_env(args.batch_size) if is_chief else None
+    if progress is not None:
+        callbacks.append(progress)
+    teacher = _build_distillation_teacher(
+        args,
+        base,
+        {
+            "sequence_length": args.sequence_length,
+            "horizon": args.horizon,
+            "feature_mode": args.feature_mode,
+            "target_cols": target_cols,
+            "dynamic_covariates": dynamic_covariates,
+            "static_covariates": static_covariates,
+            "normalize": args.normalize,
+            "normalize_method": args.normalize_method,
+            "preprocessor_pkl": str(preprocessor_path) if preprocessor_path else args.preprocessor_pkl,
+        },
+    )
 
     X_direct, y_direct = _load_training_arrays(args)
     split_indices: dict[str, Any] = {}
+    cv_results: dict[str, Any] | None = None
+    initial_checkpoint: str | None = None
     baselines_obj: dict[str, Any] = {
         "skipped": True,
         "reason": "only computed for univariate series mode",
     }
+    baseline_inputs: dict[str, Any] | None = None
 
+    autotune_report: dict[str, Any] | None = None
     if X_direct is not None and y_direct is not None:
         # Contract path: use pre-windowed arrays directly.
         if isinstance(X_direct, list):
@@ -770,6 +1123,20 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             static_features = 0
 
         output_units = int(y_direct.shape[1])
+        autotune_report = _autotune(
+            args,
+            functools.partial(
+                _build_model,
+                args,
+                output_units=output_units,
+                input_features=input_features,
+                static_features=static_features,
+                future_features=future_features,
+            ),
+            X_direct,
+            y_direct,
+            [profiler, progress],
+        )
         model = _build_model(
             args,
             output_units=output_units,
@@ -777,6 +1144,9 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             static_features=static_features,
             future_features=future_features,
         )
+        warm_start = _resolve_warm_start(args, base, model)
+        if warm_start is not None:
+            initial_checkpoint = warm_start["checkpoint"]
 
         trainer = Trainer(
             model=model,
@@ -794,9 +1164,28 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
                 epochs=args.epochs,
                 batch_size=args.batch_size,
                 verbose=args.verbose,
+                n_jobs=args.cv_jobs,
+                threads_per_fold=args.cv_threads_per_fold or None,
+                model_factory=functools.partial(
+                    _build_model,
+                    args,
+                    output_units=output_units,
+                    input_features=input_features,
+                    static_features=static_features,
+                    future_features=future_features,
+                ),
+                warm_start=args.cv_warm_start,
+                warm_start_epochs=args.cv_warm_start_epochs,
+                warm_start_patience=args.cv_warm_start_patience,
+                checkpoint_dir=str(checkpoint_dir / "cv"),
+                # The final fit holds out the last test_size share; CV must not train or select on it.
+                test_size=args.test_size,
             )
             # Use CV metrics as primary results context if needed
             logger.info(f"CV Avg RMSE: {cv_results['avg_metrics']['rmse']:.4f}")
+            if args.cv_reuse_best:
+                initial_checkpoint = cv_results["best_checkpoint"]
+                logger.info("Seeding final training from CV fold %d checkpoint", cv_results["best_fold"])
 
         results = trainer.train(
             X=X_direct,
@@ -807,6 +1196,13 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             val_size=args.val_size,
             verbose=args.verbose,
             extra_callbacks=callbacks,
+            initial_checkpoint=initial_checkpoint,
+            teacher=teacher,
+            distill_alpha=args.distill_alpha,
+            new_windows_from=warm_start["new_windows_from"] if warm_start else None,
+            replay_fraction=args.warm_start_replay,
+            strategy=strategy,
+            initial_epoch=initial_epoch,
         )
         split_indices = results.get("split_indices", {})
         y_pred = results["y_pred"]
@@ -830,20 +1226,30 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
                 raise Phase3BaselineComparisonError(
                     "phase3 baseline comparison invalid: univariate mode requires y.shape[1] == horizon"
                 )
-            baselines_obj = build_baseline_report(
-                y_true=y_test,
-                y_lstm=y_pred,
-                X_test=X_test,
-                horizon=args.horizon,
-                ma_window=args.ma_window,
-            )
+            baseline_inputs = {
+                "y_true": y_test,
+                "y_lstm": y_pred,
+                "X_test": X_test,
+                "horizon": args.horizon,
+                "ma_window": args.ma_window,
+                "y_quantiles": results.get("y_pred_quantiles"),
+                "quantiles": model.quantiles,
+            }
+            baselines_obj = build_baseline_report(**baseline_inputs)
     else:
         series = _load_series(args)
         inferred_features = 1 if series.ndim == 1 else int(series.shape[1])
         f_target = max(1, len(target_cols))
         output_units = args.horizon if args.feature_mode == "univariate" else args.horizon * f_target
 
+        autotune_report = _autotune(
+            args,
+            functools.partial(_build_model, args, output_units=output_units, input_features=inferred_features),
+            *_series_windows(series, args.sequence_length, output_units),
+            [profiler, progress],
+        )
         model = _build_model(args, output_units=output_units, input_features=inferred_features)
+        warm_start = _resolve_warm_start(args, base, model)
         trainer = Trainer(
             model=model,
             sequence_length=args.sequence_length,
@@ -862,30 +1268,103 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             early_stopping=args.early_stopping,
             verbose=args.verbose,
             extra_callbacks=callbacks,
+            initial_checkpoint=warm_start["checkpoint"] if warm_start else None,
+            teacher=teacher,
+            distill_alpha=args.distill_alpha,
+            new_windows_from=warm_start["new_windows_from"] if warm_start else None,
+            replay_fraction=args.warm_start_replay,
+            strategy=strategy,
+            initial_epoch=initial_epoch,
         )
         split_indices = results.get("split_indices", {})
 
-        baselines_obj = build_baseline_report(
-            y_true=trainer.y_test,
-            y_lstm=trainer.y_pred,
-            X_test=trainer.X_test,
-            horizon=args.horizon,
-            ma_window=args.ma_window,
-        )
+        baseline_inputs = {
+            "y_true": trainer.y_test,
+            "y_lstm": trainer.y_pred,
+            "X_test": trainer.X_test,
+            "horizon": args.horizon,
+            "ma_window": args.ma_window,
+            "y_quantiles": trainer.y_pred_quantiles,
+            "quantiles": model.quantiles,
+        }
+        baselines_obj = build_baseline_report(**baseline_inputs)
 
         X_test, y_test, y_pred = trainer.X_test, trainer.y_test, trainer.y_pred
 
-    last_ckpt = checkpoint_dir / "last.keras"
-    last_ckpt_h5 = checkpoint_dir / "last.h5"
-    model.save(str(last_ckpt_h5))
-    if not last_ckpt.exists():
-        shutil.copy2(last_ckpt_h5, last_ckpt)
+    if not is_chief:
+        checkpoints.close()
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        logger.info("Worker finished run %s; artifacts are written by the chief", run_id)
+        return {
+            "run_id": run_id,
+            "distributed": results["distributed"],
+            "metrics": results["metrics"],
+            "training": results["training_stats"],
+        }
+
+    compression_report: dict[str, Any] = {"enabled": False}
+    compression_config = CompressionConfig(
+        sparsity=args.prune_sparsity,
+        granularity=args.prune_granularity,
+        clusters=args.cluster_count,
+        fine_tune_epochs=args.compression_fine_tune_epochs,
+    )
+    if compression_config.enabled:
+        pre_compression_ckpt = checkpoint_dir / "pre_compression.h5"
+        model.save(str(pre_compression_ckpt))
+        y_pred_uncompressed = np.asarray(results["y_pred"])
+        compression_report = compress_model(
+            model,
+            compression_config,
+            X_train=trainer.X_train,
+            y_train=trainer.y_train,
+            validation_data=(trainer.X_val, trainer.y_val),
+            reference_inputs=X_test,
+            batch_size=args.batch_size,
+            verbose=args.verbose,
+        )
+        # The compressed model is the one saved and exported, so every reported metric is recomputed on it.
+        y_pred_compressed = np.asarray(model.predict(X_test))
+        # Shift by the compression delta so residual-learning recombination is preserved.
+        y_pred_before = y_pred
+        y_pred = y_pred + (y_pred_compressed - y_pred_uncompressed)
+        compression_report["pre_compression_checkpoint"] = str(pre_compression_ckpt)
+        compression_report["test_metrics_before"] = _compute_metrics(y_test, y_pred_before)
+        compression_report["test_metrics_after"] = _compute_metrics(y_test, y_pred)
+        y_test_model = np.asarray(results["y_test"])
+        results["metrics"] = trainer.compute_metrics(y_test_model, y_pred_compressed)
+        results["y_pred"] = trainer.y_pred = y_pred_compressed
+        if model.quantiles is not None:
+            y_quantiles_compressed = model.predict_quantiles(X_test)
+            results["y_pred_quantiles"] = trainer.y_pred_quantiles = y_quantiles_compressed
+            results["quantile_metrics"] = quantile_metrics(y_test_model, y_quantiles_compressed, model.quantiles)
+        if baseline_inputs is not None:
+            baseline_inputs.update(y_lstm=y_pred, y_quantiles=results["y_pred_quantiles"])
+            baselines_obj = build_baseline_report(**baseline_inputs)
+
+    rollout_report: dict[str, Any] | None = None
+    if args.rollout_horizon > 0:
+        if isinstance(X_test, list) or getattr(args, "residual_learning", False):
+            rollout_report = {
+                "skipped": True,
+                "reason": "rollout needs past-only inputs without residual recombination",
+            }
+        else:
+            rollout_report = trainer.evaluate_rollout(horizon=args.rollout_horizon, strategy=args.rollout_strategy)
+            logger.info(
+                "Rollout (%s, horizon=%d) RMSE: %.4f",
+                args.rollout_strategy,
+                args.rollout_horizon,
+                rollout_report["metrics"]["rmse"],
+            )
 
+    # The fitted model is both "last" and "best" (early stopping restores the best
+    # weights), so serialize it once and hard-link the other names.
+    last_ckpt = checkpoint_dir / "last.keras"
     best_ckpt = checkpoint_dir / "best.keras"
     best_ckpt_h5 = checkpoint_dir / "best.h5"
-    if not best_ckpt.exists() and not best_ckpt_h5.exists():
-        model.save(str(best_ckpt_h5))
-        shutil.copy2(best_ckpt_h5, best_ckpt)
+    checkpoints.save_model(model, "last.h5", aliases=(last_ckpt.name, best_ckpt_h5.name, best_ckpt.name))
+    checkpoints.close()
 
     x_last = [x[-1:] if x is not None else None for x in X_test] if isinstance(X_test, list) else X_test[-1:]
     export_parity_inputs = _take_model_input_samples(X_test, max_samples=1, from_tail=True)
@@ -910,7 +1389,11 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         device_benchmark_config=args.device_benchmark_config,
         sample_inputs=export_parity_inputs,
         calibration_inputs=export_calibration_inputs,
-        reference_prediction=np.asarray(y_pred_last, dtype=np.float32),
+        reference_prediction=(
+            np.asarray(model.predict_quantiles(export_parity_inputs)[-1], dtype=np.float32)
+            if model.quantiles is not None
+            else np.asarray(y_pred_last, dtype=np.float32)
+        ),
         semantic_version=args.semantic_version,
         min_app_version=args.min_app_version,
         ota_model_id=args.ota_model_id or f"spline-lstm-{args.model_type}",
@@ -919,6 +1402,7 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         parity_rmse_max=args.parity_rmse_max,
         parity_enforce=args.parity_enforce,
         keras_model_path=str(best_ckpt_h5),
+        compression=compression_report,
     )
 
     if "evaluation_context" not in baselines_obj:
@@ -956,6 +1440,34 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         "static_covariates": static_covariates,
         "covariate_spec": covariate_spec,
         "covariate_contract": covariate_contract,
+        "recurrent_dropout": getattr(args, "recurrent_dropout", 0.0),
+        "fast_kernel": getattr(args, "fast_kernel", False),
+        "cv_splits": args.cv_splits,
+        "cv_jobs": args.cv_jobs,
+        "cv_threads_per_fold": args.cv_threads_per_fold,
+        "cv_warm_start": args.cv_warm_start,
+        "cv_warm_start_epochs": args.cv_warm_start_epochs,
+        "cv_warm_start_patience": args.cv_warm_start_patience,
+        "cv_reuse_best": args.cv_reuse_best,
+        "warm_start_from": args.warm_start_from,
+        "warm_start_replay": args.warm_start_replay if args.warm_start_from else None,
+        "distributed": args.distributed,
+        "profile": profiler is not None,
+        "autotune": (
+            {k: v for k, v in autotune_report.items() if k != "trials"} if autotune_report is not None else None
+        ),
+        "epoch_checkpoints": bool(args.epoch_checkpoints),
+        "resume": args.resume,
+        "profile_trace_steps": list(trace_steps) if trace_steps is not None else None,
+        "distill_teacher": args.distill_teacher,
+        "distill_alpha": args.distill_alpha if args.distill_teacher else None,
+        "prune_sparsity": args.prune_sparsity,
+        "prune_granularity": args.prune_granularity,
+        "cluster_count": args.cluster_count,
+        "compression_fine_tune_epochs": args.compression_fine_tune_epochs,
+        "rollout_horizon": args.rollout_horizon,
+        "rollout_strategy": args.rollout_strategy,
+        "quantiles": list(model.quantiles) if model.quantiles is not None else None,
         "export_formats": export_formats,
         "edge_profile": args.edge_profile,
         "edge_sla": args.edge_sla,
@@ -1033,7 +1545,30 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             "parity": export_manifest.get("parity"),
         },
         "ota": ota_manifest,
+        "kernel_report": model.kernel_report() if hasattr(model, "kernel_report") else [],
+        "training": results["training_stats"],
     }
+    if warm_start is not None:
+        payload["warm_start"] = _warm_start_report(warm_start, results)
+    if cv_results is not None:
+        payload["cross_validation"] = {**cv_results, "final_train_initial_checkpoint": initial_checkpoint}
+    if "distillation" in results:
+        payload["distillation"] = results["distillation"]
+    if "quantile_metrics" in results:
+        payload["quantile_metrics"] = results["quantile_metrics"]
+    if compression_report["enabled"]:
+        payload["compression"] = compression_report
+    if rollout_report is not None:
+        payload["rollout"] = rollout_report
+    if "distributed" in results:
+        payload["distributed"] = results["distributed"]
+    if profiler is not None:
+        payload["profile"] = profiler.summary()
+    payload["checkpointing"] = checkpoints.metrics()
+    if autotune_report is not None:
+        payload["autotune"] = autotune_report
+    if resume_state is not None:
+        payload["resume"] = {"resumed": True, "from_epoch": resume_state["epoch"], "initial_epoch": initial_epoch}
 
     _write_json(metrics_path, payload)
     _write_json(baseline_path, baselines_obj)
@@ -1108,6 +1643,8 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
 - export manifest: `{export_manifest_path}`
 - OTA manifest: `{ota_manifest_path}`
 """
+    if "profile" in payload:
+        report += _render_profile_section(payload["profile"])
     _write_report(report_path, report)
 
     logger.info("Run complete: %s", run_id)
@@ -1158,6 +1695,12 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--dropout", type=float, default=0.2)
     p.add_argument("--learning-rate", type=float, default=1e-3)
     p.add_argument("--loss", type=str, default="mse", help="Loss function: mse, mae, huber, quantile_50")
+    p.add_argument(
+        "--quantiles",
+        type=str,
+        default=None,
+        help="Comma-separated quantile levels (e.g. 0.1,0.5,0.9) for a single multi-quantile head; overrides --loss",
+    )
     p.add_argument(
         "--lr-schedule",
         type=str,
@@ -1173,6 +1716,12 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--use-layer-norm", action="store_true", default=False, help="Add LayerNormalization after each LSTM layer"
     )
+    p.add_argument(
+        "--fast-kernel",
+        action="store_true",
+        default=False,
+        help="Keep LSTM/GRU layers on the fused kernel by applying --recurrent-dropout as input dropout",
+    )
     p.add_argument(
         "--residual-learning",
         action="store_true",
@@ -1191,6 +1740,134 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--static-covariates", type=str, default="")
     p.add_argument("--covariate-spec", type=str, default=None)
     p.add_argument("--cv-splits", type=int, default=0, help="Number of splits for time-series cross-validation")
+    p.add_argument("--cv-jobs", type=int, default=1, help="Worker processes used to train CV folds in parallel")
+    p.add_argument(
+        "--cv-threads-per-fold",
+        type=int,
+        default=0,
+        help="CPU threads per CV worker (0 = split available cores evenly across --cv-jobs)",
+    )
+    p.add_argument(
+        "--cv-warm-start",
+        action="store_true",
+        help="Initialize each expanding-window fold from the previous fold's weights (sequential)",
+    )
+    p.add_argument(
+        "--cv-warm-start-epochs", type=int, default=None, help="Epoch budget per warm-started fold (default: --epochs)"
+    )
+    p.add_argument(
+        "--cv-warm-start-patience", type=int, default=3, help="Early-stopping patience for warm-started folds"
+    )
+    p.add_argument(
+        "--cv-reuse-best",
+        action="store_true",
+        help="Initialize the final training run from the best CV fold checkpoint instead of random weights",
+    )
+    p.add_argument(
+        "--warm-start-from",
+        type=str,
+        default=None,
+        help="Fine-tune from this earlier run's best checkpoint on the windows appended since that run",
+    )
+    p.add_argument(
+        "--warm-start-replay",
+        type=float,
+        default=0.0,
+        help="Share of the previous run's training windows replayed during warm-start fine-tuning (0-1)",
+    )
+    p.add_argument(
+        "--distributed",
+        type=str,
+        choices=list(SUPPORTED_STRATEGIES),
+        default="none",
+        help="Data-parallel training: mirrored (local devices) or multi_worker (cluster from TF_CONFIG)",
+    )
+    p.add_argument(
+        "--epoch-checkpoints",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Write weights-only best/last checkpoints and optimizer state after every epoch (async)",
+    )
+    p.add_argument(
+        "--autotune",
+        action="store_true",
+        help="Benchmark batch sizes and CPU thread settings for this model and data first, then train with the fastest",
+    )
+    p.add_argument("--autotune-batch-sizes", type=int, nargs="+", default=list(DEFAULT_BATCH_SIZES))
+    p.add_argument(
+        "--autotune-threads",
+        type=str,
+        default=None,
+        help="Comma-separated 'intra[:inter]' thread settings to try (default: all, half and a quarter of the cores)",
+    )
+    p.add_argument(
+        "--autotune-memory-mb",
+        type=float,
+        default=None,
+        help="Peak RSS budget per configuration (default: 80%% of physical memory)",
+    )
+    p.add_argument("--autotune-trial-steps", type=int, default=20, help="Timed training steps per configuration")
+    p.add_argument(
+        "--autotune-lr-scaling",
+        choices=list(LR_SCALING),
+        default="none",
+        help="Rescale --learning-rate for the chosen batch size relative to --batch-size",
+    )
+    p.add_argument(
+        "--resume",
+        choices=["auto", "require", "never"],
+        default="auto",
+        help=(
+            "Continue an interrupted run with the same --run-id from its last epoch checkpoint: "
+            "auto resumes when one exists, require fails without one, never starts over"
+        ),
+    )
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record samples/sec, step-time percentiles, input wait and peak RSS into the metrics and report",
+    )
+    p.add_argument(
+        "--profile-trace-steps",
+        type=str,
+        default=None,
+        help="'start,stop' global training steps to capture with the TensorBoard profiler (implies --profile)",
+    )
+    p.add_argument(
+        "--distill-teacher",
+        type=str,
+        nargs="+",
+        default=None,
+        help=(
+            "Teacher run id(s), or checkpoints under <artifacts-dir>/checkpoints/<run_id>/, to distill from; "
+            "several are averaged as an ensemble"
+        ),
+    )
+    p.add_argument(
+        "--distill-alpha",
+        type=float,
+        default=0.5,
+        help="Weight of teacher predictions in the blended training targets (0 = labels only)",
+    )
+    p.add_argument(
+        "--distill-cache-dir",
+        type=str,
+        default=None,
+        help="Cache for teacher predictions (default: <artifacts-dir>/distill_cache)",
+    )
+    p.add_argument(
+        "--rollout-horizon",
+        type=int,
+        default=0,
+        help="Also evaluate a batched rollout to this horizon on the test windows (0 = disabled)",
+    )
+    p.add_argument(
+        "--rollout-strategy",
+        type=str,
+        choices=["direct", "recursive", "hybrid"],
+        default="hybrid",
+        help="recursive: feed back one step per call; hybrid: feed back the whole predicted block",
+    )
     p.add_argument("--export-formats", type=str, default="none")
     p.add_argument("--edge-profile", type=str, default="desktop_reference")
     p.add_argument(
@@ -1200,6 +1877,28 @@ def build_parser() -> argparse.ArgumentParser:
         default="balanced",
     )
     p.add_argument("--quantization", type=str, choices=["none", "fp16", "int8"], default="fp16")
+    p.add_argument(
+        "--prune-sparsity",
+        type=float,
+        default=0.0,
+        help="Fraction of kernel weights zeroed by magnitude pruning before export (0 = disabled)",
+    )
+    p.add_argument(
+        "--prune-granularity",
+        type=str,
+        choices=["weight", "channel"],
+        default="weight",
+        help="Prune individual weights or whole output channels (ranked by L2 norm)",
+    )
+    p.add_argument(
+        "--cluster-count", type=int, default=0, help="Shared values per kernel for weight clustering (0 = disabled)"
+    )
+    p.add_argument(
+        "--compression-fine-tune-epochs",
+        type=int,
+        default=2,
+        help="Fine-tune epochs after pruning/clustering (masks and centroids are kept fixed)",
+    )
     p.add_argument(
         "--int8-calibration-samples",
         type=int,
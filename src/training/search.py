@@ -0,0 +1,496 @@
+"""In-process hyperparameter search: random sampling + ASHA early stopping.
+
+Unlike ``edge_selection_lane`` (one runner subprocess per candidate × seed),
+every trial here runs inside a bounded thread pool against a single series
+loaded once.  Poor trials are stopped at rung boundaries by a Keras callback
+driven by an asynchronous successive-halving (ASHA) scheduler, and all trials
+land in a trials table (CSV + JSONL) with a speed-versus-quality report.
+Trials are ranked by their best validation loss.  The test RMSE each trial
+reports is informational only, so the test split never drives selection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.training.trainer import Trainer
+
+logger = logging.getLogger(__name__)
+
+SEARCHABLE_MODEL_TYPES = ("lstm", "gru", "attention_lstm", "tcn", "dlinear")
+
+TRIAL_TABLE_COLUMNS = (
+    "trial_id",
+    "status",
+    "model_type",
+    "hidden_units",
+    "dropout",
+    "learning_rate",
+    "sequence_length",
+    "epochs_run",
+    "stopped_at_rung",
+    "best_val_loss",
+    "rmse",
+    "mae",
+    "wall_time_sec",
+    "sec_per_epoch",
+    "param_count",
+    "infer_ms_per_sample",
+    "pareto_optimal",
+    "error",
+)
+
+
+@dataclass(frozen=True)
+class TrialConfig:
+    trial_id: str
+    model_type: str
+    hidden_units: tuple[int, ...]
+    dropout: float
+    learning_rate: float
+    sequence_length: int
+
+
+@dataclass
+class TrialResult:
+    config: TrialConfig
+    status: str = "pending"
+    epochs_run: int = 0
+    stopped_at_rung: int | None = None
+    best_val_loss: float | None = None
+    metrics: dict[str, float] = field(default_factory=dict)
+    wall_time_sec: float = 0.0
+    param_count: int | None = None
+    infer_ms_per_sample: float | None = None
+    pareto_optimal: bool = False
+    error: str | None = None
+
+    def to_row(self) -> dict[str, Any]:
+        row: dict[str, Any] = asdict(self.config)
+        row["hidden_units"] = list(self.config.hidden_units)
+        row.update(
+            {
+                "status": self.status,
+                "epochs_run": self.epochs_run,
+                "stopped_at_rung": self.stopped_at_rung,
+                "best_val_loss": self.best_val_loss,
+                "rmse": self.metrics.get("rmse"),
+                "mae": self.metrics.get("mae"),
+                "wall_time_sec": round(self.wall_time_sec, 4),
+                "sec_per_epoch": round(self.wall_time_sec / self.epochs_run, 4) if self.epochs_run else None,
+                "param_count": self.param_count,
+                "infer_ms_per_sample": self.infer_ms_per_sample,
+                "pareto_optimal": self.pareto_optimal,
+                "error": self.error,
+            }
+        )
+        return {k: row.get(k) for k in TRIAL_TABLE_COLUMNS}
+
+
+@dataclass(frozen=True)
+class SearchSpace:
+    model_types: tuple[str, ...] = ("lstm", "gru", "tcn", "dlinear")
+    hidden_units: tuple[tuple[int, ...], ...] = ((32,), (64, 32), (128, 64))
+    dropout: tuple[float, float] = (0.0, 0.4)
+    learning_rate: tuple[float, float] = (1e-4, 1e-2)
+    sequence_lengths: tuple[int, ...] = (12, 24, 48)
+
+    def __post_init__(self) -> None:
+        unknown = sorted(set(self.model_types) - set(SEARCHABLE_MODEL_TYPES))
+        if unknown:
+            raise ValueError(f"unsupported model_types in search space: {unknown}")
+        if not self.model_types or not self.hidden_units or not self.sequence_lengths:
+            raise ValueError("search space choices must be non-empty")
+        lo, hi = self.learning_rate
+        if not (0 < lo <= hi):
+            raise ValueError(f"learning_rate range must satisfy 0 < low <= high, got {self.learning_rate}")
+        d_lo, d_hi = self.dropout
+        if not (0 <= d_lo <= d_hi < 1):
+            raise ValueError(f"dropout range must satisfy 0 <= low <= high < 1, got {self.dropout}")
+
+
+def sample_trials(space: SearchSpace, n_trials: int, seed: int = 42) -> list[TrialConfig]:
+    """Draw ``n_trials`` random configurations (learning rate is log-uniform)."""
+    if n_trials <= 0:
+        raise ValueError(f"n_trials must be >= 1, got {n_trials}")
+    rng = np.random.default_rng(seed)
+    lr_lo, lr_hi = (math.log10(v) for v in space.learning_rate)
+    trials: list[TrialConfig] = []
+    for i in range(n_trials):
+        hidden = space.hidden_units[int(rng.integers(len(space.hidden_units)))]
+        trials.append(
+            TrialConfig(
+                trial_id=f"t{i:03d}",
+                model_type=str(space.model_types[int(rng.integers(len(space.model_types)))]),
+                hidden_units=tuple(int(u) for u in hidden),
+                dropout=round(float(rng.uniform(*space.dropout)), 4),
+                learning_rate=float(f"{10 ** rng.uniform(lr_lo, lr_hi):.6g}"),
+                sequence_length=int(space.sequence_lengths[int(rng.integers(len(space.sequence_lengths)))]),
+            )
+        )
+    return trials
+
+
+class AshaScheduler:
+    """Asynchronous successive halving (stopping variant).
+
+    Rungs sit at ``min_epochs * reduction_factor**k`` epochs below
+    ``max_epochs``.  When a trial reaches a rung it records its metric there and
+    keeps training only if it ranks within the top ``1 / reduction_factor`` of
+    all trials recorded at that rung so far.  Trials that reach a rung before
+    ``reduction_factor`` results exist are allowed to continue, so early workers
+    are never blocked waiting for peers.  Thread-safe.
+    """
+
+    def __init__(self, min_epochs: int = 1, max_epochs: int = 27, reduction_factor: int = 3) -> None:
+        if min_epochs < 1 or max_epochs < min_epochs:
+            raise ValueError("require 1 <= min_epochs <= max_epochs")
+        if reduction_factor < 2:
+            raise ValueError(f"reduction_factor must be >= 2, got {reduction_factor}")
+        self.min_epochs = int(min_epochs)
+        self.max_epochs = int(max_epochs)
+        self.reduction_factor = int(reduction_factor)
+        self.rungs: list[int] = []
+        epoch = self.min_epochs
+        while epoch < self.max_epochs:
+            self.rungs.append(epoch)
+            epoch *= self.reduction_factor
+        self._recorded: dict[int, dict[str, float]] = {r: {} for r in self.rungs}
+        self._lock = threading.Lock()
+
+    def report(self, trial_id: str, epoch: int, metric: float) -> bool:
+        """Record ``metric`` after ``epoch`` (1-based); return ``False`` to stop the trial."""
+        if epoch not in self._recorded:
+            return True
+        value = float(metric) if metric is not None and np.isfinite(metric) else math.inf
+        with self._lock:
+            recorded = self._recorded[epoch]
+            recorded[trial_id] = value
+            if len(recorded) < self.reduction_factor:
+                return True
+            keep = max(1, len(recorded) // self.reduction_factor)
+            cutoff = sorted(recorded.values())[keep - 1]
+            return value <= cutoff
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "min_epochs": self.min_epochs,
+                "max_epochs": self.max_epochs,
+                "reduction_factor": self.reduction_factor,
+                "rungs": {str(r): dict(v) for r, v in self._recorded.items()},
+            }
+
+
+def _make_pruning_callback(scheduler: AshaScheduler, trial_id: str, monitor: str = "val_loss") -> Any:
+    from tensorflow import keras
+
+    class AshaPruningCallback(keras.callbacks.Callback):
+        def __init__(self) -> None:
+            super().__init__()
+            self.stopped_at_rung: int | None = None
+
+        def on_epoch_end(self, epoch: int, logs: dict[str, Any] | None = None) -> None:
+            value = (logs or {}).get(monitor)
+            if value is None:
+                return
+            if not scheduler.report(trial_id, epoch + 1, float(value)):
+                self.stopped_at_rung = epoch + 1
+                self.model.stop_training = True
+
+    return AshaPruningCallback()
+
+
+def _count_params(model_wrapper: Any) -> int | None:
+    keras_model = getattr(model_wrapper, "model", None)
+    if keras_model is None:
+        return None
+    return int(keras_model.count_params())
+
+
+def _build_trial_model(base_args: argparse.Namespace, trial: TrialConfig, output_units: int, input_features: int):
+    from src.training.runner import _build_model
+
+    args = argparse.Namespace(
+        **{
+            **vars(base_args),
+            "model_type": trial.model_type,
+            "hidden_units": list(trial.hidden_units),
+            "dropout": trial.dropout,
+            "learning_rate": trial.learning_rate,
+            "sequence_length": trial.sequence_length,
+        }
+    )
+    return _build_model(args, output_units=output_units, input_features=input_features)
+
+
+def run_trial(
+    trial: TrialConfig,
+    series: np.ndarray,
+    args: argparse.Namespace,
+    scheduler: AshaScheduler | None,
+    save_dir: Path,
+) -> TrialResult:
+    """Train and score one configuration on the shared (read-only) series."""
+    result = TrialResult(config=trial, status="running")
+    input_features = 1 if series.ndim == 1 else int(series.shape[1])
+    started = time.perf_counter()
+    try:
+        model = _build_trial_model(args, trial, output_units=args.horizon, input_features=input_features)
+        trainer = Trainer(
+            model=model,
+            sequence_length=trial.sequence_length,
+            prediction_horizon=args.horizon,
+            save_dir=str(save_dir / trial.trial_id),
+        )
+        callbacks = [_make_pruning_callback(scheduler, trial.trial_id)] if scheduler is not None else None
+        trained = trainer.train(
+            data=series,
+            epochs=args.max_epochs,
+            batch_size=args.batch_size,
+            test_size=args.test_size,
+            val_size=args.val_size,
+            normalize=args.normalize,
+            normalize_method=args.normalize_method,
+            early_stopping=True,
+            verbose=0,
+            extra_callbacks=callbacks,
+        )
+        result.wall_time_sec = time.perf_counter() - started
+        history = trained.get("history") or {}
+        val_losses = [float(v) for v in history.get("val_loss", [])]
+        result.epochs_run = len(history.get("loss", []))
+        result.best_val_loss = min(val_losses) if val_losses else None
+        result.metrics = trained["metrics"]
+        result.param_count = _count_params(model)
+
+        X_test = trained["X_test"]
+        model.predict(X_test)  # warm-up: exclude graph tracing from the latency figure
+        t0 = time.perf_counter()
+        model.predict(X_test)
+        result.infer_ms_per_sample = round((time.perf_counter() - t0) * 1000.0 / max(1, len(X_test)), 6)
+
+        pruned_at = getattr(callbacks[0], "stopped_at_rung", None) if callbacks else None
+        result.stopped_at_rung = pruned_at
+        result.status = "pruned" if pruned_at is not None else "completed"
+    except Exception as exc:  # a broken config must not take the whole search down
+        result.wall_time_sec = time.perf_counter() - started
+        result.status = "failed"
+        result.error = f"{type(exc).__name__}: {exc}"
+        logger.warning("trial %s failed: %s", trial.trial_id, result.error)
+    return result
+
+
+def mark_pareto_front(results: list[TrialResult]) -> None:
+    """Flag trials not dominated on (best val loss, inference ms/sample); lower is better on both."""
+    scored = [r for r in results if r.status != "failed" and r.best_val_loss is not None]
+    for r in scored:
+        loss = float(r.best_val_loss or 0.0)
+        latency = float(r.infer_ms_per_sample or 0.0)
+        r.pareto_optimal = not any(
+            (float(o.best_val_loss or 0.0) <= loss and float(o.infer_ms_per_sample or 0.0) <= latency)
+            and (float(o.best_val_loss or 0.0) < loss or float(o.infer_ms_per_sample or 0.0) < latency)
+            for o in scored
+            if o is not r
+        )
+
+
+def run_search(
+    series: np.ndarray,
+    args: argparse.Namespace,
+    space: SearchSpace,
+    out_dir: Path,
+) -> dict[str, Any]:
+    """Run the search and write ``trials.csv``, ``trials.jsonl``, ``summary.json`` and ``report.md``."""
+    if args.workers < 1:
+        raise ValueError(f"workers must be >= 1, got {args.workers}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    series = np.array(series, dtype=np.float32)
+    series.setflags(write=False)  # one read-only copy shared by every worker thread
+
+    trials = sample_trials(space, args.n_trials, seed=args.seed)
+    scheduler = (
+        AshaScheduler(min_epochs=args.min_epochs, max_epochs=args.max_epochs, reduction_factor=args.reduction_factor)
+        if args.scheduler == "asha"
+        else None
+    )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="hparam-trial") as pool:
+        futures = [pool.submit(run_trial, t, series, args, scheduler, out_dir / "trials") for t in trials]
+        results = [f.result() for f in futures]
+    elapsed = time.perf_counter() - started
+
+    mark_pareto_front(results)
+    rows = [r.to_row() for r in results]
+    # Selection uses validation loss only; test RMSE stays in the table as information.
+    ranked = sorted(
+        (row for row in rows if row["status"] != "failed" and row["best_val_loss"] is not None),
+        key=lambda row: (row["best_val_loss"], row["wall_time_sec"]),
+    )
+
+    _write_trials_table(out_dir, rows)
+    summary = {
+        "search_id": args.search_id,
+        "created_at": datetime.now().isoformat(),
+        "scheduler": scheduler.snapshot() if scheduler is not None else {"kind": "none"},
+        "space": {k: (list(v) if isinstance(v, tuple) else v) for k, v in asdict(space).items()},
+        "n_trials": len(rows),
+        "workers": int(args.workers),
+        "status_counts": {s: sum(1 for r in rows if r["status"] == s) for s in ("completed", "pruned", "failed")},
+        "total_wall_time_sec": round(elapsed, 4),
+        "trial_epochs_total": int(sum(r.epochs_run for r in results)),
+        "trial_epochs_budget": int(args.max_epochs * len(rows)),
+        "best": ranked[0] if ranked else None,
+        "pareto_front": [row["trial_id"] for row in ranked if row["pareto_optimal"]],
+        "trials_csv": str(out_dir / "trials.csv"),
+        "trials_jsonl": str(out_dir / "trials.jsonl"),
+    }
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    (out_dir / "report.md").write_text(_render_report(summary, ranked), encoding="utf-8")
+    return summary
+
+
+def _write_trials_table(out_dir: Path, rows: list[dict[str, Any]]) -> None:
+    with open(out_dir / "trials.jsonl", "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    with open(out_dir / "trials.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(TRIAL_TABLE_COLUMNS))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, "hidden_units": ",".join(str(u) for u in row["hidden_units"])})
+
+
+def load_trials(path: str | Path) -> list[dict[str, Any]]:
+    """Load a ``trials.jsonl`` table (or the search directory containing it)."""
+    p = Path(path)
+    if p.is_dir():
+        p = p / "trials.jsonl"
+    return [json.loads(line) for line in p.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def query_trials(
+    rows: list[dict[str, Any]],
+    where: dict[str, Any] | None = None,
+    sort_by: str = "best_val_loss",
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Filter trial rows by exact column values and sort ascending (missing values last)."""
+    unknown = sorted(set(where or {}) - set(TRIAL_TABLE_COLUMNS))
+    if unknown or sort_by not in TRIAL_TABLE_COLUMNS:
+        raise ValueError(f"unknown trial columns: {unknown or [sort_by]}")
+    selected = [row for row in rows if all(row.get(k) == v for k, v in (where or {}).items())]
+    selected.sort(key=lambda row: (row.get(sort_by) is None, row.get(sort_by) or 0))
+    return selected[:limit] if limit is not None else selected
+
+
+def _fmt(value: float | None) -> str:
+    return f"{value:.5f}" if value is not None else "-"
+
+
+def _render_report(summary: dict[str, Any], ranked: list[dict[str, Any]]) -> str:
+    lines = [
+        f"# Hyperparameter Search Report: `{summary['search_id']}`",
+        "",
+        f"- trials: {summary['n_trials']} ({summary['status_counts']})",
+        f"- workers: {summary['workers']}",
+        f"- wall time: {summary['total_wall_time_sec']:.2f}s",
+        f"- epochs trained: {summary['trial_epochs_total']} / {summary['trial_epochs_budget']} budget",
+        "",
+        "## Speed vs quality",
+        "",
+        "Trials are ranked by best validation loss. Pareto-optimal trials (`*`) are not beaten on both",
+        "validation loss and inference latency. Test RMSE is shown for information and is not used for selection.",
+        "",
+        "| trial | model | hidden | seq_len | lr | dropout | status | epochs | val loss | test rmse | s/epoch "
+        "| infer ms/sample | params |",
+        "|---|---|---|---|---|---|---|---|---|---|---|---|---|",
+    ]
+    for row in ranked:
+        marker = "*" if row["pareto_optimal"] else ""
+        lines.append(
+            f"| {row['trial_id']}{marker} | {row['model_type']} | {row['hidden_units']} | {row['sequence_length']} "
+            f"| {row['learning_rate']:.2e} | {row['dropout']:.3f} | {row['status']} | {row['epochs_run']} "
+            f"| {row['best_val_loss']:.5f} | {_fmt(row['rmse'])} | {row['sec_per_epoch']} | {row['infer_ms_per_sample']} | {row['param_count']} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _parse_hidden_units_choices(raw: str) -> tuple[tuple[int, ...], ...]:
+    return tuple(tuple(int(u) for u in group.split(",") if u.strip()) for group in raw.split(";") if group.strip())
+
+
+def _parse_float_pair(raw: str) -> tuple[float, float]:
+    parts = [float(x) for x in raw.split(",") if x.strip()]
+    if len(parts) != 2:
+        raise argparse.ArgumentTypeError(f"expected 'low,high', got {raw!r}")
+    return parts[0], parts[1]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Random search + ASHA over the model zoo (single shared dataset)")
+    p.add_argument("--search-id", type=str, default=None)
+    p.add_argument("--artifacts-dir", type=str, default="artifacts")
+    p.add_argument("--n-trials", type=int, default=12)
+    p.add_argument("--workers", type=int, default=2, help="Concurrent trials (bounded thread pool)")
+    p.add_argument("--scheduler", choices=["asha", "none"], default="asha")
+    p.add_argument("--min-epochs", type=int, default=1, help="First ASHA rung (epochs)")
+    p.add_argument("--max-epochs", type=int, default=27)
+    p.add_argument("--reduction-factor", type=int, default=3)
+    p.add_argument("--model-types", type=str, default="lstm,gru,tcn,dlinear")
+    p.add_argument("--hidden-units-choices", type=str, default="32;64,32;128,64", help="';'-separated layer-size lists")
+    p.add_argument("--dropout-range", type=_parse_float_pair, default=(0.0, 0.4))
+    p.add_argument("--learning-rate-range", type=_parse_float_pair, default=(1e-4, 1e-2))
+    p.add_argument("--sequence-lengths", type=str, default="12,24,48")
+    p.add_argument("--horizon", type=int, default=1)
+    p.add_argument("--batch-size", type=int, default=32)
+    p.add_argument("--test-size", type=float, default=0.2)
+    p.add_argument("--val-size", type=float, default=0.2)
+    p.add_argument("--normalize", action="store_true", default=True)
+    p.add_argument("--no-normalize", action="store_false", dest="normalize")
+    p.add_argument("--normalize-method", choices=["minmax", "standard"], default="minmax")
+    p.add_argument("--processed-npz", type=str, default=None)
+    p.add_argument("--input-npy", type=str, default=None)
+    p.add_argument("--synthetic-samples", type=int, default=720)
+    p.add_argument("--synthetic-noise", type=float, default=0.08)
+    p.add_argument("--seed", type=int, default=42)
+    return p
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+    args = build_parser().parse_args()
+    args.search_id = args.search_id or f"search-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    from src.training.runner import _load_series
+    from src.utils.repro import set_global_seed
+
+    set_global_seed(args.seed)
+    space = SearchSpace(
+        model_types=tuple(m.strip() for m in args.model_types.split(",") if m.strip()),
+        hidden_units=_parse_hidden_units_choices(args.hidden_units_choices),
+        dropout=args.dropout_range,
+        learning_rate=args.learning_rate_range,
+        sequence_lengths=tuple(int(x) for x in args.sequence_lengths.split(",") if x.strip()),
+    )
+    series = _load_series(args)
+    summary = run_search(series, args, space, Path(args.artifacts_dir) / "search" / args.search_id)
+    print(json.dumps({"search_id": summary["search_id"], "best": summary["best"]}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
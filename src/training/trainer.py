@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -203,9 +204,20 @@ class Trainer:
         verbose: int = 1,
         extra_callbacks: list[Any] | None = None,
         extra_metric_fns: dict[str, Callable[[np.ndarray, np.ndarray], float]] | None = None,
+        initial_checkpoint: str | None = None,
+        teacher: Any | None = None,
+        distill_alpha: float = 0.5,
+        new_windows_from: int | None = None,
+        replay_fraction: float = 0.0,
+        strategy: Any | None = None,
+        initial_epoch: int = 0,
     ) -> dict[str, Any]:
         """Full training pipeline with leakage-safe split/normalization.
 
+        For models with a multi-quantile head (``model.quantiles``) the results
+        also carry ``y_pred_quantiles`` and ``quantile_metrics`` (pinball loss and
+        interval coverage on the test windows); ``y_pred`` is the median.
+
         Parameters
         ----------
         denormalize_metrics : bool
@@ -220,6 +232,33 @@ class Trainer:
             :func:`build_baseline_report` must ensure the baseline is computed
             in the same scale (use ``results["y_test_original_scale"]`` and
             ``results["y_pred_original_scale"]``).
+        initial_checkpoint : str | None
+            Checkpoint loaded into the model before fitting (e.g. the
+            ``best_checkpoint`` returned by :meth:`cross_validate`), so the
+            final fit fine-tunes instead of starting from random weights.
+        teacher : DistillationTeacher | None
+            Distillation teacher (see :mod:`src.training.distillation`).  The
+            model is fitted on ``distill_alpha * teacher + (1 - distill_alpha) *
+            y`` for the training windows; validation, test metrics and early
+            stopping keep using the ground truth.
+        new_windows_from : int | None
+            Incremental retraining: fit only on training windows from this index
+            on (the windows appended since the previous run), typically together
+            with ``initial_checkpoint``.  Validation and test splits are
+            unchanged.
+        replay_fraction : float
+            Share of the older training windows (before ``new_windows_from``)
+            replayed alongside the new ones, spread evenly over the history and
+            kept in chronological order.
+        strategy : tf.distribute.Strategy | None
+            Fit data-parallel under this strategy (see
+            :mod:`src.training.distributed`).  ``batch_size`` is per replica.
+            Evaluation and the returned model stay local to this process.
+        initial_epoch : int
+            Epochs already completed by an interrupted run; fitting continues
+            from there.  The model, optimizer and callback state are restored
+            by a resuming checkpoint callback (see
+            :mod:`src.training.checkpointing`) passed in ``extra_callbacks``.
         """
         X_tr: Any
         X_v: Any
@@ -265,7 +304,7 @@ class Trainer:
             X_v, y_v = self.create_sequences(val_raw)
             X_test, y_test = self.create_sequences(test_raw)
 
-        results = {
+        results: dict[str, Any] = {
             "start_time": datetime.now().isoformat(),
             "config": {
                 "sequence_length": self.sequence_length,
@@ -275,6 +314,8 @@ class Trainer:
                 "test_size": test_size,
                 "val_size": val_size,
                 "normalize_method": normalize_method,
+                "initial_checkpoint": initial_checkpoint,
+                "distill_alpha": distill_alpha if teacher is not None else None,
             },
         }
 
@@ -284,17 +325,75 @@ class Trainer:
                 "Adjust sequence_length, prediction_horizon, test_size, or val_size."
             )
 
-        history = self.model.fit_model(
-            X_tr,
-            y_tr,
-            epochs=epochs,
-            batch_size=batch_size,
-            validation_data=(X_v, y_v),
-            early_stopping=early_stopping,
-            shuffle=False,
-            verbose=verbose,
-            extra_callbacks=extra_callbacks,
-        )
+        if initial_checkpoint is not None:
+            self.load_checkpoint(initial_checkpoint)
+
+        n_train_windows = len(y_tr)
+        if new_windows_from is not None:
+            X_tr, y_tr, incremental = _select_incremental_windows(X_tr, y_tr, new_windows_from, replay_fraction)
+            results["incremental"] = incremental
+
+        distillation: dict[str, Any] | None = None
+        if teacher is not None:
+            from src.training.distillation import blend_soft_targets
+
+            y_soft, cache_hit = teacher.soft_targets(X_tr)
+            distillation = {
+                **teacher.describe(),
+                "alpha": distill_alpha,
+                "cache_hit": cache_hit,
+                "teacher_train_metrics": self.compute_metrics(y_tr, y_soft),
+            }
+            y_tr = blend_soft_targets(y_tr, y_soft, distill_alpha)
+
+        # Kept for post-training stages (e.g. compression fine-tuning).
+        self.X_train, self.y_train = X_tr, y_tr
+        self.X_val, self.y_val = X_v, y_v
+
+        for callback in extra_callbacks or []:
+            # Profiling callbacks turn step counts into samples with the fitted window count.
+            if hasattr(callback, "samples_per_epoch") and callback.samples_per_epoch is None:
+                callback.samples_per_epoch = len(y_tr)
+
+        fit_start = time.perf_counter()
+        if strategy is not None:
+            from src.training.distributed import describe_strategy, fit_distributed
+
+            history = fit_distributed(
+                self.model,
+                strategy,
+                X_tr,
+                y_tr,
+                epochs=epochs,
+                batch_size=batch_size,
+                validation_data=(X_v, y_v),
+                early_stopping=early_stopping,
+                verbose=verbose,
+                extra_callbacks=extra_callbacks,
+                initial_epoch=initial_epoch,
+            )
+            results["distributed"] = describe_strategy(strategy, batch_size)
+        else:
+            history = self.model.fit_model(
+                X_tr,
+                y_tr,
+                epochs=epochs,
+                batch_size=batch_size,
+                validation_data=(X_v, y_v),
+                early_stopping=early_stopping,
+                shuffle=False,
+                verbose=verbose,
+                extra_callbacks=extra_callbacks,
+                initial_epoch=initial_epoch,
+            )
+        results["training_stats"] = {
+            "train_windows": n_train_windows,
+            "fit_windows": len(y_tr),
+            "replicas": int(strategy.num_replicas_in_sync) if strategy is not None else 1,
+            "initial_epoch": initial_epoch,
+            "fit_seconds": float(time.perf_counter() - fit_start),
+            **_convergence_stats(history),
+        }
 
         y_pred = self.model.predict(X_test)
 
@@ -315,6 +414,25 @@ class Trainer:
             for name, fn in extra_metric_fns.items():
                 metrics[name] = float(fn(y_test_eval, y_pred_eval))
 
+        quantiles = getattr(self.model, "quantiles", None)
+        y_pred_quantiles: np.ndarray | None = None
+        if quantiles is not None:
+            from src.training.baselines import quantile_metrics
+
+            y_pred_quantiles = self.model.predict_quantiles(X_test)
+            y_quantiles_eval = y_pred_quantiles
+            if y_pred_eval is not y_pred:
+                assert norm_params_for_denorm is not None
+                y_quantiles_eval = self.denormalize(y_pred_quantiles, norm_params_for_denorm)
+            results["quantile_metrics"] = quantile_metrics(y_test_eval, y_quantiles_eval, quantiles)
+
+        if distillation is not None:
+            assert teacher is not None
+            y_teacher_test, _ = teacher.soft_targets(X_test)
+            distillation["teacher_test_metrics"] = self.compute_metrics(y_test, y_teacher_test)
+            distillation["student_test_metrics"] = self.compute_metrics(y_test, y_pred)
+            results["distillation"] = distillation
+
         results["end_time"] = datetime.now().isoformat()
         results["history"] = history
         results["metrics"] = metrics
@@ -322,6 +440,7 @@ class Trainer:
         results["X_test"] = X_test
         results["y_test"] = y_test
         results["y_pred"] = y_pred
+        results["y_pred_quantiles"] = y_pred_quantiles
         results["y_test_original_scale"] = y_test_eval
         results["y_pred_original_scale"] = y_pred_eval
 
@@ -329,26 +448,81 @@ class Trainer:
         self.X_test = X_test
         self.y_test = y_test
         self.y_pred = y_pred
+        self.y_pred_quantiles = y_pred_quantiles
 
         logger.info(f"Training complete. RMSE: {metrics['rmse']:.4f}")
 
         return results
 
     def cross_validate(
-        self, X: Any, y: np.ndarray, n_splits: int = 5, epochs: int = 50, batch_size: int = 32, verbose: int = 0
+        self,
+        X: Any,
+        y: np.ndarray,
+        n_splits: int = 5,
+        epochs: int = 50,
+        batch_size: int = 32,
+        verbose: int = 0,
+        n_jobs: int = 1,
+        threads_per_fold: int | None = None,
+        model_factory: Callable[[], Any] | None = None,
+        warm_start: bool = False,
+        warm_start_epochs: int | None = None,
+        warm_start_patience: int = 3,
+        checkpoint_dir: str | None = None,
+        test_size: float | None = None,
     ) -> dict[str, Any]:
         """Time-series cross-validation (expanding window).
 
-        The model is rebuilt from scratch before each fold so that metrics
-        reflect independent training runs rather than accumulated fine-tuning.
+        By default the model is rebuilt from scratch before each fold so that
+        metrics reflect independent training runs rather than accumulated
+        fine-tuning.
+
+        Parameters
+        ----------
+        n_jobs : int
+            Number of worker processes used to train folds concurrently.  Values
+            above 1 require ``model_factory`` (a picklable zero-argument callable
+            returning a fresh, unbuilt model wrapper) because Keras models cannot
+            be shipped across processes.
+        threads_per_fold : int | None
+            CPU thread budget for each worker; defaults to an even share of the
+            available cores so concurrent folds do not oversubscribe the host.
+        warm_start : bool
+            Initialize each expanding-window fold from the previous fold's
+            weights.  Folds then run sequentially; every fold holds out the tail
+            of its training window for early stopping.
+        warm_start_epochs : int | None
+            Epoch budget for folds after the first one in warm-start mode
+            (defaults to ``epochs``).
+        warm_start_patience : int
+            Early-stopping patience used in warm-start mode.
+        checkpoint_dir : str | None
+            Where fold checkpoints are written (defaults to ``<save_dir>/cv``).
+            The checkpoint of the fold with the lowest RMSE is reported as
+            ``best_checkpoint`` and can seed :meth:`train`.
+        test_size : float | None
+            Share of the windows that :meth:`train` later holds out as the test
+            split.  That tail is dropped before the folds are built, so neither
+            the fold metrics nor ``best_checkpoint`` have seen test data.
         """
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be >= 1, got {n_jobs}")
+        if warm_start and n_jobs > 1:
+            raise ValueError("warm_start folds depend on each other and cannot run with n_jobs > 1")
+
         n_samples = len(y)
+        if test_size is not None:
+            if not (0 < test_size < 1):
+                raise ValueError(f"test_size must be in (0, 1), got {test_size}")
+            # Same boundary as train_test_split, so CV only ever sees train+val windows.
+            n_samples = int(n_samples * (1 - test_size))
         indices = np.arange(n_samples)
+        ckpt_dir = checkpoint_dir or os.path.join(self.save_dir, "cv")
+        os.makedirs(ckpt_dir, exist_ok=True)
 
         # Simple rolling window / expanding window approach
         fold_size = n_samples // (n_splits + 1)
-        all_metrics = []
-
+        tasks: list[dict[str, Any]] = []
         for i in range(n_splits):
             train_idx = indices[: (i + 1) * fold_size]
             test_idx = indices[(i + 1) * fold_size : (i + 2) * fold_size]
@@ -356,25 +530,58 @@ class Trainer:
             if len(test_idx) == 0:
                 break
 
-            if isinstance(X, list):
-                X_tr = [x[train_idx] for x in X]
-                X_te = [x[test_idx] for x in X]
-            else:
-                X_tr = X[train_idx]
-                X_te = X[test_idx]
-
-            y_tr, y_te = y[train_idx], y[test_idx]
-
-            # Rebuild the model from scratch for each fold so that weights from
-            # previous folds do not bleed into the current fold's evaluation.
-            self.model.build()
-            self.model.fit_model(
-                X_tr, y_tr, epochs=epochs, batch_size=batch_size, verbose=verbose, early_stopping=False
+            tasks.append(
+                {
+                    "fold": i,
+                    "X_tr": _take_rows(X, train_idx),
+                    "y_tr": y[train_idx],
+                    "X_te": _take_rows(X, test_idx),
+                    "y_te": y[test_idx],
+                    "epochs": epochs,
+                    "batch_size": batch_size,
+                    "verbose": verbose,
+                    "checkpoint_path": os.path.join(ckpt_dir, f"fold_{i + 1}.h5"),
+                }
             )
-            y_pred = self.model.predict(X_te)
-            metrics = self.compute_metrics(y_te, y_pred)
-            all_metrics.append(metrics)
-            logger.info(f"Fold {i + 1}/{n_splits} - RMSE: {metrics['rmse']:.4f}")
+
+        if not tasks:
+            raise ValueError(f"Not enough samples ({n_samples}) for {n_splits}-fold cross-validation")
+
+        if n_jobs > 1:
+            if model_factory is None:
+                raise ValueError("n_jobs > 1 requires a picklable model_factory")
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+
+            from src.utils.threads import split_thread_budget
+
+            threads = split_thread_budget(n_jobs, threads_per_fold)
+            # spawn: forking a process that already initialized TensorFlow is unsafe.
+            with ProcessPoolExecutor(
+                max_workers=min(n_jobs, len(tasks)),
+                mp_context=get_context("spawn"),
+                initializer=_init_cv_worker,
+                initargs=(threads,),
+            ) as pool:
+                futures = [
+                    pool.submit(_run_cv_fold_in_worker, model_factory, self.sequence_length, self.prediction_horizon, t)
+                    for t in tasks
+                ]
+                fold_results = [f.result() for f in futures]
+        else:
+            threads = None
+            fold_results = []
+            for task in tasks:
+                if warm_start and task["fold"] > 0:
+                    task["epochs"] = warm_start_epochs or epochs
+                if warm_start:
+                    fold_results.append(self._fit_fold(task, reset=task["fold"] == 0, patience=warm_start_patience))
+                else:
+                    fold_results.append(self._fit_fold(task, reset=True))
+
+        all_metrics = [r["metrics"] for r in fold_results]
+        for r in fold_results:
+            logger.info(f"Fold {r['fold'] + 1}/{n_splits} - RMSE: {r['metrics']['rmse']:.4f}")
 
         # Aggregate metrics
         avg_metrics = {}
@@ -382,7 +589,111 @@ class Trainer:
             avg_metrics[key] = float(np.mean([m[key] for m in all_metrics]))
             avg_metrics[f"{key}_std"] = float(np.std([m[key] for m in all_metrics]))
 
-        return {"avg_metrics": avg_metrics, "folds": all_metrics}
+        best = min(fold_results, key=lambda r: r["metrics"]["rmse"])
+        return {
+            "avg_metrics": avg_metrics,
+            "folds": all_metrics,
+            "epochs_run": [r["epochs_run"] for r in fold_results],
+            "best_fold": int(best["fold"]) + 1,
+            "best_checkpoint": best["checkpoint"],
+            "fold_indices": [
+                {"train": [0, len(t["y_tr"])], "test": [len(t["y_tr"]), len(t["y_tr"]) + len(t["y_te"])]} for t in tasks
+            ],
+            "cv_samples": int(n_samples),
+            "mode": "warm_start" if warm_start else "independent",
+            "n_jobs": int(n_jobs),
+            "threads_per_fold": threads,
+        }
+
+    def _fit_fold(self, task: dict[str, Any], reset: bool = True, patience: int | None = None) -> dict[str, Any]:
+        """Fit and score a single CV fold, then checkpoint it.
+
+        ``reset`` rebuilds the model so weights from previous folds do not bleed
+        into this fold.  When ``patience`` is given the tail of the fold's
+        training window is held out for early stopping.
+        """
+        X_tr, y_tr = task["X_tr"], task["y_tr"]
+        validation_data = None
+        callbacks = None
+        if patience is not None:
+            split_idx = int(len(y_tr) * 0.8)
+            if 0 < split_idx < len(y_tr):
+                fit_idx = np.arange(split_idx)
+                val_idx = np.arange(split_idx, len(y_tr))
+                validation_data = (_take_rows(X_tr, val_idx), y_tr[val_idx])
+                X_tr, y_tr = _take_rows(X_tr, fit_idx), y_tr[fit_idx]
+                callbacks = [_early_stopping_callback(patience)]
+
+        if reset or getattr(self.model, "model", None) is None:
+            self.model.build()
+        history = self.model.fit_model(
+            X_tr,
+            y_tr,
+            epochs=task["epochs"],
+            batch_size=task["batch_size"],
+            validation_data=validation_data,
+            verbose=task["verbose"],
+            early_stopping=False,
+            extra_callbacks=callbacks,
+        )
+        y_pred = self.model.predict(task["X_te"])
+        metrics = self.compute_metrics(task["y_te"], y_pred)
+
+        checkpoint = task.get("checkpoint_path")
+        if checkpoint:
+            self.model.save(checkpoint)
+        losses = (history or {}).get("loss", []) if isinstance(history, dict) else []
+        return {
+            "fold": task["fold"],
+            "metrics": metrics,
+            "epochs_run": len(losses) if losses else int(task["epochs"]),
+            "checkpoint": checkpoint,
+        }
+
+    def evaluate_rollout(
+        self,
+        horizon: int,
+        strategy: str = "hybrid",
+        X: np.ndarray | None = None,
+        y: np.ndarray | None = None,
+    ) -> dict[str, Any]:
+        """Evaluate multi-horizon rollout beyond the trained output block.
+
+        ``X``/``y`` default to the test windows from :meth:`train`.  They must
+        be consecutive stride-1 windows (as produced by :meth:`create_sequences`),
+        so the truth for step ``k`` after window ``i`` is the first target step
+        of window ``i + k``.  Only past-only inputs whose features are the
+        targets can be rolled out.
+        """
+        from src.training.rollout import RolloutEngine
+
+        X = self.X_test if X is None else X
+        y = self.y_test if y is None else y
+        if isinstance(X, list):
+            raise ValueError("rollout evaluation supports past-only inputs, got covariate list")
+        X = np.asarray(X, dtype=np.float32)
+        n_targets = int(X.shape[2])
+        if y.shape[1] % n_targets:
+            raise ValueError(f"y width {y.shape[1]} is not a multiple of input features {n_targets}")
+        model_horizon = y.shape[1] // n_targets
+        n_eval = len(X) - horizon + 1
+        if n_eval < 1:
+            raise ValueError(f"need more than {horizon - 1} windows to evaluate horizon={horizon}, got {len(X)}")
+
+        y_steps = np.asarray(y, dtype=float).reshape(len(y), model_horizon, n_targets)
+        truth = np.stack([y_steps[k : k + n_eval, 0] for k in range(horizon)], axis=1)
+        engine = RolloutEngine.from_model(self.model, n_targets=n_targets)
+        pred = engine.forecast(X[:n_eval], horizon=horizon, strategy=strategy).astype(float)
+
+        return {
+            "horizon": horizon,
+            "strategy": strategy,
+            "model_horizon": model_horizon,
+            "n_series": n_eval,
+            "model_calls": engine.last_stats["model_calls"],
+            "metrics": self.compute_metrics(truth.reshape(n_eval, -1), pred.reshape(n_eval, -1)),
+            "per_step_rmse": [float(np.sqrt(np.mean((truth[:, k] - pred[:, k]) ** 2))) for k in range(horizon)],
+        }
 
     def save_checkpoint(self, name: str | None = None) -> str:
         """Save model checkpoint."""
@@ -474,3 +785,62 @@ class Trainer:
         """Load model checkpoint."""
         self.model.load(path)
         logger.info(f"Checkpoint loaded: {path}")
+
+
+def _convergence_stats(history: dict[str, Any] | None) -> dict[str, Any]:
+    """Epochs run and epochs to the best validation loss (what early stopping restores)."""
+    history = history or {}
+    losses = history.get("val_loss") or history.get("loss") or []
+    return {
+        "epochs_run": len(history.get("loss") or []),
+        "epochs_to_converge": int(np.argmin(losses)) + 1 if len(losses) else 0,
+        "best_val_loss": float(np.min(history["val_loss"])) if history.get("val_loss") else None,
+    }
+
+
+def _select_incremental_windows(
+    X: Any, y: np.ndarray, new_from: int, replay_fraction: float
+) -> tuple[Any, np.ndarray, dict[str, Any]]:
+    """Keep windows ``[new_from:]`` plus an evenly spaced replay sample of the older ones."""
+    if not 0.0 <= replay_fraction <= 1.0:
+        raise ValueError(f"replay_fraction must be in [0, 1], got {replay_fraction}")
+    n = len(y)
+    new_from = min(max(int(new_from), 0), n)
+    if new_from == n:
+        # No appended windows (same data as the previous run): fine-tune on everything.
+        logger.warning("No new training windows since the previous run; fine-tuning on all %d windows", n)
+        new_from = 0
+    n_replay = int(round(new_from * replay_fraction))
+    replay_idx = np.unique(np.linspace(0, new_from - 1, n_replay).astype(int)) if n_replay else np.empty(0, int)
+    idx = np.concatenate([replay_idx, np.arange(new_from, n)])
+    info = {"new_windows_from": new_from, "new_windows": n - new_from, "replay_windows": len(replay_idx)}
+    return _take_rows(X, idx), y[idx], info
+
+
+def _take_rows(X: Any, idx: np.ndarray) -> Any:
+    """Index a model input (array or ``[past, future, static]`` list) along the sample axis."""
+    if isinstance(X, list):
+        return [None if x is None else x[idx] for x in X]
+    return X[idx]
+
+
+def _early_stopping_callback(patience: int) -> Any:
+    from tensorflow import keras
+
+    return keras.callbacks.EarlyStopping(monitor="val_loss", patience=patience, restore_best_weights=True)
+
+
+def _init_cv_worker(threads: int) -> None:
+    from src.utils.threads import configure_cpu_threads
+
+    configure_cpu_threads(threads)
+
+
+def _run_cv_fold_in_worker(
+    model_factory: Callable[[], Any], sequence_length: int, prediction_horizon: int, task: dict[str, Any]
+) -> dict[str, Any]:
+    save_dir = os.path.dirname(task["checkpoint_path"]) or "."
+    trainer = Trainer(
+        model_factory(), sequence_length=sequence_length, prediction_horizon=prediction_horizon, save_dir=save_dir
+    )
+    return trainer._fit_fold(task, reset=True)
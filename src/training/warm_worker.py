@@ -0,0 +1,132 @@
+"""Long-lived runner process that keeps Python, TensorFlow and the runner imported between jobs.
+
+Started by the backend's warm pool as ``python -m src.training.warm_worker``.
+It imports ``--preload`` (default ``src.training.runner``), then reads one
+JSON job spec per stdin line::
+
+    {"job_id": "job-1", "argv": ["--run-id", "r1", ...]}
+
+and runs ``<preload>.main()`` in-process with ``sys.argv`` set to the job's
+arguments.  The job's output goes to this process's stdout/stderr.  Control
+records are single lines prefixed with :data:`MARKER` (``ready`` once the
+preload finished, ``done`` after each job with its exit code and current
+RSS); a matching ``end`` marker on stderr tells the reader that the job's
+stderr is complete.  When the backend passed a progress descriptor
+(:mod:`src.training.progress`), a ``job`` event naming the job is written to
+it before each job and an ``end`` event after it.  The pool attributes the
+progress events in between to that job and, as with stderr, finishes the job
+only after its ``end`` (``done`` reports ``progress: false`` when the
+descriptor broke).  The process exits when stdin closes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import resource
+import sys
+import time
+from typing import IO, Any
+
+from src.training.progress import progress_stream_from_env
+
+MARKER = "\x1ewarm-worker "
+
+
+def current_rss_mb() -> float:
+    """Resident set size now (not the peak), falling back to the peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024.0 * 1024.0)
+    except (OSError, ValueError, IndexError):
+        return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) / 1024.0
+
+
+def _emit(event: str, **fields: Any) -> None:
+    print(MARKER + json.dumps({"event": event, **fields}), flush=True)
+
+
+def _progress_marker(stream: IO[str] | None, event: str, job_id: Any) -> IO[str] | None:
+    """Write a job boundary to the progress stream; None once the stream is broken."""
+    if stream is None:
+        return None
+    try:
+        stream.write(json.dumps({"event": event, "job_id": job_id}) + "\n")
+        return stream
+    except (OSError, ValueError):
+        return None
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    return exc.code if isinstance(exc.code, int) else 1
+
+
+def _reset_between_jobs(environ: dict[str, str], cwd: str) -> None:
+    os.environ.clear()
+    os.environ.update(environ)
+    os.chdir(cwd)
+    keras = sys.modules.get("keras")
+    if keras is not None:
+        # Drop the previous job's graphs and layer-name counters; the runtime itself stays loaded.
+        keras.backend.clear_session()
+    gc.collect()
+
+
+def run_job(entry: Any, spec: dict[str, Any]) -> int:
+    sys.argv = [entry.__name__, *[str(a) for a in spec.get("argv", [])]]
+    try:
+        entry.main()
+        return 0
+    except SystemExit as exc:
+        return _exit_code(exc)
+    except BaseException as exc:  # a crashing job must not take the worker down
+        print(f"warm worker: job raised {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm runner worker (reads job specs from stdin)")
+    parser.add_argument("--preload", default="src.training.runner", help="Module whose main() runs each job")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    # The runner imports TensorFlow/Keras at module level, so this is where the startup cost is paid.
+    entry = importlib.import_module(args.preload)
+    environ = dict(os.environ)
+    cwd = os.getcwd()
+    progress = progress_stream_from_env()
+    _emit(
+        "ready", pid=os.getpid(), rss_mb=round(current_rss_mb(), 1), startup_s=round(time.perf_counter() - started, 3)
+    )
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        spec = json.loads(line)
+        progress = _progress_marker(progress, "job", spec.get("job_id"))
+        t0 = time.perf_counter()
+        code = run_job(entry, spec)
+        _reset_between_jobs(environ, cwd)
+        progress = _progress_marker(progress, "end", spec.get("job_id"))
+        print(MARKER + json.dumps({"event": "end", "job_id": spec.get("job_id")}), file=sys.stderr, flush=True)
+        _emit(
+            "done",
+            job_id=spec.get("job_id"),
+            exit_code=code,
+            seconds=round(time.perf_counter() - t0, 3),
+            rss_mb=round(current_rss_mb(), 1),
+            progress=progress is not None,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def available_cpu_count() -> int:
+    """Return the number of CPUs usable by this process (affinity-aware)."""
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:  # pragma: no cover - platform specific
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+def split_thread_budget(workers: int, threads_per_worker: int | None = None) -> int:
+    """Resolve a per-worker thread budget so that ``workers`` do not oversubscribe the host."""
+    if workers <= 0:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if threads_per_worker is not None and threads_per_worker > 0:
+        return int(threads_per_worker)
+    return max(1, available_cpu_count() // workers)
+
+
+def configure_cpu_threads(intra_op: int, inter_op: int | None = None) -> dict[str, Any]:
+    """Cap the CPU thread pools used by numpy/BLAS and TensorFlow in this process.
+
+    Environment variables are always exported so that libraries initialized later
+    pick them up. TensorFlow's threading config can only change before its runtime
+    starts; once it is running the request is recorded as not applied instead of
+    raising.
+    """
+    if intra_op <= 0:
+        raise ValueError(f"intra_op must be >= 1, got {intra_op}")
+    inter = int(inter_op) if inter_op is not None and inter_op > 0 else min(2, int(intra_op))
+
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(intra_op)
+    os.environ["TF_NUM_INTEROP_THREADS"] = str(inter)
+
+    info: dict[str, Any] = {"intra_op": int(intra_op), "inter_op": inter, "tensorflow_applied": False}
+    tf = sys.modules.get("tensorflow")
+    if tf is None:
+        # Not imported yet: env vars above are honoured at TF runtime start-up.
+        info["tensorflow_applied"] = True
+        return info
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(int(intra_op))
+        tf.config.threading.set_inter_op_parallelism_threads(inter)
+        info["tensorflow_applied"] = True
+    except RuntimeError as exc:
+        logger.warning("TensorFlow thread pools already initialized; keeping existing sizes (%s)", exc)
+        info["reason"] = str(exc)
+    return info
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from src.training.autotune import choose_configuration, default_thread_candidates, scale_learning_rate
+from src.training.runner import _parse_thread_candidates
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+def _trial(batch_size, intra_op, samples_per_sec, peak_rss_mb=500.0):
+    return {
+        "batch_size": batch_size,
+        "intra_op": intra_op,
+        "inter_op": 2,
+        "samples_per_sec": samples_per_sec,
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+
+def test_choice_prefers_smaller_batch_within_tolerance_and_respects_budget():
+    trials = [
+        _trial(32, 64, 900.0),
+        _trial(64, 64, 1960.0),
+        _trial(128, 64, 2000.0),
+        _trial(256, 64, 4000.0, peak_rss_mb=9000.0),  # fastest, but over budget
+        _trial(64, 16, 1500.0),
+    ]
+    chosen = choose_configuration(trials, memory_budget_mb=8000.0, tolerance=0.05)
+    assert (chosen["batch_size"], chosen["intra_op"]) == (64, 64)
+    assert [t["within_budget"] for t in trials] == [True, True, True, False, True]
+
+    with pytest.raises(RuntimeError, match="memory budget"):
+        choose_configuration(trials, memory_budget_mb=100.0, tolerance=0.05)
+
+
+def test_lr_scaling_and_thread_candidates():
+    assert scale_learning_rate(1e-3, 32, 128, "linear") == pytest.approx(4e-3)
+    assert scale_learning_rate(1e-3, 32, 128, "sqrt") == pytest.approx(2e-3)
+    assert scale_learning_rate(1e-3, 32, 128, "none") == pytest.approx(1e-3)
+    assert default_thread_candidates(64) == [(64, 2), (32, 2), (16, 2)]
+    assert default_thread_candidates(1) == [(1, 1)]
+    assert _parse_thread_candidates("16:4, 8") == [(16, 4), (8, 2)]
+    with pytest.raises(ValueError, match="intra"):
+        _parse_thread_candidates("many")
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_autotune_records_decision_and_trains_with_it(tmp_path):
+    from src.training.runner import build_parser, run
+
+    payload = run(
+        build_parser().parse_args(
+            [
+                "--artifacts-dir",
+                str(tmp_path),
+                "--synthetic-samples",
+                "200",
+                "--epochs",
+                "1",
+                "--verbose",
+                "0",
+                "--model-type",
+                "dlinear",
+                "--autotune",
+                "--autotune-batch-sizes",
+                "16",
+                "64",
+                "--autotune-threads",
+                "1",
+                "--autotune-trial-steps",
+                "3",
+                "--autotune-lr-scaling",
+                "linear",
+            ]
+        )
+    )
+
+    decision = payload["config"]["autotune"]
+    assert len(payload["autotune"]["trials"]) == 2 and "trials" not in decision
+    assert payload["config"]["batch_size"] == decision["batch_size"] in (16, 64)
+    assert payload["config"]["learning_rate"] == pytest.approx(1e-3 * decision["batch_size"] / 32)
+    assert (decision["intra_op"], decision["inter_op"]) == (1, 1)
+    # Only a fresh runner process can resize the TF pools; under pytest TF is usually running already.
+    assert decision["threads"]["intra_op"] == 1 and "tensorflow_applied" in decision["threads"]
+
+
+def test_autotune_applies_tuned_batch_size_to_step_counting_callbacks(monkeypatch):
+    import argparse
+    import io
+
+    from src.training import runner
+    from src.training.profiling import make_profiler_callback
+    from src.training.progress import make_progress_callback
+
+    decision = {"batch_size": 64, "learning_rate": 2e-3, "intra_op": 1, "inter_op": 1}
+    monkeypatch.setattr(runner, "autotune_training", lambda *a, **kw: dict(decision))
+    monkeypatch.setattr(runner, "configure_cpu_threads", lambda intra, inter: {"intra_op": intra})
+    args = argparse.Namespace(
+        autotune=True,
+        autotune_batch_sizes=[16, 64],
+        autotune_threads="1",
+        autotune_memory_mb=None,
+        autotune_trial_steps=3,
+        autotune_lr_scaling="linear",
+        batch_size=32,
+        learning_rate=1e-3,
+    )
+    profiler = make_profiler_callback(batch_size=32)
+    progress = make_progress_callback(io.StringIO(), batch_size=32)
+
+    runner._autotune(args, None, None, None, [profiler, None, progress])
+
+    assert args.batch_size == profiler.batch_size == progress.batch_size == 64
@@ -3,9 +3,12 @@ from __future__ import annotations
 import importlib
 import json
 import sys
+import threading
 import time
 from pathlib import Path
+from unittest.mock import ANY
 
+import pytest
 from fastapi.testclient import TestClient
 
 _BACKEND_MODULES = [
@@ -17,7 +20,14 @@ _BACKEND_MODULES = [
     "backend.app.routes.health",
     "backend.app.routes",
     "backend.app.executor",
+    "backend.app.joblog",
+    "backend.app.progress",
+    "backend.app.warm_pool",
+    "backend.app.bulk",
     "backend.app.inference",
+    "backend.app.inference_pool",
+    "backend.app.registry",
+    "backend.app.batching",
     "backend.app.store",
     "backend.app.runtime",
     "backend.app.utils",
@@ -25,6 +35,15 @@ _BACKEND_MODULES = [
     "backend.app.config",
     "backend.app.main",
 ]
+# Executors created by _load_client; their pending mock timers must not outlive the test.
+_LOADED_EXECUTORS: list = []
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_loaded_executors():
+    yield
+    while _LOADED_EXECUTORS:
+        _LOADED_EXECUTORS.pop().shutdown()
 
 
 def _load_client(tmp_path: Path, monkeypatch, *, mode: str, cmd: str):
@@ -37,9 +56,10 @@ def _load_client(tmp_path: Path, monkeypatch, *, mode: str, cmd: str):
     monkeypatch.setenv("SPLINE_BACKEND_RUN_TIMEOUT_SEC", "5")
 
     for mod_name in _BACKEND_MODULES:
-        sys.modules.pop(mod_name, None)
+        monkeypatch.delitem(sys.modules, mod_name, raising=False)
 
     backend_main = importlib.import_module("backend.app.main")
+    _LOADED_EXECUTORS.append(backend_main.executor)
     return TestClient(backend_main.app)
 
 
@@ -113,6 +133,332 @@ def test_real_executor_cancel(tmp_path: Path, monkeypatch) -> None:
     assert done["status"] == "canceled"
 
 
+def test_cancel_is_not_overwritten_by_an_in_flight_progress_event(tmp_path: Path, monkeypatch) -> None:
+    _load_client(tmp_path, monkeypatch, mode="real", cmd="unused")
+    executor_mod = importlib.import_module("backend.app.executor")
+    backend_main = importlib.import_module("backend.app.main")
+    store, executor = backend_main.store, backend_main.executor
+    rec = backend_main.JobRecord(
+        job_id="job-race", run_id="run-race", model_type="lstm", feature_mode="univariate", created_at=time.time()
+    )
+    rec.status = "running"
+    store.upsert(rec)
+
+    canceller = threading.Thread(target=executor.cancel, args=("job-race",))
+    real_apply = executor_mod.apply_progress
+
+    def apply_while_cancel_arrives(record, event):
+        # The progress handler already read the running record when the cancel request comes in.
+        canceller.start()
+        canceller.join(timeout=0.2)
+        return real_apply(record, event)
+
+    monkeypatch.setattr(executor_mod, "apply_progress", apply_while_cancel_arrives)
+    executor._on_progress("job-race", {"event": "epoch", "epoch": 1, "epochs": 2, "fraction": 0.5})
+    canceller.join(timeout=2.0)
+
+    final = store.get("job-race")
+    assert final is not None and final.canceled and final.status == "canceled"
+
+
+def test_failed_real_job_resubmits_with_resume_flag(tmp_path: Path, monkeypatch) -> None:
+    # Stands in for a runner killed mid-run: fails unless asked to resume.
+    cmd = f"{sys.executable} -c \"import sys; print(sys.argv[1:]); sys.exit(0 if '--resume' in sys.argv else 3)\""
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd=cmd)
+
+    job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "real-resume-001"}).json()["data"][
+        "job_id"
+    ]
+    assert _wait_for_terminal(client, job_id)["status"] == "failed"
+
+    resumed = client.post(f"/api/v1/jobs/{job_id}:resume")
+    assert resumed.status_code == 200
+    assert resumed.json()["data"]["attempt"] == 2
+
+    done = _wait_for_terminal(client, job_id)
+    assert done["status"] == "succeeded" and done["exit_code"] == 0
+    messages = [line["message"] for line in client.get(f"/api/v1/jobs/{job_id}/logs").json()["data"]["lines"]]
+    assert any("'--resume', 'require'" in m for m in messages)
+    assert any("exit_code=3" in m for m in messages)  # logs of the first attempt are kept
+
+    assert client.post(f"/api/v1/jobs/{job_id}:resume").status_code == 409
+
+
+def test_resume_waits_until_previous_attempt_is_finalized(tmp_path: Path, monkeypatch) -> None:
+    cmd = f"{sys.executable} -c \"import sys; sys.exit(0 if '--resume' in sys.argv else 3)\""
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd=cmd)
+    executor = importlib.import_module("backend.app.main").executor
+
+    job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "real-resume-race"}).json()["data"][
+        "job_id"
+    ]
+    assert _wait_for_terminal(client, job_id)["status"] == "failed"
+    deadline = time.time() + 2.0
+    while not executor.log_complete(job_id) and time.time() < deadline:
+        time.sleep(0.02)
+
+    # Stand in for a canceled runner whose finalizer has not written its terminal record yet.
+    runtime = executor._runtimes[job_id]
+    finished_at, runtime.finished_at = runtime.finished_at, None
+    busy = client.post(f"/api/v1/jobs/{job_id}:resume")
+    assert busy.status_code == 409
+    assert client.get(f"/api/v1/jobs/{job_id}").json()["data"]["attempt"] == 1
+
+    runtime.finished_at = finished_at
+    assert client.post(f"/api/v1/jobs/{job_id}:resume").status_code == 200
+    assert _wait_for_terminal(client, job_id)["status"] == "succeeded"
+
+
+def _order_logging_cmd(order_file: Path, sleep: float) -> str:
+    code = (
+        f"import sys,time; open(r'{order_file}','a').write(sys.argv[sys.argv.index('--run-id')+1]+chr(10));"
+        f" time.sleep({sleep})"
+    )
+    return f'{sys.executable} -c "{code}"'
+
+
+def test_real_jobs_queue_by_priority_when_slots_are_busy(tmp_path: Path, monkeypatch) -> None:
+    order_file = tmp_path / "order.txt"
+    monkeypatch.setenv("SPLINE_BACKEND_MAX_CONCURRENT_JOBS", "1")
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd=_order_logging_cmd(order_file, 0.4))
+
+    def submit(run_id: str, priority: str) -> dict:
+        res = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": run_id, "priority": priority})
+        assert res.status_code == 200
+        return res.json()["data"]
+
+    first = submit("prio-a", "batch")
+    second = submit("prio-b", "batch")
+    third = submit("prio-c", "interactive")
+    assert first["queue_position"] is None
+    assert second["queue_position"] == 1
+    assert third["queue_position"] == 1
+
+    queued = client.get(f"/api/v1/jobs/{second['job_id']}").json()["data"]
+    assert queued["status"] == "queued"
+    assert queued["priority"] == "batch"
+    assert queued["queue_position"] == 2
+    executor_diag = client.get("/api/v1/health").json()["data"]["details"]["executor"]
+    assert executor_diag["max_concurrent"] == 1
+    assert executor_diag["queued"] == 2
+
+    dropped = submit("prio-d", "batch")
+    assert client.post(f"/api/v1/jobs/{dropped['job_id']}:cancel").json()["data"]["status"] == "canceled"
+
+    for job in (first, second, third):
+        assert _wait_for_terminal(client, job["job_id"], timeout=10.0)["status"] == "succeeded"
+    assert order_file.read_text().split() == ["prio-a", "prio-c", "prio-b"]
+    assert client.get(f"/api/v1/jobs/{dropped['job_id']}").json()["data"]["status"] == "canceled"
+
+    bad = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "prio-x", "priority": "urgent"})
+    assert bad.status_code == 422
+
+
+def test_real_jobs_share_slots_fairly_across_runs(tmp_path: Path, monkeypatch) -> None:
+    order_file = tmp_path / "order.txt"
+    monkeypatch.setenv("SPLINE_BACKEND_MAX_CONCURRENT_JOBS", "2")
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd=_order_logging_cmd(order_file, 0.5))
+
+    def submit(run_id: str) -> str:
+        return client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": run_id}).json()["data"]["job_id"]
+
+    job_ids = [submit("fair-a")]
+    time.sleep(0.25)  # stagger the two running jobs so the freed slots are handed out in a fixed order
+    job_ids += [submit(run_id) for run_id in ("fair-a", "fair-a", "fair-b")]
+    # fair-b jumps the third fair-a job: fair-a already holds a slot when the next one frees up.
+    assert client.get(f"/api/v1/jobs/{job_ids[3]}").json()["data"]["queue_position"] == 1
+
+    for job_id in job_ids:
+        assert _wait_for_terminal(client, job_id, timeout=10.0)["status"] == "succeeded"
+    assert order_file.read_text().split() == ["fair-a", "fair-a", "fair-b", "fair-a"]
+
+
+_FAKE_RUNNER = """
+import json, os, sys, time
+
+def main():
+    run_id = sys.argv[sys.argv.index("--run-id") + 1]
+    print(f"worker pid={os.getpid()} run={run_id}")
+    event = {"event": "epoch", "epoch": 1, "epochs": 1, "loss": float(run_id[-1]), "fraction": 1.0}
+    os.write(int(os.environ["SPLINE_PROGRESS_FD"]), (json.dumps(event) + "\\n").encode())
+    if run_id.startswith("warm-fail"):
+        sys.stderr.write("boom\\n")
+        raise SystemExit(3)
+    if run_id.startswith("warm-hang"):
+        time.sleep(30)
+"""
+
+
+def test_warm_workers_reuse_and_recycle_preloaded_runner(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "fake_warm_runner.py").write_text(_FAKE_RUNNER, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    monkeypatch.setenv("SPLINE_BACKEND_MAX_CONCURRENT_JOBS", "1")
+    monkeypatch.setenv("SPLINE_BACKEND_WARM_WORKERS", "1")
+    monkeypatch.setenv("SPLINE_BACKEND_WARM_PRELOAD", "fake_warm_runner")
+    monkeypatch.setenv("SPLINE_BACKEND_WARM_MAX_JOBS", "2")
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd="")
+
+    def run(run_id: str) -> tuple[dict, list[str]]:
+        job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": run_id}).json()["data"]["job_id"]
+        done = _wait_for_terminal(client, job_id, timeout=10.0)
+        lines = client.get(f"/api/v1/jobs/{job_id}/logs").json()["data"]["lines"]
+        return done, [line["message"] for line in lines]
+
+    def worker_pid(messages: list[str]) -> str:
+        return next(m.split("pid=")[1].split()[0] for m in messages if m.startswith("worker pid="))
+
+    first, first_logs = run("warm-ok-1")
+    second, second_logs = run("warm-fail-2")
+    third, third_logs = run("warm-ok-3")
+    assert first["status"] == "succeeded" and first["exit_code"] == 0
+    assert second["status"] == "failed" and second["exit_code"] == 3
+    assert "boom" in second_logs
+    assert third["status"] == "succeeded"
+    # Two jobs share one preloaded process; the third runs on its replacement.
+    assert worker_pid(first_logs) == worker_pid(second_logs) != worker_pid(third_logs)
+    assert any(m.startswith("dispatched to warm worker") for m in first_logs)
+    # Progress reaches the record before the job finishes, and only the job that reported it.
+    assert first["training"]["loss"] == 1.0
+    assert third["training"]["loss"] == 3.0
+
+    job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "warm-hang-4"}).json()["data"]["job_id"]
+    time.sleep(0.3)
+    assert client.post(f"/api/v1/jobs/{job_id}:cancel").status_code == 200
+    assert _wait_for_terminal(client, job_id, timeout=10.0)["status"] == "canceled"
+    assert run("warm-ok-5")[0]["status"] == "succeeded"
+
+    pool = client.get("/api/v1/health").json()["data"]["details"]["executor"]["warm_pool"]
+    assert pool["jobs"] == 5
+    assert pool["recycled"] == 1
+    assert pool["spawned"] == 3
+
+
+_PROGRESS_RUNNER = """
+import json, os, time
+
+fd = int(os.environ["SPLINE_PROGRESS_FD"])
+
+def emit(**event):
+    os.write(fd, (json.dumps(event) + "\\n").encode())
+
+emit(event="train_begin", epochs=2, steps=4)
+emit(event="step", epoch=1, epochs=2, step=2, steps=4, loss=0.9, samples_per_sec=120.0, fraction=0.25, eta_s=3.0)
+emit(event="epoch", epoch=1, epochs=2, loss=0.8, val_loss=0.85, samples_per_sec=128.0, fraction=0.5, eta_s=1.5)
+print("epoch 1 done")
+time.sleep(1.0)
+emit(event="epoch", epoch=2, epochs=2, loss=0.5, val_loss=0.6, samples_per_sec=130.0, fraction=1.0, eta_s=0.0)
+emit(event="train_end", epoch=2, epochs=2)
+"""
+
+
+def test_real_job_reports_structured_training_progress(tmp_path: Path, monkeypatch) -> None:
+    script = tmp_path / "progress_runner.py"
+    script.write_text(_PROGRESS_RUNNER, encoding="utf-8")
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd=f"{sys.executable} {script}")
+
+    job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "progress-001"}).json()["data"]["job_id"]
+    deadline = time.time() + 4.0
+    while True:
+        running = client.get(f"/api/v1/jobs/{job_id}").json()["data"]
+        if (running["training"] or {}).get("val_loss") is not None or time.time() > deadline:
+            break
+        time.sleep(0.05)
+    assert running["status"] == "running"
+    assert running["progress"] == 50
+    assert running["message"] == "epoch 1/2"
+    assert running["training"] == {
+        "epoch": 1,
+        "epochs": 2,
+        "loss": 0.8,
+        "val_loss": 0.85,
+        "samples_per_sec": 128.0,
+        "eta_s": 1.5,
+    }
+
+    done = _wait_for_terminal(client, job_id)
+    assert done["status"] == "succeeded"
+    assert done["progress"] == 100
+    assert done["training"]["epoch"] == 2 and done["training"]["val_loss"] == 0.6
+    assert done["training"]["eta_s"] == 0.0
+
+    series = client.get(f"/api/v1/jobs/{job_id}/progress").json()["data"]
+    assert [p["event"] for p in series["points"]] == ["train_begin", "step", "epoch", "epoch", "train_end"]
+    epochs = client.get(f"/api/v1/jobs/{job_id}/progress", params={"kind": "epoch"}).json()["data"]["points"]
+    assert [(p["epoch"], p["val_loss"]) for p in epochs] == [(1, 0.85), (2, 0.6)]
+    assert client.get("/api/v1/jobs/job-missing/progress").status_code == 404
+
+
+def test_cpu_slots_split_available_cores(monkeypatch) -> None:
+    from backend.app import executor as executor_mod
+
+    monkeypatch.setattr(executor_mod.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3, 4}, raising=False)
+    assert executor_mod.cpu_slots(2) == [[0, 1, 2], [3, 4]]
+    assert executor_mod.cpu_slots(7)[5:] == [[0], [1]]
+    assert executor_mod.cpu_slots(2, pin=False) == [None, None]
+
+
+def _sse_events(client: TestClient, url: str, headers: dict[str, str] | None = None) -> list[dict]:
+    events: list[dict] = []
+    current: dict = {}
+    with client.stream("GET", url, headers=headers or {}) as res:
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/event-stream")
+        for line in res.iter_lines():
+            if not line:
+                if current:
+                    events.append(current)
+                current = {}
+            elif line.startswith("id: "):
+                current["id"] = int(line[4:])
+            elif line.startswith("event: "):
+                current["event"] = line[7:]
+            elif line.startswith("data: "):
+                current["data"] = json.loads(line[6:])
+    return events
+
+
+def test_job_logs_stream_over_sse_resume_and_survive_restart(tmp_path: Path, monkeypatch) -> None:
+    cmd = f"{sys.executable} -c \"import time; [print('tick', i, flush=True) or time.sleep(0.05) for i in range(5)]\""
+    client = _load_client(tmp_path, monkeypatch, mode="real", cmd=cmd)
+    job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "sse-001"}).json()["data"]["job_id"]
+
+    # Opened while the job runs; the stream ends on its own once the job is terminal.
+    events = _sse_events(client, f"/api/v1/jobs/{job_id}/logs/stream")
+    logs = [e for e in events if e["event"] == "log"]
+    assert events[-1]["event"] == "end"
+    assert events[-1]["data"]["status"] == "succeeded"
+    assert [e["id"] for e in logs] == list(range(len(logs)))
+    messages = [e["data"]["message"] for e in logs]
+    assert [m for m in messages if m.startswith("tick")] == [f"tick {i}" for i in range(5)]
+    assert messages[-1] == "process finished exit_code=0"
+
+    resumed = _sse_events(client, f"/api/v1/jobs/{job_id}/logs/stream", headers={"Last-Event-ID": str(logs[2]["id"])})
+    assert [e["id"] for e in resumed if e["event"] == "log"] == [e["id"] for e in logs[3:]]
+    assert [e["id"] for e in _sse_events(client, f"/api/v1/jobs/{job_id}/logs/stream?after=4") if "id" in e] == [
+        e["id"] for e in logs[5:]
+    ]
+
+    polled = client.get(f"/api/v1/jobs/{job_id}/logs", params={"offset": 3, "limit": 2}).json()["data"]["lines"]
+    assert [line["seq"] for line in polled] == [3, 4]
+
+    # A fresh backend process has no in-memory runtime; the lines come back from the job's log file.
+    restarted = _load_client(tmp_path, monkeypatch, mode="real", cmd=cmd)
+    persisted = restarted.get(f"/api/v1/jobs/{job_id}/logs", params={"limit": 1000}).json()["data"]["lines"]
+    assert [line["message"] for line in persisted] == messages
+    replay = _sse_events(restarted, f"/api/v1/jobs/{job_id}/logs/stream")
+    assert [e["data"]["message"] for e in replay if e["event"] == "log"] == messages
+    assert (tmp_path / "backend" / "data" / "job_logs" / f"{job_id}.jsonl").exists()
+
+
+def test_mock_job_log_stream_ends_after_synthetic_lines(tmp_path: Path, monkeypatch) -> None:
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    job_id = client.post("/api/v1/pipelines/spline-tsfm:run", json={"run_id": "sse-mock"}).json()["data"]["job_id"]
+
+    events = _sse_events(client, f"/api/v1/jobs/{job_id}/logs/stream")
+    assert [e["event"] for e in events] == ["log", "log", "log", "end"]
+    assert client.get("/api/v1/jobs/job-missing/logs/stream").status_code == 404
+
+
 def test_runtime_selection_prefers_manifest_order(tmp_path: Path, monkeypatch) -> None:
     client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
     run_id = "edge-runtime-001"
@@ -172,3 +518,354 @@ def test_infer_loader_uses_manifest_fallback_chain(tmp_path: Path, monkeypatch)
     assert data["runtime_used"] == "naive"
     assert data["attempts"][0]["runtime"] == "onnx"
     assert data["attempts"][1]["runtime"] == "keras"
+
+
+def test_infer_rolls_out_beyond_trained_horizon(tmp_path: Path, monkeypatch) -> None:
+    from src.models.dlinear import DLinearLikeModel
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    run_id = "edge-infer-rollout-001"
+    checkpoint = tmp_path / "artifacts" / "checkpoints" / run_id / "best.h5"
+    checkpoint.parent.mkdir(parents=True, exist_ok=True)
+    model = DLinearLikeModel(sequence_length=8, output_units=2)
+    model.build()
+    model.save(str(checkpoint))
+    manifest_path = tmp_path / "artifacts" / "exports" / run_id / "manifest.json"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "runtime_stack": "keras",
+                "fallback_chain": ["keras"],
+                "input_specs": [{"name": "past_input", "shape": [1, 8, 1], "dtype": "float32"}],
+                "runtime_compatibility": {"keras": {"supported": True, "path": None}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    payload = {
+        "run_id": run_id,
+        "actor": "tester",
+        "base_inputs": {"horizon": 5, "target_history": [float(x) for x in range(12)]},
+        "patches": [],
+    }
+    response = client.post("/api/v1/forecast/infer", json=payload)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["runtime_used"] == "keras"
+    assert len(data["predictions"]) == 5
+    assert data["rollout"] == {
+        "applied": True,
+        "strategy": "hybrid",
+        "model_calls": 3,
+        "steps_per_call": 2,
+        "model_horizon": 2,
+    }
+
+
+def test_infer_returns_full_quantile_set_from_one_pass(tmp_path: Path, monkeypatch) -> None:
+    from src.models.dlinear import DLinearLikeModel
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    run_id = "edge-infer-quantiles-001"
+    checkpoint = tmp_path / "artifacts" / "checkpoints" / run_id / "best.h5"
+    checkpoint.parent.mkdir(parents=True, exist_ok=True)
+    model = DLinearLikeModel(sequence_length=8, output_units=2, quantiles=(0.1, 0.5, 0.9))
+    model.build()
+    model.save(str(checkpoint))
+    manifest_path = tmp_path / "artifacts" / "exports" / run_id / "manifest.json"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "runtime_stack": "keras",
+                "fallback_chain": ["keras"],
+                "input_specs": [{"name": "past_input", "shape": [1, 8, 1], "dtype": "float32"}],
+                "quantiles": [0.1, 0.5, 0.9],
+                "runtime_compatibility": {"keras": {"supported": True, "path": None}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    payload = {
+        "run_id": run_id,
+        "actor": "tester",
+        "base_inputs": {"horizon": 2, "target_history": [float(x) for x in range(12)]},
+        "patches": [],
+    }
+    response = client.post("/api/v1/forecast/infer", json=payload)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["runtime_used"] == "keras"
+    assert sorted(data["quantiles"]) == ["p10", "p50", "p90"]
+    assert data["predictions"] == data["quantiles"]["p50"]
+    for lo, mid, hi in zip(data["quantiles"]["p10"], data["quantiles"]["p50"], data["quantiles"]["p90"], strict=True):
+        assert lo <= mid <= hi
+
+
+def test_infer_serves_numpy_runtime_export(tmp_path: Path, monkeypatch) -> None:
+    import numpy as np
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.numpy_runtime import export_numpy_model
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    run_id = "edge-infer-numpy-001"
+    model = DLinearLikeModel(sequence_length=8, output_units=2)
+    model.build()
+    npz_path = tmp_path / "artifacts" / "exports" / run_id / "dlinear" / "numpy" / "model.npz"
+    assert export_numpy_model(model.model, npz_path)["status"] == "succeeded"
+    manifest_path = npz_path.parents[2] / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "runtime_stack": "numpy",
+                "fallback_chain": ["numpy", "keras"],
+                "input_specs": [{"name": "past_input", "shape": [1, 8, 1], "dtype": "float32"}],
+                "runtime_compatibility": {
+                    "numpy": {"supported": True, "path": str(npz_path)},
+                    "keras": {"supported": True, "path": None},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    payload = {
+        "run_id": run_id,
+        "actor": "tester",
+        "base_inputs": {"horizon": 2, "target_history": [float(x) for x in range(12)]},
+        "patches": [],
+    }
+    response = client.post("/api/v1/forecast/infer", json=payload)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["runtime_used"] == "numpy"
+    expected = model.predict(np.arange(4, 12, dtype=np.float32).reshape(1, 8, 1))[0]
+    np.testing.assert_allclose(data["predictions"], expected, atol=1e-5)
+
+
+def test_infer_reuses_registry_session_until_manifest_changes(tmp_path: Path, monkeypatch) -> None:
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.numpy_runtime import export_numpy_model
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    run_id = "edge-infer-registry-001"
+    model = DLinearLikeModel(sequence_length=8, output_units=2)
+    model.build()
+    npz_path = tmp_path / "artifacts" / "exports" / run_id / "dlinear" / "numpy" / "model.npz"
+    assert export_numpy_model(model.model, npz_path)["status"] == "succeeded"
+    manifest_path = npz_path.parents[2] / "manifest.json"
+    manifest = {
+        "runtime_stack": "numpy",
+        "fallback_chain": ["numpy", "keras"],
+        "input_specs": [{"name": "past_input", "shape": [1, 8, 1], "dtype": "float32"}],
+        "runtime_compatibility": {
+            "numpy": {"supported": True, "path": str(npz_path)},
+            "keras": {"supported": True, "path": None},
+        },
+    }
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    warm = client.post(f"/api/v1/forecast/models/{run_id}:warm")
+    assert warm.status_code == 200
+    assert warm.json()["data"]["warmed"] == [
+        {"runtime": "numpy", "ok": True, "model_path": str(npz_path), "cached": False, "seconds": ANY}
+    ]
+
+    payload = {
+        "run_id": run_id,
+        "actor": "tester",
+        "base_inputs": {"horizon": 2, "target_history": [float(x) for x in range(12)]},
+        "patches": [],
+    }
+    for _ in range(2):
+        assert client.post("/api/v1/forecast/infer", json=payload).json()["data"]["runtime_used"] == "numpy"
+    stats = client.get("/api/v1/forecast/models").json()["data"]
+    assert (stats["misses"], stats["hits"], stats["entries"]) == (1, 2, 1)
+    assert stats["models"][0]["run_id"] == run_id
+
+    manifest["quantiles"] = [0.5]
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    assert client.post("/api/v1/forecast/infer", json=payload).json()["data"]["runtime_used"] == "numpy"
+    stats = client.get("/api/v1/forecast/models").json()["data"]
+    assert (stats["misses"], stats["invalidations"], stats["entries"]) == (2, 1, 1)
+
+
+def test_infer_deadline_and_stuck_runtime_do_not_block_other_routes(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    monkeypatch.setenv("SPLINE_BACKEND_INFER_WORKERS", "1")
+    monkeypatch.setenv("SPLINE_BACKEND_INFER_QUEUE", "0")
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    forecast_mod = importlib.import_module("backend.app.routes.forecast")
+    release = threading.Event()
+    real_infer = forecast_mod.infer_with_runtime_fallback
+
+    def stuck_infer(**kwargs):
+        release.wait(5)
+        return real_infer(**kwargs)
+
+    monkeypatch.setattr(forecast_mod, "infer_with_runtime_fallback", stuck_infer)
+    payload = {"run_id": "pool-001", "actor": "tester", "base_inputs": {"target_history": [1.0, 2.0]}, "patches": []}
+
+    timed_out = client.post("/api/v1/forecast/infer?timeout_ms=50", json=payload)
+    assert timed_out.status_code == 504
+    assert "deadline" in timed_out.json()["error"]
+    unavailable = client.post("/api/v1/forecast/infer", json=payload)
+    assert unavailable.status_code == 503
+    assert unavailable.headers["retry-after"] == "5"
+    assert client.get("/api/v1/health").status_code == 200
+
+    release.set()
+    deadline = time.time() + 2
+    while client.get("/api/v1/forecast/models").json()["data"]["pools"]["keras"]["stuck"] and time.time() < deadline:
+        time.sleep(0.02)
+    ok = client.post("/api/v1/forecast/infer", json=payload)
+    assert ok.status_code == 200
+    assert ok.json()["data"]["runtime_used"] == "naive"
+
+
+def _export_numpy_run(tmp_path: Path, run_id: str):
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.numpy_runtime import export_numpy_model
+
+    model = DLinearLikeModel(sequence_length=8, output_units=2)
+    model.build()
+    npz_path = tmp_path / "artifacts" / "exports" / run_id / "dlinear" / "numpy" / "model.npz"
+    assert export_numpy_model(model.model, npz_path)["status"] == "succeeded"
+    (npz_path.parents[2] / "manifest.json").write_text(
+        json.dumps(
+            {
+                "runtime_stack": "numpy",
+                "fallback_chain": ["numpy", "keras"],
+                "input_specs": [{"name": "past_input", "shape": [1, 8, 1], "dtype": "float32"}],
+                "runtime_compatibility": {
+                    "numpy": {"supported": True, "path": str(npz_path)},
+                    "keras": {"supported": True, "path": None},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    return model
+
+
+def _ndjson_lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+def test_bulk_infer_streams_chunked_batched_forecasts(tmp_path: Path, monkeypatch) -> None:
+    import numpy as np
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    run_id = "edge-bulk-001"
+    model = _export_numpy_run(tmp_path, run_id)
+    histories = [[float(i + j) for j in range(10)] for i in range(5)]
+    body = {"run_id": run_id, "series_ids": [f"s{i}" for i in range(5)], "target_history": histories}
+
+    response = client.post("/api/v1/forecast/infer:bulk?chunk_size=2", json=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = _ndjson_lines(response)
+    assert [line["type"] for line in lines] == ["meta", *["forecast"] * 5, "summary"]
+    assert lines[0]["n_series"] == 5
+    expected = model.predict(np.asarray([h[-8:] for h in histories], dtype=np.float32)[:, :, None])
+    for i, line in enumerate(lines[1:6]):
+        assert (line["series_id"], line["runtime"]) == (f"s{i}", "numpy")
+        np.testing.assert_allclose(line["predictions"], expected[i], atol=1e-5)
+    summary = lines[-1]
+    assert (summary["ok"], summary["chunks"], summary["n_forecasts"], summary["runtimes"]) == (True, 3, 5, {"numpy": 5})
+    stats = client.get("/api/v1/forecast/models").json()["data"]
+    assert stats["batching"]["batch_size"]["buckets"]["2"] == 2
+
+
+def test_bulk_infer_ndjson_rolls_out_and_matches_single_requests(tmp_path: Path, monkeypatch) -> None:
+    import numpy as np
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    run_id = "edge-bulk-002"
+    _export_numpy_run(tmp_path, run_id)
+    histories = [[float((i * 7 + j) % 5) for j in range(12)] for i in range(3)]
+    body = "\n".join(json.dumps({"series_id": f"n{i}", "target_history": h}) for i, h in enumerate(histories))
+
+    response = client.post(
+        f"/api/v1/forecast/infer:bulk?run_id={run_id}&horizon=5",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    forecasts = [line for line in _ndjson_lines(response) if line["type"] == "forecast"]
+    assert [len(line["predictions"]) for line in forecasts] == [5, 5, 5]
+    for line, history in zip(forecasts, histories, strict=True):
+        single = client.post(
+            "/api/v1/forecast/infer",
+            json={"run_id": run_id, "base_inputs": {"horizon": 5, "target_history": history}, "patches": []},
+        ).json()["data"]
+        np.testing.assert_allclose(line["predictions"], single["predictions"], atol=1e-5)
+
+
+def test_bulk_infer_rejects_bad_payloads(tmp_path: Path, monkeypatch) -> None:
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    url = "/api/v1/forecast/infer:bulk"
+
+    assert client.post(url, json={"target_history": [[1.0, 2.0]]}).status_code == 400
+    mismatched = {"run_id": "r", "series_ids": ["a"], "target_history": [[1.0], [2.0]]}
+    assert "series_ids" in client.post(url, json=mismatched).json()["error"]
+    assert client.post(f"{url}?run_id=r", content=b"x", headers={"content-type": "text/csv"}).status_code == 415
+    bad_line = client.post(f"{url}?run_id=r", content=b"{}\nnot json", headers={"content-type": "application/x-ndjson"})
+    assert bad_line.status_code == 400
+    assert "line 2" in bad_line.json()["error"]
+
+
+def test_bulk_infer_refuses_oversized_payloads_before_parsing_them(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SPLINE_BACKEND_BULK_MAX_SERIES", "2")
+    monkeypatch.setenv("SPLINE_BACKEND_BULK_MAX_MB", "1")
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    forecast = importlib.import_module("backend.app.routes.forecast")
+    parse = forecast.parse_bulk_payload
+    bodies: list[int] = []
+
+    def recording_parse(body, content_type):
+        bodies.append(len(body))
+        return parse(body, content_type)
+
+    monkeypatch.setattr(forecast, "parse_bulk_payload", recording_parse)
+    url = "/api/v1/forecast/infer:bulk?run_id=r"
+    ndjson = {"content-type": "application/x-ndjson"}
+
+    # The third line exceeds the cap, so the malformed fourth line is never decoded.
+    rows = b'{"target_history": [1.0]}\n' * 3 + b"not json"
+    too_many = client.post(url, content=rows, headers=ndjson)
+    assert too_many.status_code == 413
+    assert "at most 2 series" in too_many.json()["error"]
+    assert client.post(url, json={"target_history": [[1.0]] * 3}).status_code == 413
+
+    bodies.clear()
+    oversized = b" " * (1024 * 1024 + 1)
+    assert client.post(url, content=oversized, headers=ndjson).status_code == 413
+    assert client.post(url, content=iter([oversized[:1024], oversized]), headers=ndjson).status_code == 413
+    assert bodies == []
+
+
+def test_bulk_infer_parses_payload_off_the_event_loop(tmp_path: Path, monkeypatch) -> None:
+    import asyncio
+
+    client = _load_client(tmp_path, monkeypatch, mode="mock", cmd="")
+    forecast = importlib.import_module("backend.app.routes.forecast")
+    parse = forecast.parse_bulk_payload
+    loops: list[bool] = []
+
+    def recording_parse(body, content_type):
+        try:
+            asyncio.get_running_loop()
+            loops.append(True)
+        except RuntimeError:
+            loops.append(False)
+        return parse(body, content_type)
+
+    monkeypatch.setattr(forecast, "parse_bulk_payload", recording_parse)
+    res = client.post("/api/v1/forecast/infer:bulk", json={"target_history": [[1.0, 2.0]]})
+    assert res.status_code == 400  # no run_id; parsed before that check
+    assert loops == [False]
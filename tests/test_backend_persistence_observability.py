@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import importlib
 import json
+import sqlite3
+import sys
+import time
 from pathlib import Path
 
 from backend.app import main as backend_main
@@ -33,14 +37,135 @@ def test_job_store_atomic_upsert_and_reload(tmp_path: Path) -> None:
         created_at=1.0,
     )
     store.upsert(rec)
+    rec.status = "running"
+    store.upsert(rec)
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    assert payload["jobs"][0]["job_id"] == "job-1"
+    assert not path.exists()
+    assert store.db_path == tmp_path / "jobs_store.sqlite3"
+    with sqlite3.connect(store.db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("SELECT job_id, status FROM jobs").fetchall() == [("job-1", "running")]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(jobs)")}
+    assert {"idx_jobs_created_at", "idx_jobs_status", "idx_jobs_run_id"} <= indexes
 
     reloaded = JobStore(path)
     got = reloaded.get("job-1")
     assert got is not None
     assert got.run_id == "run-1"
+    assert got.status == "running"
+    assert set(reloaded.diagnostics()) >= {"path", "lock_path", "records", "corrupted_file", "last_save_error"}
+
+
+def test_job_store_migrates_legacy_json_once(tmp_path: Path) -> None:
+    path = tmp_path / "jobs_store.json"
+    jobs = [
+        {
+            "job_id": f"job-{i}",
+            "run_id": f"run-{i}",
+            "model_type": "lstm",
+            "feature_mode": "univariate",
+            "created_at": t,
+        }
+        for i, t in enumerate([3.0, 1.0, 2.0])
+    ]
+    path.write_text(json.dumps({"jobs": [*jobs, {"job_id": "broken"}]}), encoding="utf-8")
+
+    store = JobStore(path)
+    diag = store.diagnostics()
+    assert diag["records"] == 3
+    assert diag["migrated_from"] == str(path) + ".migrated"
+    assert not path.exists()
+    assert [r.job_id for r in store.list_recent(limit=2)] == ["job-0", "job-2"]
+
+    assert JobStore(path).diagnostics()["records"] == 3
+
+
+def test_job_store_quarantines_corrupt_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.sqlite3"
+    db_path.write_bytes(b"not a database" * 100)
+
+    store = JobStore(db_path)
+    assert store.corrupted_file is not None
+    assert Path(store.corrupted_file).read_bytes().startswith(b"not a database")
+    store.upsert(JobRecord(job_id="j", run_id="r", model_type="lstm", feature_mode="univariate", created_at=1.0))
+    assert store.diagnostics()["records"] == 1
+
+
+def _rows(db_path: Path) -> list[tuple[str, str]]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT job_id, status FROM jobs ORDER BY job_id").fetchall()
+
+
+def test_job_store_write_behind_coalesces_and_reads_pending(tmp_path: Path) -> None:
+    store = JobStore(tmp_path / "jobs.sqlite3", flush_interval_ms=60_000)
+    rec = JobRecord(job_id="job-1", run_id="run-1", model_type="lstm", feature_mode="univariate", created_at=1.0)
+    for status in ("queued", "running", "succeeded"):
+        rec.status = status
+        store.upsert_later(rec)
+
+    assert _rows(store.db_path) == []
+    got = store.get("job-1")
+    assert got is not None and got.status == "succeeded"
+    assert [r.job_id for r in store.list_recent(limit=5)] == ["job-1"]
+    assert store.count() == 1
+
+    assert store.flush() == 1
+    assert _rows(store.db_path) == [("job-1", "succeeded")]
+    stats = store.diagnostics()["write_behind"]
+    assert stats["enqueued"] == 3
+    assert stats["coalesced"] == 2
+    assert stats["flushes"] == 1
+    assert stats["pending"] == 0
+
+    rec.status = "failed"
+    store.upsert_later(rec)
+    store.close()
+    assert _rows(store.db_path) == [("job-1", "failed")]
+
+
+def test_job_store_background_flush_is_bounded(tmp_path: Path) -> None:
+    store = JobStore(tmp_path / "jobs.sqlite3", flush_interval_ms=20)
+    for i in range(5):
+        store.upsert_later(
+            JobRecord(job_id=f"job-{i}", run_id="r", model_type="lstm", feature_mode="univariate", created_at=float(i))
+        )
+    deadline = time.time() + 5.0
+    while len(_rows(store.db_path)) < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(_rows(store.db_path)) == 5
+    assert store.diagnostics()["write_behind"]["flushed_rows"] == 5
+
+
+def _isolated_backend(tmp_path: Path, monkeypatch):
+    """A fresh backend.app.main on a tmp store and artifacts dir; the original modules come back at teardown."""
+    monkeypatch.setenv("SPLINE_BACKEND_EXECUTOR_MODE", "mock")
+    monkeypatch.setenv("SPLINE_BACKEND_ARTIFACTS_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("SPLINE_BACKEND_STORE_PATH", str(tmp_path / "backend" / "data" / "jobs_store.json"))
+    for name in [m for m in sys.modules if m == "backend.app" or m.startswith("backend.app.")]:
+        monkeypatch.delitem(sys.modules, name)
+    return importlib.import_module("backend.app.main")
+
+
+def test_job_reads_do_not_write_the_store(tmp_path: Path, monkeypatch) -> None:
+    isolated = _isolated_backend(tmp_path, monkeypatch)
+    rec = isolated.JobRecord(
+        job_id="job-readonly",
+        run_id="run-readonly",
+        model_type="lstm",
+        feature_mode="univariate",
+        created_at=time.time(),
+    )
+    isolated.store.upsert(rec)
+    writes: list[str] = []
+    monkeypatch.setattr(isolated.store, "upsert", lambda r: writes.append(r.job_id))
+    monkeypatch.setattr(isolated.store, "upsert_later", lambda r: writes.append(r.job_id))
+
+    isolated_client = TestClient(isolated.app)
+    assert isolated_client.get("/api/v1/jobs/job-readonly").status_code == 200
+    assert isolated_client.get("/api/v1/jobs", params={"limit": 100}).status_code == 200
+    assert isolated_client.get("/api/v1/dashboard/summary").status_code == 200
+    assert writes == []
+    isolated.executor.shutdown()
 
 
 def test_correlation_id_surfaces_in_response_and_logs() -> None:
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+from src.training.checkpointing import CheckpointManager
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+class _Weights:
+    def __init__(self, weights):
+        self.weights = weights
+
+    def get_weights(self):
+        return self.weights
+
+    def set_weights(self, weights):
+        self.weights = weights
+
+
+def test_identical_saves_are_hard_linked_not_rewritten(tmp_path):
+    manager = CheckpointManager(tmp_path)
+    model = _Weights([np.ones((3, 2), dtype=np.float32), np.zeros(2, dtype=np.float32)])
+    manager.save_weights(model, "last")
+    manager.save_weights(model, "best")
+    manager.flush()
+
+    last, best = manager.weights_path("last"), manager.weights_path("best")
+    assert os.path.samefile(last, best)
+    metrics = manager.metrics()
+    assert metrics["saves"] == 2 and metrics["deduplicated"] == 1
+    assert metrics["bytes_written"] == last.stat().st_size
+
+    # Replacing "last" must not change the linked "best" file.
+    model.weights = [w + 1 for w in model.weights]
+    manager.save_weights(model, "last")
+    restored = _Weights([])
+    manager.load_weights(restored, "best")
+    np.testing.assert_array_equal(restored.weights[0], np.ones((3, 2)))
+    manager.load_weights(restored, "last")
+    np.testing.assert_array_equal(restored.weights[0], np.full((3, 2), 2.0))
+    manager.close()
+    assert not any(p.name.startswith(".") for p in tmp_path.iterdir())
+
+
+def test_background_write_errors_surface_on_flush(tmp_path):
+    manager = CheckpointManager(tmp_path / "ckpt")
+    (tmp_path / "ckpt").rmdir()
+    manager.save_weights(_Weights([np.ones(2)]), "last")
+    with pytest.raises(RuntimeError, match="checkpoint write failed"):
+        manager.flush()
+    manager.close()
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_writes_async_epoch_checkpoints_and_optimizer_state(tmp_path):
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.runner import build_parser, run
+
+    payload = run(
+        build_parser().parse_args(
+            [
+                "--artifacts-dir",
+                str(tmp_path),
+                "--run-id",
+                "ckpt-run",
+                "--synthetic-samples",
+                "200",
+                "--epochs",
+                "3",
+                "--verbose",
+                "0",
+                "--model-type",
+                "dlinear",
+            ]
+        )
+    )
+
+    ckpt_dir = tmp_path / "checkpoints" / "ckpt-run"
+    stats = payload["checkpointing"]
+    assert stats["pending"] == 0
+    assert {"best.weights.npz", "last.weights.npz", "optimizer.npz", "last.h5", "best.h5", "best.keras"} <= set(
+        stats["files"]
+    )
+    # One full-model write serves all four model artifacts.
+    assert os.path.samefile(ckpt_dir / "last.h5", ckpt_dir / "best.keras")
+    assert stats["deduplicated"] >= 3 + 1  # the aliases plus at least the first epoch's "best"
+    assert payload["config"]["epoch_checkpoints"] is True
+
+    model = DLinearLikeModel(sequence_length=24, output_units=1, hidden_units=[64, 32])
+    model.build()
+    manager = CheckpointManager(ckpt_dir)
+    manager.load_weights(model.model, "last")
+    meta = manager.restore_optimizer(model.model)
+    manager.close()
+    assert meta is not None and meta["epoch"] == 3
+    assert int(model.model.optimizer.iterations.numpy()) > 0
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_resumed_fit_matches_uninterrupted_fit(tmp_path):
+    import tensorflow as tf
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.checkpointing import make_checkpoint_callback
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(64, 8, 1)).astype(np.float32)
+    y = X[:, -2:, 0] * 0.5
+    val = (X[:16], y[:16])
+
+    def fit(directory, epochs, resume=False):
+        tf.keras.utils.set_random_seed(7)
+        model = DLinearLikeModel(sequence_length=8, output_units=2, hidden_units=[8], lr_schedule="reduce_on_plateau")
+        model.build()
+        manager = CheckpointManager(directory)
+        state = manager.load_resume_state() if resume else None
+        callback = make_checkpoint_callback(manager, resume_state=state)
+        initial_epoch = state["epoch"] if state else 0
+        model.fit_model(
+            X,
+            y,
+            epochs=epochs,
+            batch_size=16,
+            validation_data=val,
+            verbose=0,
+            extra_callbacks=[callback],
+            initial_epoch=initial_epoch,
+        )
+        manager.close()
+        return model, callback
+
+    reference, _ = fit(tmp_path / "full", epochs=4)
+    fit(tmp_path / "killed", epochs=2)  # stands in for a run killed after its second epoch
+    resumed, callback = fit(tmp_path / "killed", epochs=4, resume=True)
+
+    assert callback.peer_callbacks and {type(cb).__name__ for cb in callback.peer_callbacks} >= {"EarlyStopping"}
+    assert int(resumed.model.optimizer.iterations.numpy()) == int(reference.model.optimizer.iterations.numpy())
+    for got, want in zip(resumed.model.get_weights(), reference.model.get_weights(), strict=True):
+        np.testing.assert_allclose(got, want, atol=1e-6)
+
+
+def test_resume_state_rejects_weights_from_a_later_epoch(tmp_path):
+    class _Optimizer:
+        variables: list = []
+
+    manager = CheckpointManager(tmp_path)
+    model = _Weights([np.ones(2, dtype=np.float32)])
+    manager.save_weights(model, "last")
+    manager.save_optimizer(_Optimizer(), meta={"epoch": 1})
+    assert manager.load_resume_state()["epoch"] == 1
+
+    # Killed after the next epoch's weights landed but before its optimizer state did.
+    model.weights = [np.zeros(2, dtype=np.float32)]
+    manager.save_weights(model, "last")
+    assert manager.load_resume_state() is None
+    manager.close()
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_resumes_incomplete_run(tmp_path):
+    from src.training.runner import build_parser, run
+
+    def _run(epochs, *extra):
+        argv = ["--artifacts-dir", str(tmp_path), "--run-id", "preempted", "--synthetic-samples", "200"]
+        argv += ["--epochs", str(epochs), "--verbose", "0", "--model-type", "dlinear", *extra]
+        return run(build_parser().parse_args(argv))
+
+    _run(2)
+    with pytest.raises(FileNotFoundError, match="already completed"):
+        _run(4, "--resume", "require")
+
+    (tmp_path / "metrics" / "preempted.json").unlink()  # the attempt never reached its metrics write
+    payload = _run(4, "--resume", "require")
+    assert payload["resume"] == {"resumed": True, "from_epoch": 2, "initial_epoch": 2}
+    assert payload["training"]["initial_epoch"] == 2
+    assert payload["training"]["epochs_run"] == 2
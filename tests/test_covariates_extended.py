@@ -53,7 +53,7 @@ def test_lstm_with_all_covariates():
 
 
 @pytest.mark.skipif(not os.environ.get("RUN_ML_TESTS"), reason="ML tests require TensorFlow")
-def test_cross_validation_with_covariates():
+def test_cross_validation_with_covariates(tmp_path):
     """Test cross-validation with covariate list input."""
     seq_len = 5
     horizon = 2
@@ -78,7 +78,7 @@ def test_cross_validation_with_covariates():
 
     X_list = [X_past, X_fut, X_stat]
 
-    trainer = Trainer(model, sequence_length=seq_len, prediction_horizon=horizon)
+    trainer = Trainer(model, sequence_length=seq_len, prediction_horizon=horizon, save_dir=str(tmp_path))
     cv_results = trainer.cross_validate(X=X_list, y=y, n_splits=3, epochs=1, batch_size=4, verbose=0)
 
     assert "avg_metrics" in cv_results
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+from src.training.distillation import DistillationTeacher, blend_soft_targets
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+SEQ_LEN = 8
+
+
+def _save_teacher(path, seed: int = 0) -> str:
+    from src.models.lstm import GRUModel
+
+    teacher = GRUModel(sequence_length=SEQ_LEN, hidden_units=[8], dropout=0.0)
+    teacher.build()
+    rng = np.random.default_rng(seed)
+    teacher.fit_model(
+        rng.normal(size=(32, SEQ_LEN, 1)).astype(np.float32),
+        rng.normal(size=(32, 1)).astype(np.float32),
+        epochs=1,
+        early_stopping=False,
+        verbose=0,
+    )
+    teacher.save(str(path))
+    return str(path)
+
+
+def test_blend_soft_targets_weights_teacher_and_labels():
+    y = np.array([[0.0], [2.0]])
+    soft = np.array([[1.0], [0.0]])
+    np.testing.assert_allclose(blend_soft_targets(y, soft, 0.25), [[0.25], [1.5]])
+    np.testing.assert_allclose(blend_soft_targets(y, soft, 0.0), y)
+    with pytest.raises(ValueError, match="alpha"):
+        blend_soft_targets(y, soft, 1.5)
+    with pytest.raises(ValueError, match="shape"):
+        blend_soft_targets(y, soft[:1], 0.5)
+
+
+def test_teacher_requires_existing_checkpoints(tmp_path):
+    with pytest.raises(ValueError, match="at least one"):
+        DistillationTeacher([])
+    with pytest.raises(FileNotFoundError):
+        DistillationTeacher([str(tmp_path / "missing.h5")])
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_teacher_predictions_are_cached_per_dataset_and_ensembled(tmp_path):
+    first = _save_teacher(tmp_path / "a.h5", seed=0)
+    second = _save_teacher(tmp_path / "b.h5", seed=1)
+    X = np.random.default_rng(2).normal(size=(12, SEQ_LEN, 1)).astype(np.float32)
+
+    teacher = DistillationTeacher([first], cache_dir=str(tmp_path / "cache"))
+    soft, hit = teacher.soft_targets(X)
+    assert not hit and soft.shape == (12, 1)
+    again, hit = DistillationTeacher([first], cache_dir=str(tmp_path / "cache")).soft_targets(X)
+    assert hit
+    np.testing.assert_array_equal(soft, again)
+    _, hit = teacher.soft_targets(X[:6])
+    assert not hit  # different dataset -> new cache entry
+
+    ensemble = DistillationTeacher([first, second])
+    expected = (teacher.predict(X) + DistillationTeacher([second]).predict(X)) / 2
+    np.testing.assert_allclose(ensemble.predict(X), expected, atol=1e-6)
+    assert ensemble.describe()["ensemble_size"] == 2
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_trainer_distills_into_student_and_reports_teacher_metrics(tmp_path):
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.trainer import Trainer
+
+    teacher = DistillationTeacher([_save_teacher(tmp_path / "teacher.h5")], cache_dir=str(tmp_path / "cache"))
+    student = DLinearLikeModel(sequence_length=SEQ_LEN)
+    trainer = Trainer(student, sequence_length=SEQ_LEN, prediction_horizon=1, save_dir=str(tmp_path / "ckpt"))
+    series = np.sin(np.linspace(0, 8 * np.pi, 160)).astype(np.float32)
+
+    results = trainer.train(data=series, epochs=1, batch_size=16, verbose=0, teacher=teacher, distill_alpha=0.7)
+
+    info = results["distillation"]
+    assert info["alpha"] == 0.7 and info["cache_hit"] is False
+    assert {"teacher_train_metrics", "teacher_test_metrics", "student_test_metrics"} <= set(info)
+    assert info["student_test_metrics"]["rmse"] == pytest.approx(results["metrics"]["rmse"])
+    assert results["config"]["distill_alpha"] == 0.7
+
+
+def _runner_args(artifacts, run_id: str, *extra: str):
+    from src.training.runner import build_parser
+
+    return build_parser().parse_args(
+        [
+            "--run-id",
+            run_id,
+            "--artifacts-dir",
+            str(artifacts),
+            "--sequence-length",
+            str(SEQ_LEN),
+            "--synthetic-samples",
+            "200",
+            "--epochs",
+            "1",
+            "--verbose",
+            "0",
+            *extra,
+        ]
+    )
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_distillation_flows_into_payload(tmp_path):
+    from src.training.runner import run
+
+    artifacts = tmp_path / "artifacts"
+    run(_runner_args(artifacts, "distill-teacher", "--model-type", "gru", "--hidden-units", "8"))
+    payload = run(
+        _runner_args(
+            artifacts,
+            "distill-student",
+            "--model-type",
+            "dlinear",
+            "--distill-teacher",
+            "distill-teacher",
+            "--distill-alpha",
+            "0.5",
+        )
+    )
+
+    assert payload["config"]["distill_teacher"] == ["distill-teacher"]
+    assert payload["distillation"]["alpha"] == 0.5
+    assert payload["distillation"]["teacher_checkpoints"][0].startswith(
+        str(artifacts / "checkpoints" / "distill-teacher")
+    )
+    assert list((artifacts / "distill_cache").glob("*.npy"))
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_rejects_teachers_with_another_window_layout_or_scaling(tmp_path):
+    from src.training.runner import run
+
+    artifacts = tmp_path / "artifacts"
+    run(_runner_args(artifacts, "distill-teacher", "--model-type", "dlinear"))
+    student = ("--model-type", "dlinear", "--distill-teacher")
+
+    with pytest.raises(ValueError, match="sequence_length: teacher=8 student=12"):
+        run(_runner_args(artifacts, "student-a", *student, "distill-teacher", "--sequence-length", "12"))
+    with pytest.raises(ValueError, match="normalize_method"):
+        run(_runner_args(artifacts, "student-b", *student, "distill-teacher", "--normalize-method", "standard"))
+    with pytest.raises(ValueError, match="pass the teacher's run_id"):
+        run(_runner_args(artifacts, "student-c", *student, _save_teacher(tmp_path / "loose.h5")))
+    with pytest.raises(ValueError, match="expects inputs"):
+        DistillationTeacher([_save_teacher(tmp_path / "loose.h5")]).predict(np.zeros((2, SEQ_LEN + 4, 1)))
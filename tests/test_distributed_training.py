@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+import pytest
+from src.training.distributed import local_cluster, worker_info
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+def test_worker_info_picks_one_chief():
+    workers = local_cluster(3)
+    assert len({cfg["cluster"]["worker"][i] for i, cfg in enumerate(workers)}) == 3
+    roles = [worker_info(json.dumps(cfg)) for cfg in workers]
+    assert [info.is_chief for info in roles] == [True, False, False]
+    assert roles[2].num_workers == 3
+
+    with_chief = {"cluster": {"chief": ["h:1"], "worker": ["h:2"]}, "task": {"type": "worker", "index": 0}}
+    assert not worker_info(json.dumps(with_chief)).is_chief
+    with_chief["task"] = {"type": "chief", "index": 0}
+    assert worker_info(json.dumps(with_chief)).is_chief
+    assert worker_info("").is_chief
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_trainer_fits_under_mirrored_strategy(tmp_path):
+    import tensorflow as tf
+    from src.models.lstm import LSTMModel
+    from src.training.trainer import Trainer
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(120, 8, 1)).astype(np.float32)
+    y = X[:, -2:, 0] * 0.5
+    model = LSTMModel(sequence_length=8, output_units=2, hidden_units=[8], quantiles=(0.1, 0.5, 0.9))
+    trainer = Trainer(model=model, sequence_length=8, prediction_horizon=2, save_dir=str(tmp_path))
+
+    results = trainer.train(X=X, y=y, epochs=3, batch_size=16, verbose=0, strategy=tf.distribute.MirroredStrategy())
+
+    assert {"loss", "mae", "val_loss", "val_mae"} <= set(results["history"])
+    assert results["history"]["loss"][-1] < results["history"]["loss"][0]
+    assert results["distributed"]["strategy"] == "mirrored"
+    assert results["training_stats"]["replicas"] == 1
+    # The trained model is handed back outside the strategy scope.
+    assert model.model.distribute_strategy is tf.distribute.get_strategy()
+    assert results["y_pred_quantiles"].shape == (len(results["y_test"]), 2, 3)
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_local_multi_worker_run_writes_artifacts_from_chief_only(tmp_path):
+    from src.training.distributed import launch_local_workers
+
+    workers = launch_local_workers(
+        [
+            "--artifacts-dir",
+            str(tmp_path),
+            "--run-id",
+            "mw-run",
+            "--synthetic-samples",
+            "240",
+            "--epochs",
+            "2",
+            "--verbose",
+            "0",
+            "--model-type",
+            "dlinear",
+        ],
+        n_workers=2,
+        timeout=600,
+    )
+
+    assert [w["returncode"] for w in workers] == [0, 0], workers[-1]["stderr"][-2000:]
+    chief, other = (json.loads(w["stdout"]) for w in workers)
+    assert chief["distributed"]["replicas"] == 2 and chief["distributed"]["is_chief"]
+    assert chief["training"]["replicas"] == 2
+    assert not other["distributed"]["is_chief"] and "checkpoints" not in other
+    # Replicas stay in sync, so both workers end with the same weights.
+    assert other["metrics"]["rmse"] == pytest.approx(chief["metrics"]["rmse"], rel=1e-5)
+    assert sorted(p.name for p in (tmp_path / "checkpoints").iterdir()) == ["mw-run"]
+    assert (tmp_path / "metrics" / "mw-run.json").exists()
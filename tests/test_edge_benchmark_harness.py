@@ -85,12 +85,13 @@ def test_edge_benchmark_benchmarks_keras_when_path_available(tmp_path: Path, mon
     metrics_dir.mkdir(parents=True, exist_ok=True)
     (metrics_dir / f"{run_id}.json").write_text(json.dumps(metrics), encoding="utf-8")
 
-    def _fake_runtime_infer(runtime: str, model_path: Path, sample_inputs: list[np.ndarray]) -> np.ndarray:
-        assert runtime == "keras"
-        assert model_path == keras_path
-        return np.zeros((1, 24, 1), dtype=np.float32)
+    loads: list[tuple[str, Path]] = []
 
-    monkeypatch.setattr(harness, "_runtime_infer", _fake_runtime_infer)
+    def _fake_load_runtime_session(runtime: str, model_path: Path):
+        loads.append((runtime, model_path))
+        return lambda sample_inputs: np.zeros((1, 24, 1), dtype=np.float32)
+
+    monkeypatch.setattr(harness, "load_runtime_session", _fake_load_runtime_session)
 
     args = argparse.Namespace(
         run_id=run_id,
@@ -109,3 +110,6 @@ def test_edge_benchmark_benchmarks_keras_when_path_available(tmp_path: Path, mon
     assert report["status"] == "succeeded"
     assert report["latency_p95_ms"] is not None
     assert report["size_mb"] is not None
+    # One uncached load per benchmark, timed separately from the warm latency.
+    assert loads == [("keras", keras_path)]
+    assert report["cold_load_ms"] is not None
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 import src.training.edge as edge
 from src.training.edge import (
@@ -113,3 +116,46 @@ def test_export_tflite_model_subprocess_failure_returns_failed(monkeypatch, tmp_
     out = edge.export_tflite_model(_DummyModel(), tmp_path / "model.tflite", quantization="fp16")
     assert out["status"] == "failed"
     assert "LLVM ERROR" in out["error"]
+
+
+# Converting Keras models aborts in some TF builds, so the test model is a bare tf.function converted out of process.
+_TFLITE_MATMUL_MODEL = """
+import sys
+import numpy as np
+import tensorflow as tf
+
+w = tf.constant(np.arange(8, dtype=np.float32).reshape(4, 2))
+
+
+@tf.function(input_signature=[tf.TensorSpec([1, 4, 1], tf.float32)])
+def forward(x):
+    return tf.matmul(tf.reshape(x, [-1, 4]), w)
+
+
+converter = tf.lite.TFLiteConverter.from_concrete_functions([forward.get_concrete_function()], forward)
+with open(sys.argv[1], "wb") as f:
+    f.write(converter.convert())
+"""
+
+
+def test_tflite_session_keeps_one_interpreter_per_batch_shape(monkeypatch, tmp_path: Path) -> None:
+    tf = pytest.importorskip("tensorflow")
+
+    model_path = tmp_path / "model.tflite"
+    subprocess.run([sys.executable, "-c", _TFLITE_MATMUL_MODEL, str(model_path)], check=True, capture_output=True)
+    allocations: list[int] = []
+
+    class CountingInterpreter(tf.lite.Interpreter):
+        def allocate_tensors(self):
+            allocations.append(id(self))
+            return super().allocate_tensors()
+
+    monkeypatch.setattr(tf.lite, "Interpreter", CountingInterpreter)
+    predict = edge.load_tflite_session(model_path)
+    x = np.random.default_rng(0).normal(size=(4, 4, 1)).astype(np.float32)
+    w = np.arange(8, dtype=np.float32).reshape(4, 2)
+    for batch in (1, 4, 1, 4, 2):
+        np.testing.assert_allclose(predict([x[:batch]]), x[:batch].reshape(batch, 4) @ w, rtol=1e-5, atol=1e-5)
+
+    # The native batch-of-one interpreter plus one per new batch size; switching back never re-allocates.
+    assert len(allocations) == 3 and len(set(allocations)) == 3
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+
+import numpy as np
+import pytest
+from src.training.search import (
+    AshaScheduler,
+    SearchSpace,
+    TrialConfig,
+    TrialResult,
+    build_parser,
+    load_trials,
+    mark_pareto_front,
+    query_trials,
+    run_search,
+    sample_trials,
+)
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+def test_sample_trials_is_seeded_and_within_space():
+    space = SearchSpace(model_types=("gru", "dlinear"), sequence_lengths=(8, 16), learning_rate=(1e-4, 1e-2))
+
+    first = sample_trials(space, 10, seed=7)
+    assert first == sample_trials(space, 10, seed=7)
+    assert [t.trial_id for t in first] == [f"t{i:03d}" for i in range(10)]
+    for t in first:
+        assert t.model_type in {"gru", "dlinear"}
+        assert t.sequence_length in {8, 16}
+        assert 1e-4 <= t.learning_rate <= 1e-2
+        assert 0.0 <= t.dropout <= 0.4
+        assert t.hidden_units in space.hidden_units
+
+
+def test_search_space_rejects_unknown_model_type():
+    with pytest.raises(ValueError, match="unsupported model_types"):
+        SearchSpace(model_types=("transformer",))
+
+
+def test_asha_scheduler_rungs_and_top_fraction_promotion():
+    scheduler = AshaScheduler(min_epochs=1, max_epochs=9, reduction_factor=3)
+    assert scheduler.rungs == [1, 3]
+
+    # First reduction_factor - 1 arrivals always continue.
+    assert scheduler.report("a", 1, 0.5)
+    assert scheduler.report("b", 1, 0.2)
+    # Third arrival: only the top 1/3 (best of three) keeps going.
+    assert not scheduler.report("c", 1, 0.9)
+    assert scheduler.report("d", 1, 0.1)
+    # Non-rung epochs never stop a trial.
+    assert scheduler.report("c", 2, 99.0)
+    assert scheduler.snapshot()["rungs"]["1"]["d"] == 0.1
+
+
+def test_pareto_front_and_query_trials():
+    def _result(tid, val_loss, ms, rmse, status="completed"):
+        cfg = TrialConfig(tid, "gru", (8,), 0.1, 1e-3, 12)
+        return TrialResult(
+            config=cfg,
+            status=status,
+            metrics={"rmse": rmse},
+            best_val_loss=val_loss,
+            infer_ms_per_sample=ms,
+            epochs_run=2,
+        )
+
+    # "dominated" has the best test RMSE, but selection must only look at validation loss.
+    results = [_result("fast", 0.5, 0.1, 0.4), _result("accurate", 0.2, 1.0, 0.3), _result("dominated", 0.6, 2.0, 0.1)]
+    mark_pareto_front(results)
+    rows = [r.to_row() for r in results]
+
+    assert [r["trial_id"] for r in rows if r["pareto_optimal"]] == ["fast", "accurate"]
+    assert [r["trial_id"] for r in query_trials(rows)] == ["accurate", "fast", "dominated"]
+    assert (
+        query_trials(rows, where={"pareto_optimal": True}, sort_by="infer_ms_per_sample", limit=1)[0]["trial_id"]
+        == "fast"
+    )
+    with pytest.raises(ValueError, match="unknown trial columns"):
+        query_trials(rows, where={"nope": 1})
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_run_search_writes_trials_table_and_report(tmp_path):
+    args = build_parser().parse_args(
+        [
+            "--search-id",
+            "unit",
+            "--n-trials",
+            "4",
+            "--workers",
+            "2",
+            "--min-epochs",
+            "1",
+            "--max-epochs",
+            "3",
+            "--batch-size",
+            "16",
+        ]
+    )
+    space = SearchSpace(model_types=("gru", "dlinear"), hidden_units=((8,),), sequence_lengths=(6, 8))
+    t = np.linspace(0, 12 * np.pi, 240)
+    series = np.sin(t).astype(np.float32)
+
+    summary = run_search(series, args, space, tmp_path / "unit")
+
+    rows = load_trials(tmp_path / "unit")
+    assert len(rows) == 4
+    assert {r["status"] for r in rows} <= {"completed", "pruned"}
+    assert all(1 <= r["epochs_run"] <= 3 for r in rows)
+    assert summary["trial_epochs_total"] <= summary["trial_epochs_budget"] == 12
+    assert summary["best"]["trial_id"] == query_trials(rows, sort_by="best_val_loss")[0]["trial_id"]
+    assert summary["pareto_front"]
+
+    with open(tmp_path / "unit" / "trials.csv", newline="", encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == 4
+    assert json.loads((tmp_path / "unit" / "summary.json").read_text())["search_id"] == "unit"
+    assert "Speed vs quality" in (tmp_path / "unit" / "report.md").read_text()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from backend.app.inference_pool import InferenceSaturatedError, RuntimePool, RuntimeUnavailableError
+
+
+def test_pool_rejects_when_workers_and_queue_are_full() -> None:
+    pool = RuntimePool("keras", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario() -> list[object]:
+        first = asyncio.ensure_future(pool.run(release.wait, timeout_s=5))
+        second = asyncio.ensure_future(pool.run(lambda: "queued", timeout_s=5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(InferenceSaturatedError):
+            await pool.run(lambda: "rejected", timeout_s=5)
+        release.set()
+        return list(await asyncio.gather(first, second))
+
+    assert asyncio.run(scenario()) == [True, "queued"]
+    stats = pool.stats()
+    assert (stats["submitted"], stats["completed"], stats["rejected"], stats["in_flight"]) == (2, 2, 1, 0)
+    pool.shutdown()
+
+
+def test_stuck_workers_turn_into_fast_unavailable_until_they_return() -> None:
+    pool = RuntimePool("tflite", max_workers=1, max_queue=4)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        with pytest.raises(TimeoutError, match="deadline"):
+            await pool.run(release.wait, timeout_s=0.05)
+        assert pool.stats()["stuck"] == 1
+        start = time.perf_counter()
+        with pytest.raises(RuntimeUnavailableError):
+            await pool.run(lambda: None, timeout_s=5)
+        assert time.perf_counter() - start < 0.5
+        release.set()
+        await asyncio.sleep(0.05)
+        assert await pool.run(lambda: "ok", timeout_s=5) == "ok"
+
+    asyncio.run(scenario())
+    stats = pool.stats()
+    assert (stats["timed_out"], stats["unavailable"], stats["stuck"]) == (1, 1, 0)
+    pool.shutdown()
+
+
+def test_queued_call_past_its_deadline_is_dropped_without_running() -> None:
+    pool = RuntimePool("numpy", max_workers=1, max_queue=2)
+    release = threading.Event()
+    ran: list[str] = []
+
+    async def scenario() -> None:
+        busy = asyncio.ensure_future(pool.run(release.wait, timeout_s=5))
+        await asyncio.sleep(0.02)
+        with pytest.raises(TimeoutError):
+            await pool.run(lambda: ran.append("queued"), timeout_s=0.05)
+        release.set()
+        await busy
+
+    asyncio.run(scenario())
+    assert ran == []
+    assert pool.stats()["stuck"] == 0
+    pool.shutdown()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+from backend.app.joblog import JobLog, read_persisted
+
+
+def test_job_log_serves_evicted_lines_from_disk(tmp_path: Path) -> None:
+    log = JobLog("job-1", log_dir=tmp_path, buffer_size=3)
+    for i in range(10):
+        log.append("INFO", f"line {i}\n", source="stdout")
+
+    assert [line["seq"] for line in log.read(8, 10)] == [8, 9]
+    assert [line["message"] for line in log.read(0, 4)] == ["line 0", "line 1", "line 2", "line 3"]
+    assert [line["seq"] for line in log.read(5, 100)] == [5, 6, 7, 8, 9]
+    assert log.read(10, 5) == []
+
+
+def test_job_log_rotates_and_continues_numbering_after_restart(tmp_path: Path) -> None:
+    log = JobLog("job-2", log_dir=tmp_path, buffer_size=5, max_bytes=1024, backups=2)
+    for i in range(200):
+        log.append("INFO", f"message {i:04d} " + "x" * 40)
+    log.close()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["job-2.jsonl", "job-2.jsonl.1", "job-2.jsonl.2"]
+    persisted = read_persisted(log.path, 0, 1000, backups=2)
+    seqs = [line["seq"] for line in persisted]
+    assert seqs == list(range(seqs[0], 200))  # oldest rotated-out lines are gone, the rest is contiguous
+    assert seqs[0] > 0
+
+    reopened = JobLog("job-2", log_dir=tmp_path, backups=2)
+    assert reopened.next_seq == 200
+    assert reopened.append("INFO", "after restart")["seq"] == 200
+    assert reopened.read(199, 5)[0]["message"].startswith("message 0199")
+
+
+def test_job_log_wait_wakes_on_append_from_another_thread(tmp_path: Path) -> None:
+    log = JobLog("job-3", log_dir=tmp_path)
+    log.append("INFO", "first")
+
+    async def scenario() -> tuple[bool, bool, bool]:
+        already = await log.wait(-1, timeout=0.01)
+        timed_out = await log.wait(0, timeout=0.05)
+        threading.Timer(0.05, log.append, args=("INFO", "second")).start()
+        woke = await log.wait(0, timeout=5.0)
+        return already, timed_out, woke
+
+    assert asyncio.run(scenario()) == (True, False, True)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from backend.app.batching import Histogram, MicroBatcher
+
+
+def _run_concurrently(batcher: MicroBatcher, values: list[float]) -> list[np.ndarray | Exception]:
+    barrier = threading.Barrier(len(values))
+
+    def call(value: float) -> np.ndarray | Exception:
+        barrier.wait()
+        try:
+            return batcher([np.full((1, 4, 1), value, dtype=np.float32)])
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=len(values)) as pool:
+        return list(pool.map(call, values))
+
+
+def test_concurrent_requests_share_one_forward_pass_and_get_their_own_rows() -> None:
+    batch_sizes: list[int] = []
+
+    def predict(inputs: list[np.ndarray]) -> np.ndarray:
+        batch_sizes.append(inputs[0].shape[0])
+        return inputs[0].sum(axis=(1, 2))[:, None] * np.ones((1, 2), dtype=np.float32)
+
+    batcher = MicroBatcher(predict, max_batch_size=8, max_wait_ms=500)
+    values = [float(i) for i in range(8)]
+    outputs = _run_concurrently(batcher, values)
+
+    assert batch_sizes == [8]
+    for value, out in zip(values, outputs, strict=True):
+        assert isinstance(out, np.ndarray)
+        np.testing.assert_allclose(out, [[4 * value, 4 * value]])
+    stats = batcher.stats.snapshot()
+    assert (stats["requests"], stats["batches"]) == (8, 1)
+    assert stats["batch_size"]["buckets"]["8"] == 1
+    assert stats["queue_depth"]["count"] == 8
+
+
+def test_max_batch_size_splits_the_queue_across_leaders() -> None:
+    batch_sizes: list[int] = []
+    lock = threading.Lock()
+
+    def predict(inputs: list[np.ndarray]) -> np.ndarray:
+        with lock:
+            batch_sizes.append(inputs[0].shape[0])
+        return inputs[0][:, 0, :]
+
+    batcher = MicroBatcher(predict, max_batch_size=3, max_wait_ms=200)
+    outputs = _run_concurrently(batcher, [float(i) for i in range(7)])
+
+    assert sum(batch_sizes) == 7
+    assert max(batch_sizes) <= 3
+    assert sorted(float(o[0, 0]) for o in outputs if isinstance(o, np.ndarray)) == [float(i) for i in range(7)]
+
+
+def test_failed_batch_is_retried_per_request_and_errors_stay_isolated() -> None:
+    def predict(inputs: list[np.ndarray]) -> np.ndarray:
+        x = inputs[0]
+        if x.shape[0] > 1:
+            raise ValueError("fixed batch-of-one model")
+        if x[0, 0, 0] < 0:
+            raise ValueError("negative input")
+        return x[:, 0, :]
+
+    batcher = MicroBatcher(predict, max_batch_size=4, max_wait_ms=500)
+    outputs = _run_concurrently(batcher, [1.0, -1.0, 2.0, 3.0])
+
+    assert isinstance(outputs[1], ValueError)
+    assert [float(o[0, 0]) for o in outputs if isinstance(o, np.ndarray)] == [1.0, 2.0, 3.0]
+    assert batcher.stats.snapshot()["split_fallbacks"] >= 1
+
+
+def test_lone_request_does_not_wait_out_max_wait() -> None:
+    batcher = MicroBatcher(lambda inputs: inputs[0][:, 0, :], max_batch_size=8, max_wait_ms=2000, in_flight=lambda: 1)
+
+    start = time.perf_counter()
+    out = batcher([np.ones((1, 4, 1), dtype=np.float32)])
+
+    assert time.perf_counter() - start < 1.0
+    np.testing.assert_allclose(out, [[1.0]])
+
+
+def test_leader_waits_only_for_calls_in_flight() -> None:
+    batch_sizes: list[int] = []
+
+    def predict(inputs: list[np.ndarray]) -> np.ndarray:
+        batch_sizes.append(inputs[0].shape[0])
+        return inputs[0][:, 0, :]
+
+    batcher = MicroBatcher(predict, max_batch_size=8, max_wait_ms=5000, in_flight=lambda: 4)
+    start = time.perf_counter()
+    outputs = _run_concurrently(batcher, [float(i) for i in range(4)])
+
+    assert batch_sizes == [4]
+    assert time.perf_counter() - start < 2.5
+    assert all(isinstance(o, np.ndarray) for o in outputs)
+
+
+def test_histogram_overflow_bucket() -> None:
+    hist = Histogram(buckets=(1, 4))
+    for value in (1, 3, 4, 9):
+        hist.observe(value)
+    assert hist.snapshot() == {"buckets": {"1": 1, "4": 2, "+Inf": 1}, "count": 4, "mean": pytest.approx(4.25)}
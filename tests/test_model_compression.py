@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+import pytest
+from src.training.compression import CompressionConfig, _kmeans_1d, _magnitude_mask
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+def test_compression_config_validation():
+    assert not CompressionConfig().enabled
+    assert CompressionConfig(clusters=4).enabled
+    with pytest.raises(ValueError, match="sparsity"):
+        CompressionConfig(sparsity=1.0)
+    with pytest.raises(ValueError, match="granularity"):
+        CompressionConfig(sparsity=0.5, granularity="block")
+    with pytest.raises(ValueError, match="clusters"):
+        CompressionConfig(clusters=1)
+
+
+def test_magnitude_mask_weight_and_channel_granularity():
+    w = np.array([[0.1, -2.0, 0.3], [-0.05, 1.0, 0.2]], dtype=np.float32)
+
+    mask = _magnitude_mask(w, 0.5, "weight")
+    np.testing.assert_array_equal(mask, [[0, 1, 1], [0, 1, 0]])
+
+    # Column norms: 0.11, 2.24, 0.36 -> drop the weakest output channel.
+    channel = _magnitude_mask(w, 1 / 3, "channel")
+    np.testing.assert_array_equal(channel, [[0, 1, 1], [0, 1, 1]])
+
+
+def test_kmeans_1d_recovers_separated_clusters():
+    values = np.array([-1.02, -0.98, -1.0, 0.49, 0.51, 2.0, 2.01], dtype=np.float64)
+    centroids, assignments = _kmeans_1d(values, 3)
+    np.testing.assert_allclose(np.sort(centroids), [-1.0, 0.5, 2.005], atol=1e-6)
+    assert len(set(assignments[:3])) == 1 and len(set(assignments)) == 3
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_compress_model_keeps_sparsity_and_clusters_through_fine_tune():
+    from src.models.lstm import GRUModel
+    from src.training.compression import compress_model, compressible_variables
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(64, 8, 1)).astype(np.float32)
+    y = X[:, -1, :] * 0.5
+    model = GRUModel(sequence_length=8, hidden_units=[16, 8], dropout=0.0)
+    model.fit_model(X, y, epochs=1, early_stopping=False, verbose=0)
+
+    report = compress_model(
+        model,
+        CompressionConfig(sparsity=0.5, clusters=4, fine_tune_epochs=1),
+        X_train=X,
+        y_train=y,
+        reference_inputs=X[:8],
+    )
+
+    assert report["enabled"] and report["achieved_sparsity"] == pytest.approx(0.5, abs=0.01)
+    assert {t["weight"] for t in report["tensors"]} == {v.path for v in compressible_variables(model.model)}
+    for entry in report["tensors"]:
+        assert entry["sparsity"] == pytest.approx(0.5, abs=0.01)
+        assert entry["unique_values"] <= 4
+    assert report["gzip_size_bytes_after"] < report["gzip_size_bytes_before"]
+    assert set(report["parity"]) == {"max_abs_diff", "mean_abs_diff", "rmse"}
+    assert report["fine_tune_final_loss"] is not None
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_records_compression_in_manifest(tmp_path):
+    from src.training.runner import build_parser, run
+
+    args = build_parser().parse_args(
+        [
+            "--run-id",
+            "compressed-run",
+            "--artifacts-dir",
+            str(tmp_path),
+            "--model-type",
+            "gru",
+            "--hidden-units",
+            "16",
+            "--sequence-length",
+            "8",
+            "--synthetic-samples",
+            "200",
+            "--epochs",
+            "1",
+            "--prune-sparsity",
+            "0.4",
+            "--prune-granularity",
+            "channel",
+            "--compression-fine-tune-epochs",
+            "1",
+            "--verbose",
+            "0",
+        ]
+    )
+    payload = run(args)
+
+    manifest = json.loads((tmp_path / "exports" / "compressed-run" / "manifest.json").read_text())
+    assert manifest["compression"]["enabled"] is True
+    assert manifest["compression"]["config"]["granularity"] == "channel"
+    assert {"test_metrics_before", "test_metrics_after", "parity"} <= set(payload["compression"])
+    assert (tmp_path / "checkpoints" / "compressed-run" / "pre_compression.h5").exists()
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_residual_run_reports_the_compressed_model(tmp_path):
+    import tensorflow as tf
+    from src.training.runner import build_parser, run
+
+    rng = np.random.default_rng(0)
+    n, seq = 120, 8
+    X = rng.normal(size=(n, seq, 1)).astype(np.float32)
+    y = rng.normal(size=(n, 1)).astype(np.float32)
+    y_spline = np.linspace(10.0, 20.0, n, dtype=np.float32).reshape(n, 1)
+    npz = tmp_path / "residual.npz"
+    np.savez(npz, X=X, y=y, y_spline=y_spline, feature_names=np.array(["target"]), target_indices=np.array([0]))
+
+    payload = run(
+        build_parser().parse_args(
+            [
+                "--run-id",
+                "compressed-residual",
+                "--artifacts-dir",
+                str(tmp_path),
+                "--processed-npz",
+                str(npz),
+                "--residual-learning",
+                "--model-type",
+                "gru",
+                "--hidden-units",
+                "16",
+                "--sequence-length",
+                str(seq),
+                "--epochs",
+                "1",
+                "--prune-sparsity",
+                "0.5",
+                "--compression-fine-tune-epochs",
+                "1",
+                "--verbose",
+                "0",
+            ]
+        )
+    )
+
+    compressed = tf.keras.models.load_model(tmp_path / "checkpoints" / "compressed-residual" / "best.h5", compile=False)
+    test_start = payload["split_indices"]["test"]["start"]
+    fresh = compressed.predict(X[test_start:], verbose=0)
+    # The shifted, recombined prediction is what the compressed model predicts on its own.
+    np.testing.assert_allclose(payload["inference"]["y_pred_last"], fresh[-1] + y_spline[-1], rtol=1e-5, atol=1e-5)
+    assert payload["metrics"]["rmse"] == pytest.approx(float(np.sqrt(np.mean((y[test_start:] - fresh) ** 2))))
+    assert payload["baselines"]["lstm"]["rmse"] == pytest.approx(payload["compression"]["test_metrics_after"]["rmse"])
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+from backend.app.registry import ModelRegistry
+
+
+def _counting_loader(calls: list[tuple[str, str]]):
+    def load(runtime: str, model_path: Path):
+        calls.append((runtime, model_path.name))
+        return lambda inputs: np.zeros((1, 1), dtype=np.float32)
+
+    return load
+
+
+def _write(path: Path, size: int, fill: bytes = b"x") -> Path:
+    path.write_bytes(fill * size)
+    return path
+
+
+def test_registry_caches_by_file_hash_and_evicts_lru(tmp_path: Path) -> None:
+    calls: list[tuple[str, str]] = []
+    registry = ModelRegistry(max_entries=2, max_bytes=10_000, loader=_counting_loader(calls))
+    a, b, c = (_write(tmp_path / f"{n}.npz", 100, n.encode()) for n in "abc")
+
+    registry.get("run-a", "numpy", a)
+    registry.get("run-a", "numpy", a)
+    registry.get("run-b", "numpy", b)
+    registry.get("run-a", "numpy", a)  # refresh: run-b is now least recently used
+    registry.get("run-c", "numpy", c)
+    assert calls == [("numpy", "a.npz"), ("numpy", "b.npz"), ("numpy", "c.npz")]
+    stats = registry.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1)
+    assert {m["run_id"] for m in stats["models"]} == {"run-a", "run-c"}
+
+    # A re-exported file hashes differently and gets a fresh session.
+    mtime = a.stat().st_mtime_ns
+    a.write_bytes(b"z" * 100)
+    os.utime(a, ns=(mtime + 1, mtime + 1))
+    registry.get("run-a", "numpy", a)
+    assert calls[-1] == ("numpy", "a.npz")
+    assert len(calls) == 4
+
+
+def test_registry_respects_byte_budget_and_manifest_changes(tmp_path: Path) -> None:
+    calls: list[tuple[str, str]] = []
+    registry = ModelRegistry(max_entries=8, max_bytes=250, loader=_counting_loader(calls))
+    small = _write(tmp_path / "small.npz", 100)
+    other = _write(tmp_path / "other.npz", 100, b"o")
+    third = _write(tmp_path / "third.npz", 100, b"t")
+    huge = _write(tmp_path / "huge.npz", 1000)
+
+    for path in (small, other, third):
+        registry.get("run", "numpy", path)
+    assert registry.stats()["bytes"] == 200
+    registry.get("run", "tflite", huge)
+    assert registry.stats()["uncached"] == 1
+    assert not registry.contains("run", "tflite")
+
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{}", encoding="utf-8")
+    assert registry.check_manifest("run", manifest) is False
+    manifest.write_text('{"runtime_stack": "numpy"}', encoding="utf-8")
+    assert registry.check_manifest("run", manifest) is True
+    assert registry.stats()["entries"] == 0
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from src.training.edge import build_runtime_compatibility, select_runtime_stack
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _perturbed(model, seed: int = 0) -> None:
+    # Fresh layers have zero biases; shift every weight so the parity check covers them.
+    rng = np.random.default_rng(seed)
+    model.model.set_weights(
+        [w + rng.normal(scale=0.1, size=w.shape).astype(w.dtype) for w in model.model.get_weights()]
+    )
+
+
+def test_numpy_runtime_ranks_before_keras_fallback():
+    matrix = build_runtime_compatibility(
+        {"tflite": {"status": "failed", "error": "x"}, "numpy": {"status": "succeeded", "path": "m.npz"}},
+        keras_path="best.keras",
+    )
+    assert matrix["numpy"] == {"supported": True, "path": "m.npz", "reason": None}
+    assert select_runtime_stack(matrix) == ("numpy", ["numpy", "keras"])
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+@pytest.mark.parametrize(
+    "model_name,kwargs",
+    [
+        ("dlinear", {"hidden_units": [8], "static_features": 2, "future_features": 1}),
+        ("dlinear", {"hidden_units": [8], "quantiles": (0.1, 0.5, 0.9)}),
+        ("lstm", {"hidden_units": [6, 4], "use_layer_norm": True, "use_residual": True, "static_features": 2}),
+        ("gru", {"hidden_units": [5, 3], "future_features": 1, "quantiles": (0.2, 0.5, 0.8)}),
+    ],
+)
+def test_numpy_forward_pass_matches_keras(model_name, kwargs, tmp_path):
+    from src.models import DLinearLikeModel, GRUModel, LSTMModel
+    from src.training.edge import compute_parity, run_numpy_inference
+    from src.training.numpy_runtime import export_numpy_model
+
+    model_cls = {"dlinear": DLinearLikeModel, "lstm": LSTMModel, "gru": GRUModel}[model_name]
+    model = model_cls(sequence_length=7, output_units=3, input_features=2, **kwargs)
+    model.build()
+    _perturbed(model)
+    rng = np.random.default_rng(1)
+    inputs = [rng.normal(size=(16, 7, 2)).astype(np.float32)]
+    if kwargs.get("future_features"):
+        inputs.append(rng.normal(size=(16, 3, 1)).astype(np.float32))
+    if kwargs.get("static_features"):
+        inputs.append(rng.normal(size=(16, 2)).astype(np.float32))
+
+    result = export_numpy_model(model.model, tmp_path / "model.npz")
+    assert result["status"] == "succeeded", result
+
+    reference = np.asarray(model.model(inputs, training=False))
+    candidate = run_numpy_inference(tmp_path / "model.npz", inputs)
+    assert candidate.shape == reference.shape
+    assert compute_parity(reference, candidate)["max_abs_diff"] < 1e-4
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_unsupported_layers_fail_export_with_reason(tmp_path):
+    from src.models import TCNModel
+    from src.training.numpy_runtime import export_numpy_model
+
+    model = TCNModel(sequence_length=8, output_units=2)
+    model.build()
+    result = export_numpy_model(model.model, tmp_path / "model.npz")
+    assert result["status"] == "failed"
+    assert "Conv1D" in result["error"]
+    assert not (tmp_path / "model.npz").exists()
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_exports_numpy_runtime_and_serves_it_without_tensorflow(tmp_path):
+    from src.training.runner import build_parser, run
+
+    payload = run(
+        build_parser().parse_args(
+            [
+                "--artifacts-dir",
+                str(tmp_path),
+                "--synthetic-samples",
+                "200",
+                "--epochs",
+                "1",
+                "--verbose",
+                "0",
+                "--model-type",
+                "gru",
+                "--export-formats",
+                "numpy",
+            ]
+        )
+    )
+
+    assert payload["exports"]["formats"]["numpy"]["status"] == "succeeded"
+    assert payload["exports"]["parity"]["numpy"]["within_threshold"] is True
+    assert payload["exports"]["runtime_stack"] == "numpy"
+    assert payload["exports"]["fallback_chain"] == ["numpy", "keras"]
+
+    npz_path = payload["exports"]["formats"]["numpy"]["path"]
+    script = (
+        "import json, sys\n"
+        "import numpy as np\n"
+        "from pathlib import Path\n"
+        "from src.training.edge import run_numpy_inference\n"
+        "out = run_numpy_inference(Path(sys.argv[1]), [np.zeros((4, 24, 1), dtype=np.float32)])\n"
+        "print(json.dumps({'shape': list(out.shape), 'tensorflow': 'tensorflow' in sys.modules}))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script, npz_path], cwd=ROOT, capture_output=True, text=True, check=True, timeout=120
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert result == {"shape": [4, payload["config"]["horizon"]], "tensorflow": False}
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+import pytest
+from src.training.baselines import build_baseline_report, naive_quantile_predict, quantile_metrics
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+QUANTILES = (0.1, 0.5, 0.9)
+
+
+def _windows(n: int = 96, lookback: int = 10, horizon: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, lookback, 1)).astype(np.float32)
+    y = (X[:, -horizon:, 0] + rng.normal(scale=0.5, size=(n, horizon))).astype(np.float32)
+    return X, y
+
+
+def test_quantile_metrics_pinball_and_coverage():
+    y_true = np.array([[0.0], [1.0], [2.0], [3.0]])
+    y_q = np.stack([y_true - 1.0, y_true, y_true + 1.0], axis=-1)
+    y_q[3, 0, 2] = 2.5  # one p90 miss -> 0.75 coverage
+
+    out = quantile_metrics(y_true, y_q, QUANTILES)
+
+    assert out["pinball_by_quantile"]["p50"] == 0.0
+    assert out["pinball_by_quantile"]["p10"] == pytest.approx(0.1)
+    assert out["pinball_by_quantile"]["p90"] == pytest.approx((0.1 * 3 + 0.9 * 0.5) / 4)
+    assert out["intervals"]["p10-p90"]["nominal"] == pytest.approx(0.8)
+    assert out["intervals"]["p10-p90"]["coverage"] == pytest.approx(0.75)
+
+
+def test_naive_quantile_baseline_in_report():
+    X, y = _windows(n=40, horizon=3)
+    naive_q = naive_quantile_predict(X, QUANTILES, horizon=3)
+    assert naive_q.shape == (40, 3, 3)
+    assert np.all(np.diff(naive_q, axis=-1) >= 0)
+
+    report = build_baseline_report(
+        y_true=y, y_lstm=naive_q[..., 1], X_test=X, horizon=3, y_quantiles=naive_q, quantiles=QUANTILES
+    )
+    assert report["quantile"]["pinball_improvement_pct"] == pytest.approx(0.0, abs=1e-6)
+    assert "p10-p90" in report["quantile"]["model"]["intervals"]
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_quantile_validation():
+    from src.models.lstm import LSTMModel
+
+    for bad in ([0.5], [0.1, 1.2], [0.9, 0.1]):
+        with pytest.raises(ValueError, match="quantiles"):
+            LSTMModel(quantiles=bad)
+    with pytest.raises(ValueError, match="without quantiles"):
+        model = LSTMModel(sequence_length=4, hidden_units=[4])
+        model.build()
+        model.predict_quantiles(np.zeros((1, 4, 1), dtype=np.float32))
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_multi_quantile_loss_matches_numpy_pinball():
+    from src.models.lstm import MultiQuantileLoss
+
+    rng = np.random.default_rng(1)
+    y_true = rng.normal(size=(6, 2)).astype(np.float32)
+    y_pred = rng.normal(size=(6, 2, 3)).astype(np.float32)
+    expected = np.mean(list(quantile_metrics(y_true, y_pred, QUANTILES)["pinball_by_quantile"].values()))
+    assert float(MultiQuantileLoss(QUANTILES)(y_true, y_pred)) == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+@pytest.mark.parametrize("model_name", ["lstm", "gru", "attention_lstm", "tcn", "dlinear"])
+def test_every_model_class_predicts_ordered_quantiles(model_name, tmp_path):
+    from src.models import AttentionLSTMModel, DLinearLikeModel, GRUModel, LSTMModel, TCNModel
+
+    model_cls = {
+        "lstm": LSTMModel,
+        "gru": GRUModel,
+        "attention_lstm": AttentionLSTMModel,
+        "tcn": TCNModel,
+        "dlinear": DLinearLikeModel,
+    }[model_name]
+    X, y = _windows()
+    kwargs = {"sequence_length": 10, "output_units": 2, "hidden_units": [8], "quantiles": QUANTILES}
+    model = model_cls(**kwargs)
+    history = model.fit_model(X, y, epochs=2, batch_size=32, validation_data=(X[:16], y[:16]), verbose=0)
+    assert {"loss", "mae", "val_loss", "val_mae"} <= set(history)
+
+    q = model.predict_quantiles(X[:8])
+    assert q.shape == (8, 2, 3)
+    assert np.all(np.diff(q, axis=-1) >= 0)
+    np.testing.assert_allclose(model.predict(X[:8]), q[..., 1], rtol=1e-6)
+
+    path = str(tmp_path / "model.h5")
+    model.save(path)
+    reloaded = model_cls(**kwargs)
+    reloaded.load(path)
+    np.testing.assert_allclose(reloaded.predict_quantiles(X[:8]), q, atol=1e-5)
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_reports_quantile_metrics_and_manifest(tmp_path):
+    from src.training.runner import build_parser, run
+
+    payload = run(
+        build_parser().parse_args(
+            [
+                "--artifacts-dir",
+                str(tmp_path),
+                "--synthetic-samples",
+                "200",
+                "--epochs",
+                "1",
+                "--verbose",
+                "0",
+                "--model-type",
+                "dlinear",
+                "--quantiles",
+                "0.1,0.5,0.9",
+                "--rollout-horizon",
+                "3",
+            ]
+        )
+    )
+
+    assert payload["config"]["quantiles"] == [0.1, 0.5, 0.9]
+    assert set(payload["quantile_metrics"]["pinball_by_quantile"]) == {"p10", "p50", "p90"}
+    assert "p10-p90" in payload["baselines"]["quantile"]["naive"]["intervals"]
+    assert len(payload["rollout"]["per_step_rmse"]) == 3
+    with open(payload["exports"]["manifest_path"], encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    assert manifest["quantiles"] == [0.1, 0.5, 0.9]
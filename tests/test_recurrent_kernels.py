@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+import os
+
+import numpy as np
+import pytest
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+pytestmark = pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+
+
+@pytest.mark.parametrize("model_name", ["LSTMModel", "GRUModel", "BidirectionalLSTMModel", "AttentionLSTMModel"])
+def test_recurrent_dropout_is_reported_as_generic_fallback(model_name):
+    import src.models.lstm as lstm_mod
+
+    model = getattr(lstm_mod, model_name)(sequence_length=8, hidden_units=[8, 4], recurrent_dropout=0.2)
+    model.build()
+
+    report = model.kernel_report()
+    assert len(report) == 2
+    for entry in report:
+        assert entry["kernel"] == "generic"
+        assert entry["cudnn_eligible"] is False
+        assert "recurrent_dropout=0.2" in entry["fallback_reasons"]
+    assert report[0]["bidirectional"] is (model_name == "BidirectionalLSTMModel")
+
+
+@pytest.mark.parametrize("model_name", ["LSTMModel", "GRUModel", "BidirectionalLSTMModel", "AttentionLSTMModel"])
+def test_fast_kernel_moves_recurrent_dropout_to_input_dropout(model_name):
+    import src.models.lstm as lstm_mod
+
+    model = getattr(lstm_mod, model_name)(
+        sequence_length=8, hidden_units=[8, 4], recurrent_dropout=0.2, fast_kernel=True
+    )
+    model.build()
+
+    for entry in model.kernel_report():
+        assert entry["kernel"] in {"fused", "cudnn"}
+        assert entry["cudnn_eligible"] is True
+        assert entry["fallback_reasons"] == []
+        assert entry["recurrent_dropout"] == 0.0
+        assert entry["input_dropout"] == pytest.approx(0.2)
+
+
+def test_build_warns_when_a_layer_falls_back(caplog):
+    from src.models.lstm import GRUModel
+
+    with caplog.at_level(logging.WARNING, logger="src.models.lstm"):
+        GRUModel(sequence_length=6, hidden_units=[4], recurrent_dropout=0.1).build()
+    assert any("fast_kernel=True" in rec.getMessage() for rec in caplog.records)
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="src.models.lstm"):
+        GRUModel(sequence_length=6, hidden_units=[4], recurrent_dropout=0.1, fast_kernel=True).build()
+    assert not any("fast_kernel=True" in rec.getMessage() for rec in caplog.records)
+
+
+def test_fast_kernel_model_trains_and_non_recurrent_models_accept_flag():
+    from src.models.dlinear import DLinearLikeModel
+    from src.models.lstm import LSTMModel
+    from src.models.tcn import TCNModel
+
+    X = np.random.rand(16, 6, 1).astype(np.float32)
+    y = np.random.rand(16, 1).astype(np.float32)
+    model = LSTMModel(sequence_length=6, hidden_units=[4], recurrent_dropout=0.3, fast_kernel=True)
+    history = model.fit_model(X, y, epochs=1, batch_size=8, early_stopping=False, verbose=0)
+    assert np.isfinite(history["loss"][-1])
+
+    # Convolutional/linear models accept the flag for runner API compatibility.
+    TCNModel(sequence_length=6, fast_kernel=True)
+    DLinearLikeModel(sequence_length=6, fast_kernel=True)
+
+
+def test_kernel_benchmark_compares_both_variants():
+    from src.training.kernel_benchmark import run_kernel_benchmark
+
+    result = run_kernel_benchmark(
+        model_type="gru", hidden_units=[4], sequence_length=6, n_samples=32, batch_size=16, epochs=1, infer_repeats=1
+    )
+    assert result["recurrent_dropout"]["kernels"] == ["generic"]
+    assert result["fast_kernel"]["kernels"] in (["fused"], ["cudnn"])
+    assert result["train_speedup"] > 0
+    assert result["infer_speedup"] > 0
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+from src.training.rollout import RolloutEngine, _WindowRing
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+def _ramp_predict(model_horizon: int):
+    calls: list[int] = []
+
+    def _predict(inputs):
+        window = inputs[0]
+        calls.append(window.shape[0])
+        steps = np.arange(1, model_horizon + 1, dtype=np.float32)
+        return window[:, -1, 0:1] + steps[None, :]
+
+    return _predict, calls
+
+
+def test_window_ring_keeps_contiguous_sliding_windows():
+    ring = _WindowRing(n_series=2, length=3, features=1)
+    ring.reset(np.arange(10, dtype=np.float32).reshape(2, 5, 1))
+    np.testing.assert_array_equal(ring.window()[:, :, 0], [[2, 3, 4], [7, 8, 9]])
+    buffer_id = id(ring._buf)
+
+    ring.extend(np.array([[[5], [6]], [[10], [11]]], dtype=np.float32))
+    np.testing.assert_array_equal(ring.window()[:, :, 0], [[4, 5, 6], [9, 10, 11]])
+    assert ring.window().base is ring._buf and id(ring._buf) == buffer_id
+
+
+@pytest.mark.parametrize(("strategy", "expected_calls"), [("recursive", 7), ("hybrid", 3)])
+def test_rollout_strategies_batch_series_and_count_calls(strategy, expected_calls):
+    predict, calls = _ramp_predict(model_horizon=3)
+    engine = RolloutEngine(predict, sequence_length=4, model_horizon=3)
+    history = np.stack([np.arange(6), np.arange(6) * 2]).astype(np.float32)
+
+    out = engine.forecast(history, horizon=7, strategy=strategy)
+
+    assert out.shape == (2, 7, 1)
+    np.testing.assert_allclose(out[:, :, 0], history[:, -1:] + np.arange(1, 8))
+    assert engine.last_stats["model_calls"] == expected_calls
+    assert calls == [2] * expected_calls
+
+
+def test_rollout_shifts_future_covariate_windows():
+    def predict(inputs):
+        window, future = inputs
+        return window[:, -1, 0:1] + future[:, :, 0]
+
+    engine = RolloutEngine(predict, sequence_length=2, model_horizon=2)
+    future = np.arange(1, 7, dtype=np.float32).reshape(1, 6, 1)
+    out = engine.forecast(np.zeros((1, 3)), horizon=4, strategy="hybrid", future=future)
+    # Block 1 sees future[0:2] -> [1, 2]; block 2 starts from 2 and sees future[2:4] -> [5, 6].
+    np.testing.assert_allclose(out[0, :, 0], [1, 2, 5, 6])
+
+    with pytest.raises(ValueError, match="future covariates cover"):
+        engine.forecast(np.zeros((1, 3)), horizon=6, strategy="recursive", future=future)
+
+
+def test_rollout_validation():
+    predict, _ = _ramp_predict(model_horizon=2)
+    engine = RolloutEngine(predict, sequence_length=4, model_horizon=2)
+    with pytest.raises(ValueError, match="direct strategy"):
+        engine.forecast(np.zeros((1, 4)), horizon=3, strategy="direct")
+    with pytest.raises(ValueError, match="history needs"):
+        engine.forecast(np.zeros((1, 2)), horizon=2)
+    with pytest.raises(ValueError, match="strategy"):
+        engine.forecast(np.zeros((1, 4)), horizon=2, strategy="beam")
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_trainer_evaluate_rollout_matches_manual_recursion(tmp_path):
+    from src.models.dlinear import DLinearLikeModel
+    from src.training.trainer import Trainer
+
+    model = DLinearLikeModel(sequence_length=8, output_units=2)
+    trainer = Trainer(model, sequence_length=8, prediction_horizon=2, save_dir=str(tmp_path))
+    series = np.sin(np.linspace(0, 10 * np.pi, 200)).astype(np.float32)
+    trainer.train(data=series, epochs=1, batch_size=16, verbose=0)
+
+    report = trainer.evaluate_rollout(horizon=5, strategy="hybrid")
+
+    assert report["horizon"] == 5 and report["model_calls"] == 3
+    assert len(report["per_step_rmse"]) == 5
+    assert report["n_series"] == len(trainer.X_test) - 4
+
+    # First hybrid block equals the model's own direct prediction for each window.
+    direct = model.predict(trainer.X_test[: report["n_series"]])
+    first = RolloutEngine.from_model(model).forecast(trainer.X_test[: report["n_series"]], horizon=2)
+    np.testing.assert_allclose(first[:, :, 0], direct, atol=1e-5)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+pytestmark = pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+
+SEQ_LEN = 10
+
+
+def _series(n: int = 40, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=n).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "kwargs"),
+    [
+        ("LSTMModel", {"use_residual": True, "use_layer_norm": True}),
+        ("GRUModel", {"hidden_units": [8, 4]}),
+    ],
+)
+def test_streaming_matches_full_window_recomputation(model_name, kwargs):
+    import src.models.lstm as lstm_mod
+    from src.models.streaming import StreamingForecaster
+
+    model = getattr(lstm_mod, model_name)(sequence_length=SEQ_LEN, output_units=2, **{"hidden_units": [6, 5], **kwargs})
+    model.build()
+    stream = StreamingForecaster.from_model(model)
+    series = _series()
+
+    expected = model.predict(series[None, :SEQ_LEN, None])[0]
+    np.testing.assert_allclose(stream.prime("a", series[:SEQ_LEN]), expected, atol=1e-5)
+
+    # Priming with part of the window and stepping the rest is the same computation.
+    stream.prime("b", series[:3])
+    for value in series[3:SEQ_LEN]:
+        stepped = stream.update("b", value)
+    np.testing.assert_allclose(stepped, expected, atol=1e-5)
+    assert stream.cache.get("b").ticks == SEQ_LEN
+
+
+def test_refresh_every_reanchors_to_the_window_model():
+    from src.models.lstm import LSTMModel
+    from src.models.streaming import StreamingForecaster
+
+    model = LSTMModel(sequence_length=SEQ_LEN, hidden_units=[6])
+    model.build()
+    stream = StreamingForecaster.from_model(model, refresh_every=4)
+    series = _series()
+
+    stream.prime("s", series[:SEQ_LEN])
+    for t in range(SEQ_LEN, SEQ_LEN + 4):
+        out = stream.update("s", series[t])
+    # The fourth tick recomputes the retained window from a zero state.
+    window = series[t + 1 - SEQ_LEN : t + 1]
+    np.testing.assert_allclose(out, model.predict(window[None, :, None])[0], atol=1e-5)
+    assert stream.cache.get("s").ticks_since_refresh == 0
+
+
+def test_update_batch_with_covariates_matches_single_updates():
+    from src.models.lstm import GRUModel
+    from src.models.streaming import StreamingForecaster
+
+    model = GRUModel(sequence_length=SEQ_LEN, hidden_units=[6], output_units=3, future_features=1, static_features=2)
+    model.build()
+    stream = StreamingForecaster.from_model(model)
+    rng = np.random.default_rng(1)
+    future = rng.normal(size=(2, 3, 1)).astype(np.float32)
+    static = rng.normal(size=(2, 2)).astype(np.float32)
+    histories = rng.normal(size=(2, SEQ_LEN)).astype(np.float32)
+
+    for i, sid in enumerate(("x", "y")):
+        stream.prime(sid, histories[i, :-1], future=future[i], static=static[i])
+    batched = stream.update_batch(["x", "y"], histories[:, -1], future=future, static=static)
+
+    expected = model.predict([histories[:, :, None], future, static])
+    np.testing.assert_allclose(batched, expected, atol=1e-5)
+    with pytest.raises(ValueError, match="future covariates"):
+        stream.update("x", 0.0)
+
+
+def test_state_cache_is_lru_bounded():
+    from src.models.lstm import LSTMModel
+    from src.models.streaming import StreamingForecaster
+
+    model = LSTMModel(sequence_length=SEQ_LEN, hidden_units=[4])
+    model.build()
+    stream = StreamingForecaster.from_model(model, max_series=2)
+    stream.update("a", 1.0)
+    stream.update("b", 1.0)
+    stream.update("a", 2.0)
+    stream.update("c", 1.0)
+
+    assert "a" in stream.cache and "c" in stream.cache and "b" not in stream.cache
+    assert stream.cache.evictions == 1
+    stream.reset("a")
+    assert len(stream.cache) == 1
+
+
+def test_failed_update_batch_leaves_cached_series_untouched():
+    from src.models.lstm import LSTMModel
+    from src.models.streaming import StreamingForecaster
+
+    model = LSTMModel(sequence_length=SEQ_LEN, hidden_units=[4])
+    model.build()
+    stream = StreamingForecaster.from_model(model, refresh_every=1)
+    stream.prime("a", np.arange(SEQ_LEN, dtype=np.float32))
+    stream.update("b", 1.0)
+    before = {sid: (list(stream.cache.get(sid).window), stream.cache.get(sid).ticks) for sid in ("a", "b")}
+
+    run = stream._run
+    calls = []
+
+    def failing_run(*args):
+        calls.append(1)
+        if len(calls) == 2:  # the refresh call, after "b" and "new" were stepped
+            raise RuntimeError("boom")
+        return run(*args)
+
+    stream._run = failing_run
+    with pytest.raises(RuntimeError, match="boom"):
+        stream.update_batch(["a", "b", "new"], [[5.0], [6.0], [7.0]])
+
+    assert "new" not in stream.cache
+    for sid, (window, ticks) in before.items():
+        entry = stream.cache.get(sid)
+        assert entry.ticks == ticks
+        np.testing.assert_array_equal(list(entry.window), window)
+
+    stream._run = run
+    expected = stream.update_batch(["a", "b", "new"], [[5.0], [6.0], [7.0]])
+    assert "new" in stream.cache and stream.cache.get("a").ticks == SEQ_LEN + 1
+    assert expected.shape[0] == 3
+
+
+def test_exported_step_model_round_trips(tmp_path):
+    from src.models.lstm import LSTMModel
+    from src.models.streaming import StreamingForecaster, export_streaming_model
+    from tensorflow import keras
+
+    model = LSTMModel(sequence_length=SEQ_LEN, hidden_units=[6, 4])
+    model.build()
+    path = export_streaming_model(model, str(tmp_path / "streaming.keras"))
+    assert path.endswith(".h5")
+
+    loaded = StreamingForecaster(keras.models.load_model(path, compile=False), sequence_length=SEQ_LEN)
+    series = _series()
+    np.testing.assert_allclose(
+        loaded.prime("s", series[:SEQ_LEN]), model.predict(series[None, :SEQ_LEN, None])[0], atol=1e-5
+    )
+
+
+@pytest.mark.parametrize("model_name", ["BidirectionalLSTMModel", "AttentionLSTMModel"])
+def test_full_window_backbones_are_rejected(model_name):
+    import src.models.lstm as lstm_mod
+    from src.models.streaming import build_streaming_model
+
+    model = getattr(lstm_mod, model_name)(sequence_length=SEQ_LEN, hidden_units=[4, 4])
+    model.build()
+    with pytest.raises(ValueError, match="cannot be streamed"):
+        build_streaming_model(model)
@@ -0,0 +1,175 @@
+"""Tests for parallel / warm-start time-series cross-validation."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from src.training.trainer import Trainer
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+class FoldRecorderModel:
+    """Picklable stand-in model that records how each fold was trained."""
+
+    def __init__(self):
+        self.model = None
+        self.builds = 0
+        self.fits: list[dict] = []
+        self.loaded: list[str] = []
+
+    def build(self):
+        self.builds += 1
+        self.model = object()
+
+    def fit_model(self, X, y, **kwargs):
+        self.fits.append({"n": len(y), **kwargs})
+        return {"loss": [0.3, 0.2]}
+
+    def predict(self, X):
+        past = X[0] if isinstance(X, list) else X
+        return past[:, -1, :1].astype(float)
+
+    def save(self, path):
+        Path(path).write_text("ckpt")
+
+    def load(self, path):
+        self.loaded.append(path)
+
+
+def _windows(n: int = 60, seq_len: int = 4):
+    series = np.sin(np.linspace(0, 6, n + seq_len + 1))
+    X = np.stack([series[i : i + seq_len] for i in range(n)])[..., None]
+    y = series[seq_len : seq_len + n].reshape(-1, 1)
+    return X, y
+
+
+def test_cross_validate_independent_folds_rebuild_and_report_best_checkpoint(tmp_path):
+    model = FoldRecorderModel()
+    trainer = Trainer(model, sequence_length=4, save_dir=str(tmp_path))
+    X, y = _windows()
+
+    cv = trainer.cross_validate(X, y, n_splits=3, epochs=2, batch_size=8)
+
+    assert model.builds == 3
+    assert all(fit["validation_data"] is None for fit in model.fits)
+    assert cv["mode"] == "independent"
+    assert len(cv["folds"]) == 3
+    best = min(range(3), key=lambda i: cv["folds"][i]["rmse"])
+    assert cv["best_fold"] == best + 1
+    assert cv["best_checkpoint"] == str(tmp_path / "cv" / f"fold_{best + 1}.h5")
+    assert Path(cv["best_checkpoint"]).exists()
+
+
+def test_cross_validate_warm_start_carries_weights_with_epoch_budget(tmp_path):
+    model = FoldRecorderModel()
+    trainer = Trainer(model, sequence_length=4, save_dir=str(tmp_path))
+    X, y = _windows()
+
+    cv = trainer.cross_validate(X, y, n_splits=3, epochs=6, warm_start=True, warm_start_epochs=2, warm_start_patience=1)
+
+    assert model.builds == 1
+    assert [fit["epochs"] for fit in model.fits] == [6, 2, 2]
+    for fit in model.fits:
+        # Tail of the fold's training window is held out for early stopping.
+        assert fit["validation_data"] is not None
+        assert fit["extra_callbacks"][0].patience == 1
+    assert [fit["n"] for fit in model.fits] == [12, 24, 36]
+    assert cv["mode"] == "warm_start"
+
+
+def test_cross_validate_parallel_matches_sequential(tmp_path):
+    X, y = _windows()
+    sequential = Trainer(FoldRecorderModel(), sequence_length=4, save_dir=str(tmp_path / "seq")).cross_validate(
+        X, y, n_splits=3, epochs=1
+    )
+    parallel = Trainer(FoldRecorderModel(), sequence_length=4, save_dir=str(tmp_path / "par")).cross_validate(
+        X, y, n_splits=3, epochs=1, n_jobs=2, threads_per_fold=1, model_factory=FoldRecorderModel
+    )
+
+    assert parallel["folds"] == sequential["folds"]
+    assert parallel["threads_per_fold"] == 1
+    assert parallel["best_fold"] == sequential["best_fold"]
+    assert Path(parallel["best_checkpoint"]).exists()
+
+
+def test_cross_validate_rejects_invalid_parallel_config(tmp_path):
+    trainer = Trainer(FoldRecorderModel(), sequence_length=4, save_dir=str(tmp_path))
+    X, y = _windows()
+
+    with pytest.raises(ValueError, match="model_factory"):
+        trainer.cross_validate(X, y, n_splits=3, n_jobs=2)
+    with pytest.raises(ValueError, match="warm_start"):
+        trainer.cross_validate(X, y, n_splits=3, n_jobs=2, warm_start=True, model_factory=FoldRecorderModel)
+
+
+class RowRecorderModel(FoldRecorderModel):
+    """Records the window ids (stored in every X value) each fold fits on or scores."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows: set[int] = set()
+
+    def fit_model(self, X, y, **kwargs):
+        self.rows.update(int(v) for v in X[:, 0, 0])
+        return super().fit_model(X, y, **kwargs)
+
+    def predict(self, X):
+        self.rows.update(int(v) for v in X[:, 0, 0])
+        return super().predict(X)
+
+
+def test_cross_validate_never_touches_the_test_tail(tmp_path):
+    model = RowRecorderModel()
+    trainer = Trainer(model, sequence_length=4, save_dir=str(tmp_path))
+    n = 60
+    X = np.repeat(np.arange(n, dtype=float)[:, None, None], 4, axis=1)
+    y = np.zeros((n, 1))
+
+    cv = trainer.cross_validate(X, y, n_splits=3, epochs=1, test_size=0.2)
+
+    # train_test_split holds out windows 48.. as the test split of the final fit.
+    test_start = len(trainer.train_test_split(X, y, test_size=0.2)[2])
+    assert test_start == 48 and cv["cv_samples"] == 48
+    assert max(model.rows) < test_start
+    assert all(fold["test"][1] <= test_start for fold in cv["fold_indices"])
+    with pytest.raises(ValueError, match="test_size"):
+        trainer.cross_validate(X, y, n_splits=3, test_size=1.0)
+
+
+def test_train_loads_initial_checkpoint_before_fit(tmp_path):
+    model = FoldRecorderModel()
+    trainer = Trainer(model, sequence_length=4, save_dir=str(tmp_path))
+    X, y = _windows()
+
+    results = trainer.train(X=X, y=y, epochs=1, verbose=0, initial_checkpoint="fold_2.h5")
+
+    assert model.loaded == ["fold_2.h5"]
+    assert results["config"]["initial_checkpoint"] == "fold_2.h5"
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_warm_start_cv_checkpoint_seeds_final_training(tmp_path):
+    from src.models.lstm import GRUModel
+
+    X, y = _windows(n=48, seq_len=6)
+    model = GRUModel(sequence_length=6, hidden_units=[8], output_units=1, input_features=1)
+    trainer = Trainer(model, sequence_length=6, save_dir=str(tmp_path))
+
+    cv = trainer.cross_validate(X, y, n_splits=2, epochs=2, batch_size=8, warm_start=True, warm_start_patience=1)
+    assert Path(cv["best_checkpoint"]).exists()
+
+    fresh = GRUModel(sequence_length=6, hidden_units=[8], output_units=1, input_features=1)
+    fresh.load(cv["best_checkpoint"])
+    expected = fresh.predict(X[:4])
+
+    final_model = GRUModel(sequence_length=6, hidden_units=[8], output_units=1, input_features=1)
+    final = Trainer(final_model, sequence_length=6, save_dir=str(tmp_path))
+    final.load_checkpoint(cv["best_checkpoint"])
+    np.testing.assert_allclose(final_model.predict(X[:4]), expected, atol=1e-6)
+
+    results = final.train(X=X, y=y, epochs=1, batch_size=8, verbose=0, initial_checkpoint=cv["best_checkpoint"])
+    assert np.isfinite(results["metrics"]["rmse"])
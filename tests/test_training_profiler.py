@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_profiler_counts_steps_samples_and_wait(monkeypatch):
+    from src.training import profiling
+
+    clock = iter([0.0, 0.0, 1.0, 3.0, 3.5, 3.7, 4.0, 4.5])
+    monkeypatch.setattr(profiling.time, "perf_counter", lambda: next(clock))
+    profiler = profiling.make_profiler_callback(batch_size=32, samples_per_epoch=50)
+
+    profiler.on_train_begin()  # 0.0
+    profiler.on_epoch_begin(0)  # 0.0
+    profiler.on_train_batch_begin(0)  # 1.0 -> 1.0s wait
+    profiler.on_train_batch_end(0)  # 3.0 -> 2000ms (first step)
+    profiler.on_train_batch_begin(1)  # 3.5 -> 0.5s wait
+    profiler.on_train_batch_end(1)  # 3.7 -> 200ms
+    profiler.on_epoch_end(0)  # 4.0 -> 0.3s validation
+    profiler.on_train_end()  # 4.5
+    summary = profiler.summary()
+
+    epoch = summary["epochs"][0]
+    assert epoch["steps"] == 2 and epoch["samples"] == 50  # the partial last batch is not over-counted
+    assert epoch["input_wait_seconds"] == pytest.approx(1.5)
+    assert epoch["val_seconds"] == pytest.approx(0.3)
+    assert epoch["samples_per_sec"] == pytest.approx(50 / 3.7, rel=1e-3)
+    assert summary["step_time_ms"]["first_step_ms"] == pytest.approx(2000.0)
+    assert summary["step_time_ms"]["p50"] == pytest.approx(200.0)
+    assert summary["input_wait_fraction"] == pytest.approx(1.5 / 3.7, rel=1e-3)
+    assert summary["steady_samples_per_sec"] is None
+    assert summary["peak_rss_mb"] > 0
+
+    with pytest.raises(ValueError, match="trace_dir"):
+        profiling.make_profiler_callback(batch_size=32, trace_steps=(2, 3))
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_writes_profile_to_metrics_and_report(tmp_path):
+    from src.training.runner import build_parser, run
+
+    payload = run(
+        build_parser().parse_args(
+            [
+                "--artifacts-dir",
+                str(tmp_path),
+                "--run-id",
+                "profiled",
+                "--synthetic-samples",
+                "200",
+                "--epochs",
+                "2",
+                "--verbose",
+                "0",
+                "--model-type",
+                "dlinear",
+                "--profile",
+            ]
+        )
+    )
+
+    profile = payload["profile"]
+    assert [e["epoch"] for e in profile["epochs"]] == [1, 2]
+    assert profile["samples"] == 2 * payload["training"]["fit_windows"]
+    assert profile["steady_samples_per_sec"] > 0
+    assert profile["trace_dir"] is None
+    assert payload["config"]["profile"] is True
+    assert "## Training Profile" in (tmp_path / "reports" / "profiled.md").read_text(encoding="utf-8")
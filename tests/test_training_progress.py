@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+
+import pytest
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_progress_callback_emits_throttled_steps_and_eta(monkeypatch):
+    from src.training import progress
+
+    clock = iter([0.0, 0.0, 1.0, 1.0, 1.2, 2.0, 2.5])
+    monkeypatch.setattr(progress.time, "perf_counter", lambda: next(clock))
+    stream = io.StringIO()
+    reporter = progress.make_progress_callback(stream, batch_size=32, samples_per_epoch=50, min_interval_s=0.5)
+    reporter.set_params({"epochs": 2, "steps": 2})
+
+    reporter.on_train_begin()  # 0.0
+    reporter.on_epoch_begin(0)  # 0.0
+    reporter.on_train_batch_end(0, {"loss": 1.5})  # 1.0, 1.0 -> emitted
+    reporter.on_train_batch_end(1, {"loss": 1.25})  # 1.2 -> throttled
+    reporter.on_epoch_end(0, {"loss": 1.25, "val_loss": float("nan")})  # 2.0, 2.5
+    reporter.on_train_end()
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    assert [e["event"] for e in events] == ["train_begin", "step", "epoch", "train_end"]
+    step, epoch = events[1], events[2]
+    assert (step["epoch"], step["step"], step["steps"], step["loss"]) == (1, 1, 2, 1.5)
+    assert step["samples_per_sec"] == 32.0
+    assert step["fraction"] == 0.25 and step["eta_s"] == pytest.approx(3.0)
+    assert epoch["samples_per_sec"] == pytest.approx(50 / 2.0)  # the partial last batch is not over-counted
+    assert epoch["fraction"] == 0.5 and epoch["eta_s"] == pytest.approx(2.0)
+    assert epoch["val_loss"] is None  # non-finite metrics become null instead of invalid JSON
+    assert epoch["seconds"] == pytest.approx(2.5)
+
+    monkeypatch.delenv(progress.PROGRESS_FD_ENV, raising=False)
+    assert progress.make_progress_callback_from_env(batch_size=32) is None
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_reports_progress_on_inherited_fd(tmp_path, monkeypatch):
+    from src.training.progress import PROGRESS_FD_ENV
+    from src.training.runner import build_parser, run
+
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setenv(PROGRESS_FD_ENV, str(write_fd))
+    try:
+        payload = run(
+            build_parser().parse_args(
+                [
+                    "--artifacts-dir",
+                    str(tmp_path),
+                    "--run-id",
+                    "progress-run",
+                    "--synthetic-samples",
+                    "200",
+                    "--epochs",
+                    "2",
+                    "--verbose",
+                    "0",
+                    "--model-type",
+                    "dlinear",
+                ]
+            )
+        )
+    finally:
+        os.close(write_fd)
+    with os.fdopen(read_fd, encoding="utf-8") as f:
+        events = [json.loads(line) for line in f]
+
+    epochs = [e for e in events if e["event"] == "epoch"]
+    assert events[0]["event"] == "train_begin" and events[-1]["event"] == "train_end"
+    assert [e["epoch"] for e in epochs] == [1, 2]
+    assert epochs[-1]["fraction"] == 1.0 and epochs[-1]["eta_s"] == 0.0
+    assert all(e["val_loss"] is not None and e["samples_per_sec"] > 0 for e in epochs)
+    assert payload["training"]["fit_windows"] > 0
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+from src.training.trainer import _convergence_stats, _select_incremental_windows
+
+RUN_ML = os.environ.get("RUN_ML_TESTS", "1")  # enabled by default in CI
+
+
+def test_incremental_windows_keep_new_tail_and_spread_replay():
+    X = np.arange(20, dtype=np.float32).reshape(10, 2, 1)
+    y = np.arange(10, dtype=np.float32).reshape(10, 1)
+
+    X_sel, y_sel, info = _select_incremental_windows(X, y, new_from=6, replay_fraction=0.5)
+
+    assert info == {"new_windows_from": 6, "new_windows": 4, "replay_windows": 3}
+    np.testing.assert_array_equal(y_sel[:, 0], [0, 2, 5, 6, 7, 8, 9])
+    np.testing.assert_array_equal(X_sel[:, 0, 0], y_sel[:, 0] * 2)
+
+    # Same data as the previous run: nothing new, so every window is used.
+    _, y_all, info = _select_incremental_windows(X, y, new_from=10, replay_fraction=0.0)
+    assert len(y_all) == 10 and info["new_windows"] == 10
+
+    with pytest.raises(ValueError, match="replay_fraction"):
+        _select_incremental_windows(X, y, new_from=6, replay_fraction=1.5)
+
+
+def test_convergence_stats_use_best_validation_epoch():
+    stats = _convergence_stats({"loss": [3.0, 2.0, 1.0, 0.5], "val_loss": [2.0, 1.0, 1.5, 1.2]})
+    assert stats == {"epochs_run": 4, "epochs_to_converge": 2, "best_val_loss": 1.0}
+
+
+@pytest.mark.skipif(not RUN_ML, reason="ML tests require TensorFlow")
+def test_runner_warm_start_from_previous_run(tmp_path):
+    from src.training.runner import build_parser, run
+
+    common = ["--artifacts-dir", str(tmp_path), "--epochs", "1", "--verbose", "0", "--model-type", "dlinear"]
+    cold = run(build_parser().parse_args([*common, "--run-id", "cold-run", "--synthetic-samples", "200"]))
+    warm = run(
+        build_parser().parse_args(
+            [
+                *common,
+                "--run-id",
+                "warm-run",
+                "--synthetic-samples",
+                "260",
+                "--warm-start-from",
+                "cold-run",
+                "--warm-start-replay",
+                "0.25",
+            ]
+        )
+    )
+
+    report = warm["warm_start"]
+    assert report["from_run_id"] == "cold-run"
+    assert report["checkpoint"].endswith("best.h5")
+    assert report["incremental"]["new_windows_from"] == cold["training"]["train_windows"]
+    assert report["incremental"]["new_windows"] == warm["training"]["train_windows"] - cold["training"]["train_windows"]
+    assert warm["training"]["fit_windows"] < warm["training"]["train_windows"]
+    assert report["cold_start"]["run_id"] == "cold-run"
+    assert report["vs_cold_start"]["epochs_to_converge"]["cold"] == cold["training"]["epochs_to_converge"]
+    assert warm["config"]["warm_start_from"] == "cold-run"
+
+    with pytest.raises(ValueError, match="incompatible"):
+        run(
+            build_parser().parse_args(
+                [
+                    *common,
+                    "--run-id",
+                    "bad-run",
+                    "--synthetic-samples",
+                    "260",
+                    "--sequence-length",
+                    "12",
+                    "--warm-start-from",
+                    "cold-run",
+                ]
+            )
+        )